@@ -0,0 +1,89 @@
+"""
+Benchmark de memória e percurso da AST
+
+Mede a memória por nó da AST de um programa sintético (o objeto nó e
+toda a memória retida pela árvore) e o tempo
+dos percursos sobre ela: análise semântica, geração de código
+intermediário e geração de código Python. A árvore é construída uma única
+vez, para medir apenas os percursos.
+
+Uso:
+    python benchmarks/benchmark_ast.py [blocos]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+import warnings
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ast_nodes import AST
+from src.lexer_regex import LexerRegex
+from src.parser import Parser
+from src.semantic import AnalisadorSemantico
+from src.intermediate import GeradorCodigoIntermediario
+from src.codegen import GeradorDeCodigo
+from benchmarks.programas_sinteticos import gerar_programa
+
+
+def medir(funcao, repeticoes=3):
+    """Retorna o melhor tempo (em segundos) entre as repetições"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def contar_nos(programa):
+    """Quantidade de nós da AST e bytes dos objetos nó (com o `__dict__`, se houver)"""
+    quantidade = tamanho = 0
+    pilha = [programa]
+    while pilha:
+        item = pilha.pop()
+        if isinstance(item, list):
+            pilha.extend(item)
+        elif isinstance(item, AST):
+            quantidade += 1
+            tamanho += sys.getsizeof(item)
+            if hasattr(item, '__dict__'):
+                tamanho += sys.getsizeof(item.__dict__)
+            pilha.extend(getattr(item, campo) for campo in item.__dataclass_fields__)
+    return quantidade, tamanho
+
+
+def analisar_semantica(programa):
+    """Análise semântica sem os avisos de inicialização"""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        AnalisadorSemantico().analisar(programa)
+
+
+def main():
+    blocos = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    codigo = gerar_programa(blocos)
+    buffer = LexerRegex(codigo).tokenizar()
+
+    tracemalloc.start()
+    programa = Parser(buffer).analisar()
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    nos, tamanho = contar_nos(programa)
+
+    print(f"Programa: {blocos} blocos, {nos} nós")
+    print("-" * 60)
+    print(f"{'objeto nó':14} {tamanho / nos:8.1f} bytes/nó")
+    print(f"{'AST retida':14} {memoria / nos:8.1f} bytes/nó  ({memoria / 2 ** 20:.1f} MiB)")
+    for nome, funcao in (
+            ('semântica', lambda: analisar_semantica(programa)),
+            ('intermediário', lambda: GeradorCodigoIntermediario().gerar(programa)),
+            ('codegen', lambda: GeradorDeCodigo().gerar(programa))):
+        tempo = medir(funcao)
+        print(f"{nome:14} {tempo:8.3f} s  {nos / tempo / 1e3:9.1f} knós/s")
+
+
+if __name__ == '__main__':
+    main()
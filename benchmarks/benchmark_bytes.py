@@ -0,0 +1,77 @@
+"""
+Benchmark do motor léxico sobre bytes
+
+Compara a leitura em modo texto (decodificação + `LexerRegex`) com o
+`LexerBytes` sobre os bytes do arquivo, com quebras de linha '\\n' e
+'\\r\\n', verificando antes que os tokens são idênticos. Mede o consumo
+por `proximo_token()` (o caminho do parser) e por `tokenizar()`.
+
+Uso:
+    python benchmarks/benchmark_bytes.py [blocos]
+"""
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ast_nodes import TipoToken
+from src.lexer_regex import LexerRegex
+from src.lexer_bytes import LexerBytes
+from benchmarks.programas_sinteticos import gerar_programa
+
+
+def consumir(lexer):
+    """Consome os tokens um a um, como o parser"""
+    proximo = lexer.proximo_token
+    quantidade = 0
+    while proximo().tipo is not TipoToken.EOF:
+        quantidade += 1
+    return quantidade
+
+
+def modo_texto(dados):
+    """Decodifica como open(..., 'r', encoding='utf-8') faria"""
+    return io.TextIOWrapper(io.BytesIO(dados), encoding='utf-8').read()
+
+
+def medir(funcao, repeticoes=3):
+    """Retorna o melhor tempo (em segundos) entre as repetições"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main():
+    blocos = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    codigo = gerar_programa(blocos)
+
+    for nome_quebra, quebra in (('LF', '\n'), ('CRLF', '\r\n')):
+        dados = codigo.replace('\n', quebra).encode('utf-8')
+        assert list(LexerRegex(modo_texto(dados)).tokenizar()) == list(LexerBytes(dados).tokenizar()), \
+            "Tokens divergentes"
+        tokens = consumir(LexerBytes(dados))
+
+        print(f"Programa ({nome_quebra}): {len(dados) / 1e6:.1f} MB, {tokens} tokens")
+        print("-" * 60)
+        casos = (
+            ('texto+regex', lambda: consumir(LexerRegex(modo_texto(dados)))),
+            ('bytes', lambda: consumir(LexerBytes(dados))),
+            ('texto+regex (lote)', lambda: LexerRegex(modo_texto(dados)).tokenizar()),
+            ('bytes (lote)', lambda: LexerBytes(dados).tokenizar()),
+        )
+        tempos = [medir(funcao) for _, funcao in casos]
+        for indice, ((nome, _), tempo) in enumerate(zip(casos, tempos)):
+            referencia = tempos[indice - indice % 2]
+            print(f"{nome:20} {tempo:8.3f} s  {tokens / tempo / 1e3:9.1f} ktokens/s  "
+                  f"({referencia / tempo:.2f}x)")
+        print()
+
+
+if __name__ == '__main__':
+    main()
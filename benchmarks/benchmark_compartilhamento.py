@@ -0,0 +1,92 @@
+"""
+Benchmark do compartilhamento de subexpressões (hash-consing)
+
+Para cada programa válido de `exemplos/` e para um programa sintético grande,
+compara a AST dos parsers com a AST após `compartilhar_expressoes`: nós de
+expressão, memória retida pela árvore (com e sem a tabela de nós únicos)
+e tempo da geração de código. Antes de medir, verifica que o código
+gerado é o mesmo.
+
+Uso:
+    python benchmarks/benchmark_compartilhamento.py [blocos]
+"""
+
+import gc
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer_regex import LexerRegex
+from src.parser import Parser
+from src.codegen import GeradorDeCodigo
+from src.compartilhamento import compartilhar_expressoes
+from src.exceptions import CompiladorError
+from benchmarks.programas_sinteticos import gerar_programa
+
+
+def medir(funcao, repeticoes=3):
+    """Retorna o melhor tempo (em segundos) entre as repetições"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def memoria_atual():
+    """Memória alocada e ainda viva (tracemalloc), após coletar o lixo"""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def comparar(nome, codigo, tempos=False):
+    """Imprime nós, memória e (opcional) tempo de geração antes e depois"""
+    try:
+        original = Parser(LexerRegex(codigo).tokenizar()).analisar()
+    except CompiladorError as erro:
+        print(f"{nome:26} (não compila: {erro})")
+        return
+    buffer = LexerRegex(codigo).tokenizar()
+
+    tracemalloc.start()
+    base = memoria_atual()
+    ast = Parser(buffer).analisar()
+    memoria_antes = memoria_atual() - base
+    tabela = compartilhar_expressoes(ast)
+    memoria_com_tabela = memoria_atual() - base
+    ocorrencias, unicos, compartilhados = tabela.ocorrencias, len(tabela), tabela.compartilhados
+    tabela = None
+    memoria_depois = memoria_atual() - base
+    tracemalloc.stop()
+
+    esperado = GeradorDeCodigo().gerar(original)
+    assert GeradorDeCodigo(compartilhados).gerar(ast) == esperado, "código divergente"
+
+    print(f"{nome:26} {ocorrencias:8} -> {unicos:7} nós  "
+          f"{memoria_antes / 1024:9.1f} -> {memoria_depois / 1024:8.1f} KiB "
+          f"({memoria_com_tabela / 1024:.1f} com a tabela)")
+    if tempos:
+        antes = medir(lambda: GeradorDeCodigo().gerar(original))
+        depois = medir(lambda: GeradorDeCodigo(compartilhados).gerar(ast))
+        print(f"{'codegen':26} {antes * 1e3:8.1f} -> {depois * 1e3:7.1f} ms")
+
+
+def main():
+    blocos = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    raiz = os.path.join(os.path.dirname(__file__), '..', 'exemplos')
+
+    print(f"{'programa':26} {'expressões':>22}  {'memória da AST':>22}")
+    print("-" * 78)
+    for caminho in sorted(glob.glob(os.path.join(raiz, '*.por'))):
+        with open(caminho, encoding='utf-8') as arquivo:
+            comparar(os.path.basename(caminho), arquivo.read())
+    comparar(f"sintético ({blocos} blocos)", gerar_programa(blocos), tempos=True)
+
+
+if __name__ == '__main__':
+    main()
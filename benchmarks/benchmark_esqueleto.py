@@ -0,0 +1,62 @@
+"""
+Benchmark da análise de esqueleto
+
+Compara, sobre um programa sintético, a análise completa (`Parser`) com o
+`Esqueleto` (declarações e contorno dos blocos, corpos adiados), com a
+tokenização isolada como piso, e o acesso a um único bloco com a
+análise completa. Antes de medir, verifica que o `Esqueleto` produz a
+mesma AST.
+
+Uso:
+    python benchmarks/benchmark_esqueleto.py [blocos]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer_regex import LexerRegex
+from src.parser import Parser
+from src.analise_esqueleto import Esqueleto
+from benchmarks.programas_sinteticos import gerar_programa
+
+
+def medir(funcao, repeticoes=3):
+    """Retorna o melhor tempo (em segundos) entre as repetições"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def bloco_do_meio(codigo):
+    """Esqueleto e análise de um único bloco, no meio do programa"""
+    esqueleto = Esqueleto(codigo)
+    return esqueleto.blocos[len(esqueleto.blocos) // 2].comando
+
+
+def main():
+    blocos = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    codigo = gerar_programa(blocos)
+    assert Esqueleto(codigo).analisar() == Parser(LexerRegex(codigo).tokenizar()).analisar()
+
+    esqueleto = Esqueleto(codigo)
+    print(f"Programa: {blocos} blocos, {len(esqueleto.tokens)} tokens, "
+          f"{sum(1 for _ in esqueleto.contorno())} blocos no contorno")
+    print("-" * 60)
+    tempos = [(nome, medir(funcao, repeticoes=5)) for nome, funcao in (
+        ('completa', lambda: Parser(LexerRegex(codigo).tokenizar()).analisar()),
+        ('tokenização', lambda: LexerRegex(codigo).tokenizar()),
+        ('esqueleto', lambda: Esqueleto(codigo)),
+        ('um bloco', lambda: bloco_do_meio(codigo)))]
+    completo = tempos[0][1]
+    for nome, tempo in tempos:
+        print(f"{nome:14} {tempo:8.3f} s  {completo / tempo:6.2f}x mais rápido que a completa")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark de vazão dos motores léxicos
+
+Compara o `Lexer` imperativo com o `LexerRegex`, o `LexerAFD` e o
+`LexerTabelado` sobre um programa sintético grande, verificando antes que
+todos produzem a mesma sequência de tokens.
+
+Uso:
+    python benchmarks/benchmark_lexer.py [blocos]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ast_nodes import TipoToken
+from src.lexer import Lexer
+from src.lexer_regex import LexerRegex
+from src.lexer_afd import LexerAFD
+from src.lexer_tabelado import LexerTabelado
+from benchmarks.programas_sinteticos import gerar_programa
+
+
+# Motores comparados (o primeiro é a referência)
+MOTORES = {'imperativo': Lexer, 'regex': LexerRegex, 'afd': LexerAFD,
+           'tabelado': LexerTabelado}
+
+
+def listar_tokens(classe_lexer, codigo):
+    """Retorna a lista completa de tokens (incluindo EOF)"""
+    lexer = classe_lexer(codigo)
+    tokens = []
+    while True:
+        token = lexer.proximo_token()
+        tokens.append(token)
+        if token.tipo == TipoToken.EOF:
+            return tokens
+
+
+def medir(classe_lexer, codigo, repeticoes=3):
+    """Retorna o melhor tempo (em segundos) entre as repetições"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        listar_tokens(classe_lexer, codigo)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main():
+    blocos = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    codigo = gerar_programa(blocos)
+    tamanho_mb = len(codigo.encode('utf-8')) / 1e6
+
+    referencia = listar_tokens(Lexer, codigo)
+    for classe in MOTORES.values():
+        assert listar_tokens(classe, codigo) == referencia, "Sequências de tokens divergentes"
+
+    print(f"Programa: {codigo.count(chr(10))} linhas, {tamanho_mb:.2f} MB, {len(referencia)} tokens")
+    print("-" * 60)
+    base = None
+    for nome, classe in MOTORES.items():
+        tempo = medir(classe, codigo)
+        base = base or tempo
+        print(f"{nome:12} {tempo:8.3f} s  {len(referencia) / tempo / 1e3:9.1f} ktokens/s  "
+              f"{tamanho_mb / tempo:6.2f} MB/s  ({base / tempo:.1f}x)")
+
+    # Custo fixo por instância (correção em lote cria milhares de lexers)
+    print("-" * 60)
+    for nome, classe in MOTORES.items():
+        instancias = 100000
+        inicio = time.perf_counter()
+        for _ in range(instancias):
+            classe('x')
+        custo = (time.perf_counter() - inicio) / instancias
+        print(f"{nome:12} {custo * 1e6:8.2f} us por instância")
+
+
+if __name__ == '__main__':
+    main()
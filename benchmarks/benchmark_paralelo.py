@@ -0,0 +1,54 @@
+"""
+Benchmark da tokenização paralela
+
+Compara `LexerRegex.tokenizar()` com `tokenizar_paralelo` sobre um
+programa sintético grande, verificando antes que os buffers são
+idênticos (tokens, posições e linhas).
+
+Uso:
+    python benchmarks/benchmark_paralelo.py [blocos] [trabalhadores]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer_regex import LexerRegex
+from src.lexer_paralelo import tokenizar_paralelo
+from benchmarks.programas_sinteticos import gerar_programa
+
+
+def medir(funcao, repeticoes=3):
+    """Retorna o melhor tempo (em segundos) entre as repetições"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main():
+    blocos = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    trabalhadores = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    codigo = gerar_programa(blocos)
+
+    sequencial = LexerRegex(codigo).tokenizar()
+    paralelo = tokenizar_paralelo(codigo, trabalhadores=trabalhadores, limiar=0)
+    for campo in ('tipos', 'inicios', 'fins', 'linhas', 'colunas', 'lexemas_especiais'):
+        assert getattr(sequencial, campo) == getattr(paralelo, campo), f"Campo {campo} divergente"
+
+    print(f"Programa: {len(codigo) / 1e6:.1f} M caracteres, {len(sequencial)} tokens, "
+          f"{trabalhadores} processos")
+    print("-" * 60)
+    tempo_sequencial = medir(lambda: LexerRegex(codigo).tokenizar())
+    tempo_paralelo = medir(lambda: tokenizar_paralelo(codigo, trabalhadores=trabalhadores, limiar=0))
+    for nome, tempo in (('sequencial', tempo_sequencial), ('paralelo', tempo_paralelo)):
+        print(f"{nome:12} {tempo:8.3f} s  {len(sequencial) / tempo / 1e3:9.1f} ktokens/s  "
+              f"({tempo_sequencial / tempo:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark do analisador de expressões
+
+Compara o `Parser` (um método por nível de precedência) com o
+`ParserPratt` (laço único dirigido pela tabela de precedência) e o
+`ParserIterativo` (o mesmo laço, sem recursão) sobre um programa dominado
+por expressões, verificando antes que as ASTs são idênticas. Os tokens são gerados uma única vez (`BufferTokens`), para
+medir apenas a análise sintática.
+
+Uso:
+    python benchmarks/benchmark_parser.py [linhas]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer_regex import LexerRegex
+from src.parser import Parser
+from src.parser_pratt import ParserPratt
+from src.parser_iterativo import ParserIterativo
+from benchmarks.programas_sinteticos import gerar_programa_expressoes
+
+
+def medir(funcao, repeticoes=3):
+    """Retorna o melhor tempo (em segundos) entre as repetições"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def analisar(classe_parser, buffer):
+    """Analisa o buffer desde o primeiro token"""
+    buffer.reiniciar()
+    return classe_parser(buffer).analisar()
+
+
+def main():
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    codigo = gerar_programa_expressoes(linhas)
+    buffer = LexerRegex(codigo).tokenizar()
+    esperado = analisar(Parser, buffer)
+    assert esperado == analisar(ParserPratt, buffer) == analisar(ParserIterativo, buffer), \
+        "ASTs divergentes"
+
+    print(f"Programa: {linhas} expressões, {len(buffer)} tokens")
+    print("-" * 60)
+    tempo_descendente = medir(lambda: analisar(Parser, buffer))
+    tempo_pratt = medir(lambda: analisar(ParserPratt, buffer))
+    tempo_iterativo = medir(lambda: analisar(ParserIterativo, buffer))
+    for nome, tempo in (('descendente', tempo_descendente), ('pratt', tempo_pratt),
+                        ('iterativo', tempo_iterativo)):
+        print(f"{nome:12} {tempo:8.3f} s  {len(buffer) / tempo / 1e3:9.1f} ktokens/s  "
+              f"({tempo_descendente / tempo:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark das expressões em código pós-fixo
+
+Compara o `ParserIterativo` (árvore de expressões) com o `ParserPosfixo`
+(código pós-fixo em um único array) sobre um programa dominado por
+expressões: tempo da análise sintática e memória retida pelo resultado.
+Os tokens são gerados uma única vez (`BufferTokens`), e antes de medir
+verifica que as expressões reconstruídas são as mesmas.
+
+Uso:
+    python benchmarks/benchmark_posfixo.py [linhas]
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer_regex import LexerRegex
+from src.parser_iterativo import ParserIterativo
+from src.parser_posfixo import ParserPosfixo, para_arvore
+from benchmarks.programas_sinteticos import gerar_programa_expressoes
+
+
+def medir(funcao, repeticoes=3):
+    """Retorna o melhor tempo (em segundos) entre as repetições"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def analisar(classe_parser, buffer):
+    """Analisa o buffer desde o primeiro token"""
+    buffer.reiniciar()
+    return classe_parser(buffer).analisar()
+
+
+def memoria_retida(classe_parser, buffer):
+    """Memória alocada pela análise e ainda viva no resultado"""
+    gc.collect()
+    tracemalloc.start()
+    resultado = analisar(classe_parser, buffer)
+    gc.collect()
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del resultado
+    return memoria
+
+
+def main():
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    codigo = gerar_programa_expressoes(linhas)
+    buffer = LexerRegex(codigo).tokenizar()
+    arvores = analisar(ParserIterativo, buffer)
+    posfixo = analisar(ParserPosfixo, buffer)
+    assert [para_arvore(comando.expressao) for comando in posfixo.comandos] == \
+        [comando.expressao for comando in arvores.comandos], "expressões divergentes"
+
+    print(f"Programa: {linhas} expressões, {len(buffer)} tokens")
+    print("-" * 60)
+    motores = (('árvore', ParserIterativo), ('pós-fixo', ParserPosfixo))
+    tempos = [medir(lambda: analisar(classe_parser, buffer), repeticoes=5) for _, classe_parser in motores]
+    for (nome, classe_parser), tempo in zip(motores, tempos):
+        memoria = memoria_retida(classe_parser, buffer)
+        print(f"{nome:10} {tempo:8.3f} s  ({tempos[0] / tempo:.2f}x)  "
+              f"{memoria / 2 ** 20:7.1f} MiB retidos")
+
+
+if __name__ == '__main__':
+    main()
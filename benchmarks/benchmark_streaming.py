@@ -0,0 +1,86 @@
+"""
+Benchmark de pico de memória do modo streaming
+
+Grava programas sintéticos de tamanhos crescentes em arquivos temporários
+e mede o pico de memória (tracemalloc) para percorrer todos os tokens:
+
+- leitura completa do arquivo + LexerRegex
+- LexerStreaming sobre um mmap do arquivo
+
+No modo streaming o pico deve permanecer constante com o tamanho.
+
+Uso:
+    python benchmarks/benchmark_streaming.py [blocos]
+"""
+
+import mmap
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ast_nodes import TipoToken
+from src.lexer_regex import LexerRegex
+from src.lexer_streaming import LexerStreaming
+from benchmarks.programas_sinteticos import gerar_programa
+
+
+def percorrer(lexer):
+    """Consome todos os tokens sem guardá-los"""
+    quantidade = 0
+    while lexer.proximo_token().tipo != TipoToken.EOF:
+        quantidade += 1
+    return quantidade
+
+
+def arquivo_completo(caminho):
+    """Caminho padrão: o arquivo inteiro em uma str"""
+    with open(caminho, 'r', encoding='utf-8') as arquivo:
+        codigo = arquivo.read()
+    return percorrer(LexerRegex(codigo))
+
+
+def arquivo_em_blocos(caminho):
+    """Modo streaming: janela deslizante sobre o mmap"""
+    with open(caminho, 'rb') as arquivo:
+        with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            return percorrer(LexerStreaming(mapa))
+
+
+def medir(funcao, caminho):
+    """Retorna (segundos, pico de memória em bytes, tokens)"""
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    quantidade = funcao(caminho)
+    tempo = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tempo, pico, quantidade
+
+
+def main():
+    blocos = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    print(f"{'tamanho':>10} {'completo':>12} {'streaming':>12} {'tempo':>16}")
+    print("-" * 56)
+    for multiplo in (1, 2, 4):
+        codigo = gerar_programa(blocos * multiplo)
+        with tempfile.NamedTemporaryFile('w', suffix='.por', encoding='utf-8',
+                                         delete=False) as arquivo:
+            arquivo.write(codigo)
+        try:
+            tempo_completo, pico_completo, tokens = medir(arquivo_completo, arquivo.name)
+            tempo_blocos, pico_blocos, tokens_blocos = medir(arquivo_em_blocos, arquivo.name)
+            assert tokens == tokens_blocos, "Quantidades de tokens divergentes"
+        finally:
+            os.unlink(arquivo.name)
+
+        tamanho = len(codigo.encode('utf-8'))
+        print(f"{tamanho / 2**20:8.2f}MB {pico_completo / 2**20:10.2f}MB "
+              f"{pico_blocos / 2**20:10.2f}MB {tempo_completo:6.2f}s/{tempo_blocos:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
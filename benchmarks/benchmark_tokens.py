@@ -0,0 +1,71 @@
+"""
+Benchmark de memória e tempo do buffer compacto de tokens
+
+Compara a lista de objetos Token (laço sobre `proximo_token`) com o
+`BufferTokens` produzido por `Lexer.tokenizar()`.
+
+Uso:
+    python benchmarks/benchmark_tokens.py [blocos]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ast_nodes import TipoToken
+from src.lexer_regex import LexerRegex
+from benchmarks.programas_sinteticos import gerar_programa
+
+
+def lista_de_tokens(codigo):
+    """Caminho antigo: um objeto Token por token"""
+    lexer = LexerRegex(codigo)
+    tokens = []
+    while True:
+        token = lexer.proximo_token()
+        tokens.append(token)
+        if token.tipo == TipoToken.EOF:
+            return tokens
+
+
+def buffer_de_tokens(codigo):
+    """Caminho em lote: arrays do BufferTokens"""
+    return LexerRegex(codigo).tokenizar()
+
+
+def medir(funcao, codigo):
+    """Retorna (segundos, bytes alocados retidos, resultado)"""
+    inicio = time.perf_counter()
+    funcao(codigo)
+    tempo = time.perf_counter() - inicio
+
+    tracemalloc.start()
+    resultado = funcao(codigo)
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tempo, memoria, resultado
+
+
+def main():
+    blocos = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    codigo = gerar_programa(blocos)
+
+    tempo_lista, memoria_lista, lista = medir(lista_de_tokens, codigo)
+    tempo_buffer, memoria_buffer, buffer = medir(buffer_de_tokens, codigo)
+    assert list(buffer) == lista, "Sequências de tokens divergentes"
+
+    quantidade = len(lista)
+    print(f"Programa: {codigo.count(chr(10))} linhas, {quantidade} tokens")
+    print("-" * 60)
+    print(f"{'list[Token]':14} {tempo_lista:7.3f} s  {memoria_lista / quantidade:7.1f} bytes/token")
+    print(f"{'BufferTokens':14} {tempo_buffer:7.3f} s  {memoria_buffer / quantidade:7.1f} bytes/token")
+    print("-" * 60)
+    print(f"Memória: {memoria_lista / memoria_buffer:.1f}x menor   "
+          f"Tempo: {tempo_lista / tempo_buffer:.1f}x mais rápido")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark da validação de tokens com AFDs
+
+Compara `ValidadorTokensAFD.identificar_tipo_token` (um AFD passo a passo
+por texto) com `classificar_lote` (todas as strings sobre as tabelas do
+AFD combinado mínimo), verificando antes que os resultados coincidem.
+
+Uso:
+    python benchmarks/benchmark_validacao.py [quantidade]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.automaton import TIPOS_VALIDACAO, ValidadorTokensAFD
+
+
+def gerar_candidatos(quantidade, semente=0):
+    """Gera nomes de variáveis e literais, válidos e inválidos"""
+    gerador = random.Random(semente)
+    letras = 'abcdefghijklmnopqrstuvwxyz_ABCçã'
+    digitos = '0123456789'
+    candidatos = []
+    for indice in range(quantidade):
+        forma = indice % 4
+        tamanho = gerador.randint(1, 12)
+        if forma == 0:
+            texto = gerador.choice(letras) + ''.join(gerador.choice(letras + digitos) for _ in range(tamanho))
+        elif forma == 1:
+            texto = ''.join(gerador.choice(digitos) for _ in range(tamanho))
+        elif forma == 2:
+            texto = ''.join(gerador.choice(digitos) for _ in range(tamanho)) + '.' + gerador.choice(digitos)
+        else:
+            texto = ''.join(gerador.choice(letras + digitos + '.-$ ') for _ in range(tamanho))
+        candidatos.append(texto)
+    return candidatos
+
+
+def medir(funcao, repeticoes=3):
+    """Retorna o melhor tempo (em segundos) entre as repetições"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    candidatos = gerar_candidatos(quantidade)
+    validador = ValidadorTokensAFD()
+
+    individual = [validador.identificar_tipo_token(texto) for texto in candidatos]
+    lote = [TIPOS_VALIDACAO[codigo] for codigo in validador.classificar_lote(candidatos)]
+    assert individual == lote, "Classificações divergentes"
+
+    print(f"Candidatos: {quantidade}")
+    print("-" * 60)
+    tempo_individual = medir(lambda: [validador.identificar_tipo_token(texto) for texto in candidatos])
+    tempo_lote = medir(lambda: validador.classificar_lote(candidatos))
+    for nome, tempo in (('por texto', tempo_individual), ('em lote', tempo_lote)):
+        print(f"{nome:12} {tempo:8.3f} s  {quantidade / tempo / 1e3:9.1f} ktextos/s  "
+              f"({tempo_individual / tempo:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Geração de programas Portugol sintéticos para os benchmarks
+
+Os programas gerados exercitam todas as categorias de tokens
+(palavras-chave, identificadores, números, strings, operadores e
+comentários) e crescem linearmente com o número de blocos pedido.
+"""
+
+BLOCO = '''    // bloco {n}: comentario de linha
+    contador_{m} <- contador_{m} + {n} * 2 - (soma / 3.5)
+    /* comentario de bloco
+       em duas linhas */
+    se contador_{m} >= {n} e soma != 0.25 ou falso entao
+        escreva("Contador \\"{n}\\":", contador_{m}, soma % 7)
+    senao
+        soma <- soma ^ 2 - -contador_{m}
+    fimse
+    para i de 1 ate {n} passo 1 faca
+        soma <- soma + i
+    fimpara
+    enquanto soma > 1000 faca
+        soma <- soma - 1000
+    fimenquanto
+'''
+
+
+def gerar_programa(blocos: int, variaveis: int = 50) -> str:
+    """
+    Gera um programa Portugol válido
+
+    Args:
+        blocos: Quantidade de blocos de comandos (~15 linhas cada)
+        variaveis: Quantidade de variáveis contador distintas
+
+    Returns:
+        str: Código fonte do programa
+    """
+    nomes = ', '.join(f'contador_{m}' for m in range(variaveis))
+    partes = [
+        '/* Programa sintético para benchmarks */',
+        f'inteiro {nomes}, i;',
+        'real soma;',
+        '',
+        'inicio',
+        '    soma <- 0.0',
+    ]
+    for m in range(variaveis):
+        partes.append(f'    contador_{m} <- 0')
+    for n in range(blocos):
+        partes.append(BLOCO.format(n=n, m=n % variaveis))
+    partes.append('fim')
+    return '\n'.join(partes) + '\n'
+
+
+def gerar_programa_expressoes(linhas: int, termos: int = 12) -> str:
+    """
+    Gera um programa dominado por expressões
+
+    Cada linha atribui uma expressão com `termos` operandos, misturando
+    todos os níveis de precedência, parênteses, '^' encadeado e menos
+    unário; uma em cada quatro linhas atribui um literal isolado.
+
+    Args:
+        linhas: Quantidade de atribuições
+        termos: Operandos por expressão
+
+    Returns:
+        str: Código fonte do programa
+    """
+    operandos = ('a', 'b', 'c', '2', '3.5', '(a - 1)', '-b', '(b + c * 2)')
+    operadores = (' + ', ' - ', ' * ', ' / ', ' % ', ' ^ ')
+    partes = ['inteiro a, b, c;', 'logico r;', 'inicio', '    a <- 1', '    b <- 2', '    c <- 3']
+    for n in range(linhas):
+        if n % 4 == 3:
+            partes.append(f'    a <- {n}')
+            continue
+        expressao = operandos[n % len(operandos)]
+        for t in range(1, termos):
+            expressao += operadores[(n + t) % len(operadores)] + operandos[(n * 3 + t) % len(operandos)]
+        if n % 4 == 2:
+            partes.append(f'    r <- {expressao} >= a e b < c ou nao_usado == 0')
+        else:
+            partes.append(f'    c <- {expressao}')
+    partes.append('fim')
+    return '\n'.join(partes) + '\n'
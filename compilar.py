@@ -10,12 +10,26 @@ Opções:
     --intermediate  Mostra código intermediário (3 endereços)
     --optimize      Aplica otimizações no código intermediário
     --show-afd      Demonstra AFDs de reconhecimento de tokens
+    --lexer=MOTOR   Seleciona o motor léxico (imperativo, regex, afd, tabelado)
+    --streaming     Lê o arquivo em blocos (arquivos muito grandes)
+    --paralelo      Tokeniza arquivos grandes em vários processos
+    --bytes         Analisa os bytes UTF-8 do arquivo (BOM e CRLF no lexer)
+    --parser=MOTOR  Seleciona o analisador sintático (descendente, pratt, iterativo)
+    --recuperar     Relata todos os erros do programa em uma única compilação
+    --compartilhar  Compartilha subexpressões iguais da AST (hash-consing)
     
 Exemplos:
     python compilar.py programa.por
     python compilar.py programa.por --debug
     python compilar.py programa.por --intermediate --optimize
     python compilar.py programa.por --show-afd
+    python compilar.py programa.por --lexer=regex
+    python compilar.py gerado.por --streaming
+    python compilar.py gerado.por --paralelo
+    python compilar.py programa.por --bytes
+    python compilar.py programa.por --parser=pratt
+    python compilar.py programa.por --recuperar
+    python compilar.py gerado.por --compartilhar
 """
 
 import sys
@@ -29,6 +43,13 @@ def main():
     mostrar_intermediario = False
     otimizar = False
     mostrar_afd = False
+    motor_lexico = 'imperativo'
+    streaming = False
+    paralelo = False
+    modo_bytes = False
+    motor_sintatico = 'descendente'
+    recuperar = False
+    compartilhar = False
     
     # Processar argumentos
     args = sys.argv[1:]
@@ -50,6 +71,20 @@ def main():
             otimizar = True
         elif arg == '--show-afd':
             mostrar_afd = True
+        elif arg.startswith('--lexer='):
+            motor_lexico = arg.split('=', 1)[1]
+        elif arg == '--streaming':
+            streaming = True
+        elif arg == '--paralelo':
+            paralelo = True
+        elif arg == '--bytes':
+            modo_bytes = True
+        elif arg.startswith('--parser='):
+            motor_sintatico = arg.split('=', 1)[1]
+        elif arg == '--recuperar':
+            recuperar = True
+        elif arg == '--compartilhar':
+            compartilhar = True
         elif arg == '--help' or arg == '-h':
             print(__doc__)
             return 0
@@ -74,7 +109,14 @@ def main():
         compilador = CompiladorPortugol(
             debug=debug,
             mostrar_intermediario=mostrar_intermediario,
-            otimizar=otimizar
+            otimizar=otimizar,
+            motor_lexico=motor_lexico,
+            streaming=streaming,
+            paralelo=paralelo,
+            modo_bytes=modo_bytes,
+            motor_sintatico=motor_sintatico,
+            recuperar=recuperar,
+            compartilhar=compartilhar
         )
         
         # Compilar e executar
@@ -98,6 +140,10 @@ def main():
         print(f"❌ Erro: arquivo '{arquivo_entrada}' não encontrado")
         print("Certifique-se de que o arquivo existe no diretório atual")
         return 1
+    except ValueError as e:
+        # Motor inexistente ou opções incompatíveis
+        print(f"❌ Erro: {e}")
+        return 1
     except Exception as e:
         print(f"❌ Erro inesperado: {e}")
         return 1
@@ -5,7 +5,23 @@ Desenvolvido como projeto acadêmico
 
 Módulos:
 - lexer: Análise léxica (tokenização)
+- lexer_regex: Motor léxico por expressão regular mestre
+- lexer_streaming: Motor léxico em blocos para arquivos grandes
+- lexer_paralelo: Tokenização de arquivos grandes em vários processos
+- indice_linhas: Índice de linhas para resolver posições sob demanda
+- lexer_bytes: Motor léxico sobre os bytes UTF-8, sem decodificação prévia
+- lexer_afd: Motor léxico sobre os AFDs compilados em tabelas
+- gerador_afd: Geração do AFD léxico a partir das ERs (Thompson + subconjuntos)
+- lexer_tabelado: Motor léxico sobre o AFD gerado das ERs
+- fluxo_tokens: Buffer circular de tokens com lookahead para o parser
+- gerador_ll1: Geração da tabela LL(1) a partir da gramática
 - parser: Análise sintática (geração de AST)
+- parser_pratt: Expressões por tabela de precedência (Pratt)
+- parser_iterativo: Análise sintática sem recursão, com limites de profundidade e tamanho
+- parser_posfixo: Expressões em código pós-fixo, em um único array por programa
+- analise_incremental: Reanálise sintática e semântica incremental a partir de edições
+- analise_esqueleto: Declarações e contorno dos blocos, com os corpos analisados sob demanda
+- compartilhamento: Subexpressões iguais da AST como um único nó (hash-consing)
 - semantic: Análise semântica (validação de tipos)
 - codegen: Geração de código Python
 - ast_nodes: Definições dos nós da AST
@@ -16,15 +32,22 @@ __version__ = "1.0.0"
 __author__ = "Estudante de Compiladores"
 
 # Exportar classes principais para facilitar importação
-from .exceptions import CompiladorError, ErroLexico, ErroSintatico, ErroSemantico
+from .exceptions import CompiladorError, ErroLexico, ErroSintatico, ErroSemantico, AvisoSemantico
 from .lexer import Lexer
+from .lexer_regex import LexerRegex
+from .lexer_streaming import LexerStreaming
+from .lexer_bytes import LexerBytes
+from .lexer_afd import LexerAFD
+from .lexer_tabelado import LexerTabelado
 from .parser import Parser
+from .parser_pratt import ParserPratt
+from .parser_iterativo import ParserIterativo
 from .semantic import AnalisadorSemantico
 from .codegen import GeradorDeCodigo
 from .main import CompiladorPortugol
 
 __all__ = [
     'CompiladorPortugol',
-    'CompiladorError', 'ErroLexico', 'ErroSintatico', 'ErroSemantico',
-    'Lexer', 'Parser', 'AnalisadorSemantico', 'GeradorDeCodigo'
+    'CompiladorError', 'ErroLexico', 'ErroSintatico', 'ErroSemantico', 'AvisoSemantico',
+    'Lexer', 'LexerRegex', 'LexerStreaming', 'LexerBytes', 'LexerAFD', 'LexerTabelado', 'Parser', 'ParserPratt', 'ParserIterativo', 'AnalisadorSemantico', 'GeradorDeCodigo'
 ]
\ No newline at end of file
@@ -0,0 +1,245 @@
+"""
+Análise de esqueleto: declarações completas e corpos de blocos adiados
+
+Ferramentas que só precisam das declarações de variáveis ou do contorno
+dos blocos (índice de um editor, listagem de símbolos) pagariam, com
+`Parser.analisar`, a análise de todas as expressões de todos os laços. O
+`Esqueleto` analisa por completo apenas a seção de declarações; o corpo
+do programa e cada bloco 'se'/'enquanto'/'para' ficam registrados como
+intervalos de tokens e só são analisados quando acessados.
+
+VARREDURA:
+==========
+O código é tokenizado uma vez em um `BufferTokens`. Depois de 'inicio',
+apenas os tokens de estrutura (se, enquanto, para, os seus fechamentos,
+'inicio' e 'fim') interessam: uma expressão regular sobre o array de
+códigos de tipo os encontra em C, sem materializar os demais tokens. Uma
+pilha casa cada abertura com o seu fechamento e monta o contorno
+(`BlocoAdiado`, com os blocos internos de cada um). O custo total é o da
+tokenização mais uma passada sobre o array de bytes dos tipos.
+
+ANÁLISE SOB DEMANDA:
+====================
+`Esqueleto.comandos` analisa o corpo do programa, e `BlocoAdiado.comando`
+apenas o seu bloco, com o `ParserIterativo` posicionado no primeiro token
+do intervalo. Os nós de blocos internos obtidos assim são associados aos
+`BlocoAdiado` correspondentes (mesma ordem no código), que não são
+analisados de novo. `analisar()` devolve a mesma AST de `Parser.analisar`.
+
+ERROS:
+======
+Erros léxicos e das declarações são lançados na construção, como na
+análise completa. Um erro dentro de um bloco só aparece quando ele é
+analisado. Se a varredura encontra uma estrutura inválida (fechamento sem
+abertura correspondente, 'fim' dentro de um bloco, tokens após 'fim'), o
+corpo é analisado imediatamente para lançar o mesmo erro da análise
+completa.
+"""
+
+import re
+from typing import Iterator, List, Optional, Tuple, Type, Union
+from .ast_nodes import (
+    TipoToken, Programa, DeclaracaoVariavel, Comando, Condicional, Repeticao, RepeticaoPara
+)
+from .buffer_tokens import BufferTokens, CODIGOS_TIPO, CODIGO_EOF, TIPOS_TOKEN
+from .exceptions import ErroSintatico
+from .lexer import Lexer
+from .lexer_regex import LexerRegex
+from .parser import _FECHAMENTOS
+from .parser_iterativo import ParserIterativo
+
+
+_INICIO = TipoToken.INICIO
+_FIM = TipoToken.FIM
+
+# Código da abertura -> código do fechamento, como no array de tipos do buffer
+_FECHAMENTOS_POR_CODIGO = {
+    CODIGOS_TIPO[abertura]: CODIGOS_TIPO[fechamento] for abertura, fechamento in _FECHAMENTOS.items()
+}
+_CODIGO_FIM = CODIGOS_TIPO[_FIM]
+
+# Tokens de estrutura: um único byte cada no array de tipos do buffer
+_ESTRUTURA = re.compile(b'[' + b''.join(
+    re.escape(bytes([codigo]))
+    for codigo in (*_FECHAMENTOS_POR_CODIGO, *_FECHAMENTOS_POR_CODIGO.values(),
+                   CODIGOS_TIPO[_INICIO], _CODIGO_FIM)
+) + b']')
+
+
+class BlocoAdiado:
+    """
+    Bloco 'se'/'enquanto'/'para' do contorno, analisado sob demanda
+
+    Attributes:
+        tipo: Token de abertura (SE, ENQUANTO ou PARA)
+        linha, coluna: Posição da abertura
+        linha_fim, coluna_fim: Posição do fechamento
+        inicio, fim: Intervalo [inicio, fim) dos tokens do bloco no buffer
+        blocos: Blocos internos, na ordem do código
+    """
+
+    __slots__ = ('tipo', 'linha', 'coluna', 'linha_fim', 'coluna_fim', 'inicio', 'fim',
+                 'blocos', '_esqueleto', '_comando')
+
+    def __init__(self, esqueleto: 'Esqueleto', indice: int):
+        tokens = esqueleto.tokens
+        self.tipo = TIPOS_TOKEN[tokens.tipos[indice]]
+        self.linha = tokens.linhas[indice]
+        self.coluna = tokens.colunas[indice]
+        self.linha_fim = self.coluna_fim = 0
+        self.inicio = indice
+        self.fim = indice
+        self.blocos: List['BlocoAdiado'] = []
+        self._esqueleto = esqueleto
+        self._comando: Optional[Comando] = None
+
+    def fechar(self, indice: int) -> None:
+        """Registra o token de fechamento do bloco"""
+        tokens = self._esqueleto.tokens
+        self.linha_fim = tokens.linhas[indice]
+        self.coluna_fim = tokens.colunas[indice]
+        self.fim = indice + 1
+
+    @property
+    def analisado(self) -> bool:
+        """Se o nó do bloco já foi construído"""
+        return self._comando is not None
+
+    @property
+    def comando(self) -> Comando:
+        """
+        Nó do bloco (Condicional, Repeticao ou RepeticaoPara)
+
+        Raises:
+            ErroLexico, ErroSintatico: Se o bloco for inválido
+        """
+        if self._comando is None:
+            parser = self._esqueleto._criar_parser(self.inicio)
+            self._comando = parser._analisar_comando()
+            _associar([self], [self._comando])
+        return self._comando
+
+
+def _associar(blocos: List[BlocoAdiado], comandos: List[Comando]) -> None:
+    """Associa os nós de bloco dos comandos aos `BlocoAdiado` de mesma ordem"""
+    pilha: List[Tuple[List[BlocoAdiado], List[Comando]]] = [(blocos, comandos)]
+    while pilha:
+        blocos, comandos = pilha.pop()
+        internos = iter(blocos)
+        for comando in comandos:
+            if isinstance(comando, (Condicional, Repeticao, RepeticaoPara)):
+                bloco = next(internos)
+                bloco._comando = comando
+                if isinstance(comando, Condicional):
+                    pilha.append((bloco.blocos, comando.comandos_entao + comando.comandos_senao))
+                else:
+                    pilha.append((bloco.blocos, comando.comandos))
+
+
+class Esqueleto:
+    """
+    Declarações e contorno dos blocos de um programa (ver VARREDURA)
+
+    Args:
+        codigo_fonte: Código fonte, ou um BufferTokens já preenchido
+        classe_lexer: Motor léxico usado para tokenizar o código
+
+    Attributes:
+        declaracoes: Declarações de variáveis (analisadas por completo)
+        blocos: Blocos do corpo do programa, na ordem do código
+        tokens: BufferTokens com todos os tokens do programa
+
+    Raises:
+        ErroLexico: Se o código tiver um erro léxico
+        ErroSintatico: Se as declarações ou a estrutura dos blocos forem
+            inválidas (ver ERROS)
+    """
+
+    def __init__(self, codigo_fonte: Union[str, BufferTokens], classe_lexer: Type[Lexer] = LexerRegex):
+        if isinstance(codigo_fonte, BufferTokens):
+            self.tokens = codigo_fonte
+        else:
+            self.tokens = classe_lexer(codigo_fonte).tokenizar()
+        parser = self._criar_parser(0)
+        self.linha, self.coluna = parser.token_atual.linha, parser.token_atual.coluna
+        self.declaracoes: List[DeclaracaoVariavel] = parser._analisar_declaracoes()
+        if parser.token_atual.tipo is not _INICIO:
+            parser._esperar_token(_INICIO)
+        # O buffer já avançou além do token atual ('inicio')
+        self._inicio = self.tokens.cursor - 1
+        self.blocos: List[BlocoAdiado] = []
+        self._comandos: Optional[List[Comando]] = None
+        self._varrer()
+
+    def _criar_parser(self, indice: int) -> ParserIterativo:
+        """Parser com o primeiro token no índice do buffer"""
+        self.tokens.cursor = indice
+        return ParserIterativo(self.tokens)
+
+    def _varrer(self) -> None:
+        """Monta o contorno casando aberturas e fechamentos (ver VARREDURA)"""
+        tipos = self.tokens.tipos
+        abertos: List[BlocoAdiado] = []
+        # Código do fechamento esperado para cada bloco aberto
+        esperados: List[int] = []
+        atual = self.blocos
+        for ocorrencia in _ESTRUTURA.finditer(tipos, self._inicio + 1):
+            indice = ocorrencia.start()
+            codigo = tipos[indice]
+            fechamento = _FECHAMENTOS_POR_CODIGO.get(codigo)
+            if fechamento is not None:
+                bloco = BlocoAdiado(self, indice)
+                atual.append(bloco)
+                abertos.append(bloco)
+                esperados.append(fechamento)
+                atual = bloco.blocos
+            elif esperados and codigo == esperados[-1]:
+                esperados.pop()
+                abertos.pop().fechar(indice)
+                atual = abertos[-1].blocos if abertos else self.blocos
+            elif codigo == _CODIGO_FIM and not abertos and tipos[indice + 1] == CODIGO_EOF:
+                return
+            else:
+                break
+        self._erro_estrutural()
+
+    def _erro_estrutural(self) -> None:
+        """Lança o erro da análise completa para uma estrutura inválida"""
+        self.comandos
+        token = self.tokens.token(self._inicio)
+        raise ErroSintatico("Estrutura de blocos inválida", token.linha, token.coluna)
+
+    @property
+    def comandos(self) -> List[Comando]:
+        """
+        Comandos do corpo do programa, analisados no primeiro acesso
+
+        Raises:
+            ErroLexico, ErroSintatico: Se o corpo for inválido
+        """
+        if self._comandos is None:
+            parser = self._criar_parser(self._inicio)
+            parser._esperar_token(_INICIO)
+            comandos = parser._analisar_comandos()
+            parser._esperar_token(_FIM)
+            parser._esperar_token(TipoToken.EOF)
+            _associar(self.blocos, comandos)
+            self._comandos = comandos
+        return self._comandos
+
+    def analisar(self) -> Programa:
+        """
+        AST completa, igual à de `Parser.analisar`
+
+        Raises:
+            ErroLexico, ErroSintatico: Se o corpo for inválido
+        """
+        return Programa(self.declaracoes, self.comandos, linha=self.linha, coluna=self.coluna)
+
+    def contorno(self) -> Iterator[Tuple[int, BlocoAdiado]]:
+        """Blocos em pré-ordem com o nível de aninhamento (0 no corpo do programa)"""
+        pilha = [(0, bloco) for bloco in reversed(self.blocos)]
+        while pilha:
+            nivel, bloco = pilha.pop()
+            yield nivel, bloco
+            pilha.extend((nivel + 1, interno) for interno in reversed(bloco.blocos))
@@ -0,0 +1,639 @@
+"""
+Análise sintática e semântica incremental a partir de edições
+
+Editores e modos de observação chamam `Parser.analisar` e
+`AnalisadorSemantico.analisar` sobre o programa inteiro a cada tecla. A
+`AnaliseIncremental` guarda a AST anterior junto com o trecho de cada
+comando e, a cada edição, reanalisa apenas o menor bloco afetado: os
+demais nós são reaproveitados (são os mesmos objetos) e a AST é
+atualizada no lugar.
+
+TRECHOS:
+========
+Cada lista de comandos da AST (corpo do programa, 'entao', 'senao' e
+corpo dos laços) tem um `_Bloco` com, para cada comando, o estado do
+lexer no seu primeiro token (deslocamento, linha e coluna), e o estado
+logo após o token que abre a lista e o do token que a fecha. Deslocamentos
+e linhas são relativos ao primeiro token do comando que contém o bloco:
+uma edição desloca só os comandos seguintes das listas que a contêm, e
+os blocos internos desses comandos continuam válidos.
+
+REANÁLISE:
+==========
+A edição é localizada descendo pelos blocos cujo interior (entre o token
+de abertura e o de fechamento) a contém. No bloco mais interno, o lexer
+reinicia no primeiro token do último comando que começa antes da edição
+(ou logo após a abertura) — texto anterior à edição, portanto o mesmo
+estado de antes (ver `lexer_incremental.py`). Os comandos são analisados
+até que o próximo token, já depois da edição, coincida em deslocamento
+(menos delta), linha (menos a diferença de linhas) e coluna com o início
+de um comando antigo ou com o fechamento do bloco: daí em diante os
+tokens e os comandos se repetem e são reaproveitados.
+
+Se o fechamento não coincide (ex.: um 'fimse' digitado ou apagado), o
+bloco externo é reanalisado a partir do comando que contém o interno; no
+corpo do programa, a análise é completa. Edições nas declarações
+reanalisam só as declarações; edições em 'inicio', 'fim' ou após 'fim'
+reanalisam tudo.
+
+Um erro léxico ou sintático no trecho reanalisado é o mesmo que a análise
+completa lançaria (o parser chega ao trecho no mesmo estado): ele é
+lançado e a edição seguinte recomeça com uma análise completa.
+
+VERIFICAÇÃO SEMÂNTICA:
+======================
+Os erros de um comando (sem os blocos internos) dependem apenas dos tipos
+declarados das variáveis que ele usa. Cada comando guarda seus erros e
+esses nomes; são verificados de novo apenas os comandos reanalisados e,
+quando as declarações mudam, os que usam uma variável cujo tipo ou
+índice de símbolo (a posição entre as declarações) mudou.
+`erros` reúne os erros na ordem da análise completa no modo de
+recuperação. O aviso de variável possivelmente não inicializada depende
+da ordem do programa inteiro e não é emitido aqui. A verificação também
+renova as anotações semânticas dos nós do comando (tipos e símbolos); as
+dos comandos não verificados continuam valendo, pois o tipo e o índice
+das variáveis que eles usam não mudaram.
+
+CUSTO:
+======
+Uma edição dentro de uma linha custa a reanálise dos comandos dela, mais
+o deslocamento dos arrays de posições das listas que a contêm (uma
+compreensão de inteiros, sem análise). Uma edição que acrescenta ou
+remove linhas também renumera a linha dos nós seguintes da AST.
+"""
+
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Type
+from .ast_nodes import (
+    TipoToken, Token, Programa, DeclaracaoVariavel,
+    Comando, Atribuicao, Condicional, Repeticao, RepeticaoPara, Saida,
+    Expressao, ExpressaoBinaria, ExpressaoUnaria
+)
+from .exceptions import CompiladorError, ErroSemantico
+from .lexer import Lexer
+from .lexer_regex import LexerRegex
+from .parser import _FIM_DE_BLOCO, _PRODUCAO_COMANDO
+from .parser_pratt import ParserPratt
+from .semantic import AnalisadorSemantico, Simbolo
+
+
+# Estado do lexer: (deslocamento, linha, coluna)
+Estado = Tuple[int, int, int]
+
+
+@dataclass(slots=True)
+class _TokenPosicionado(Token):
+    """Token com o deslocamento inicial e o estado do lexer após o token anterior"""
+    inicio: int = 0
+    anterior: Estado = (0, 1, 1)
+
+
+class _FontePosicionada:
+    """Fonte de tokens que registra as posições de cada token do lexer"""
+
+    def __init__(self, lexer: Lexer):
+        self.lexer = lexer
+        self._estado: Estado = (lexer.posicao_atual, lexer.linha, lexer.coluna)
+
+    def proximo_token(self) -> _TokenPosicionado:
+        lexer = self.lexer
+        anterior = self._estado
+        lexer._ignorar_espacos_e_comentarios()
+        inicio = lexer.posicao_atual
+        token = lexer.proximo_token()
+        self._estado = (lexer.posicao_atual, lexer.linha, lexer.coluna)
+        return _TokenPosicionado(token.tipo, token.lexema, token.linha, token.coluna, inicio, anterior)
+
+
+def _deslocar(valores: array, desde: int, delta: int) -> None:
+    """Soma delta aos valores a partir do índice `desde`"""
+    if delta and desde < len(valores):
+        valores[desde:] = array('i', [valor + delta for valor in valores[desde:]])
+
+
+class _Bloco:
+    """
+    Trechos dos comandos de uma lista da AST (ver TRECHOS)
+
+    Args:
+        abertura: Estado do lexer logo após o token que abre a lista
+    """
+
+    __slots__ = ('comandos', 'inicios', 'linhas', 'colunas', 'filhos', 'erros', 'nomes',
+                 'abertura', 'fechamento', 'pai', 'total')
+
+    def __init__(self, abertura: Estado):
+        self.comandos: List[Comando] = []
+        self.inicios = array('i')
+        self.linhas = array('i')
+        self.colunas = array('i')
+        # Blocos de cada comando ('entao' e 'senao' de um se, corpo dos laços)
+        self.filhos: List[Tuple['_Bloco', ...]] = []
+        # Erros semânticos próprios de cada comando e as variáveis que ele usa
+        self.erros: List[Tuple[ErroSemantico, ...]] = []
+        self.nomes: List[FrozenSet[str]] = []
+        self.abertura = abertura
+        self.fechamento: Tuple[int, int, int, TipoToken] = (0, 0, 0, TipoToken.EOF)
+        self.pai: Optional['_Bloco'] = None
+        # Quantidade de erros semânticos dos comandos do bloco e dos internos
+        self.total = 0
+
+    def adicionar(self, comando: Comando, token: _TokenPosicionado, filhos: Tuple['_Bloco', ...]) -> None:
+        """Registra um comando analisado (posições absolutas)"""
+        self.comandos.append(comando)
+        self.inicios.append(token.inicio)
+        self.linhas.append(token.linha)
+        self.colunas.append(token.coluna)
+        self.filhos.append(filhos)
+        self.erros.append(())
+        self.nomes.append(frozenset())
+        for filho in filhos:
+            filho.pai = self
+
+    def fechar(self, token: _TokenPosicionado) -> None:
+        """Registra o token que encerra a lista"""
+        self.fechamento = (token.inicio, token.linha, token.coluna, token.tipo)
+
+    def relativizar(self, base: int, base_linha: int) -> None:
+        """Torna as posições relativas ao primeiro token do comando que contém o bloco"""
+        self.deslocar(0, -base, -base_linha)
+        deslocamento, linha, coluna = self.abertura
+        self.abertura = (deslocamento - base, linha - base_linha, coluna)
+
+    def deslocar(self, desde: int, delta: int, linhas: int) -> None:
+        """Desloca os comandos a partir de `desde` e o fechamento"""
+        _deslocar(self.inicios, desde, delta)
+        _deslocar(self.linhas, desde, linhas)
+        deslocamento, linha, coluna, tipo = self.fechamento
+        self.fechamento = (deslocamento + delta, linha + linhas, coluna, tipo)
+
+    def substituir(self, inicio: int, fim: int, registros: List[Tuple[Comando, _TokenPosicionado, tuple]],
+                   base: int, base_linha: int, delta: int, linhas: int) -> None:
+        """
+        Troca os comandos [inicio, fim) pelos reanalisados
+
+        Os comandos seguintes são deslocados por delta/linhas; a lista da
+        AST é alterada no lugar.
+        """
+        self.deslocar(fim, delta, linhas)
+        quantidade = len(registros)
+        self.comandos[inicio:fim] = [comando for comando, _, _ in registros]
+        self.inicios[inicio:fim] = array('i', [token.inicio - base for _, token, _ in registros])
+        self.linhas[inicio:fim] = array('i', [token.linha - base_linha for _, token, _ in registros])
+        self.colunas[inicio:fim] = array('i', [token.coluna for _, token, _ in registros])
+        self.filhos[inicio:fim] = [filhos for _, _, filhos in registros]
+        self.erros[inicio:fim] = [()] * quantidade
+        self.nomes[inicio:fim] = [frozenset()] * quantidade
+        for _, _, filhos in registros:
+            for filho in filhos:
+                filho.pai = self
+
+    def contribuicao(self, indice: int) -> int:
+        """Erros semânticos do comando no índice, incluindo os dos blocos internos"""
+        return len(self.erros[indice]) + sum(filho.total for filho in self.filhos[indice])
+
+
+class _ParserComTrechos(ParserPratt):
+    """
+    ParserPratt que registra o `_Bloco` de cada lista de comandos
+
+    Args:
+        lexer: Lexer já posicionado no ponto de reinício
+    """
+
+    def __init__(self, lexer: Lexer):
+        self._filhos: List[List[_Bloco]] = []
+        self.raiz: Optional[_Bloco] = None
+        self.inicio: Optional[_TokenPosicionado] = None
+        self.analisados = 0
+        super().__init__(_FontePosicionada(lexer))
+
+    def analisar_comando_registrado(self) -> Optional[Tuple[Comando, _TokenPosicionado, Tuple[_Bloco, ...]]]:
+        """
+        Analisa um comando registrando os blocos internos
+
+        Returns:
+            (comando, primeiro token, blocos internos com posições relativas
+            ao primeiro token), ou None se o token atual encerra o bloco
+        """
+        token = self.token_atual
+        filhos: List[_Bloco] = []
+        self._filhos.append(filhos)
+        comando = self._analisar_comando()
+        self._filhos.pop()
+        if comando is None:
+            return None
+        self.analisados += 1
+        for filho in filhos:
+            filho.relativizar(token.inicio, token.linha)
+        return comando, token, tuple(filhos)
+
+    def _analisar_declaracoes(self) -> List[DeclaracaoVariavel]:
+        """Analisa as declarações e guarda o token seguinte ('inicio')"""
+        declaracoes = super()._analisar_declaracoes()
+        self.inicio = self.token_atual
+        return declaracoes
+
+    def _analisar_bloco(self, fechamento: TipoToken = TipoToken.FIM, senao: bool = False) -> List[Comando]:
+        """Analisa comandos até um token que encerra o bloco, registrando seus trechos"""
+        bloco = _Bloco(self.token_atual.anterior)
+        if self._filhos:
+            self._filhos[-1].append(bloco)
+        else:
+            self.raiz = bloco
+        registro = self.analisar_comando_registrado()
+        while registro is not None:
+            bloco.adicionar(*registro)
+            registro = self.analisar_comando_registrado()
+        bloco.fechar(self.token_atual)
+        return bloco.comandos
+
+
+class _VerificadorComandos(AnalisadorSemantico):
+    """
+    Analisador semântico que verifica um comando por vez
+
+    As declarações são registradas na criação; todas as variáveis contam
+    como inicializadas (ver VERIFICAÇÃO SEMÂNTICA).
+
+    Args:
+        declaracoes: Declarações do programa
+    """
+
+    def __init__(self, declaracoes: List[DeclaracaoVariavel]):
+        super().__init__(recuperar=True)
+        for declaracao in declaracoes:
+            try:
+                self._analisar_declaracao(declaracao)
+            except ErroSemantico as erro:
+                self._relatar(erro)
+        self.erros_declaracoes = self.erros
+        for nome in self.tabela_simbolos.simbolos:
+            self.tabela_simbolos.marcar_como_inicializada(nome)
+        # Todos os bits: nenhuma leitura gera aviso
+        self._atribuidas = -1
+        self.nomes: Set[str] = set()
+
+    def declarados(self) -> Dict[str, Tuple[str, int]]:
+        """Tipo declarado e índice do símbolo de cada variável"""
+        return {nome: (simbolo.tipo, simbolo.indice) for nome, simbolo in self.tabela_simbolos.simbolos.items()}
+
+    def _resolver(self, nome: str, linha: int, coluna: int) -> Optional[Simbolo]:
+        """Registra o nome usado e resolve o símbolo"""
+        self.nomes.add(nome)
+        return super()._resolver(nome, linha, coluna)
+
+    def verificar(self, comando: Comando) -> Tuple[Tuple[ErroSemantico, ...], FrozenSet[str]]:
+        """
+        Verifica o comando, sem os blocos internos
+
+        Returns:
+            (erros do comando, variáveis que ele usa)
+        """
+        self.erros = []
+        self.nomes = set()
+        etapas = self._iniciar_comando(comando)
+        if etapas is not None:
+            # As verificações próprias vêm antes do primeiro bloco
+            next(etapas)
+        return tuple(self.erros), frozenset(self.nomes)
+
+
+def _expressoes(comando: Comando) -> List[Expressao]:
+    """Expressões do próprio comando (sem as dos blocos internos)"""
+    if isinstance(comando, Atribuicao):
+        return [comando.expressao]
+    if isinstance(comando, (Condicional, Repeticao)):
+        return [comando.condicao]
+    if isinstance(comando, RepeticaoPara):
+        return [comando.inicio, comando.fim, comando.passo]
+    if isinstance(comando, Saida):
+        return list(comando.expressoes)
+    return []
+
+
+def _deslocar_linhas_comando(comando: Comando, linhas: int) -> None:
+    """Soma `linhas` à linha do comando e dos nós das suas expressões"""
+    pilha: list = [comando, *_expressoes(comando)]
+    while pilha:
+        no = pilha.pop()
+        no.linha += linhas
+        if isinstance(no, ExpressaoBinaria):
+            pilha.append(no.esquerda)
+            pilha.append(no.direita)
+        elif isinstance(no, ExpressaoUnaria):
+            pilha.append(no.operando)
+
+
+class AnaliseIncremental:
+    """
+    AST e erros semânticos mantidos a cada edição do código
+
+    Args:
+        codigo_fonte: Código fonte inicial
+        classe_lexer: Motor léxico usado nas análises
+
+    Raises:
+        ErroLexico, ErroSintatico: Se o código inicial for inválido
+    """
+
+    def __init__(self, codigo_fonte: str, classe_lexer: Type[Lexer] = LexerRegex):
+        self.codigo_fonte = codigo_fonte
+        self.classe_lexer = classe_lexer
+        self.ast: Optional[Programa] = None
+        # Comandos analisados e verificados na última edição
+        self.comandos_analisados = 0
+        self.comandos_verificados = 0
+        self._raiz: Optional[_Bloco] = None
+        self._inicio: Estado = (0, 0, 0)
+        self._verificador: Optional[_VerificadorComandos] = None
+        self._analisar_tudo()
+
+    @property
+    def erros(self) -> List[ErroSemantico]:
+        """Erros semânticos do programa atual, na ordem da análise completa"""
+        if self.ast is None:
+            return []
+        erros = list(self._verificador.erros_declaracoes)
+        if not self._raiz.total:
+            return erros
+        pilha = [(self._raiz, iter(range(len(self._raiz.comandos))))]
+        while pilha:
+            bloco, indices = pilha[-1]
+            indice = next(indices, None)
+            if indice is None:
+                pilha.pop()
+                continue
+            erros.extend(bloco.erros[indice])
+            for filho in reversed(bloco.filhos[indice]):
+                if filho.total:
+                    pilha.append((filho, iter(range(len(filho.comandos)))))
+        return erros
+
+    def editar(self, deslocamento: int, removidos: int, inseridos: str) -> Programa:
+        """
+        Aplica uma edição ao código e atualiza a AST e os erros semânticos
+
+        Args:
+            deslocamento: Posição da edição no código atual
+            removidos: Quantidade de caracteres removidos a partir do deslocamento
+            inseridos: Texto inserido no deslocamento
+
+        Returns:
+            Programa: AST do código editado, igual à de uma análise completa
+
+        Raises:
+            ErroLexico, ErroSintatico: Se o código editado for inválido
+            ValueError: Se a edição estiver fora do código
+        """
+        antigo = self.codigo_fonte
+        if deslocamento < 0 or removidos < 0 or deslocamento + removidos > len(antigo):
+            raise ValueError("Edição fora dos limites do código fonte")
+
+        self.codigo_fonte = antigo[:deslocamento] + inseridos + antigo[deslocamento + removidos:]
+        self.comandos_analisados = self.comandos_verificados = 0
+        if self.ast is None:
+            self._analisar_tudo()
+            return self.ast
+
+        delta = len(inseridos) - removidos
+        linhas = inseridos.count('\n') - antigo.count('\n', deslocamento, deslocamento + removidos)
+        try:
+            if not self._reanalisar(deslocamento, removidos, deslocamento + len(inseridos), delta, linhas):
+                self._analisar_tudo()
+        except CompiladorError:
+            self.ast = None
+            raise
+        return self.ast
+
+    def _criar_parser(self, estado: Estado) -> _ParserComTrechos:
+        """Parser sobre o código atual, com o lexer no estado dado"""
+        lexer = self.classe_lexer(self.codigo_fonte)
+        lexer.posicao_atual, lexer.linha, lexer.coluna = estado
+        return _ParserComTrechos(lexer)
+
+    def _analisar_tudo(self) -> None:
+        """Análise sintática e verificação semântica completas"""
+        self.ast = None
+        parser = self._criar_parser((0, 1, 1))
+        ast = parser.analisar()
+        self._raiz = parser.raiz
+        self._inicio = (parser.inicio.inicio, parser.inicio.linha, parser.inicio.coluna)
+        self._verificador = _VerificadorComandos(ast.declaracoes)
+        self._raiz.total = self._verificar(self._raiz, 0, len(self._raiz.comandos))
+        self.comandos_analisados = parser.analisados
+        self.ast = ast
+
+    def _reanalisar(self, deslocamento: int, removidos: int, fim_edicao: int,
+                    delta: int, linhas: int) -> bool:
+        """
+        Reanalisa o menor bloco que contém a edição (ver REANÁLISE)
+
+        Returns:
+            bool: False se for preciso analisar tudo
+        """
+        raiz = self._raiz
+        if deslocamento <= raiz.abertura[0]:
+            return self._reanalisar_declaracoes(fim_edicao, delta, linhas)
+        if deslocamento + removidos > raiz.fechamento[0]:
+            return False
+
+        cadeia = self._localizar(deslocamento, removidos)
+        for nivel in range(len(cadeia) - 1, -1, -1):
+            bloco, base, base_linha, indice = cadeia[nivel]
+            trecho = self._reanalisar_bloco(bloco, base, base_linha, indice, fim_edicao, delta, linhas)
+            if trecho is not None:
+                self._substituir(cadeia, nivel, trecho[0], trecho[1], delta, linhas)
+                return True
+        return False
+
+    def _localizar(self, deslocamento: int, removidos: int) -> List[Tuple[_Bloco, int, int, int]]:
+        """
+        Blocos que contêm a edição, do corpo do programa ao mais interno
+
+        Returns:
+            Lista de (bloco, deslocamento base, linha base, índice do
+            último comando que começa antes da edição, ou -1)
+        """
+        cadeia = []
+        bloco, base, base_linha = self._raiz, 0, 0
+        while True:
+            indice = bisect_left(bloco.inicios, deslocamento - base) - 1
+            cadeia.append((bloco, base, base_linha, indice))
+            if indice < 0:
+                return cadeia
+            base_comando = base + bloco.inicios[indice]
+            for filho in bloco.filhos[indice]:
+                if (base_comando + filho.abertura[0] < deslocamento
+                        and deslocamento + removidos <= base_comando + filho.fechamento[0]):
+                    bloco, base, base_linha = filho, base_comando, base_linha + bloco.linhas[indice]
+                    break
+            else:
+                return cadeia
+
+    def _reanalisar_bloco(self, bloco: _Bloco, base: int, base_linha: int, indice: int,
+                          fim_edicao: int, delta: int, linhas: int):
+        """
+        Reanalisa comandos do bloco até reencontrar um ponto antigo
+
+        Returns:
+            (índice do primeiro comando antigo reaproveitado, registros dos
+            comandos novos), ou None se o fechamento do bloco mudou
+
+        Raises:
+            ErroLexico, ErroSintatico: Erro no trecho reanalisado
+        """
+        if indice >= 0:
+            estado = (base + bloco.inicios[indice], base_linha + bloco.linhas[indice], bloco.colunas[indice])
+        else:
+            deslocamento, linha, coluna = bloco.abertura
+            estado = (base + deslocamento, base_linha + linha, coluna)
+        parser = self._criar_parser(estado)
+        if indice >= 0 and parser.token_atual.tipo not in _PRODUCAO_COMANDO:
+            # O primeiro token deixou de iniciar um comando
+            return None
+
+        registros = []
+        inicios = bloco.inicios
+        while True:
+            token = parser.token_atual
+            if token.inicio >= fim_edicao:
+                antigo = token.inicio - delta - base
+                linha = token.linha - linhas - base_linha
+                if token.tipo in _FIM_DE_BLOCO:
+                    if (antigo, linha, token.coluna, token.tipo) != bloco.fechamento:
+                        return None
+                    self.comandos_analisados = parser.analisados
+                    return len(bloco.comandos), registros
+                proximo = bisect_left(inicios, antigo)
+                if (proximo < len(inicios) and inicios[proximo] == antigo
+                        and bloco.linhas[proximo] == linha and bloco.colunas[proximo] == token.coluna):
+                    self.comandos_analisados = parser.analisados
+                    return proximo, registros
+            elif token.tipo in _FIM_DE_BLOCO:
+                return None
+            registros.append(parser.analisar_comando_registrado())
+
+    def _substituir(self, cadeia: List[Tuple[_Bloco, int, int, int]], nivel: int, fim: int,
+                    registros: list, delta: int, linhas: int) -> None:
+        """Aplica a reanálise do bloco da cadeia no nível dado e desloca os trechos seguintes"""
+        bloco, base, base_linha, indice = cadeia[nivel]
+        inicio = max(indice, 0)
+        removida = sum(bloco.contribuicao(i) for i in range(inicio, fim))
+        bloco.substituir(inicio, fim, registros, base, base_linha, delta, linhas)
+        novo_fim = inicio + len(registros)
+        self._propagar(bloco, self._verificar(bloco, inicio, novo_fim) - removida)
+        if linhas:
+            self._deslocar_linhas(bloco, novo_fim, linhas)
+
+        interno = bloco
+        for bloco, _, _, indice in reversed(cadeia[:nivel]):
+            posterior = False
+            for filho in bloco.filhos[indice]:
+                if posterior:
+                    # Ex.: 'senao' após uma edição no 'entao'
+                    deslocamento, linha, coluna = filho.abertura
+                    filho.abertura = (deslocamento + delta, linha + linhas, coluna)
+                    filho.deslocar(0, delta, linhas)
+                    if linhas:
+                        self._deslocar_linhas(filho, 0, linhas)
+                posterior = posterior or filho is interno
+            bloco.deslocar(indice + 1, delta, linhas)
+            if linhas:
+                self._deslocar_linhas(bloco, indice + 1, linhas)
+            interno = bloco
+
+    def _reanalisar_declaracoes(self, fim_edicao: int, delta: int, linhas: int) -> bool:
+        """
+        Reanalisa as declarações e verifica os comandos afetados
+
+        Returns:
+            bool: False se 'inicio' não foi reencontrado na mesma posição
+        """
+        parser = self._criar_parser((0, 1, 1))
+        primeiro = parser.token_atual
+        declaracoes = parser._analisar_declaracoes()
+        token = parser.inicio
+        if (token.tipo is not TipoToken.INICIO or token.inicio < fim_edicao
+                or (token.inicio - delta, token.linha - linhas, token.coluna) != self._inicio):
+            return False
+        self._inicio = (token.inicio, token.linha, token.coluna)
+        self.ast.declaracoes[:] = declaracoes
+        self.ast.linha, self.ast.coluna = primeiro.linha, primeiro.coluna
+
+        raiz = self._raiz
+        deslocamento, linha, coluna = raiz.abertura
+        raiz.abertura = (deslocamento + delta, linha + linhas, coluna)
+        raiz.deslocar(0, delta, linhas)
+        if linhas:
+            self._deslocar_linhas(raiz, 0, linhas)
+
+        anteriores = self._verificador.declarados()
+        self._verificador = _VerificadorComandos(declaracoes)
+        atuais = self._verificador.declarados()
+        alterados = {nome for nome in anteriores.keys() | atuais.keys()
+                     if anteriores.get(nome) != atuais.get(nome)}
+        if alterados:
+            self._reverificar(alterados)
+        return True
+
+    def _verificar(self, bloco: _Bloco, inicio: int, fim: int) -> int:
+        """
+        Verifica os comandos [inicio, fim) do bloco e os dos blocos internos
+
+        Returns:
+            int: Erros semânticos desses comandos, incluindo os internos
+        """
+        verificar = self._verificador.verificar
+        internos = []
+        pilha = [(bloco, inicio, fim)]
+        while pilha:
+            atual, de, ate = pilha.pop()
+            for indice in range(de, ate):
+                atual.erros[indice], atual.nomes[indice] = verificar(atual.comandos[indice])
+                for filho in atual.filhos[indice]:
+                    internos.append(filho)
+                    pilha.append((filho, 0, len(filho.comandos)))
+            self.comandos_verificados += ate - de
+        # Cada bloco interno aparece depois do bloco que o contém
+        for filho in reversed(internos):
+            filho.total = sum(filho.contribuicao(indice) for indice in range(len(filho.comandos)))
+        return sum(bloco.contribuicao(indice) for indice in range(inicio, fim))
+
+    def _reverificar(self, alterados: Set[str]) -> None:
+        """Verifica de novo os comandos que usam alguma variável alterada"""
+        verificar = self._verificador.verificar
+        pilha = [self._raiz]
+        while pilha:
+            bloco = pilha.pop()
+            for indice, nomes in enumerate(bloco.nomes):
+                if not alterados.isdisjoint(nomes):
+                    anteriores = len(bloco.erros[indice])
+                    bloco.erros[indice], bloco.nomes[indice] = verificar(bloco.comandos[indice])
+                    self.comandos_verificados += 1
+                    self._propagar(bloco, len(bloco.erros[indice]) - anteriores)
+                pilha.extend(bloco.filhos[indice])
+
+    @staticmethod
+    def _propagar(bloco: Optional[_Bloco], diferenca: int) -> None:
+        """Soma a diferença de erros ao total do bloco e dos que o contêm"""
+        if diferenca:
+            while bloco is not None:
+                bloco.total += diferenca
+                bloco = bloco.pai
+
+    @staticmethod
+    def _deslocar_linhas(bloco: _Bloco, desde: int, linhas: int) -> None:
+        """Renumera as linhas dos nós e erros dos comandos a partir de `desde`"""
+        pilha = [(bloco, desde)]
+        while pilha:
+            bloco, desde = pilha.pop()
+            for indice in range(desde, len(bloco.comandos)):
+                _deslocar_linhas_comando(bloco.comandos[indice], linhas)
+                for erro in bloco.erros[indice]:
+                    if erro.linha > 0:
+                        erro.linha += linhas
+                for filho in bloco.filhos[indice]:
+                    pilha.append((filho, 0))
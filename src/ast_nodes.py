@@ -3,12 +3,41 @@ Definições dos nós da Árvore Sintática Abstrata (AST)
 
 Este módulo contém todas as classes que representam os diferentes
 tipos de nós na AST gerada pelo parser.
+
+NÓS COMPACTOS
+=============
+Cada nó é uma dataclass com `slots=True`: os campos ficam em posições
+fixas do objeto, sem o dicionário de atributos por instância. Isso reduz
+a memória de cada nó e torna o acesso aos campos (feito a cada visita dos
+percursos semântico, intermediário e de geração de código) um acesso
+direto por descritor. Como consequência, nenhum atributo pode ser criado
+fora dos campos declarados: a posição (linha, coluna) é um campo de todo
+nó, passado pelo parser na construção.
+
+ANOTAÇÕES SEMÂNTICAS
+====================
+Alguns campos não vêm do parser: são preenchidos pela análise semântica
+durante a sua única passada, para que as fases seguintes os leiam em vez
+de refazer a inferência:
+
+    Expressao.tipo      tipo da expressão ('inteiro', 'real', 'caracter',
+                        'logico', ou 'erro' no modo de recuperação)
+    simbolo             `Simbolo` da variável usada, com o seu índice
+                        denso (Variavel, Atribuicao, Entrada,
+                        RepeticaoPara, DeclaracaoVariavel), ou None se
+                        ela não foi declarada
+
+Até a análise, valem None. Como a posição, não entram na comparação nem
+no repr dos nós.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 from enum import Enum
 
+if TYPE_CHECKING:
+    from .semantic import Simbolo
+
 
 class TipoToken(Enum):
     """Enumeração dos tipos de tokens da linguagem Portugol"""
@@ -75,9 +104,12 @@ class TipoToken(Enum):
     
     # Fim do arquivo
     EOF = "eof"
+    
+    # Trecho inválido (lexer no modo de recuperação)
+    ERRO = "erro"
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """Representa um token encontrado durante a análise léxica"""
     tipo: TipoToken
@@ -86,46 +118,57 @@ class Token:
     coluna: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AST:
-    """Classe base para todos os nós da Árvore Sintática Abstrata"""
-    pass
+    """
+    Classe base para todos os nós da Árvore Sintática Abstrata
 
+    Todos os nós usam `__slots__` (sem `__dict__` por instância) e guardam
+    a posição do seu primeiro token no código-fonte. A posição não entra na
+    comparação entre nós: duas árvores iguais em posições diferentes são
+    iguais. O passo implícito de um 'para' sem 'passo' é um literal 1
+    próprio de cada laço, na posição do 'para'.
+    """
+    linha: int = field(default=0, kw_only=True, compare=False, repr=False)
+    coluna: int = field(default=0, kw_only=True, compare=False, repr=False)
 
-@dataclass
+
+@dataclass(slots=True)
 class Comando(AST):
     """Classe base para todos os comandos"""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Expressao(AST):
-    """Classe base para todas as expressões"""
-    pass
+    """Classe base para todas as expressões (ver ANOTAÇÕES SEMÂNTICAS)"""
+    tipo: Optional[str] = field(default=None, kw_only=True, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Programa(AST):
     """Nó raiz da AST representando o programa completo"""
     declaracoes: List['DeclaracaoVariavel']
     comandos: List[Comando]
 
 
-@dataclass
+@dataclass(slots=True)
 class DeclaracaoVariavel(AST):
     """Declaração de uma variável com seu tipo"""
     tipo: str
     nome: str
+    simbolo: Optional['Simbolo'] = field(default=None, kw_only=True, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Atribuicao(Comando):
     """Comando de atribuição: variavel <- expressao"""
     variavel: str
     expressao: Expressao
+    simbolo: Optional['Simbolo'] = field(default=None, kw_only=True, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Condicional(Comando):
     """Comando condicional: se-entao-senao-fimse"""
     condicao: Expressao
@@ -133,14 +176,14 @@ class Condicional(Comando):
     comandos_senao: List[Comando] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Repeticao(Comando):
     """Comando de repetição: enquanto-faca-fimenquanto"""
     condicao: Expressao
     comandos: List[Comando]
 
 
-@dataclass
+@dataclass(slots=True)
 class RepeticaoPara(Comando):
     """Comando de repetição: para-de-ate-passo-faca-fimpara"""
     variavel: str
@@ -148,21 +191,23 @@ class RepeticaoPara(Comando):
     fim: Expressao
     passo: Expressao
     comandos: List[Comando]
+    simbolo: Optional['Simbolo'] = field(default=None, kw_only=True, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Entrada(Comando):
     """Comando de entrada: leia(variavel)"""
     variavel: str
+    simbolo: Optional['Simbolo'] = field(default=None, kw_only=True, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Saida(Comando):
     """Comando de saída: escreva(expressao, ...)"""
     expressoes: List[Expressao]
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpressaoBinaria(Expressao):
     """Expressão binária: esquerda operador direita"""
     esquerda: Expressao
@@ -170,20 +215,21 @@ class ExpressaoBinaria(Expressao):
     direita: Expressao
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpressaoUnaria(Expressao):
     """Expressão unária: operador operando"""
     operador: str
     operando: Expressao
 
 
-@dataclass
+@dataclass(slots=True)
 class Literal(Expressao):
     """Literal (número, string, booleano)"""
     valor: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Variavel(Expressao):
     """Referência a uma variável"""
-    nome: str
\ No newline at end of file
+    nome: str
+    simbolo: Optional['Simbolo'] = field(default=None, kw_only=True, compare=False, repr=False)
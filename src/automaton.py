@@ -23,9 +23,39 @@ Transições:
 - q0 --[a-zA-Z_]--> q1
 - q1 --[a-zA-Z0-9_]--> q1
 - qualquer outro → q_erro
+
+COMPILAÇÃO EM TABELAS:
+======================
+`AFD.transitar` resolve cada símbolo por dicionário e predicados, o que é
+didático mas lento. `compilar_afds` combina vários AFDs em um único AFD
+produto (estado = tupla com o estado de cada AFD) sobre classes de
+caracteres, gerando um `AFDTabelado`:
+
+- cada caractere Latin-1 é mapeado para sua classe por uma tabela de 256
+  entradas; os demais, pelos mesmos predicados dos AFDs;
+- estados são inteiros e as transições ficam em um único array plano;
+- o reconhecimento usa casamento mais longo (maximal munch), com a
+  prioridade dada pela ordem dos AFDs quando mais de um aceita.
+
+MINIMIZAÇÃO (HOPCROFT):
+=======================
+`AFDTabelado.minimizar` funde estados equivalentes refinando partições:
+começa separando os estados por token aceito (e o estado morto à parte)
+e divide cada bloco enquanto algum símbolo levar seus estados a blocos
+diferentes. O custo é O(n·k·log n) para n estados e k classes. Depois da
+fusão, colunas que ficaram idênticas também são fundidas.
+
+O estado morto nunca é fundido com estados vivos: o AFD mínimo para no
+mesmo ponto que o original em qualquer entrada, então os motores léxicos
+(que olham o último estado antes do estado morto) não mudam de comportamento.
+
+As tabelas podem ser exportadas para bytes (`exportar`) e carregadas de
+volta sem reconstrução (`AFDTabelado.importar`).
 """
 
-from typing import Dict, Set, Optional, Callable
+import struct
+from array import array
+from typing import Dict, Iterable, List, Set, Optional, Callable, Sequence, Tuple
 from enum import Enum
 
 
@@ -72,33 +102,54 @@ class AFD:
         Returns:
             bool: True se transição foi bem-sucedida, False se erro
         """
-        if self.estado_atual not in self.tabela_transicoes:
-            self.estado_atual = EstadoAFD.ERRO
-            return False
+        self.estado_atual = self.proximo_estado(self.estado_atual, simbolo)
+        return self.estado_atual != EstadoAFD.ERRO
+    
+    def proximo_estado(self, estado: EstadoAFD, simbolo: str) -> EstadoAFD:
+        """
+        Aplica a função de transição δ(estado, simbolo) sem alterar o AFD
         
-        transicoes = self.tabela_transicoes[self.estado_atual]
+        Args:
+            estado: Estado de origem
+            simbolo: Caractere de entrada
+            
+        Returns:
+            EstadoAFD: Estado de destino (ERRO se não há transição)
+        """
+        transicoes = self.tabela_transicoes.get(estado)
+        if transicoes is None:
+            return EstadoAFD.ERRO
         
         # Verificar transição direta
         if simbolo in transicoes:
-            self.estado_atual = transicoes[simbolo]
-            return True
+            return transicoes[simbolo]
         
         # Verificar transições por categoria (usando funções)
         for chave, proximo_estado in transicoes.items():
             if chave.startswith('_') and callable(getattr(self, chave, None)):
                 predicado = getattr(self, chave)
                 if predicado(simbolo):
-                    self.estado_atual = proximo_estado
-                    return True
+                    return proximo_estado
         
         # Nenhuma transição encontrada
-        self.estado_atual = EstadoAFD.ERRO
-        return False
+        return EstadoAFD.ERRO
     
     def esta_em_estado_final(self) -> bool:
         """Verifica se o estado atual é um estado final"""
         return self.estado_atual in self.estados_finais
     
+    def minimizar(self, nome: str = 'ACEITA') -> 'AFDTabelado':
+        """
+        Compila o AFD em tabelas e aplica a minimização de Hopcroft
+        
+        Args:
+            nome: Nome retornado pelo AFD tabelado nos estados finais
+            
+        Returns:
+            AFDTabelado: AFD mínimo equivalente
+        """
+        return compilar_afds([(nome, self)]).minimizar()
+    
     def processar_string(self, entrada: str) -> bool:
         """
         Processa uma string completa
@@ -226,6 +277,14 @@ class AFDNumeroReal(AFD):
         return char.isdigit()
 
 
+# Códigos da validação em lote (índices em TIPOS_VALIDACAO)
+TIPOS_VALIDACAO = ('desconhecido', 'identificador', 'inteiro', 'real')
+CODIGO_DESCONHECIDO = 0
+CODIGO_IDENTIFICADOR = 1
+CODIGO_INTEIRO = 2
+CODIGO_REAL = 3
+
+
 class ValidadorTokensAFD:
     """
     Classe utilitária que usa AFDs para validar tokens
@@ -237,6 +296,9 @@ class ValidadorTokensAFD:
         self.afd_identificador = AFDIdentificador()
         self.afd_numero_inteiro = AFDNumeroInteiro()
         self.afd_numero_real = AFDNumeroReal()
+        # Tabelas da validação em lote (compiladas no primeiro uso)
+        self._afd_lote: Optional['AFDTabelado'] = None
+        self._codigos_lote: List[int] = []
     
     def eh_identificador_valido(self, texto: str) -> bool:
         """
@@ -313,6 +375,452 @@ class ValidadorTokensAFD:
             return 'inteiro'
         else:
             return 'desconhecido'
+    
+    def classificar_lote(self, textos: Iterable[str]) -> array:
+        """
+        Classifica muitos textos de uma vez sobre as tabelas compiladas
+        
+        Equivale a `identificar_tipo_token` para cada texto, mas percorre o
+        AFD combinado mínimo (uma consulta de classe e uma de transição por
+        caractere), sem objetos AFD nem chamadas de predicado.
+        
+        Args:
+            textos: Iterável de strings a classificar
+            
+        Returns:
+            array: array('B') com um código por texto (índice em
+            TIPOS_VALIDACAO: 0 desconhecido, 1 identificador, 2 inteiro, 3 real)
+            
+        Exemplo:
+            >>> validador = ValidadorTokensAFD()
+            >>> list(validador.classificar_lote(["soma", "42", "3.14", "1a"]))
+            [1, 2, 3, 0]
+        """
+        if self._afd_lote is None:
+            self._afd_lote = compilar_afds_de_tokens().minimizar()
+            codigos = {'IDENTIFICADOR': CODIGO_IDENTIFICADOR, 'NUMERO_INTEIRO': CODIGO_INTEIRO,
+                       'NUMERO_REAL': CODIGO_REAL}
+            # Entrada extra no final: o estado morto (-1) indexa o último item
+            self._codigos_lote = [codigos.get(nome, CODIGO_DESCONHECIDO)
+                                  for nome in self._afd_lote.aceitacao] + [CODIGO_DESCONHECIDO]
+        afd = self._afd_lote
+        transicoes = afd.transicoes
+        latin1 = afd.deslocamentos_latin1
+        codigos_estado = self._codigos_lote
+        
+        resultado = array('B')
+        adicionar = resultado.append
+        for texto in textos:
+            estado = 0
+            for caractere in texto:
+                codigo = ord(caractere)
+                estado = transicoes[(latin1[codigo] if codigo < 256 else afd.deslocamento(caractere)) + estado]
+                if estado < 0:
+                    break
+            adicionar(codigos_estado[estado])
+        return resultado
+
+
+# Destino de uma transição inexistente nas tabelas compiladas
+ESTADO_MORTO = -1
+
+# Cabeçalho do formato binário: assinatura, estados, total de transições
+FORMATO_EXPORTACAO = '<4sii'
+ASSINATURA_EXPORTACAO = b'AFD1'
+
+
+class AFDTabelado:
+    """
+    AFD em forma de tabelas planas, com estados inteiros
+    
+    Estruturas:
+    - deslocamentos_latin1: para cada caractere de código < 256, o
+      deslocamento (classe * num_estados) da sua classe em `transicoes`
+    - transicoes: array('i') indexado por deslocamento + estado, com
+      ESTADO_MORTO quando não há transição
+    - aceitacao: nome do token aceito em cada estado (None se não final)
+    
+    O estado inicial é 0. Caracteres fora do Latin-1 são classificados por
+    `classificar_unicode` (com cache por caractere).
+    """
+    
+    def __init__(self, deslocamentos_latin1: Sequence[int], transicoes: Sequence[int],
+                 num_estados: int, aceitacao: Sequence[Optional[str]],
+                 classificar_unicode: Callable[[str], int]):
+        self.deslocamentos_latin1 = array('i', deslocamentos_latin1)
+        self.transicoes = array('i', transicoes)
+        self.num_estados = num_estados
+        self.aceitacao = list(aceitacao)
+        self.classificar_unicode = classificar_unicode
+        self._cache_unicode: Dict[str, int] = {}
+    
+    @property
+    def num_classes(self) -> int:
+        """Quantidade de classes de caracteres (colunas da tabela)"""
+        return len(self.transicoes) // self.num_estados
+    
+    def deslocamento(self, caractere: str) -> int:
+        """Deslocamento da classe do caractere em `transicoes`"""
+        codigo = ord(caractere)
+        if codigo < 256:
+            return self.deslocamentos_latin1[codigo]
+        deslocamento = self._cache_unicode.get(caractere)
+        if deslocamento is None:
+            deslocamento = self.classificar_unicode(caractere)
+            self._cache_unicode[caractere] = deslocamento
+        return deslocamento
+    
+    def reconhecer(self, texto: str, inicio: int = 0) -> Tuple[int, Optional[str]]:
+        """
+        Reconhece o maior prefixo aceito a partir de `inicio`
+        
+        Args:
+            texto: Texto de entrada
+            inicio: Posição inicial do reconhecimento
+            
+        Returns:
+            Tuple[int, Optional[str]]: (fim do token, nome do token), ou
+            (inicio, None) se nenhum prefixo é aceito
+        """
+        transicoes = self.transicoes
+        latin1 = self.deslocamentos_latin1
+        aceitacao = self.aceitacao
+        
+        estado = 0
+        fim, nome = inicio, None
+        posicao = inicio
+        tamanho = len(texto)
+        while posicao < tamanho:
+            caractere = texto[posicao]
+            codigo = ord(caractere)
+            deslocamento = latin1[codigo] if codigo < 256 else self.deslocamento(caractere)
+            estado = transicoes[deslocamento + estado]
+            if estado < 0:
+                break
+            posicao += 1
+            if aceitacao[estado] is not None:
+                fim, nome = posicao, aceitacao[estado]
+        return fim, nome
+    
+    def aceitar(self, texto: str) -> Optional[str]:
+        """Retorna o nome do token se o texto inteiro é aceito, senão None"""
+        fim, nome = self.reconhecer(texto)
+        return nome if fim == len(texto) and texto else None
+    
+    def contagens(self) -> Tuple[int, int]:
+        """Retorna (estados, transições para estados vivos)"""
+        transicoes = sum(1 for destino in self.transicoes if destino != ESTADO_MORTO)
+        return self.num_estados, transicoes
+    
+    def minimizar(self) -> 'AFDTabelado':
+        """
+        Retorna o AFD mínimo equivalente (algoritmo de Hopcroft)
+        
+        Estados inalcançáveis são descartados e o estado inicial continua
+        sendo 0. O resultado reconhece os mesmos tokens, com os mesmos
+        pontos de parada, que o AFD original.
+        
+        Returns:
+            AFDTabelado: Novo AFD com tabelas minimizadas
+        """
+        num_estados = self.num_estados
+        num_classes = self.num_classes
+        morto = num_estados  # estado morto explícito durante o refinamento
+        
+        # Transições inversas: inversas[classe][destino] = origens
+        inversas = [[[] for _ in range(num_estados + 1)] for _ in range(num_classes)]
+        for classe in range(num_classes):
+            base = classe * num_estados
+            inversa = inversas[classe]
+            for estado in range(num_estados):
+                destino = self.transicoes[base + estado]
+                inversa[morto if destino == ESTADO_MORTO else destino].append(estado)
+            inversa[morto].append(morto)
+        
+        # Partição inicial: um bloco por token aceito, morto à parte
+        por_aceitacao: Dict[Optional[str], List[int]] = {}
+        for estado in range(num_estados):
+            por_aceitacao.setdefault(self.aceitacao[estado], []).append(estado)
+        blocos: List[Set[int]] = [set(estados) for estados in por_aceitacao.values()]
+        blocos.append({morto})
+        bloco_de = [0] * (num_estados + 1)
+        for numero, bloco in enumerate(blocos):
+            for estado in bloco:
+                bloco_de[estado] = numero
+        
+        pendentes = set(range(len(blocos)))
+        while pendentes:
+            divisor = list(blocos[pendentes.pop()])
+            for inversa in inversas:
+                # Estados que levam ao divisor, agrupados por bloco
+                origens: Dict[int, List[int]] = {}
+                for destino in divisor:
+                    for origem in inversa[destino]:
+                        origens.setdefault(bloco_de[origem], []).append(origem)
+                for numero, estados in origens.items():
+                    bloco = blocos[numero]
+                    if len(estados) == len(bloco):
+                        continue
+                    parte = set(estados)
+                    resto = bloco - parte
+                    novo = len(blocos)
+                    # O bloco original fica com a parte maior
+                    if len(parte) > len(resto):
+                        parte, resto = resto, parte
+                    blocos[numero] = resto
+                    blocos.append(parte)
+                    for estado in parte:
+                        bloco_de[estado] = novo
+                    if numero in pendentes:
+                        pendentes.add(novo)
+                    else:
+                        pendentes.add(novo if len(parte) <= len(resto) else numero)
+        
+        # Renumeração em largura a partir do inicial (só blocos alcançáveis)
+        bloco_morto = bloco_de[morto]
+        numeros = {bloco_de[0]: 0}
+        ordem = [bloco_de[0]]
+        for numero in ordem:
+            representante = next(iter(blocos[numero]))
+            for classe in range(num_classes):
+                destino = self.transicoes[classe * num_estados + representante]
+                if destino == ESTADO_MORTO or bloco_de[destino] == bloco_morto:
+                    continue
+                if bloco_de[destino] not in numeros:
+                    numeros[bloco_de[destino]] = len(ordem)
+                    ordem.append(bloco_de[destino])
+        novos_estados = len(ordem)
+        representantes = [next(iter(blocos[numero])) for numero in ordem]
+        
+        def novo_destino(estado: int) -> int:
+            return ESTADO_MORTO if estado == ESTADO_MORTO else numeros[bloco_de[estado]]
+        
+        # Novas colunas, fundindo as que ficaram idênticas
+        colunas: Dict[Tuple[int, ...], int] = {}
+        transicoes: List[int] = []
+        deslocamento_novo = []
+        for classe in range(num_classes):
+            base = classe * num_estados
+            coluna = tuple(novo_destino(self.transicoes[base + estado]) for estado in representantes)
+            if coluna not in colunas:
+                colunas[coluna] = len(colunas) * novos_estados
+                transicoes.extend(coluna)
+            deslocamento_novo.append(colunas[coluna])
+        
+        classificar_original = self.classificar_unicode
+        
+        def classificar(caractere: str) -> int:
+            return deslocamento_novo[classificar_original(caractere) // num_estados]
+        
+        return AFDTabelado(
+            [deslocamento_novo[deslocamento // num_estados] for deslocamento in self.deslocamentos_latin1],
+            transicoes, novos_estados,
+            [self.aceitacao[estado] for estado in representantes],
+            classificar,
+        )
+    
+    def exportar(self) -> bytes:
+        """
+        Serializa as tabelas em formato binário compacto
+        
+        Formato: cabeçalho FORMATO_EXPORTACAO (assinatura, estados, total de
+        transições), 256 deslocamentos Latin-1 e as transições como int32,
+        seguidos dos nomes aceitos em UTF-8 (um por estado, separados por
+        '\\n'; vazio para estados não finais).
+        
+        A classificação de caracteres fora do Latin-1 é uma função e não é
+        exportada: deve ser fornecida de novo em `importar`.
+        """
+        nomes = '\n'.join(nome or '' for nome in self.aceitacao).encode('utf-8')
+        return (struct.pack(FORMATO_EXPORTACAO, ASSINATURA_EXPORTACAO,
+                            self.num_estados, len(self.transicoes))
+                + array('i', self.deslocamentos_latin1).tobytes()
+                + array('i', self.transicoes).tobytes()
+                + nomes)
+    
+    @classmethod
+    def importar(cls, dados: bytes, classificar_unicode: Callable[[str], int]) -> 'AFDTabelado':
+        """
+        Carrega tabelas geradas por `exportar`, sem reconstruir o AFD
+        
+        Args:
+            dados: Bytes produzidos por `exportar`
+            classificar_unicode: Deslocamento da classe de caracteres >= 256
+            
+        Returns:
+            AFDTabelado: AFD com as tabelas carregadas
+            
+        Raises:
+            ValueError: Se os dados não estiverem no formato esperado
+        """
+        tamanho_cabecalho = struct.calcsize(FORMATO_EXPORTACAO)
+        if len(dados) < tamanho_cabecalho:
+            raise ValueError("Dados de AFD truncados")
+        assinatura, num_estados, num_transicoes = struct.unpack_from(FORMATO_EXPORTACAO, dados)
+        if assinatura != ASSINATURA_EXPORTACAO:
+            raise ValueError("Dados não contêm um AFD exportado")
+        
+        latin1 = array('i')
+        transicoes = array('i')
+        inicio = tamanho_cabecalho
+        fim_latin1 = inicio + 256 * latin1.itemsize
+        fim_transicoes = fim_latin1 + num_transicoes * transicoes.itemsize
+        if len(dados) < fim_transicoes:
+            raise ValueError("Dados de AFD truncados")
+        latin1.frombytes(dados[inicio:fim_latin1])
+        transicoes.frombytes(dados[fim_latin1:fim_transicoes])
+        nomes = bytes(dados[fim_transicoes:]).decode('utf-8').split('\n')
+        if len(nomes) != num_estados:
+            raise ValueError("Dados de AFD truncados")
+        return cls(latin1, transicoes, num_estados, [nome or None for nome in nomes],
+                   classificar_unicode)
+
+
+def compilar_afds(afds: Sequence[Tuple[str, AFD]]) -> AFDTabelado:
+    """
+    Compila AFDs em um único AFD produto tabelado
+    
+    Classes de caracteres: cada caractere é descrito pelo vetor de valores
+    dos predicados dos AFDs (ex.: `_eh_digito`) ou, se for uma chave de
+    transição direta (ex.: '.'), pelo próprio caractere. Todas as
+    combinações de predicados recebem uma coluna, então qualquer caractere
+    Unicode tem classe definida. Colunas idênticas são fundidas.
+    
+    Args:
+        afds: Pares (nome do token, AFD) em ordem de prioridade
+        
+    Returns:
+        AFDTabelado: AFD combinado pronto para reconhecimento
+        
+    Exemplo:
+        >>> tabela = compilar_afds([('IDENTIFICADOR', AFDIdentificador())])
+        >>> tabela.reconhecer("soma + 1")
+        (4, 'IDENTIFICADOR')
+    """
+    # Predicados e chaves diretas usados em alguma transição
+    predicados: List[Tuple[int, str]] = []
+    diretas: List[str] = []
+    for indice, (_, afd) in enumerate(afds):
+        for transicoes in afd.tabela_transicoes.values():
+            for chave in transicoes:
+                if chave.startswith('_') and callable(getattr(afd, chave, None)):
+                    if (indice, chave) not in predicados:
+                        predicados.append((indice, chave))
+                elif chave not in diretas:
+                    diretas.append(chave)
+    
+    # Classe = vetor de predicados (sem chave direta) ou chave direta
+    classes: List[Tuple] = [
+        tuple(bool(vetor >> bit & 1) for bit in range(len(predicados)))
+        for vetor in range(1 << len(predicados))
+    ]
+    classes.extend(diretas)
+    
+    def destino(indice: int, estado: EstadoAFD, classe) -> EstadoAFD:
+        """δ de um AFD para uma classe (mesma ordem de `proximo_estado`)"""
+        afd = afds[indice][1]
+        if isinstance(classe, str):
+            return afd.proximo_estado(estado, classe)
+        transicoes = afd.tabela_transicoes.get(estado, {})
+        for chave, proximo in transicoes.items():
+            if (indice, chave) in predicados and classe[predicados.index((indice, chave))]:
+                return proximo
+        return EstadoAFD.ERRO
+    
+    # Construção do AFD produto (apenas estados alcançáveis)
+    inicial = tuple(EstadoAFD.Q0 for _ in afds)
+    estados = [inicial]
+    numeros = {inicial: 0}
+    destinos: List[List[int]] = []
+    for estado_produto in estados:
+        linha = []
+        for classe in classes:
+            proximo = tuple(destino(indice, estado, classe)
+                            for indice, estado in enumerate(estado_produto))
+            if all(estado == EstadoAFD.ERRO for estado in proximo):
+                linha.append(ESTADO_MORTO)
+                continue
+            if proximo not in numeros:
+                numeros[proximo] = len(estados)
+                estados.append(proximo)
+            linha.append(numeros[proximo])
+        destinos.append(linha)
+    
+    num_estados = len(estados)
+    aceitacao = []
+    for estado_produto in estados:
+        nome = None
+        for indice, estado in enumerate(estado_produto):
+            if estado in afds[indice][1].estados_finais:
+                nome = afds[indice][0]
+                break
+        aceitacao.append(nome)
+    
+    # Fusão de colunas idênticas: cada classe aponta para uma coluna única
+    colunas: Dict[Tuple[int, ...], int] = {}
+    transicoes: List[int] = []
+    deslocamento_classe = []
+    for numero_classe in range(len(classes)):
+        coluna = tuple(destinos[estado][numero_classe] for estado in range(num_estados))
+        if coluna not in colunas:
+            colunas[coluna] = len(colunas) * num_estados
+            transicoes.extend(coluna)
+        deslocamento_classe.append(colunas[coluna])
+    
+    numero_direta = {chave: (1 << len(predicados)) + indice
+                     for indice, chave in enumerate(diretas)}
+    
+    def classificar(caractere: str) -> int:
+        """Deslocamento da classe de qualquer caractere"""
+        if caractere in numero_direta:
+            return deslocamento_classe[numero_direta[caractere]]
+        vetor = 0
+        for bit, (indice, chave) in enumerate(predicados):
+            if getattr(afds[indice][1], chave)(caractere):
+                vetor |= 1 << bit
+        return deslocamento_classe[vetor]
+    
+    latin1 = [classificar(chr(codigo)) for codigo in range(256)]
+    return AFDTabelado(latin1, transicoes, num_estados, aceitacao, classificar)
+
+
+def compilar_afds_de_tokens() -> AFDTabelado:
+    """
+    Compila os AFDs de identificadores e números em um único AFD
+    
+    Os nomes aceitos correspondem aos membros de TipoToken. A ordem só
+    importa em empates; aqui as linguagens são disjuntas.
+    """
+    return compilar_afds([
+        ('IDENTIFICADOR', AFDIdentificador()),
+        ('NUMERO_REAL', AFDNumeroReal()),
+        ('NUMERO_INTEIRO', AFDNumeroInteiro()),
+    ])
+
+
+def relatorio_minimizacao(original: AFDTabelado, minimizado: AFDTabelado) -> str:
+    """
+    Gera relatório comparativo da minimização
+    
+    Args:
+        original: AFD antes da minimização
+        minimizado: AFD retornado por `minimizar`
+        
+    Returns:
+        str: Relatório formatado
+    """
+    estados_antes, transicoes_antes = original.contagens()
+    estados_depois, transicoes_depois = minimizado.contagens()
+    return "\n".join([
+        "=" * 60,
+        "RELATÓRIO DE MINIMIZAÇÃO (HOPCROFT)",
+        "=" * 60,
+        f"Estados:    {estados_antes:6} → {estados_depois:6}",
+        f"Transições: {transicoes_antes:6} → {transicoes_depois:6}",
+        f"Classes:    {original.num_classes:6} → {minimizado.num_classes:6}",
+        f"Tabela:     {len(original.transicoes):6} → {len(minimizado.transicoes):6} entradas",
+        "=" * 60,
+    ])
 
 
 def demonstrar_afd():
@@ -352,6 +860,10 @@ def demonstrar_afd():
     print("para reconhecer padrões específicos (identificadores, números).")
     print("\nAFDs garantem reconhecimento determinístico e eficiente!")
     print("=" * 60)
+    
+    compilado = compilar_afds_de_tokens()
+    print("\nAFD COMBINADO (identificadores e números):")
+    print(relatorio_minimizacao(compilado, compilado.minimizar()))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,175 @@
+"""
+Buffer compacto de tokens (struct-of-arrays)
+
+Este módulo implementa o `BufferTokens`, a saída da API em lote
+`Lexer.tokenizar()`. Em vez de um objeto `Token` por token, o buffer
+guarda cada atributo em um array contíguo:
+
+    tipos    array('B')  código inteiro do TipoToken
+    inicios  array('i')  deslocamento inicial do token no código fonte
+    fins     array('i')  deslocamento final (exclusivo)
+    linhas   array('i')  linha do token
+    colunas  array('i')  coluna do token
+
+Os lexemas não são armazenados: são fatias do código fonte, resolvidas
+sob demanda. Apenas strings com caracteres de escape (cujo lexema difere
+do texto original) ficam em um dicionário à parte.
+
+CUSTO POR TOKEN:
+================
+- Token (objeto + lexema + referência em lista): ~130 bytes
+- BufferTokens: 17 bytes (+ lexema apenas para strings com escape)
+"""
+
+import sys
+from array import array
+from typing import Dict, Iterator, Optional
+from .ast_nodes import TipoToken, Token
+
+
+# Códigos inteiros dos tipos de token (índice na enumeração)
+TIPOS_TOKEN = tuple(TipoToken)
+CODIGOS_TIPO: Dict[TipoToken, int] = {tipo: codigo for codigo, tipo in enumerate(TIPOS_TOKEN)}
+
+CODIGO_IDENTIFICADOR = CODIGOS_TIPO[TipoToken.IDENTIFICADOR]
+CODIGO_TEXTO = CODIGOS_TIPO[TipoToken.TEXTO]
+CODIGO_EOF = CODIGOS_TIPO[TipoToken.EOF]
+
+
+class BufferTokens:
+    """
+    Sequência de tokens armazenada em arrays paralelos
+
+    Pode ser consumida diretamente pelo `Parser`, pois implementa
+    `proximo_token()` com um cursor interno.
+    """
+
+    def __init__(self, codigo_fonte: str):
+        self.codigo_fonte = codigo_fonte
+        self.tipos = array('B')
+        self.inicios = array('i')
+        self.fins = array('i')
+        self.linhas = array('i')
+        self.colunas = array('i')
+        # Lexemas que diferem do código fonte (strings com escape)
+        self.lexemas_especiais: Dict[int, str] = {}
+        self.cursor = 0
+
+    def __len__(self) -> int:
+        return len(self.tipos)
+
+    def __getitem__(self, indice: int) -> Token:
+        if indice < 0:
+            indice += len(self.tipos)
+        return self.token(indice)
+
+    def __iter__(self) -> Iterator[Token]:
+        for indice in range(len(self.tipos)):
+            yield self.token(indice)
+
+    def adicionar(self, codigo_tipo: int, inicio: int, fim: int,
+                  linha: int, coluna: int, lexema: Optional[str] = None) -> None:
+        """
+        Adiciona um token ao final do buffer
+
+        Args:
+            codigo_tipo: Código inteiro do tipo (ver CODIGOS_TIPO)
+            inicio: Deslocamento inicial do token no código fonte
+            fim: Deslocamento final (exclusivo)
+            linha: Linha do token
+            coluna: Coluna do token
+            lexema: Lexema, apenas se diferente do código fonte
+        """
+        if lexema is not None:
+            self.lexemas_especiais[len(self.tipos)] = lexema
+        self.tipos.append(codigo_tipo)
+        self.inicios.append(inicio)
+        self.fins.append(fim)
+        self.linhas.append(linha)
+        self.colunas.append(coluna)
+
+    def adicionar_token(self, token: Token, inicio: int, fim: int) -> None:
+        """Adiciona um objeto Token cujo texto ocupa [inicio, fim)"""
+        codigo_tipo = CODIGOS_TIPO[token.tipo]
+        lexema = None
+        if self._lexema_do_codigo(codigo_tipo, inicio, fim) != token.lexema:
+            lexema = token.lexema
+        self.adicionar(codigo_tipo, inicio, fim, token.linha, token.coluna, lexema)
+
+    def copiar(self, origem: 'BufferTokens', inicio: int, fim: int,
+               delta_posicao: int = 0, delta_linha: int = 0) -> None:
+        """
+        Acrescenta os tokens [inicio, fim) de outro buffer
+
+        Args:
+            origem: Buffer de onde os tokens são copiados
+            inicio: Primeiro índice copiado
+            fim: Índice final (exclusivo)
+            delta_posicao: Deslocamento somado aos inícios e fins
+            delta_linha: Diferença somada às linhas
+        """
+        base = len(self.tipos)
+        for indice, lexema in origem.lexemas_especiais.items():
+            if inicio <= indice < fim:
+                self.lexemas_especiais[base + indice - inicio] = lexema
+
+        self.tipos.extend(origem.tipos[inicio:fim])
+        self.colunas.extend(origem.colunas[inicio:fim])
+        if delta_posicao:
+            self.inicios.extend(array('i', [p + delta_posicao for p in origem.inicios[inicio:fim]]))
+            self.fins.extend(array('i', [p + delta_posicao for p in origem.fins[inicio:fim]]))
+        else:
+            self.inicios.extend(origem.inicios[inicio:fim])
+            self.fins.extend(origem.fins[inicio:fim])
+        if delta_linha:
+            self.linhas.extend(array('i', [l + delta_linha for l in origem.linhas[inicio:fim]]))
+        else:
+            self.linhas.extend(origem.linhas[inicio:fim])
+
+    def tipo(self, indice: int) -> TipoToken:
+        """Retorna o TipoToken do token no índice"""
+        return TIPOS_TOKEN[self.tipos[indice]]
+
+    def lexema(self, indice: int) -> str:
+        """Resolve o lexema do token no índice a partir do código fonte"""
+        especial = self.lexemas_especiais.get(indice)
+        if especial is not None:
+            return especial
+        return self._lexema_do_codigo(self.tipos[indice], self.inicios[indice], self.fins[indice])
+
+    def token(self, indice: int) -> Token:
+        """Materializa o token no índice como objeto Token"""
+        return Token(TIPOS_TOKEN[self.tipos[indice]], self.lexema(indice),
+                     self.linhas[indice], self.colunas[indice])
+
+    def proximo_token(self) -> Token:
+        """
+        Retorna o token sob o cursor e avança
+
+        Após o último token (EOF), continua retornando EOF, como o Lexer.
+        """
+        indice = self.cursor
+        if indice < len(self.tipos) - 1:
+            self.cursor = indice + 1
+        return self.token(indice)
+
+    def reiniciar(self) -> None:
+        """Volta o cursor para o primeiro token"""
+        self.cursor = 0
+
+    def tamanho_em_bytes(self) -> int:
+        """Memória ocupada pelos arrays (sem contar o código fonte)"""
+        total = sum(arr.itemsize * len(arr) for arr in
+                    (self.tipos, self.inicios, self.fins, self.linhas, self.colunas))
+        return total + sum(len(lexema) for lexema in self.lexemas_especiais.values())
+
+    def _lexema_do_codigo(self, codigo_tipo: int, inicio: int, fim: int) -> str:
+        """Lexema implícito: fatia do código (sem aspas para strings)"""
+        if codigo_tipo == CODIGO_IDENTIFICADOR:
+            # Nomes repetidos compartilham o mesmo objeto str
+            return sys.intern(self.codigo_fonte[inicio:fim])
+        if codigo_tipo == CODIGO_TEXTO:
+            return self.codigo_fonte[inicio + 1:fim - 1]
+        if codigo_tipo == CODIGO_EOF:
+            return 'EOF'
+        return self.codigo_fonte[inicio:fim]
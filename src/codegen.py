@@ -5,7 +5,7 @@ Este módulo implementa a geração de código Python a partir da AST,
 convertendo construções Portugol para código Python equivalente.
 """
 
-from typing import List, Dict
+from typing import AbstractSet, Dict, Iterator, List, Optional, Tuple, Union
 from .ast_nodes import (
     Programa, DeclaracaoVariavel,
     Comando, Atribuicao, Condicional, Repeticao, RepeticaoPara, Entrada, Saida,
@@ -19,9 +19,16 @@ class GeradorDeCodigo:
     
     Converte cada nó da AST em código Python equivalente,
     mantendo a semântica original do programa Portugol.
+    
+    Args:
+        compartilhados: `id` dos nós de expressão compartilhados por
+            várias ocorrências (`TabelaNos.compartilhados`); o código de
+            cada um é gerado uma única vez por programa
     """
     
-    def __init__(self):
+    def __init__(self, compartilhados: AbstractSet[int] = frozenset()):
+        self.compartilhados = compartilhados
+        self._codigo_compartilhado: Dict[int, str] = {}
         self.codigo_gerado = []
         self.nivel_indentacao = 0
         self.mapeamento_tipos = {
@@ -44,6 +51,7 @@ class GeradorDeCodigo:
         """
         self.codigo_gerado = []
         self.nivel_indentacao = 0
+        self._codigo_compartilhado = {}
         
         # Cabeçalho do programa
         self._adicionar_linha("# Código gerado automaticamente do Portugol")
@@ -58,8 +66,7 @@ class GeradorDeCodigo:
         
         # Comandos do programa
         if programa.comandos:
-            for comando in programa.comandos:
-                self._gerar_comando(comando)
+            self._gerar_comandos(programa.comandos)
         else:
             self._adicionar_linha("pass")
         
@@ -73,7 +80,21 @@ class GeradorDeCodigo:
         return '\n'.join(self.codigo_gerado)
 
     def _gerar_declaracoes(self, declaracoes: List[DeclaracaoVariavel]) -> None:
-        """Gera declarações de variáveis com valores padrão"""
+        """
+        Gera declarações de variáveis com valores padrão
+        
+        A variável que a análise semântica anotou como atribuída antes de
+        qualquer leitura (`Simbolo.atribuida_antes_do_uso`) não recebe o
+        valor padrão: nenhum caminho do programa o leria.
+        """
+        for declaracao in declaracoes:
+            # Armazenar tipo da variável para uso posterior
+            self.tabela_tipos[declaracao.nome] = declaracao.tipo
+        declaracoes = [
+            declaracao for declaracao in declaracoes
+            if declaracao.simbolo is None or not declaracao.simbolo.atribuida_antes_do_uso
+        ]
+        
         if declaracoes:
             self._adicionar_linha("# Declarações de variáveis")
             
@@ -85,44 +106,70 @@ class GeradorDeCodigo:
         }
         
         for declaracao in declaracoes:
-            # Armazenar tipo da variável para uso posterior
-            self.tabela_tipos[declaracao.nome] = declaracao.tipo
-            
             valor_padrao = valores_padrao.get(declaracao.tipo, 'None')
             self._adicionar_linha(f"{declaracao.nome} = {valor_padrao}")
         
         if declaracoes:
             self._adicionar_linha("")
 
+    def _gerar_comandos(self, comandos: List[Comando]) -> None:
+        """
+        Gera código para uma lista de comandos sem recursão
+        
+        Os comandos com blocos aninhados são geradores: produzem cada bloco
+        já com a indentação ajustada e retomam depois dele. A pilha
+        explícita guarda os blocos e geradores em andamento.
+        """
+        pilha: List[Iterator] = [iter(comandos)]
+        while pilha:
+            item = next(pilha[-1], None)
+            if item is None:
+                pilha.pop()
+            elif isinstance(item, list):
+                pilha.append(iter(item))
+            else:
+                etapas = self._iniciar_comando(item)
+                if etapas is not None:
+                    pilha.append(etapas)
+
     def _gerar_comando(self, comando: Comando) -> None:
-        """Gera código para um comando"""
+        """Gera código para um comando (e seus blocos aninhados)"""
+        self._gerar_comandos([comando])
+
+    def _iniciar_comando(self, comando: Comando) -> Optional[Iterator[List[Comando]]]:
+        """
+        Gera um comando simples, ou inicia um comando com blocos
+        
+        Returns:
+            Gerador dos blocos aninhados, ou None para comandos simples
+        """
         if isinstance(comando, Atribuicao):
             self._gerar_atribuicao(comando)
         elif isinstance(comando, Condicional):
-            self._gerar_condicional(comando)
+            return self._gerar_condicional(comando)
         elif isinstance(comando, Repeticao):
-            self._gerar_repeticao(comando)
+            return self._gerar_repeticao(comando)
         elif isinstance(comando, RepeticaoPara):
-            self._gerar_repeticao_para(comando)
+            return self._gerar_repeticao_para(comando)
         elif isinstance(comando, Entrada):
             self._gerar_entrada(comando)
         elif isinstance(comando, Saida):
             self._gerar_saida(comando)
+        return None
 
     def _gerar_atribuicao(self, atribuicao: Atribuicao) -> None:
         """Gera código para atribuição"""
         expressao_codigo = self._gerar_expressao(atribuicao.expressao)
         self._adicionar_linha(f"{atribuicao.variavel} = {expressao_codigo}")
 
-    def _gerar_condicional(self, condicional: Condicional) -> None:
-        """Gera código para estrutura condicional"""
+    def _gerar_condicional(self, condicional: Condicional) -> Iterator[List[Comando]]:
+        """Gera código para estrutura condicional (gerador dos blocos aninhados)"""
         condicao_codigo = self._gerar_expressao(condicional.condicao)
         self._adicionar_linha(f"if {condicao_codigo}:")
         
         self._aumentar_indentacao()
         if condicional.comandos_entao:
-            for comando in condicional.comandos_entao:
-                self._gerar_comando(comando)
+            yield condicional.comandos_entao
         else:
             self._adicionar_linha("pass")
         self._diminuir_indentacao()
@@ -130,25 +177,24 @@ class GeradorDeCodigo:
         if condicional.comandos_senao:
             self._adicionar_linha("else:")
             self._aumentar_indentacao()
-            for comando in condicional.comandos_senao:
-                self._gerar_comando(comando)
+            yield condicional.comandos_senao
             self._diminuir_indentacao()
 
-    def _gerar_repeticao(self, repeticao: Repeticao) -> None:
-        """Gera código para estrutura de repetição"""
+    def _gerar_repeticao(self, repeticao: Repeticao) -> Iterator[List[Comando]]:
+        """Gera código para estrutura de repetição (gerador dos blocos aninhados)"""
         condicao_codigo = self._gerar_expressao(repeticao.condicao)
         self._adicionar_linha(f"while {condicao_codigo}:")
 
         self._aumentar_indentacao()
         if repeticao.comandos:
-            for comando in repeticao.comandos:
-                self._gerar_comando(comando)
+            yield repeticao.comandos
         else:
             self._adicionar_linha("pass")
         self._diminuir_indentacao()
 
-    def _gerar_repeticao_para(self, repeticao: RepeticaoPara) -> None:
-        """Gera código para estrutura de repetição 'para' com suporte a passo positivo e negativo"""
+    def _gerar_repeticao_para(self, repeticao: RepeticaoPara) -> Iterator[List[Comando]]:
+        """Gera código para estrutura de repetição 'para' com suporte a passo positivo e negativo
+        (gerador dos blocos aninhados)"""
         # Traduz para loop while com condição dinâmica baseada no sinal do passo
         inicio_codigo = self._gerar_expressao(repeticao.inicio)
         fim_codigo = self._gerar_expressao(repeticao.fim)
@@ -170,8 +216,7 @@ class GeradorDeCodigo:
 
         self._aumentar_indentacao()
         if repeticao.comandos:
-            for comando in repeticao.comandos:
-                self._gerar_comando(comando)
+            yield repeticao.comandos
         else:
             self._adicionar_linha("pass")
 
@@ -181,8 +226,12 @@ class GeradorDeCodigo:
 
     def _gerar_entrada(self, entrada: Entrada) -> None:
         """Gera código para comando de entrada"""
-        # Conversão automática de tipo baseada na declaração da variável
-        tipo_variavel = self.tabela_tipos.get(entrada.variavel, 'caracter')
+        # Conversão automática de tipo: o anotado pela análise semântica ou,
+        # em uma AST não analisada, o da declaração da variável
+        if entrada.simbolo is not None:
+            tipo_variavel = entrada.simbolo.tipo
+        else:
+            tipo_variavel = self.tabela_tipos.get(entrada.variavel, 'caracter')
         
         if tipo_variavel == 'inteiro':
             # Conversão inline com tratamento de erro em uma linha
@@ -243,22 +292,54 @@ class GeradorDeCodigo:
         """
         Gera código para uma expressão
         
+        Os fragmentos são emitidos da esquerda para a direita com uma
+        pilha explícita (sem recursão) e unidos uma única vez, o que mantém
+        o custo linear mesmo em cadeias longas de operadores. O código de
+        um operador compartilhado é guardado ao terminar (marcador com a
+        posição em que começou) e reaproveitado nas outras ocorrências.
+        
         Args:
             expressao: Nó da expressão
             
         Returns:
             str: Código Python da expressão
         """
-        if isinstance(expressao, Literal):
-            return self._gerar_literal(expressao)
-        elif isinstance(expressao, Variavel):
-            return expressao.nome
-        elif isinstance(expressao, ExpressaoBinaria):
-            return self._gerar_expressao_binaria(expressao)
-        elif isinstance(expressao, ExpressaoUnaria):
-            return self._gerar_expressao_unaria(expressao)
-        else:
-            return "# Expressão não reconhecida"
+        compartilhados = self.compartilhados
+        memo = self._codigo_compartilhado
+        partes: List[str] = []
+        pilha: List[Union[Expressao, str, Tuple[int, int]]] = [expressao]
+        while pilha:
+            no = pilha.pop()
+            if isinstance(no, str):
+                partes.append(no)
+            elif isinstance(no, tuple):
+                # Fim de um operador compartilhado: (id do nó, início)
+                memo[no[0]] = ''.join(partes[no[1]:])
+            elif isinstance(no, Literal):
+                partes.append(self._gerar_literal(no))
+            elif isinstance(no, Variavel):
+                partes.append(no.nome)
+            elif compartilhados and id(no) in memo:
+                partes.append(memo[id(no)])
+            elif isinstance(no, ExpressaoBinaria):
+                # ({esquerda} {operador} {direita})
+                if compartilhados and id(no) in compartilhados:
+                    pilha.append((id(no), len(partes)))
+                partes.append("(")
+                pilha.append(")")
+                pilha.append(no.direita)
+                pilha.append(f" {self._gerar_operador_binario(no.operador)} ")
+                pilha.append(no.esquerda)
+            elif isinstance(no, ExpressaoUnaria):
+                # ({operador}{operando})
+                if compartilhados and id(no) in compartilhados:
+                    pilha.append((id(no), len(partes)))
+                partes.append(f"({no.operador}")
+                pilha.append(")")
+                pilha.append(no.operando)
+            else:
+                partes.append("# Expressão não reconhecida")
+        return ''.join(partes)
 
     def _gerar_literal(self, literal: Literal) -> str:
         """Gera código para literal"""
@@ -277,12 +358,8 @@ class GeradorDeCodigo:
         # Números e outros valores literais
         return valor
 
-    def _gerar_expressao_binaria(self, expressao: ExpressaoBinaria) -> str:
-        """Gera código para expressão binária"""
-        esquerda = self._gerar_expressao(expressao.esquerda)
-        direita = self._gerar_expressao(expressao.direita)
-        operador = expressao.operador
-        
+    def _gerar_operador_binario(self, operador: str) -> str:
+        """Gera o operador Python de uma expressão binária"""
         # Mapeamento de operadores Portugol -> Python
         mapeamento_operadores = {
             'e': 'and',
@@ -301,18 +378,7 @@ class GeradorDeCodigo:
             '^': '**'
         }
         
-        operador_python = mapeamento_operadores.get(operador, operador)
-        return f"({esquerda} {operador_python} {direita})"
-
-    def _gerar_expressao_unaria(self, expressao: ExpressaoUnaria) -> str:
-        """Gera código para expressão unária"""
-        operando = self._gerar_expressao(expressao.operando)
-        operador = expressao.operador
-        
-        if operador == '-':
-            return f"(-{operando})"
-        else:
-            return f"({operador}{operando})"
+        return mapeamento_operadores.get(operador, operador)
 
     def _adicionar_linha(self, linha: str) -> None:
         """Adiciona uma linha de código com indentação apropriada"""
@@ -0,0 +1,164 @@
+"""
+Compartilhamento de subexpressões da AST (hash-consing)
+
+Cada ocorrência de um literal, de uma variável ou de uma operação é um
+objeto próprio na AST produzida pelos parsers: `x + 1` escrito dez vezes
+são dez árvores iguais, percorridas dez vezes por cada fase. A
+`TabelaNos` substitui cada subexpressão pela primeira árvore igual já
+vista, de modo que expressões estruturalmente idênticas passam a ser um
+único nó compartilhado.
+
+HASH-CONSING
+============
+A árvore é percorrida em pós-ordem (pilha explícita, sem recursão). Ao
+chegar a um nó, os seus filhos já são os nós únicos, então a chave do nó
+usa a identidade dos filhos em vez de compará-los de novo:
+
+    Literal            ('L', valor)
+    Variavel           ('V', nome)
+    ExpressaoUnaria    ('U', operador, id(operando))
+    ExpressaoBinaria   ('B', id(esquerda), operador, id(direita))
+
+As expressões da linguagem não têm efeitos colaterais (não há chamadas
+nem atribuições dentro delas), então toda subexpressão pode ser
+compartilhada. A tabela guarda os nós únicos, o que mantém válidos os
+`id` usados nas chaves enquanto ela existir.
+
+POSIÇÕES E IMUTABILIDADE
+========================
+O nó compartilhado guarda a posição (linha, coluna) de uma só das suas
+ocorrências, a primeira visitada. Por isso o compartilhamento é feito
+depois da análise semântica, cujos diagnósticos precisam da posição de
+cada ocorrência; as fases seguintes (código intermediário e geração de
+código) não usam posições. Um nó compartilhado não deve ser alterado: a mudança
+apareceria em todas as ocorrências. A `AnaliseIncremental`, que desloca
+as linhas dos nós a cada edição, trabalha sobre uma AST sem
+compartilhamento.
+
+MEMOIZAÇÃO
+==========
+`compartilhados` contém a identidade dos nós usados mais de uma vez. O
+`GeradorDeCodigo` a usa para gerar o código de cada um desses nós uma
+única vez. O código intermediário não é reaproveitado: o temporário de
+`x + 1` calculado antes de uma atribuição a `x` não vale depois dela.
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+from .ast_nodes import (
+    Programa, Comando, Atribuicao, Condicional, Repeticao, RepeticaoPara, Saida,
+    Expressao, ExpressaoBinaria, ExpressaoUnaria, Literal, Variavel
+)
+
+
+class TabelaNos:
+    """
+    Nós únicos das expressões (ver HASH-CONSING)
+
+    Attributes:
+        ocorrencias: Nós de expressão visitados
+        compartilhados: `id` dos nós únicos usados mais de uma vez
+    """
+
+    def __init__(self):
+        self._nos: Dict[tuple, Expressao] = {}
+        self.ocorrencias = 0
+        self.compartilhados: Set[int] = set()
+
+    def __len__(self) -> int:
+        """Quantidade de nós únicos"""
+        return len(self._nos)
+
+    def compartilhar(self, expressao: Expressao) -> Expressao:
+        """
+        Substitui a expressão e as suas subexpressões pelos nós únicos
+
+        Nós vistos pela primeira vez tornam-se os nós únicos (os seus
+        filhos são trocados pelos nós únicos correspondentes).
+
+        Args:
+            expressao: Raiz da expressão
+
+        Returns:
+            Expressao: Nó único igual à expressão
+        """
+        nos = self._nos
+        compartilhados = self.compartilhados
+        unicos: List[Expressao] = []
+        pilha: List[Tuple[Expressao, bool]] = [(expressao, False)]
+        while pilha:
+            no, filhos_prontos = pilha.pop()
+            if isinstance(no, ExpressaoBinaria):
+                if not filhos_prontos:
+                    pilha.append((no, True))
+                    pilha.append((no.direita, False))
+                    pilha.append((no.esquerda, False))
+                    continue
+                direita = unicos.pop()
+                esquerda = unicos.pop()
+                chave = ('B', id(esquerda), no.operador, id(direita))
+            elif isinstance(no, ExpressaoUnaria):
+                if not filhos_prontos:
+                    pilha.append((no, True))
+                    pilha.append((no.operando, False))
+                    continue
+                operando = unicos.pop()
+                chave = ('U', no.operador, id(operando))
+            elif isinstance(no, Literal):
+                chave = ('L', no.valor)
+            elif isinstance(no, Variavel):
+                chave = ('V', no.nome)
+            else:
+                # Expressão desconhecida: não é compartilhada
+                unicos.append(no)
+                continue
+
+            self.ocorrencias += 1
+            unico = nos.get(chave)
+            if unico is None:
+                if isinstance(no, ExpressaoBinaria):
+                    no.esquerda = esquerda
+                    no.direita = direita
+                elif isinstance(no, ExpressaoUnaria):
+                    no.operando = operando
+                nos[chave] = unico = no
+            else:
+                compartilhados.add(id(unico))
+            unicos.append(unico)
+        return unicos[0]
+
+
+def compartilhar_expressoes(programa: Programa, tabela: Optional[TabelaNos] = None) -> TabelaNos:
+    """
+    Compartilha as subexpressões iguais de todos os comandos do programa
+
+    Args:
+        programa: AST (já verificada pela análise semântica, ver POSIÇÕES
+            E IMUTABILIDADE); as expressões são substituídas no lugar
+        tabela: Tabela a reaproveitar (nova se None)
+
+    Returns:
+        TabelaNos: Tabela com os nós únicos e os compartilhados
+    """
+    if tabela is None:
+        tabela = TabelaNos()
+    compartilhar = tabela.compartilhar
+    pilha: List[List[Comando]] = [programa.comandos]
+    while pilha:
+        for comando in pilha.pop():
+            if isinstance(comando, Atribuicao):
+                comando.expressao = compartilhar(comando.expressao)
+            elif isinstance(comando, Saida):
+                comando.expressoes[:] = [compartilhar(expressao) for expressao in comando.expressoes]
+            elif isinstance(comando, Condicional):
+                comando.condicao = compartilhar(comando.condicao)
+                pilha.append(comando.comandos_senao)
+                pilha.append(comando.comandos_entao)
+            elif isinstance(comando, Repeticao):
+                comando.condicao = compartilhar(comando.condicao)
+                pilha.append(comando.comandos)
+            elif isinstance(comando, RepeticaoPara):
+                comando.inicio = compartilhar(comando.inicio)
+                comando.fim = compartilhar(comando.fim)
+                comando.passo = compartilhar(comando.passo)
+                pilha.append(comando.comandos)
+    return tabela
@@ -6,11 +6,15 @@ fases da compilação, facilitando o tratamento de erros e debugging.
 """
 
 from typing import Optional
+from .indice_linhas import IndiceLinhas
 
 
 class CompiladorError(Exception):
     """Classe base para todos os erros do compilador"""
     
+    # Fase da compilação que detectou o erro (nos diagnósticos)
+    fase = 'compilação'
+    
     def __init__(self, mensagem: str, linha: int = 0, coluna: int = 0):
         self.mensagem = mensagem
         self.linha = linha
@@ -22,23 +26,47 @@ class CompiladorError(Exception):
         if self.linha > 0:
             return f"{self.mensagem} (linha {self.linha}, coluna {self.coluna})"
         return self.mensagem
+    
+    def contexto(self, indice: IndiceLinhas) -> str:
+        """
+        Mostra a linha do código onde o erro ocorreu, com um marcador
+        
+        Args:
+            indice: Índice de linhas do código compilado
+            
+        Returns:
+            str: Linha do código e '^' sob a coluna do erro, ou '' se o
+            erro não tem posição no código
+        """
+        if not 0 < self.linha <= len(indice):
+            return ''
+        texto = indice.texto_linha(self.linha)
+        # Tabulações são mantidas para o marcador alinhar com o texto
+        recuo = ''.join(c if c == '\t' else ' ' for c in texto[:max(self.coluna - 1, 0)])
+        margem = f"{self.linha:5} | "
+        return f"{margem}{texto}\n{' ' * (len(margem) - 2)}| {recuo}^"
 
 
 class ErroLexico(CompiladorError):
     """Erro durante a análise léxica (tokenização)"""
-    pass
+    fase = 'léxica'
 
 
 class ErroSintatico(CompiladorError):
     """Erro durante a análise sintática (parsing)"""
-    pass
+    fase = 'sintática'
 
 
 class ErroSemantico(CompiladorError):
     """Erro durante a análise semântica (validação de tipos)"""
-    pass
+    fase = 'semântica'
+
+
+class AvisoSemantico(CompiladorError):
+    """Problema não fatal da análise semântica (variável possivelmente não inicializada)"""
+    fase = 'semântica'
 
 
 class ErroGeracaoCodigo(CompiladorError):
     """Erro durante a geração de código"""
-    pass
\ No newline at end of file
+    fase = 'geração de código'
\ No newline at end of file
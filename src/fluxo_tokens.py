@@ -0,0 +1,173 @@
+"""
+Fluxo de tokens com lookahead (buffer circular)
+
+O `FluxoTokens` fica entre qualquer fonte de tokens (`Lexer` e seus
+motores, `BufferTokens`) e o `Parser`. Ele guarda os tokens em um buffer
+circular de capacidade fixa, o que permite:
+
+- peek(k): olhar k tokens à frente sem consumi-los
+- mark()/reset(marca): voltar a um ponto já lido sem reanalisar o código
+
+BUFFER CIRCULAR:
+================
+Cada token recebe um número absoluto (0, 1, 2, ...) e ocupa a posição
+`numero & mascara` de uma lista de tamanho potência de dois. Metade da
+capacidade é reservada para lookahead e metade para o histórico
+alcançável por reset, de modo que nenhum dos dois sobrescreve o outro.
+
+CAMINHO RÁPIDO:
+===============
+Os tokens são buscados na fonte em lotes (até `TAMANHO_LOTE` por vez),
+com o método da fonte em variável local; `proximo_token` só chama a
+fonte quando o lote se esgota. Um erro léxico encontrado durante a
+leitura antecipada fica pendente e só é lançado quando o consumidor
+chega à posição dele, preservando a ordem dos erros.
+
+Se a fonte é um `BufferTokens`, todos os tokens já estão em memória: o
+fluxo não copia nada, `proximo_token` é o próprio método do buffer e
+peek/mark/reset operam sobre o cursor do buffer (sem limite de janela).
+"""
+
+from typing import List, Optional, Union
+from .ast_nodes import TipoToken, Token
+from .buffer_tokens import BufferTokens
+from .exceptions import ErroLexico
+from .lexer import Lexer
+
+
+CAPACIDADE_PADRAO = 256
+TAMANHO_LOTE = 32
+_EOF = TipoToken.EOF
+
+
+class FluxoTokens:
+    """
+    Buffer circular de tokens com peek(k) e mark()/reset()
+
+    Args:
+        fonte: Qualquer objeto com `proximo_token()` (Lexer, BufferTokens)
+        capacidade: Tamanho do buffer, arredondado para potência de dois;
+            metade é o lookahead máximo e metade o histórico de reset
+    """
+
+    def __init__(self, fonte: Union[Lexer, BufferTokens], capacidade: int = CAPACIDADE_PADRAO):
+        capacidade = max(capacidade, 2 * TAMANHO_LOTE)
+        capacidade = 1 << (capacidade - 1).bit_length()
+        self.fonte = fonte
+        self.capacidade = capacidade
+        self.janela = capacidade // 2
+        self._mascara = capacidade - 1
+        self._tokens: List[Optional[Token]] = [None] * capacidade
+        self._cursor = 0           # número do próximo token a entregar
+        self._lidos = 0            # quantidade de tokens já obtidos da fonte
+        self._eof: Optional[Token] = None
+        self._erro: Optional[ErroLexico] = None
+        self._buffer: Optional[BufferTokens] = None
+        if isinstance(fonte, BufferTokens):
+            # Caminho rápido: delega ao buffer, sem camada extra por token
+            self._buffer = fonte
+            self.proximo_token = fonte.proximo_token
+
+    def proximo_token(self) -> Token:
+        """
+        Consome e retorna o próximo token
+
+        Após o EOF, continua retornando EOF, como o Lexer.
+
+        Raises:
+            ErroLexico: Se a fonte encontrou um erro nesta posição
+        """
+        cursor = self._cursor
+        if cursor < self._lidos:
+            self._cursor = cursor + 1
+            return self._tokens[cursor & self._mascara]
+        if self._eof is not None:
+            return self._eof
+        self._preencher(TAMANHO_LOTE)
+        self._cursor = cursor + 1
+        return self._tokens[cursor & self._mascara]
+
+    def peek(self, k: int = 1) -> Token:
+        """
+        Retorna o k-ésimo token à frente sem consumi-lo
+
+        peek(1) é o token que o próximo `proximo_token()` retornará.
+        Além do EOF, retorna o próprio EOF.
+
+        Args:
+            k: Distância à frente (1 <= k <= janela)
+
+        Raises:
+            ValueError: Se k estiver fora do lookahead suportado
+            ErroLexico: Se a fonte encontrou um erro até essa posição
+        """
+        if self._buffer is not None:
+            buffer = self._buffer
+            if k < 1:
+                raise ValueError(f"Lookahead {k} deve ser positivo")
+            return buffer.token(min(buffer.cursor + k - 1, len(buffer) - 1))
+        if not 1 <= k <= self.janela:
+            raise ValueError(f"Lookahead {k} fora do intervalo 1..{self.janela}")
+        numero = self._cursor + k - 1
+        while numero >= self._lidos:
+            if self._eof is not None:
+                return self._eof
+            self._preencher(numero - self._lidos + 1)
+        return self._tokens[numero & self._mascara]
+
+    def mark(self) -> int:
+        """Retorna uma marca da posição atual para `reset`"""
+        if self._buffer is not None:
+            return self._buffer.cursor
+        return self._cursor
+
+    def reset(self, marca: int) -> None:
+        """
+        Volta para uma posição marcada, sem reanalisar o código
+
+        Args:
+            marca: Valor retornado por `mark()`
+
+        Raises:
+            ValueError: Se a marca já saiu do buffer (mais de `janela`
+            tokens consumidos desde então) ou é posterior ao cursor
+        """
+        if self._buffer is not None:
+            if not 0 <= marca <= self._buffer.cursor:
+                raise ValueError("Marca fora do buffer de tokens")
+            self._buffer.cursor = marca
+            return
+        if not self._lidos - self.capacidade <= marca <= self._cursor:
+            raise ValueError("Marca fora do buffer de tokens")
+        self._cursor = marca
+
+    def _preencher(self, minimo: int) -> None:
+        """
+        Lê até `TAMANHO_LOTE` tokens da fonte (pelo menos `minimo`)
+
+        Nunca sobrescreve os `janela` tokens anteriores ao cursor.
+        """
+        if self._erro is not None:
+            erro, self._erro = self._erro, None
+            raise erro
+        proximo_da_fonte = self.fonte.proximo_token
+        tokens = self._tokens
+        mascara = self._mascara
+        lidos = self._lidos
+        limite = min(lidos + max(minimo, TAMANHO_LOTE), self._cursor + self.janela)
+        primeiro = lidos
+        while lidos < limite:
+            try:
+                token = proximo_da_fonte()
+            except ErroLexico as erro:
+                if lidos == primeiro:
+                    raise
+                # Erro adiado até o consumidor chegar a esta posição
+                self._erro = erro
+                break
+            tokens[lidos & mascara] = token
+            lidos += 1
+            if token.tipo is _EOF:
+                self._eof = token
+                break
+        self._lidos = lidos
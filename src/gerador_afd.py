@@ -0,0 +1,462 @@
+"""
+Gerador de AFD a partir das expressões regulares dos tokens
+
+Este módulo deriva o autômato do analisador léxico diretamente das ERs,
+em vez de codificá-lo à mão:
+
+1. ER → árvore: analisador de descida recursiva para a notação usada na
+   documentação do `lexer.py` (literais, escapes, classes [a-z] e [^...],
+   '.', agrupamento, '|', '*', '+' e '?')
+2. Árvore → AFN: construção de Thompson (fragmentos com transições ε)
+3. AFN → AFD: construção de subconjuntos sobre classes de caracteres,
+   resolvendo conflitos pela prioridade (ordem da especificação): uma
+   palavra-chave vence um identificador de mesmo tamanho; em seguida o
+   AFD é minimizado (Hopcroft, ver `AFDTabelado.minimizar`)
+4. AFD → módulo Python: as tabelas são gravadas em `tabelas_lexicas.py`
+   com a assinatura da especificação, e carregadas na inicialização sem
+   nova geração (ver `carregar_tabelas`)
+
+ALFABETO:
+=========
+Os símbolos são os 256 caracteres Latin-1 mais um símbolo DEMAIS, que
+representa todos os caracteres de código >= 256 (as ERs só citam
+caracteres ASCII, então nenhuma ER distingue dois caracteres desse
+grupo). Símbolos com o mesmo comportamento em todas as transições do AFN
+formam uma classe, e o AFD tem uma coluna por classe.
+
+Para regenerar as tabelas após alterar a especificação:
+    python -m src.gerador_afd
+"""
+
+import hashlib
+import os
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+from .automaton import AFDTabelado, ESTADO_MORTO
+from .lexer import PALAVRAS_CHAVE
+
+
+# Símbolo que representa todos os caracteres de código >= 256
+DEMAIS = 256
+TODOS_SIMBOLOS = frozenset(range(DEMAIS + 1))
+
+
+def _palavra_sem_caixa(palavra: str) -> str:
+    """ER que reconhece a palavra sem diferenciar maiúsculas: se → [sS][eE]"""
+    return ''.join(f'[{letra}{letra.upper()}]' for letra in palavra)
+
+
+# Especificação léxica em ordem de prioridade: (nome, ER). Os nomes são
+# membros de TipoToken, exceto ESPACO e COMENTARIO_*, que são ignorados.
+# NUMERO_REAL aceita "3." (ponto sem casas decimais), como o Lexer.
+ESPECIFICACAO: List[Tuple[str, str]] = (
+    [(tipo.name, _palavra_sem_caixa(palavra)) for palavra, tipo in PALAVRAS_CHAVE.items()]
+    + [
+        ('IDENTIFICADOR', r'[a-zA-Z_][a-zA-Z0-9_]*'),
+        ('NUMERO_REAL', r'[0-9]+\.[0-9]*'),
+        ('NUMERO_INTEIRO', r'[0-9]+'),
+        ('TEXTO', r'"([^"\\\n]|\\[^\n])*"'),
+        ('MENOR_IGUAL', r'<='),
+        ('MAIOR_IGUAL', r'>='),
+        ('IGUAL', r'=='),
+        ('DIFERENTE', r'!='),
+        ('ATRIBUICAO', r'<-|='),
+        ('MENOR', r'<'),
+        ('MAIOR', r'>'),
+        ('MAIS', r'\+'),
+        ('MENOS', r'-'),
+        ('MULTIPLICACAO', r'\*'),
+        ('DIVISAO', r'/'),
+        ('MODULO', r'%'),
+        ('POTENCIA', r'\^'),
+        ('ABRE_PARENTESES', r'\('),
+        ('FECHA_PARENTESES', r'\)'),
+        ('ABRE_CHAVES', r'{'),
+        ('FECHA_CHAVES', r'}'),
+        ('PONTO_E_VIRGULA', r';'),
+        ('VIRGULA', r','),
+        ('COMENTARIO_LINHA', r'//[^\n]*'),
+        ('COMENTARIO_BLOCO', r'/\*([^*]|\*+[^*/])*\*+/'),
+        ('ESPACO', r'[ \t\n\r\x0b\x0c\x1c-\x1f]+'),
+    ]
+)
+
+
+def assinatura_especificacao(especificacao: Sequence[Tuple[str, str]] = ESPECIFICACAO) -> str:
+    """Hash que identifica a especificação que gerou um conjunto de tabelas"""
+    return hashlib.sha1(repr(list(especificacao)).encode('utf-8')).hexdigest()
+
+
+# ============================================================
+# 1. ANÁLISE DAS ERs
+# ============================================================
+
+# Nós da árvore: ('conjunto', simbolos) | ('concat', a, b) | ('uniao', a, b)
+#                | ('estrela', a) | ('vazio',)
+No = tuple
+
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'f': '\f', 'v': '\v'}
+
+
+class _AnalisadorER:
+    """Descida recursiva sobre uma ER"""
+
+    def __init__(self, er: str):
+        self.er = er
+        self.posicao = 0
+
+    def analisar(self) -> No:
+        no = self._uniao()
+        if self.posicao != len(self.er):
+            self._erro("caractere inesperado")
+        return no
+
+    def _erro(self, mensagem: str) -> None:
+        raise ValueError(f"ER inválida {self.er!r} na posição {self.posicao}: {mensagem}")
+
+    def _atual(self) -> Optional[str]:
+        return self.er[self.posicao] if self.posicao < len(self.er) else None
+
+    def _uniao(self) -> No:
+        no = self._concatenacao()
+        while self._atual() == '|':
+            self.posicao += 1
+            no = ('uniao', no, self._concatenacao())
+        return no
+
+    def _concatenacao(self) -> No:
+        no = ('vazio',)
+        while self._atual() not in (None, '|', ')'):
+            fator = self._fator()
+            no = fator if no == ('vazio',) else ('concat', no, fator)
+        return no
+
+    def _fator(self) -> No:
+        no = self._atomo()
+        while self._atual() in ('*', '+', '?'):
+            operador = self._atual()
+            self.posicao += 1
+            if operador == '*':
+                no = ('estrela', no)
+            elif operador == '+':
+                no = ('concat', no, ('estrela', no))
+            else:
+                no = ('uniao', no, ('vazio',))
+        return no
+
+    def _atomo(self) -> No:
+        caractere = self._atual()
+        if caractere == '(':
+            self.posicao += 1
+            no = self._uniao()
+            if self._atual() != ')':
+                self._erro("')' esperado")
+            self.posicao += 1
+            return no
+        if caractere == '[':
+            return ('conjunto', self._classe())
+        if caractere == '.':
+            self.posicao += 1
+            return ('conjunto', TODOS_SIMBOLOS - {ord('\n')})
+        if caractere in ('*', '+', '?'):
+            self._erro("operador sem operando")
+        return ('conjunto', frozenset({ord(self._literal())}))
+
+    def _literal(self) -> str:
+        """Lê um caractere, resolvendo escapes (\\n, \\x1f, \\. ...)"""
+        caractere = self._atual()
+        if caractere is None:
+            self._erro("fim inesperado")
+        self.posicao += 1
+        if caractere != '\\':
+            return caractere
+        escapado = self._atual()
+        if escapado is None:
+            self._erro("escape incompleto")
+        self.posicao += 1
+        if escapado == 'x':
+            codigo = self.er[self.posicao:self.posicao + 2]
+            self.posicao += 2
+            return chr(int(codigo, 16))
+        return _ESCAPES.get(escapado, escapado)
+
+    def _classe(self) -> FrozenSet[int]:
+        """Lê [abc], [a-z] ou [^...] (a negação inclui DEMAIS)"""
+        self.posicao += 1
+        negada = self._atual() == '^'
+        if negada:
+            self.posicao += 1
+        simbolos = set()
+        while self._atual() != ']':
+            inicio = self._literal()
+            if self._atual() == '-' and self.er[self.posicao + 1:self.posicao + 2] not in ('', ']'):
+                self.posicao += 1
+                fim = self._literal()
+                simbolos.update(range(ord(inicio), ord(fim) + 1))
+            else:
+                simbolos.add(ord(inicio))
+        self.posicao += 1
+        if any(simbolo >= DEMAIS for simbolo in simbolos):
+            self._erro("apenas caracteres Latin-1 são suportados")
+        return TODOS_SIMBOLOS - simbolos if negada else frozenset(simbolos)
+
+
+def analisar_er(er: str) -> No:
+    """
+    Converte uma ER em árvore sintática
+
+    Raises:
+        ValueError: Se a ER for inválida
+    """
+    return _AnalisadorER(er).analisar()
+
+
+# ============================================================
+# 2. CONSTRUÇÃO DE THOMPSON (ER → AFN)
+# ============================================================
+
+class AFN:
+    """
+    Autômato finito não determinístico com transições ε
+
+    `transicoes[estado]` é a lista de (simbolos, destino); simbolos None
+    indica transição ε. `aceitacao[estado]` guarda a prioridade do token
+    aceito (índice na especificação).
+    """
+
+    def __init__(self):
+        self.transicoes: List[List[Tuple[Optional[FrozenSet[int]], int]]] = []
+        self.aceitacao: Dict[int, int] = {}
+        self.inicial = self.novo_estado()
+
+    def novo_estado(self) -> int:
+        self.transicoes.append([])
+        return len(self.transicoes) - 1
+
+    def fragmento(self, no: No) -> Tuple[int, int]:
+        """Constrói o fragmento de Thompson do nó: (entrada, saída)"""
+        entrada, saida = self.novo_estado(), self.novo_estado()
+        tipo = no[0]
+        if tipo == 'vazio':
+            self.transicoes[entrada].append((None, saida))
+        elif tipo == 'conjunto':
+            self.transicoes[entrada].append((no[1], saida))
+        elif tipo == 'concat':
+            entrada_a, saida_a = self.fragmento(no[1])
+            entrada_b, saida_b = self.fragmento(no[2])
+            self.transicoes[entrada].append((None, entrada_a))
+            self.transicoes[saida_a].append((None, entrada_b))
+            self.transicoes[saida_b].append((None, saida))
+        elif tipo == 'uniao':
+            for filho in no[1:]:
+                entrada_f, saida_f = self.fragmento(filho)
+                self.transicoes[entrada].append((None, entrada_f))
+                self.transicoes[saida_f].append((None, saida))
+        else:  # estrela
+            entrada_f, saida_f = self.fragmento(no[1])
+            self.transicoes[entrada].append((None, entrada_f))
+            self.transicoes[entrada].append((None, saida))
+            self.transicoes[saida_f].append((None, entrada_f))
+            self.transicoes[saida_f].append((None, saida))
+        return entrada, saida
+
+    def fecho_epsilon(self, estados) -> FrozenSet[int]:
+        """Conjunto de estados alcançáveis apenas por transições ε"""
+        pilha = list(estados)
+        fecho = set(pilha)
+        while pilha:
+            for simbolos, destino in self.transicoes[pilha.pop()]:
+                if simbolos is None and destino not in fecho:
+                    fecho.add(destino)
+                    pilha.append(destino)
+        return frozenset(fecho)
+
+
+def construir_afn(especificacao: Sequence[Tuple[str, str]]) -> AFN:
+    """AFN com um ramo ε por token a partir do estado inicial"""
+    afn = AFN()
+    for prioridade, (_, er) in enumerate(especificacao):
+        entrada, saida = afn.fragmento(analisar_er(er))
+        afn.transicoes[afn.inicial].append((None, entrada))
+        afn.aceitacao[saida] = prioridade
+    return afn
+
+
+# ============================================================
+# 3. CONSTRUÇÃO DE SUBCONJUNTOS (AFN → AFD)
+# ============================================================
+
+class TabelasLexicas:
+    """
+    Tabelas de um AFD gerado, em forma serializável
+
+    - classes_latin1: classe de cada caractere de código < 256
+    - classe_demais: classe dos caracteres de código >= 256
+    - transicoes: lista plana indexada por classe * num_estados + estado
+    - aceitacao: nome do token aceito por estado (None se não final)
+    """
+
+    def __init__(self, classes_latin1: Sequence[int], classe_demais: int, num_estados: int,
+                 transicoes: Sequence[int], aceitacao: Sequence[Optional[str]], assinatura: str):
+        self.classes_latin1 = list(classes_latin1)
+        self.classe_demais = classe_demais
+        self.num_estados = num_estados
+        self.transicoes = list(transicoes)
+        self.aceitacao = list(aceitacao)
+        self.assinatura = assinatura
+
+    @classmethod
+    def de_afd(cls, afd: AFDTabelado, assinatura: str) -> 'TabelasLexicas':
+        """Converte um AFD cujos caracteres >= 256 formam uma única classe"""
+        return cls([deslocamento // afd.num_estados for deslocamento in afd.deslocamentos_latin1],
+                   afd.deslocamento(chr(DEMAIS)) // afd.num_estados, afd.num_estados,
+                   afd.transicoes, afd.aceitacao, assinatura)
+
+    @property
+    def num_classes(self) -> int:
+        return len(self.transicoes) // self.num_estados
+
+    def para_afd(self) -> AFDTabelado:
+        """Converte para o formato de reconhecimento (`AFDTabelado`)"""
+        deslocamento_demais = self.classe_demais * self.num_estados
+        return AFDTabelado(
+            [classe * self.num_estados for classe in self.classes_latin1],
+            self.transicoes, self.num_estados, self.aceitacao,
+            lambda caractere: deslocamento_demais,
+        )
+
+
+def _particionar_alfabeto(afn: AFN) -> List[List[int]]:
+    """Agrupa símbolos que pertencem exatamente aos mesmos conjuntos do AFN"""
+    conjuntos = {simbolos for transicoes in afn.transicoes
+                 for simbolos, _ in transicoes if simbolos is not None}
+    conjuntos = list(conjuntos)
+    grupos: Dict[Tuple[bool, ...], List[int]] = {}
+    for simbolo in sorted(TODOS_SIMBOLOS):
+        chave = tuple(simbolo in conjunto for conjunto in conjuntos)
+        grupos.setdefault(chave, []).append(simbolo)
+    return list(grupos.values())
+
+
+def gerar_tabelas(especificacao: Sequence[Tuple[str, str]] = ESPECIFICACAO,
+                  minimizar: bool = True) -> TabelasLexicas:
+    """
+    Gera o AFD da especificação (Thompson + subconjuntos)
+
+    Args:
+        especificacao: Pares (nome do token, ER) em ordem de prioridade
+        minimizar: Se True, aplica a minimização de Hopcroft
+
+    Returns:
+        TabelasLexicas: Tabelas do AFD com estado inicial 0
+    """
+    afn = construir_afn(especificacao)
+    grupos = _particionar_alfabeto(afn)
+    representantes = [grupo[0] for grupo in grupos]
+
+    inicial = afn.fecho_epsilon([afn.inicial])
+    estados = [inicial]
+    numeros = {inicial: 0}
+    destinos: List[List[int]] = []
+    for conjunto in estados:
+        linha = []
+        for simbolo in representantes:
+            alcancados = [destino for estado in conjunto
+                          for simbolos, destino in afn.transicoes[estado]
+                          if simbolos is not None and simbolo in simbolos]
+            if not alcancados:
+                linha.append(ESTADO_MORTO)
+                continue
+            proximo = afn.fecho_epsilon(alcancados)
+            if proximo not in numeros:
+                numeros[proximo] = len(estados)
+                estados.append(proximo)
+            linha.append(numeros[proximo])
+        destinos.append(linha)
+
+    # Conflitos: vence o token de menor índice na especificação
+    aceitacao = []
+    for conjunto in estados:
+        prioridades = [afn.aceitacao[estado] for estado in conjunto if estado in afn.aceitacao]
+        aceitacao.append(especificacao[min(prioridades)][0] if prioridades else None)
+
+    classe_do_simbolo = {}
+    for classe, grupo in enumerate(grupos):
+        for simbolo in grupo:
+            classe_do_simbolo[simbolo] = classe
+    transicoes = [destinos[estado][classe]
+                  for classe in range(len(grupos)) for estado in range(len(estados))]
+    tabelas = TabelasLexicas(
+        [classe_do_simbolo[codigo] for codigo in range(DEMAIS)], classe_do_simbolo[DEMAIS],
+        len(estados), transicoes, aceitacao, assinatura_especificacao(especificacao),
+    )
+    if minimizar:
+        tabelas = TabelasLexicas.de_afd(tabelas.para_afd().minimizar(), tabelas.assinatura)
+    return tabelas
+
+
+# ============================================================
+# 4. EMISSÃO E CARGA DAS TABELAS
+# ============================================================
+
+CAMINHO_TABELAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tabelas_lexicas.py')
+
+
+def _lista_python(valores: Sequence, por_linha: int = 20) -> str:
+    """Formata uma sequência como literal de tupla em várias linhas"""
+    linhas = []
+    for inicio in range(0, len(valores), por_linha):
+        linhas.append('    ' + ', '.join(repr(valor) for valor in valores[inicio:inicio + por_linha]) + ',')
+    return '(\n' + '\n'.join(linhas) + '\n)'
+
+
+def emitir_modulo(tabelas: TabelasLexicas) -> str:
+    """Gera o código fonte do módulo `tabelas_lexicas.py`"""
+    return (
+        '"""\n'
+        'Tabelas do AFD léxico geradas por `python -m src.gerador_afd`\n'
+        '\n'
+        'NÃO EDITE: altere ESPECIFICACAO em gerador_afd.py e gere novamente.\n'
+        '"""\n'
+        '\n'
+        f'ASSINATURA = {tabelas.assinatura!r}\n'
+        f'NUM_ESTADOS = {tabelas.num_estados}\n'
+        f'CLASSE_DEMAIS = {tabelas.classe_demais}\n'
+        '\n'
+        f'CLASSES_LATIN1 = {_lista_python(tabelas.classes_latin1, 32)}\n'
+        '\n'
+        f'TRANSICOES = {_lista_python(tabelas.transicoes)}\n'
+        '\n'
+        f'ACEITACAO = {_lista_python(tabelas.aceitacao, 6)}\n'
+    )
+
+
+def salvar_tabelas(caminho: str = CAMINHO_TABELAS) -> TabelasLexicas:
+    """Gera as tabelas da especificação atual e grava o módulo"""
+    tabelas = gerar_tabelas()
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        arquivo.write(emitir_modulo(tabelas))
+    return tabelas
+
+
+def carregar_tabelas() -> TabelasLexicas:
+    """
+    Carrega as tabelas gravadas, sem gerar o AFD novamente
+
+    Se o módulo não existir ou tiver sido gerado para outra especificação
+    (assinatura diferente), as tabelas são geradas em memória.
+    """
+    try:
+        from . import tabelas_lexicas as modulo
+    except ImportError:
+        return gerar_tabelas()
+    if modulo.ASSINATURA != assinatura_especificacao():
+        return gerar_tabelas()
+    return TabelasLexicas(modulo.CLASSES_LATIN1, modulo.CLASSE_DEMAIS, modulo.NUM_ESTADOS,
+                          modulo.TRANSICOES, modulo.ACEITACAO, modulo.ASSINATURA)
+
+
+if __name__ == '__main__':
+    from .automaton import relatorio_minimizacao
+    geradas = salvar_tabelas()
+    print(f"✓ {CAMINHO_TABELAS}")
+    print(relatorio_minimizacao(gerar_tabelas(minimizar=False).para_afd(), geradas.para_afd()))
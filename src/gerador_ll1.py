@@ -0,0 +1,325 @@
+"""
+Gerador da tabela LL(1) a partir da especificação da gramática
+
+A gramática do Portugol é escrita como dados (`GRAMATICA`), e a tabela de
+análise preditiva é derivada dela, em vez de codificada em cadeias de
+`if` sobre `TipoToken`:
+
+1. Anuláveis: não terminais que derivam a cadeia vazia
+2. FIRST(X): terminais que podem iniciar uma derivação de X
+3. FOLLOW(A): terminais que podem aparecer logo após A
+4. Tabela M[A, a]: para cada produção A → α, a entra em FIRST(α); se α é
+   anulável, também cada a em FOLLOW(A). Duas produções na mesma célula
+   são um conflito: a gramática não é LL(1) e a geração falha
+5. Tabela → módulo Python: gravada em `tabelas_sintaticas.py` com a
+   assinatura da gramática e carregada sem nova geração (ver
+   `carregar_tabela`)
+
+NOTAÇÃO:
+========
+Terminais são nomes de `TipoToken` (maiúsculas); não terminais, nomes em
+minúsculas; uma produção de corpo vazio é ε. As expressões aparecem na
+forma plana (fator operador fator ...), suficiente para FIRST/FOLLOW;
+precedência e associatividade ficam na tabela `OPERADORES_BINARIOS` do
+`parser_pratt`.
+
+O `Parser` consulta as linhas `comando` (qual comando começa com o token)
+e `comandos` (continuar o bloco ou encerrá-lo, pelo FOLLOW).
+
+Para regenerar a tabela após alterar a gramática:
+    python -m src.gerador_ll1
+"""
+
+import hashlib
+import os
+from typing import Dict, List, Sequence, Set, Tuple
+from .gerador_afd import _lista_python
+
+
+# Produções em ordem: (não terminal, corpo). A primeira define o símbolo inicial.
+GRAMATICA: List[Tuple[str, Tuple[str, ...]]] = [
+    ('programa', ('declaracoes', 'INICIO', 'comandos', 'FIM', 'EOF')),
+
+    ('declaracoes', ('declaracao', 'declaracoes')),
+    ('declaracoes', ()),
+    ('declaracao', ('tipo', 'IDENTIFICADOR', 'lista_nomes', 'PONTO_E_VIRGULA')),
+    ('tipo', ('INTEIRO',)),
+    ('tipo', ('REAL',)),
+    ('tipo', ('CARACTER',)),
+    ('tipo', ('LOGICO',)),
+    ('lista_nomes', ('VIRGULA', 'IDENTIFICADOR', 'lista_nomes')),
+    ('lista_nomes', ()),
+
+    ('comandos', ('comando', 'comandos')),
+    ('comandos', ()),
+    ('comando', ('atribuicao',)),
+    ('comando', ('condicional',)),
+    ('comando', ('repeticao',)),
+    ('comando', ('repeticao_para',)),
+    ('comando', ('entrada',)),
+    ('comando', ('saida',)),
+    ('atribuicao', ('IDENTIFICADOR', 'ATRIBUICAO', 'expressao')),
+    ('condicional', ('SE', 'expressao', 'ENTAO', 'comandos', 'senao', 'FIMSE')),
+    ('senao', ('SENAO', 'comandos')),
+    ('senao', ()),
+    ('repeticao', ('ENQUANTO', 'expressao', 'FACA', 'comandos', 'FIMENQUANTO')),
+    ('repeticao_para', ('PARA', 'IDENTIFICADOR', 'DE', 'expressao', 'ATE', 'expressao',
+                        'passo', 'FACA', 'comandos', 'FIMPARA')),
+    ('passo', ('PASSO', 'expressao')),
+    ('passo', ()),
+    ('entrada', ('LEIA', 'ABRE_PARENTESES', 'IDENTIFICADOR', 'FECHA_PARENTESES')),
+    ('saida', ('ESCREVA', 'ABRE_PARENTESES', 'expressao', 'lista_expressoes', 'FECHA_PARENTESES')),
+    ('lista_expressoes', ('VIRGULA', 'expressao', 'lista_expressoes')),
+    ('lista_expressoes', ()),
+
+    ('expressao', ('fator', 'resto_expressao')),
+    ('resto_expressao', ('operador_binario', 'fator', 'resto_expressao')),
+    ('resto_expressao', ()),
+    ('fator', ('IDENTIFICADOR',)),
+    ('fator', ('NUMERO_INTEIRO',)),
+    ('fator', ('NUMERO_REAL',)),
+    ('fator', ('TEXTO',)),
+    ('fator', ('VERDADEIRO',)),
+    ('fator', ('FALSO',)),
+    ('fator', ('ABRE_PARENTESES', 'expressao', 'FECHA_PARENTESES')),
+    ('fator', ('MENOS', 'fator')),
+] + [
+    ('operador_binario', (operador,)) for operador in (
+        'OU', 'E', 'IGUAL', 'DIFERENTE', 'MENOR', 'MENOR_IGUAL', 'MAIOR', 'MAIOR_IGUAL',
+        'MAIS', 'MENOS', 'MULTIPLICACAO', 'DIVISAO', 'MODULO', 'POTENCIA',
+    )
+]
+
+Gramatica = Sequence[Tuple[str, Sequence[str]]]
+
+
+def assinatura_gramatica(gramatica: Gramatica = GRAMATICA) -> str:
+    """Hash que identifica a gramática que gerou uma tabela"""
+    normalizada = [(cabeca, tuple(corpo)) for cabeca, corpo in gramatica]
+    return hashlib.sha1(repr(normalizada).encode('utf-8')).hexdigest()
+
+
+def nao_terminais(gramatica: Gramatica) -> List[str]:
+    """Não terminais na ordem da primeira produção de cada um"""
+    return list(dict.fromkeys(cabeca for cabeca, _ in gramatica))
+
+
+def terminais(gramatica: Gramatica) -> List[str]:
+    """Terminais na ordem em que aparecem nos corpos"""
+    cabecas = set(nao_terminais(gramatica))
+    return list(dict.fromkeys(simbolo for _, corpo in gramatica for simbolo in corpo
+                              if simbolo not in cabecas))
+
+
+# ============================================================
+# 1. ANULÁVEIS, FIRST E FOLLOW
+# ============================================================
+
+def calcular_anulaveis(gramatica: Gramatica) -> Set[str]:
+    """Não terminais que derivam ε (ponto fixo)"""
+    anulaveis: Set[str] = set()
+    mudou = True
+    while mudou:
+        mudou = False
+        for cabeca, corpo in gramatica:
+            if cabeca not in anulaveis and all(simbolo in anulaveis for simbolo in corpo):
+                anulaveis.add(cabeca)
+                mudou = True
+    return anulaveis
+
+
+def first_sequencia(simbolos: Sequence[str], first: Dict[str, Set[str]],
+                    anulaveis: Set[str]) -> Tuple[Set[str], bool]:
+    """
+    FIRST de uma sequência de símbolos
+
+    Returns:
+        Tuple[Set[str], bool]: Terminais iniciais e se a sequência é anulável
+    """
+    resultado: Set[str] = set()
+    for simbolo in simbolos:
+        if simbolo not in first:
+            resultado.add(simbolo)  # terminal
+            return resultado, False
+        resultado |= first[simbolo]
+        if simbolo not in anulaveis:
+            return resultado, False
+    return resultado, True
+
+
+def calcular_first(gramatica: Gramatica, anulaveis: Set[str]) -> Dict[str, Set[str]]:
+    """FIRST de cada não terminal (ponto fixo)"""
+    first: Dict[str, Set[str]] = {cabeca: set() for cabeca in nao_terminais(gramatica)}
+    mudou = True
+    while mudou:
+        mudou = False
+        for cabeca, corpo in gramatica:
+            iniciais, _ = first_sequencia(corpo, first, anulaveis)
+            if not iniciais <= first[cabeca]:
+                first[cabeca] |= iniciais
+                mudou = True
+    return first
+
+
+def calcular_follow(gramatica: Gramatica, first: Dict[str, Set[str]],
+                    anulaveis: Set[str]) -> Dict[str, Set[str]]:
+    """
+    FOLLOW de cada não terminal (ponto fixo)
+
+    O símbolo inicial termina com o terminal EOF na própria gramática, por
+    isso não há marcador de fim à parte.
+    """
+    follow: Dict[str, Set[str]] = {cabeca: set() for cabeca in first}
+    mudou = True
+    while mudou:
+        mudou = False
+        for cabeca, corpo in gramatica:
+            for posicao, simbolo in enumerate(corpo):
+                if simbolo not in follow:
+                    continue
+                seguintes, anulavel = first_sequencia(corpo[posicao + 1:], first, anulaveis)
+                if anulavel:
+                    seguintes = seguintes | follow[cabeca]
+                if not seguintes <= follow[simbolo]:
+                    follow[simbolo] |= seguintes
+                    mudou = True
+    return follow
+
+
+# ============================================================
+# 2. TABELA DE ANÁLISE PREDITIVA
+# ============================================================
+
+SEM_PRODUCAO = -1
+
+
+class TabelaLL1:
+    """
+    Tabela LL(1) em forma serializável
+
+    - nao_terminais / terminais: rótulos das linhas e colunas
+    - producoes: (não terminal, corpo) numeradas pela posição
+    - celulas: lista plana indexada por linha * len(terminais) + coluna,
+      com o número da produção ou SEM_PRODUCAO
+    """
+
+    def __init__(self, nao_terminais: Sequence[str], terminais: Sequence[str],
+                 producoes: Sequence[Tuple[str, Sequence[str]]], celulas: Sequence[int],
+                 assinatura: str):
+        self.nao_terminais = list(nao_terminais)
+        self.terminais = list(terminais)
+        self.producoes = [(cabeca, tuple(corpo)) for cabeca, corpo in producoes]
+        self.celulas = list(celulas)
+        self.assinatura = assinatura
+        self._linhas = {nome: indice for indice, nome in enumerate(self.nao_terminais)}
+        self._colunas = {nome: indice for indice, nome in enumerate(self.terminais)}
+
+    def producao(self, nao_terminal: str, terminal: str) -> int:
+        """Número da produção de M[nao_terminal, terminal], ou SEM_PRODUCAO"""
+        coluna = self._colunas.get(terminal)
+        if coluna is None:
+            return SEM_PRODUCAO
+        return self.celulas[self._linhas[nao_terminal] * len(self.terminais) + coluna]
+
+    def linha(self, nao_terminal: str) -> Dict[str, int]:
+        """Células preenchidas de uma linha: terminal → número da produção"""
+        inicio = self._linhas[nao_terminal] * len(self.terminais)
+        return {terminal: producao
+                for terminal, producao in zip(self.terminais, self.celulas[inicio:])
+                if producao != SEM_PRODUCAO}
+
+
+def gerar_tabela(gramatica: Gramatica = GRAMATICA) -> TabelaLL1:
+    """
+    Gera a tabela LL(1) da gramática
+
+    Raises:
+        ValueError: Se a gramática não é LL(1) (duas produções na mesma
+            célula) ou usa um não terminal sem produções
+    """
+    cabecas = nao_terminais(gramatica)
+    colunas = terminais(gramatica)
+    for _, corpo in gramatica:
+        for simbolo in corpo:
+            if simbolo.islower() and simbolo not in cabecas:
+                raise ValueError(f"Não terminal '{simbolo}' sem produções")
+    anulaveis = calcular_anulaveis(gramatica)
+    first = calcular_first(gramatica, anulaveis)
+    follow = calcular_follow(gramatica, first, anulaveis)
+
+    indice_coluna = {terminal: indice for indice, terminal in enumerate(colunas)}
+    celulas = [SEM_PRODUCAO] * (len(cabecas) * len(colunas))
+    for numero, (cabeca, corpo) in enumerate(gramatica):
+        previstos, anulavel = first_sequencia(corpo, first, anulaveis)
+        if anulavel:
+            previstos = previstos | follow[cabeca]
+        inicio = cabecas.index(cabeca) * len(colunas)
+        for terminal in previstos:
+            celula = inicio + indice_coluna[terminal]
+            if celulas[celula] != SEM_PRODUCAO:
+                raise ValueError(
+                    f"Gramática não é LL(1): M[{cabeca}, {terminal}] tem as produções "
+                    f"{celulas[celula]} e {numero}"
+                )
+            celulas[celula] = numero
+    return TabelaLL1(cabecas, colunas, gramatica, celulas, assinatura_gramatica(gramatica))
+
+
+# ============================================================
+# 3. EMISSÃO E CARGA DA TABELA
+# ============================================================
+
+CAMINHO_TABELAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tabelas_sintaticas.py')
+
+
+def emitir_modulo(tabela: TabelaLL1) -> str:
+    """Gera o código fonte do módulo `tabelas_sintaticas.py`"""
+    return (
+        '"""\n'
+        'Tabela LL(1) gerada por `python -m src.gerador_ll1`\n'
+        '\n'
+        'NÃO EDITE: altere GRAMATICA em gerador_ll1.py e gere novamente.\n'
+        '"""\n'
+        '\n'
+        f'ASSINATURA = {tabela.assinatura!r}\n'
+        '\n'
+        f'NAO_TERMINAIS = {_lista_python(tabela.nao_terminais, 6)}\n'
+        '\n'
+        f'TERMINAIS = {_lista_python(tabela.terminais, 6)}\n'
+        '\n'
+        f'PRODUCOES = {_lista_python(tabela.producoes, 1)}\n'
+        '\n'
+        f'CELULAS = {_lista_python(tabela.celulas, len(tabela.terminais))}\n'
+    )
+
+
+def salvar_tabela(caminho: str = CAMINHO_TABELAS) -> TabelaLL1:
+    """Gera a tabela da gramática atual e grava o módulo"""
+    tabela = gerar_tabela()
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        arquivo.write(emitir_modulo(tabela))
+    return tabela
+
+
+def carregar_tabela() -> TabelaLL1:
+    """
+    Carrega a tabela gravada, sem calcular FIRST/FOLLOW novamente
+
+    Se o módulo não existir ou tiver sido gerado para outra gramática
+    (assinatura diferente), a tabela é gerada em memória.
+    """
+    try:
+        from . import tabelas_sintaticas as modulo
+    except ImportError:
+        return gerar_tabela()
+    if modulo.ASSINATURA != assinatura_gramatica():
+        return gerar_tabela()
+    return TabelaLL1(modulo.NAO_TERMINAIS, modulo.TERMINAIS, modulo.PRODUCOES,
+                     modulo.CELULAS, modulo.ASSINATURA)
+
+
+if __name__ == '__main__':
+    gerada = salvar_tabela()
+    print(f"✓ {CAMINHO_TABELAS}")
+    print(f"  {len(gerada.producoes)} produções, {len(gerada.nao_terminais)} não terminais, "
+          f"{len(gerada.terminais)} terminais")
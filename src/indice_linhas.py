@@ -0,0 +1,68 @@
+"""
+Índice de linhas do código fonte
+
+Guarda o deslocamento inicial de cada linha, calculado uma única vez com
+`str.find('\\n')` em bloco. Linha e coluna de qualquer deslocamento são
+resolvidas por busca binária (`bisect`) apenas quando alguém precisa
+delas, em vez de serem mantidas caractere a caractere.
+
+Usado pelos diagnósticos (`CompiladorError.contexto`) para mostrar a
+linha do erro, e por qualquer ferramenta que converta deslocamentos de um
+`BufferTokens` em posições.
+
+NOTA: as posições dos tokens seguem as convenções do `Lexer` (por
+exemplo, comentários de linha e os delimitadores '/*' e '*/' não contam
+colunas), que podem diferir da coluna física resolvida por este índice.
+"""
+
+import bisect
+from typing import List, Tuple
+
+
+class IndiceLinhas:
+    """
+    Deslocamentos iniciais das linhas de um código fonte
+
+    Args:
+        codigo_fonte: Código fonte completo
+    """
+
+    def __init__(self, codigo_fonte: str):
+        self.codigo_fonte = codigo_fonte
+        inicios: List[int] = [0]
+        quebra = codigo_fonte.find('\n')
+        while quebra != -1:
+            inicios.append(quebra + 1)
+            quebra = codigo_fonte.find('\n', quebra + 1)
+        self.inicios = inicios
+
+    def __len__(self) -> int:
+        """Quantidade de linhas (um código vazio tem uma linha vazia)"""
+        return len(self.inicios)
+
+    def linha(self, deslocamento: int) -> int:
+        """Linha (a partir de 1) do deslocamento"""
+        return bisect.bisect_right(self.inicios, deslocamento)
+
+    def posicao(self, deslocamento: int) -> Tuple[int, int]:
+        """
+        Resolve um deslocamento em (linha, coluna), ambas a partir de 1
+
+        Args:
+            deslocamento: Posição no código fonte (0 <= deslocamento <= len)
+
+        Returns:
+            Tuple[int, int]: Linha e coluna físicas do deslocamento
+        """
+        linha = bisect.bisect_right(self.inicios, deslocamento)
+        return linha, deslocamento - self.inicios[linha - 1] + 1
+
+    def inicio_linha(self, linha: int) -> int:
+        """Deslocamento do primeiro caractere da linha"""
+        return self.inicios[linha - 1]
+
+    def texto_linha(self, linha: int) -> str:
+        """Texto da linha, sem a quebra de linha final"""
+        inicio = self.inicios[linha - 1]
+        fim = self.inicios[linha] - 1 if linha < len(self.inicios) else len(self.codigo_fonte)
+        return self.codigo_fonte[inicio:fim]
@@ -31,7 +31,7 @@ Código Intermediário:
     x = t2
 """
 
-from typing import List, Union, Optional
+from typing import Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from .ast_nodes import (
     Programa, DeclaracaoVariavel,
@@ -132,8 +132,7 @@ class GeradorCodigoIntermediario:
             self._gerar_declaracao(declaracao)
         
         # Gerar código para comandos
-        for comando in programa.comandos:
-            self._gerar_comando(comando)
+        self._gerar_comandos(programa.comandos)
         
         return self.instrucoes
     
@@ -153,20 +152,51 @@ class GeradorCodigoIntermediario:
             operando1=valor_inicial
         ))
     
+    def _gerar_comandos(self, comandos: List[Comando]) -> None:
+        """
+        Gera código intermediário para uma lista de comandos sem recursão
+        
+        Os comandos com blocos aninhados são geradores: produzem cada bloco
+        no ponto em que o código dele deve ser emitido e retomam depois
+        dele (saltos e labels de fechamento). A pilha explícita guarda os
+        blocos e geradores em andamento.
+        """
+        pilha: List[Iterator] = [iter(comandos)]
+        while pilha:
+            item = next(pilha[-1], None)
+            if item is None:
+                pilha.pop()
+            elif isinstance(item, list):
+                pilha.append(iter(item))
+            else:
+                etapas = self._iniciar_comando(item)
+                if etapas is not None:
+                    pilha.append(etapas)
+    
     def _gerar_comando(self, comando: Comando) -> None:
-        """Gera código intermediário para um comando"""
+        """Gera código intermediário para um comando (e seus blocos)"""
+        self._gerar_comandos([comando])
+    
+    def _iniciar_comando(self, comando: Comando) -> Optional[Iterator[List[Comando]]]:
+        """
+        Gera um comando simples, ou inicia um comando com blocos
+        
+        Returns:
+            Gerador dos blocos aninhados, ou None para comandos simples
+        """
         if isinstance(comando, Atribuicao):
             self._gerar_atribuicao(comando)
         elif isinstance(comando, Condicional):
-            self._gerar_condicional(comando)
+            return self._gerar_condicional(comando)
         elif isinstance(comando, Repeticao):
-            self._gerar_repeticao(comando)
+            return self._gerar_repeticao(comando)
         elif isinstance(comando, RepeticaoPara):
-            self._gerar_repeticao_para(comando)
+            return self._gerar_repeticao_para(comando)
         elif isinstance(comando, Entrada):
             self._gerar_entrada(comando)
         elif isinstance(comando, Saida):
             self._gerar_saida(comando)
+        return None
     
     def _gerar_atribuicao(self, atribuicao: Atribuicao) -> None:
         """
@@ -190,9 +220,10 @@ class GeradorCodigoIntermediario:
             operando1=temp_expr
         ))
     
-    def _gerar_condicional(self, condicional: Condicional) -> None:
+    def _gerar_condicional(self, condicional: Condicional) -> Iterator[List[Comando]]:
         """
-        Gera código intermediário para estrutura condicional
+        Gera código intermediário para estrutura condicional (gerador dos
+        blocos aninhados)
         
         Estrutura:
             ifFalse condicao goto L_senao
@@ -223,8 +254,7 @@ class GeradorCodigoIntermediario:
             ))
         
         # Comandos do "então"
-        for comando in condicional.comandos_entao:
-            self._gerar_comando(comando)
+        yield condicional.comandos_entao
         
         # Se há senão, pular para fim após executar então
         if condicional.comandos_senao:
@@ -240,8 +270,7 @@ class GeradorCodigoIntermediario:
             ))
             
             # Comandos do "senão"
-            for comando in condicional.comandos_senao:
-                self._gerar_comando(comando)
+            yield condicional.comandos_senao
         
         # Label do fim
         self.adicionar_instrucao(InstrucaoIntermediaria(
@@ -249,9 +278,10 @@ class GeradorCodigoIntermediario:
             resultado=label_fim
         ))
     
-    def _gerar_repeticao(self, repeticao: Repeticao) -> None:
+    def _gerar_repeticao(self, repeticao: Repeticao) -> Iterator[List[Comando]]:
         """
-        Gera código intermediário para loop while
+        Gera código intermediário para loop while (gerador dos blocos
+        aninhados)
         
         Estrutura:
         L_inicio:
@@ -280,8 +310,7 @@ class GeradorCodigoIntermediario:
         ))
         
         # Comandos do loop
-        for comando in repeticao.comandos:
-            self._gerar_comando(comando)
+        yield repeticao.comandos
         
         # Voltar para início
         self.adicionar_instrucao(InstrucaoIntermediaria(
@@ -295,9 +324,10 @@ class GeradorCodigoIntermediario:
             resultado=label_fim
         ))
 
-    def _gerar_repeticao_para(self, repeticao: RepeticaoPara) -> None:
+    def _gerar_repeticao_para(self, repeticao: RepeticaoPara) -> Iterator[List[Comando]]:
         """
-        Gera código intermediário para loop 'para'
+        Gera código intermediário para loop 'para' (gerador dos blocos
+        aninhados)
 
         Estrutura:
             variavel = inicio
@@ -345,8 +375,7 @@ class GeradorCodigoIntermediario:
         ))
 
         # Comandos do loop
-        for comando in repeticao.comandos:
-            self._gerar_comando(comando)
+        yield repeticao.comandos
 
         # Incrementar variável
         temp_passo = self._gerar_expressao(repeticao.passo)
@@ -396,71 +425,88 @@ class GeradorCodigoIntermediario:
         """
         Gera código intermediário para uma expressão
         
+        A árvore é percorrida em pós-ordem com uma pilha explícita (sem
+        recursão); os operandos já gerados ficam em uma segunda pilha até
+        o operador que os consome.
+        
         Args:
             expressao: Nó da expressão
             
         Returns:
             str: Nome do temporário ou variável que contém o resultado
         """
-        if isinstance(expressao, Literal):
-            # Literais são usados diretamente
-            valor = expressao.valor
-            if valor == 'verdadeiro':
-                return 'true'
-            elif valor == 'falso':
-                return 'false'
-            return valor
-        
-        elif isinstance(expressao, Variavel):
-            # Variáveis são usadas diretamente
-            return expressao.nome
-        
-        elif isinstance(expressao, ExpressaoBinaria):
-            # Avaliar operandos
-            temp1 = self._gerar_expressao(expressao.esquerda)
-            temp2 = self._gerar_expressao(expressao.direita)
+        operandos: List[str] = []
+        pilha: List[Tuple[Expressao, bool]] = [(expressao, False)]
+        while pilha:
+            no, operandos_prontos = pilha.pop()
+            if isinstance(no, Literal):
+                # Literais são usados diretamente
+                valor = no.valor
+                if valor == 'verdadeiro':
+                    valor = 'true'
+                elif valor == 'falso':
+                    valor = 'false'
+                operandos.append(valor)
             
-            # Criar temporário para resultado
-            resultado = self.novo_temporario()
+            elif isinstance(no, Variavel):
+                # Variáveis são usadas diretamente
+                operandos.append(no.nome)
             
-            # Mapear operadores Portugol → intermediário
-            operador = expressao.operador
-            if operador == 'e':
-                operador = 'and'
-            elif operador == 'ou':
-                operador = 'or'
+            elif isinstance(no, ExpressaoBinaria):
+                if not operandos_prontos:
+                    # Avaliar operandos (esquerda primeiro)
+                    pilha.append((no, True))
+                    pilha.append((no.direita, False))
+                    pilha.append((no.esquerda, False))
+                    continue
+                temp2 = operandos.pop()
+                temp1 = operandos.pop()
+                
+                # Criar temporário para resultado
+                resultado = self.novo_temporario()
+                
+                # Mapear operadores Portugol → intermediário
+                operador = no.operador
+                if operador == 'e':
+                    operador = 'and'
+                elif operador == 'ou':
+                    operador = 'or'
+                
+                # Adicionar instrução
+                self.adicionar_instrucao(InstrucaoIntermediaria(
+                    tipo='OP',
+                    resultado=resultado,
+                    operando1=temp1,
+                    operador=operador,
+                    operando2=temp2
+                ))
+                operandos.append(resultado)
             
-            # Adicionar instrução
-            self.adicionar_instrucao(InstrucaoIntermediaria(
-                tipo='OP',
-                resultado=resultado,
-                operando1=temp1,
-                operador=operador,
-                operando2=temp2
-            ))
+            elif isinstance(no, ExpressaoUnaria):
+                if not operandos_prontos:
+                    # Avaliar operando
+                    pilha.append((no, True))
+                    pilha.append((no.operando, False))
+                    continue
+                temp = operandos.pop()
+                
+                # Criar temporário para resultado
+                resultado = self.novo_temporario()
+                
+                # Adicionar instrução unária
+                self.adicionar_instrucao(InstrucaoIntermediaria(
+                    tipo='UNARY',
+                    resultado=resultado,
+                    operador=no.operador,
+                    operando1=temp
+                ))
+                operandos.append(resultado)
             
-            return resultado
+            else:
+                # Expressão desconhecida
+                operandos.append("???")
         
-        elif isinstance(expressao, ExpressaoUnaria):
-            # Avaliar operando
-            temp = self._gerar_expressao(expressao.operando)
-            
-            # Criar temporário para resultado
-            resultado = self.novo_temporario()
-            
-            # Adicionar instrução unária
-            self.adicionar_instrucao(InstrucaoIntermediaria(
-                tipo='UNARY',
-                resultado=resultado,
-                operador=expressao.operador,
-                operando1=temp
-            ))
-            
-            return resultado
-        
-        else:
-            # Expressão desconhecida
-            return "???"
+        return operandos[0]
     
     def imprimir_codigo(self) -> str:
         """
@@ -56,13 +56,83 @@ Os tokens são reconhecidos seguindo os seguintes padrões (ERs):
 
 NOTA: O lexer atual usa lógica imperativa direta (if/while) ao invés de
 um AFD explícito, mas os padrões acima definem formalmente cada token.
+O módulo `lexer_regex.py` oferece um segundo motor (`LexerRegex`) que
+combina essas ERs em uma única expressão regular mestre, e o módulo
+`gerador_afd.py` gera delas um AFD (Thompson + subconjuntos) usado pelo
+`LexerTabelado`.
 """
 
-from typing import Dict, Optional
+import re
+import sys
+from typing import Dict, List, Optional
 from .ast_nodes import TipoToken, Token
+from .buffer_tokens import BufferTokens
 from .exceptions import ErroLexico
 
 
+# Mapeamento de palavras-chave para tipos de token (tabela única do módulo,
+# compartilhada por todas as instâncias do Lexer)
+PALAVRAS_CHAVE: Dict[str, TipoToken] = {
+    'se': TipoToken.SE,
+    'entao': TipoToken.ENTAO,
+    'senao': TipoToken.SENAO,
+    'fimse': TipoToken.FIMSE,
+    'enquanto': TipoToken.ENQUANTO,
+    'fimenquanto': TipoToken.FIMENQUANTO,
+    'para': TipoToken.PARA,
+    'de': TipoToken.DE,
+    'ate': TipoToken.ATE,
+    'passo': TipoToken.PASSO,
+    'fimpara': TipoToken.FIMPARA,
+    'leia': TipoToken.LEIA,
+    'escreva': TipoToken.ESCREVA,
+    'inicio': TipoToken.INICIO,
+    'fim': TipoToken.FIM,
+    'inteiro': TipoToken.INTEIRO,
+    'real': TipoToken.REAL,
+    'caracter': TipoToken.CARACTER,
+    'logico': TipoToken.LOGICO,
+    'e': TipoToken.E,
+    'ou': TipoToken.OU,
+    'faca': TipoToken.FACA,
+    'verdadeiro': TipoToken.VERDADEIRO,
+    'falso': TipoToken.FALSO
+}
+
+# Trechos varridos em bloco pelos laços do lexer (sem atualizar linha e
+# coluna a cada caractere): \s e \w equivalem a str.isspace() e a
+# str.isalnum() ou '_'
+PADRAO_ESPACOS = re.compile(r'\s+')
+PADRAO_PALAVRA = re.compile(r'\w+')
+PADRAO_ESPECIAIS_STRING = re.compile(r'[\\"\n]')
+
+# Comprimentos possíveis de uma palavra-chave. Um identificador com outro
+# comprimento, ou já todo em minúsculas, não precisa de lower()
+TAMANHOS_PALAVRAS_CHAVE = frozenset(len(palavra) for palavra in PALAVRAS_CHAVE)
+
+
+def classificar_palavra(lexema: str) -> TipoToken:
+    """
+    Classifica uma palavra como palavra-chave ou identificador
+    
+    A busca exata cobre o caso comum (código em minúsculas). Só palavras
+    com maiúsculas e comprimento de alguma palavra-chave pagam a
+    conversão para minúsculas.
+    
+    Args:
+        lexema: Palavra reconhecida pela ER de identificadores
+        
+    Returns:
+        TipoToken: Tipo da palavra-chave, ou IDENTIFICADOR
+    """
+    tipo = PALAVRAS_CHAVE.get(lexema)
+    if tipo is not None:
+        return tipo
+    if len(lexema) in TAMANHOS_PALAVRAS_CHAVE and not lexema.islower():
+        return PALAVRAS_CHAVE.get(lexema.lower(), TipoToken.IDENTIFICADOR)
+    return TipoToken.IDENTIFICADOR
+
+
 class Lexer:
     """
     Analisador léxico para a linguagem Portugol
@@ -72,42 +142,27 @@ class Lexer:
     - Identificar palavras-chave, operadores e literais
     - Ignorar espaços em branco e comentários
     - Rastrear posição (linha/coluna) para relatórios de erro
+    
+    No modo de recuperação (`recuperar=True`), um trecho inválido não
+    interrompe a análise: o erro é guardado em `erros` e o trecho vira um
+    token ERRO, na posição do erro. Uma string não fechada é relatada na
+    aspa de abertura; o seu token ERRO vai até o fim do código e liga
+    `erro_ate_o_fim`, para o parser não relatar o EOF que vem em seguida.
     """
     
-    def __init__(self, codigo_fonte: str):
+    def __init__(self, codigo_fonte: str, recuperar: bool = False):
         self.codigo_fonte = codigo_fonte
         self.tamanho_codigo = len(codigo_fonte)
         self.posicao_atual = 0
         self.linha = 1
         self.coluna = 1
         
-        # Mapeamento de palavras-chave para tipos de token
-        self.palavras_chave: Dict[str, TipoToken] = {
-            'se': TipoToken.SE,
-            'entao': TipoToken.ENTAO,
-            'senao': TipoToken.SENAO,
-            'fimse': TipoToken.FIMSE,
-            'enquanto': TipoToken.ENQUANTO,
-            'fimenquanto': TipoToken.FIMENQUANTO,
-            'para': TipoToken.PARA,
-            'de': TipoToken.DE,
-            'ate': TipoToken.ATE,
-            'passo': TipoToken.PASSO,
-            'fimpara': TipoToken.FIMPARA,
-            'leia': TipoToken.LEIA,
-            'escreva': TipoToken.ESCREVA,
-            'inicio': TipoToken.INICIO,
-            'fim': TipoToken.FIM,
-            'inteiro': TipoToken.INTEIRO,
-            'real': TipoToken.REAL,
-            'caracter': TipoToken.CARACTER,
-            'logico': TipoToken.LOGICO,
-            'e': TipoToken.E,
-            'ou': TipoToken.OU,
-            'faca': TipoToken.FACA,
-            'verdadeiro': TipoToken.VERDADEIRO,
-            'falso': TipoToken.FALSO
-        }
+        # Tabela compartilhada (ver PALAVRAS_CHAVE)
+        self.palavras_chave = PALAVRAS_CHAVE
+        
+        self.recuperar = recuperar
+        self.erros: List[ErroLexico] = []
+        self.erro_ate_o_fim = False
 
     def _avancar(self, num_caracteres: int = 1) -> None:
         """Avança a posição atual no código fonte"""
@@ -126,110 +181,165 @@ class Lexer:
             return self.codigo_fonte[self.posicao_atual + 1]
         return None
 
+    def _relatar_erro(self, erro: ErroLexico, inicio: int, fim: int) -> Token:
+        """
+        Lança o erro léxico ou, no modo de recuperação, registra-o
+        
+        Args:
+            erro: Erro encontrado
+            inicio: Deslocamento inicial do trecho inválido
+            fim: Deslocamento final (exclusivo) do trecho inválido, na
+                mesma linha da posição atual
+            
+        Returns:
+            Token: Token ERRO com o trecho, que é consumido
+            
+        Raises:
+            ErroLexico: Fora do modo de recuperação
+        """
+        if not self.recuperar:
+            raise erro
+        self.erros.append(erro)
+        self._avancar(fim - self.posicao_atual)
+        if fim >= self.tamanho_codigo:
+            self.erro_ate_o_fim = True
+        return Token(TipoToken.ERRO, self.codigo_fonte[inicio:fim], erro.linha, erro.coluna)
+
+    def _contabilizar_espacos(self, inicio: int, fim: int) -> None:
+        """
+        Atualiza linha/coluna para o trecho ignorado [inicio, fim)
+        
+        Os laços de varredura avançam apenas o deslocamento; a linha e a
+        coluna são resolvidas aqui, uma vez por trecho.
+        """
+        quebras = self.codigo_fonte.count('\n', inicio, fim)
+        if quebras:
+            self.linha += quebras
+            self.coluna = fim - self.codigo_fonte.rfind('\n', inicio, fim)
+        else:
+            self.coluna += fim - inicio
+        self.posicao_atual = fim
+
     def _ignorar_espacos_e_comentarios(self) -> None:
         """Ignora espaços em branco e comentários"""
-        while self.posicao_atual < self.tamanho_codigo:
-            caractere = self._caractere_atual()
+        codigo = self.codigo_fonte
+        tamanho = self.tamanho_codigo
+        while self.posicao_atual < tamanho:
+            posicao = self.posicao_atual
+            caractere = codigo[posicao]
             
-            # Espaços em branco
+            # Espaços em branco (\s equivale a str.isspace)
             if caractere.isspace():
-                if caractere == '\n':
-                    self.linha += 1
-                    self.coluna = 1
-                else:
-                    self.coluna += 1
-                self.posicao_atual += 1
+                self._contabilizar_espacos(posicao, PADRAO_ESPACOS.match(codigo, posicao).end())
                 
-            # Comentário de linha (//)
-            elif caractere == '/' and self._proximo_caractere() == '/':
-                while self.posicao_atual < self.tamanho_codigo and self._caractere_atual() != '\n':
-                    self.posicao_atual += 1
-                # Nova linha será processada na próxima iteração
+            # Comentário de linha (//): não conta colunas; a nova linha
+            # será processada na próxima iteração
+            elif codigo.startswith('//', posicao):
+                fim = codigo.find('\n', posicao)
+                self.posicao_atual = tamanho if fim == -1 else fim
                 
-            # Comentário de bloco (/* */)
-            elif caractere == '/' and self._proximo_caractere() == '*':
-                self.posicao_atual += 2
-                while self.posicao_atual + 1 < self.tamanho_codigo:
-                    if self._caractere_atual() == '*' and self._proximo_caractere() == '/':
-                        self.posicao_atual += 2
-                        break
-                    if self._caractere_atual() == '\n':
-                        self.linha += 1
-                        self.coluna = 1
-                    else:
-                        self.coluna += 1
-                    self.posicao_atual += 1
+            # Comentário de bloco (/* */): os delimitadores não contam colunas
+            elif codigo.startswith('/*', posicao):
+                fim = codigo.find('*/', posicao + 2)
+                if fim == -1:
+                    # Não fechado: o último caractere fica para a tokenização
+                    self._contabilizar_espacos(posicao + 2, max(posicao + 2, tamanho - 1))
+                else:
+                    self._contabilizar_espacos(posicao + 2, fim)
+                    self.posicao_atual = fim + 2
             else:
                 break
 
     def _ler_identificador_ou_palavra_chave(self) -> Token:
         """Lê um identificador ou palavra-chave"""
         pos_inicial_coluna = self.coluna
-        lexema = ''
+        inicio = self.posicao_atual
         
-        caractere = self._caractere_atual()
-        while caractere is not None and (caractere.isalnum() or caractere == '_'):
-            lexema += caractere
-            self._avancar()
-            caractere = self._caractere_atual()
+        # \w equivale a str.isalnum() ou '_'
+        fim = PADRAO_PALAVRA.match(self.codigo_fonte, inicio).end()
+        lexema = self.codigo_fonte[inicio:fim]
+        self._avancar(fim - inicio)
             
         # Verifica se é palavra-chave ou identificador
-        tipo = self.palavras_chave.get(lexema.lower(), TipoToken.IDENTIFICADOR)
+        tipo = classificar_palavra(lexema)
+        if tipo == TipoToken.IDENTIFICADOR:
+            # Nomes repetidos compartilham o mesmo objeto str
+            lexema = sys.intern(lexema)
         return Token(tipo, lexema, self.linha, pos_inicial_coluna)
 
     def _ler_numero(self) -> Token:
         """Lê um literal numérico (inteiro ou real)"""
         pos_inicial_coluna = self.coluna
-        lexema = ''
+        codigo = self.codigo_fonte
+        inicio = self.posicao_atual
         is_real = False
         
-        caractere = self._caractere_atual()
-        while caractere is not None and (caractere.isdigit() or caractere == '.'):
-            if caractere == '.':
+        fim = inicio
+        while fim < self.tamanho_codigo and (codigo[fim].isdigit() or codigo[fim] == '.'):
+            if codigo[fim] == '.':
                 if is_real:
-                    raise ErroLexico("Número real inválido - múltiplos pontos decimais", 
-                                   self.linha, self.coluna)
+                    self._avancar(fim - inicio)
+                    erro = ErroLexico("Número real inválido - múltiplos pontos decimais", 
+                                      self.linha, self.coluna)
+                    # O restante do número (dígitos e pontos) faz parte do trecho inválido
+                    while fim < self.tamanho_codigo and (codigo[fim].isdigit() or codigo[fim] == '.'):
+                        fim += 1
+                    return self._relatar_erro(erro, inicio, fim)
                 is_real = True
-            lexema += caractere
-            self._avancar()
-            caractere = self._caractere_atual()
+            fim += 1
+        lexema = codigo[inicio:fim]
+        self._avancar(fim - inicio)
             
         tipo = TipoToken.NUMERO_REAL if is_real else TipoToken.NUMERO_INTEIRO
         return Token(tipo, lexema, self.linha, pos_inicial_coluna)
 
     def _ler_string(self) -> Token:
         """Lê um literal de string"""
+        pos_inicial_linha = self.linha
         pos_inicial_coluna = self.coluna
-        self._avancar()  # Pula a primeira aspas
-        lexema = ''
+        codigo = self.codigo_fonte
+        tamanho = self.tamanho_codigo
+        inicio = self.posicao_atual
+        posicao = inicio + 1  # Pula a primeira aspas
+        partes = []
         
-        while self._caractere_atual() is not None:
-            caractere = self._caractere_atual()
-            
-            # Tratamento de escape
-            if caractere == '\\':
-                self._avancar()
-                proximo = self._caractere_atual()
-                if proximo:
-                    lexema += proximo
-                    self._avancar()
-                continue
+        # Avança por trechos até o próximo '\\', '"' ou '\n'
+        while True:
+            especial = PADRAO_ESPECIAIS_STRING.search(codigo, posicao)
+            if especial is None:
+                partes.append(codigo[posicao:])
+                posicao = tamanho
+                break
+            indice = especial.start()
+            partes.append(codigo[posicao:indice])
+            caractere = codigo[indice]
             
             if caractere == '"':
+                posicao = indice
                 break
-                
-            if caractere == '\n':
-                self.linha += 1
-                self.coluna = 1
             
-            lexema += caractere
-            self._avancar()
+            if caractere == '\\':
+                # Tratamento de escape (um '\\n' escapado não conta linha)
+                if indice + 1 < tamanho:
+                    partes.append(codigo[indice + 1])
+                posicao = min(indice + 2, tamanho)
+                continue
             
-        if self._caractere_atual() != '"':
-            raise ErroLexico("String não fechada", self.linha, pos_inicial_coluna)
+            # Quebra de linha: a coluna recomeça em 1 e conta o próprio '\n'
+            partes.append('\n')
+            self.linha += 1
+            self.coluna = 1 - (indice - inicio)
+            posicao = indice + 1
+        
+        self._avancar(posicao - self.posicao_atual)
+        if posicao >= tamanho:
+            # No modo de recuperação, na aspa de abertura (ver Lexer)
+            linha_erro = pos_inicial_linha if self.recuperar else self.linha
+            return self._relatar_erro(ErroLexico("String não fechada", linha_erro, pos_inicial_coluna),
+                                      inicio, tamanho)
             
         self._avancar()  # Pula a aspas final
-        return Token(TipoToken.TEXTO, lexema, self.linha, pos_inicial_coluna)
+        return Token(TipoToken.TEXTO, ''.join(partes), self.linha, pos_inicial_coluna)
 
     def _ler_operador_composto(self) -> Optional[Token]:
         """Lê operadores compostos (<=, >=, ==, !=, <-)"""
@@ -262,7 +372,8 @@ class Lexer:
             Token: O próximo token encontrado
             
         Raises:
-            ErroLexico: Se encontrar um caractere inválido
+            ErroLexico: Se encontrar um caractere inválido (exceto no modo
+                de recuperação, que devolve um token ERRO)
         """
         self._ignorar_espacos_e_comentarios()
         
@@ -271,6 +382,7 @@ class Lexer:
 
         caractere = self._caractere_atual()
         pos_inicial_coluna = self.coluna
+        posicao = self.posicao_atual
 
         # Identificadores e palavras-chave
         if caractere.isalpha() or caractere == '_':
@@ -299,8 +411,9 @@ class Lexer:
             elif caractere == '>':
                 return Token(TipoToken.MAIOR, '>', self.linha, pos_inicial_coluna)
             elif caractere == '!':
-                raise ErroLexico("Operador '!' deve ser seguido de '='", 
-                               self.linha, pos_inicial_coluna)
+                erro = ErroLexico("Operador '!' deve ser seguido de '='", 
+                                  self.linha, pos_inicial_coluna)
+                return self._relatar_erro(erro, posicao, posicao + 1)
 
         # Símbolos simples
         simbolos_simples = {
@@ -323,4 +436,24 @@ class Lexer:
             return Token(simbolos_simples[caractere], caractere, self.linha, pos_inicial_coluna)
 
         # Caractere não reconhecido
-        raise ErroLexico(f"Caractere inesperado '{caractere}'", self.linha, pos_inicial_coluna)
\ No newline at end of file
+        erro = ErroLexico(f"Caractere inesperado '{caractere}'", self.linha, pos_inicial_coluna)
+        return self._relatar_erro(erro, posicao, posicao + 1)
+
+    def tokenizar(self) -> BufferTokens:
+        """
+        Tokeniza todo o código fonte restante de uma vez
+        
+        Returns:
+            BufferTokens: Buffer compacto com todos os tokens, terminando em EOF
+            
+        Raises:
+            ErroLexico: Se encontrar um caractere inválido
+        """
+        buffer = BufferTokens(self.codigo_fonte)
+        while True:
+            self._ignorar_espacos_e_comentarios()
+            inicio = self.posicao_atual
+            token = self.proximo_token()
+            buffer.adicionar_token(token, inicio, self.posicao_atual)
+            if token.tipo == TipoToken.EOF:
+                return buffer
\ No newline at end of file
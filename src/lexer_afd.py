@@ -0,0 +1,131 @@
+"""
+Motor léxico dirigido pelas tabelas dos AFDs
+
+Os AFDs de `automaton.py` (identificadores, inteiros e reais) são
+compilados uma única vez, no carregamento do módulo, em um AFD produto
+tabelado (`compilar_afds_de_tokens`). O `LexerAFD` reconhece
+identificadores, palavras-chave e números por casamento mais longo sobre
+essas tabelas: uma consulta à tabela de classes e uma ao array de
+transições por caractere.
+
+Operadores são resolvidos pela tabela `OPERADORES` do motor regex.
+Comentários, strings e os casos de erro (ex.: número com múltiplos
+pontos) seguem o `Lexer` imperativo, de modo que a sequência de tokens,
+posições e erros é idêntica à dos demais motores.
+"""
+
+import re
+import sys
+from typing import Optional
+from .ast_nodes import TipoToken, Token
+from .automaton import AFDTabelado, compilar_afds_de_tokens
+from .lexer import Lexer, classificar_palavra
+from .lexer_regex import OPERADORES
+
+
+# AFD combinado padrão (compilado uma vez por processo)
+AFD_TOKENS = compilar_afds_de_tokens()
+
+# Nomes aceitos pelo AFD → tipos de token
+TIPOS_POR_NOME = {tipo.name: tipo for tipo in TipoToken}
+_IDENTIFICADOR = TipoToken.IDENTIFICADOR
+
+# Espaços comuns antes do token (os demais seguem o Lexer imperativo)
+PADRAO_ESPACOS = re.compile(r'[ \t\n]*')
+
+
+class LexerAFD(Lexer):
+    """
+    Analisador léxico que usa AFDs tabelados no caminho rápido
+
+    Args:
+        codigo_fonte: Código fonte em Portugol
+        afd: Tabelas a usar (padrão: AFD_TOKENS)
+        recuperar: Registra erros léxicos e devolve tokens ERRO (ver Lexer)
+    """
+
+    def __init__(self, codigo_fonte: str, afd: Optional[AFDTabelado] = None,
+                 recuperar: bool = False):
+        super().__init__(codigo_fonte, recuperar)
+        self.afd = afd if afd is not None else AFD_TOKENS
+
+    def proximo_token(self) -> Token:
+        """
+        Retorna o próximo token do código fonte
+
+        Returns:
+            Token: O próximo token encontrado
+
+        Raises:
+            ErroLexico: Se encontrar um caractere inválido
+        """
+        codigo = self.codigo_fonte
+        tamanho = self.tamanho_codigo
+        posicao = self.posicao_atual
+
+        # Espaços comuns sem passar pelo laço genérico
+        fim = PADRAO_ESPACOS.match(codigo, posicao).end()
+        if fim != posicao:
+            quebras = codigo.count('\n', posicao, fim)
+            if quebras:
+                self.linha += quebras
+                self.coluna = fim - codigo.rfind('\n', posicao, fim)
+            else:
+                self.coluna += fim - posicao
+            self.posicao_atual = posicao = fim
+
+        if posicao >= tamanho:
+            return Token(TipoToken.EOF, 'EOF', self.linha, self.coluna)
+
+        caractere = codigo[posicao]
+        if caractere == '/' or caractere.isspace():
+            # Comentários e espaços incomuns
+            self._ignorar_espacos_e_comentarios()
+            posicao = self.posicao_atual
+            if posicao >= tamanho:
+                return Token(TipoToken.EOF, 'EOF', self.linha, self.coluna)
+
+        # Percorre as tabelas até o estado morto
+        afd = self.afd
+        transicoes = afd.transicoes
+        latin1 = afd.deslocamentos_latin1
+        estado = 0
+        fim = posicao
+        while fim < tamanho:
+            ordinal = ord(codigo[fim])
+            proximo = transicoes[(latin1[ordinal] if ordinal < 256 else afd.deslocamento(codigo[fim])) + estado]
+            if proximo < 0:
+                break
+            estado = proximo
+            fim += 1
+
+        nome = afd.aceitacao[estado]
+        if nome is None and fim > posicao:
+            # Último estado não final: recua até o último aceito
+            fim, nome = afd.reconhecer(codigo, posicao)
+
+        coluna = self.coluna
+        if nome is None:
+            # Operadores; strings e erros seguem o Lexer imperativo
+            lexema = codigo[posicao:posicao + 2]
+            tipo = OPERADORES.get(lexema)
+            if tipo is None:
+                lexema = lexema[:1]
+                tipo = OPERADORES.get(lexema)
+                if tipo is None:
+                    return super().proximo_token()
+            fim = posicao + len(lexema)
+        elif fim < tamanho and codigo[fim] == '.':
+            # Número com múltiplos pontos: erro na posição do Lexer
+            return super().proximo_token()
+        else:
+            lexema = codigo[posicao:fim]
+            tipo = TIPOS_POR_NOME[nome]
+            if tipo is _IDENTIFICADOR:
+                tipo = classificar_palavra(lexema)
+                if tipo is _IDENTIFICADOR:
+                    lexema = sys.intern(lexema)
+
+        self.coluna = coluna + fim - posicao
+        self.posicao_atual = fim
+        return Token(tipo, lexema, self.linha, coluna)
@@ -0,0 +1,381 @@
+"""
+Motor léxico sobre os bytes UTF-8 do arquivo (sem decodificação prévia)
+
+Os demais motores recebem uma `str`: o arquivo inteiro é decodificado (e
+as quebras de linha traduzidas pelo modo texto) antes da análise começar,
+mantendo na memória os bytes lidos e o texto decodificado. O `LexerBytes`
+trabalha diretamente sobre os bytes (`bytes`, `bytearray` ou
+`memoryview`), com as mesmas ERs do `LexerRegex` compiladas em uma regex
+de bytes, cujas classes de caracteres ASCII são tabelas de bytes.
+
+DECODIFICAÇÃO SOB DEMANDA:
+==========================
+Só são decodificados:
+- os lexemas de identificadores e números (ASCII; um nome repetido é
+  decodificado uma única vez, via cache por instância)
+- o conteúdo de strings
+- comentários de bloco com caracteres não-ASCII ou '\\r' (para contar
+  colunas em caracteres, e não em bytes)
+- trechos com caracteres não-ASCII fora de strings (identificadores
+  acentuados como `média`) e os casos de borda (strings com quebra de
+  linha ou não fechadas, comentários não fechados, caracteres inválidos):
+  o trecho é decodificado e analisado pelo `Lexer` imperativo, a partir
+  da linha e coluna atuais
+
+BOM E QUEBRAS DE LINHA:
+=======================
+No mesmo passo da análise, um BOM UTF-8 inicial é ignorado e '\\r\\n' e
+'\\r' isolado contam como uma única quebra de linha, como na leitura em
+modo texto. A sequência de tokens (tipos, lexemas, linhas e colunas em
+caracteres) é idêntica à do `Lexer` sobre
+`dados.decode('utf-8-sig')` com quebras de linha universais. Os
+deslocamentos do `BufferTokens` retornado por `tokenizar()` são em bytes.
+
+NOTA: bytes UTF-8 inválidos geram `ErroLexico` apenas quando o trecho
+precisa ser decodificado; dentro de comentários ASCII eles são ignorados.
+"""
+
+import codecs
+import re
+import sys
+from typing import Dict, Iterator, List, Tuple, Union
+from .ast_nodes import TipoToken, Token
+from .buffer_tokens import (
+    BufferTokens, CODIGOS_TIPO, TIPOS_TOKEN, CODIGO_EOF, CODIGO_IDENTIFICADOR, CODIGO_TEXTO,
+)
+from .exceptions import ErroLexico
+from .lexer import Lexer, classificar_palavra
+from .lexer_regex import OPERADORES, PADRAO_ESCAPE
+
+
+# Mesma alternância do PADRAO_MESTRE do LexerRegex, sobre bytes. Os
+# espaços incluem '\r'; strings com '\r' ou '\n', comentários não
+# fechados e qualquer byte >= 0x80 fora de strings e comentários caem em
+# COMENTARIO_ABERTO ou OUTRO (trecho decodificado).
+PADRAO_MESTRE_BYTES = re.compile(rb"""
+    (?P<ESPACO>[\t-\r\x1c-\x1f ]*)
+    (?:
+        (?P<IDENTIFICADOR>[A-Za-z_][A-Za-z0-9_]*)
+      | (?P<COMENTARIO_LINHA>//[^\n\r]*)
+      | (?P<COMENTARIO_BLOCO>/\*(?s:.*?)\*/)
+      | (?P<COMENTARIO_ABERTO>/\*)
+      | (?P<OPERADOR><=|>=|==|!=|<-|[-+*/%^<>=(){};,])
+      | (?P<NUMERO>[0-9][0-9.]*)
+      | (?P<TEXTO>"[^"\\\n\r]*(?:\\[^\n\r][^"\\\n\r]*)*")
+      | (?P<EOF>\Z)
+      | (?P<OUTRO>)
+    )
+""", re.VERBOSE)
+
+# Trecho que contém identificadores/números com caracteres não-ASCII: ele
+# termina em um caractere ASCII que não continua nenhum token
+PADRAO_TRECHO_PALAVRAS = re.compile(rb'[0-9A-Za-z_.\x80-\xff]+')
+
+# String com quebra de linha ou não fechada (mesma extensão do Lexer)
+PADRAO_TRECHO_STRING = re.compile(rb'"(?:[^"\\]|\\.)*(?:"|\\?\Z)', re.DOTALL)
+
+BOM_UTF8 = codecs.BOM_UTF8
+
+_CODIGOS_OPERADORES_BYTES = {
+    lexema.encode('ascii'): (CODIGOS_TIPO[tipo], lexema) for lexema, tipo in OPERADORES.items()
+}
+_COD_NUMERO_INTEIRO = CODIGOS_TIPO[TipoToken.NUMERO_INTEIRO]
+_COD_NUMERO_REAL = CODIGOS_TIPO[TipoToken.NUMERO_REAL]
+
+_GRUPO_IDENTIFICADOR = PADRAO_MESTRE_BYTES.groupindex['IDENTIFICADOR']
+_GRUPO_COMENTARIO_LINHA = PADRAO_MESTRE_BYTES.groupindex['COMENTARIO_LINHA']
+_GRUPO_COMENTARIO_BLOCO = PADRAO_MESTRE_BYTES.groupindex['COMENTARIO_BLOCO']
+_GRUPO_OPERADOR = PADRAO_MESTRE_BYTES.groupindex['OPERADOR']
+_GRUPO_NUMERO = PADRAO_MESTRE_BYTES.groupindex['NUMERO']
+_GRUPO_TEXTO = PADRAO_MESTRE_BYTES.groupindex['TEXTO']
+_GRUPO_EOF = PADRAO_MESTRE_BYTES.groupindex['EOF']
+
+# (código do tipo, lexema, início, fim, linha, coluna)
+TokenBruto = Tuple[int, str, int, int, int, int]
+
+
+def decodificar_trecho(dados: bytes) -> Tuple[str, List[int]]:
+    """
+    Decodifica um trecho UTF-8 com quebras de linha universais
+
+    Args:
+        dados: Bytes do trecho
+
+    Returns:
+        Tuple[str, List[int]]: Texto com '\\r\\n' e '\\r' trocados por '\\n'
+        e, para cada posição do texto (inclusive o fim), o deslocamento
+        correspondente em bytes
+
+    Raises:
+        UnicodeDecodeError: Se os bytes não forem UTF-8 válido
+    """
+    bruto = dados.decode('utf-8')
+    caracteres: List[str] = []
+    posicoes: List[int] = []
+    deslocamento = 0
+    indice = 0
+    while indice < len(bruto):
+        caractere = bruto[indice]
+        posicoes.append(deslocamento)
+        indice += 1
+        if caractere == '\r':
+            caractere = '\n'
+            if bruto.startswith('\n', indice):
+                indice += 1
+                deslocamento += 1
+        caracteres.append(caractere)
+        codigo = ord(caractere)
+        deslocamento += 1 if codigo < 0x80 else 2 if codigo < 0x800 else 3 if codigo < 0x10000 else 4
+    posicoes.append(deslocamento)
+    return ''.join(caracteres), posicoes
+
+
+def decodificar_fonte(dados: Union[bytes, bytearray, memoryview]) -> str:
+    """
+    Texto equivalente aos bytes lidos em modo texto, sem o BOM
+
+    Usado para mostrar o contexto de erros; bytes inválidos viram U+FFFD.
+    """
+    texto = bytes(dados).decode('utf-8-sig', errors='replace')
+    return texto.replace('\r\n', '\n').replace('\r', '\n')
+
+
+class BufferTokensBytes(BufferTokens):
+    """BufferTokens cujo código fonte são bytes UTF-8 (deslocamentos em bytes)"""
+
+    def _lexema_do_codigo(self, codigo_tipo: int, inicio: int, fim: int) -> str:
+        """Lexema implícito: fatia decodificada do código (sem aspas para strings)"""
+        if codigo_tipo == CODIGO_IDENTIFICADOR:
+            return sys.intern(self.codigo_fonte[inicio:fim].decode('utf-8'))
+        if codigo_tipo == CODIGO_TEXTO:
+            return self.codigo_fonte[inicio + 1:fim - 1].decode('utf-8')
+        if codigo_tipo == CODIGO_EOF:
+            return 'EOF'
+        return self.codigo_fonte[inicio:fim].decode('utf-8')
+
+
+class LexerBytes(Lexer):
+    """
+    Analisador léxico sobre os bytes UTF-8 do código fonte
+
+    Mantém a interface do `Lexer` (`proximo_token` e `tokenizar`);
+    `posicao_atual` é um deslocamento em bytes, enquanto `linha` e
+    `coluna` contam caracteres, como nos demais motores.
+    """
+
+    def __init__(self, dados: Union[bytes, bytearray, memoryview]):
+        """
+        Args:
+            dados: Código fonte em UTF-8 (bytearray e memoryview são
+                copiados para bytes, sem decodificação)
+        """
+        if not isinstance(dados, bytes):
+            dados = bytes(dados)
+        super().__init__(dados)
+        if dados.startswith(BOM_UTF8):
+            self.posicao_atual = len(BOM_UTF8)
+        # Cache de palavras: bytes -> (código do tipo, lexema)
+        self._palavras: Dict[bytes, Tuple[int, str]] = {}
+        self._tokens = self._varrer()
+
+    def proximo_token(self) -> Token:
+        """
+        Retorna o próximo token do código fonte
+
+        Raises:
+            ErroLexico: Se encontrar um caractere inválido ou UTF-8 inválido
+        """
+        codigo_tipo, lexema, _, _, linha, coluna = next(self._tokens)
+        return Token(TIPOS_TOKEN[codigo_tipo], lexema, linha, coluna)
+
+    def tokenizar(self) -> BufferTokensBytes:
+        """
+        Tokeniza todo o código fonte restante de uma vez
+
+        Returns:
+            BufferTokensBytes: Buffer com deslocamentos em bytes, terminando em EOF
+
+        Raises:
+            ErroLexico: Se encontrar um caractere inválido ou UTF-8 inválido
+        """
+        buffer = BufferTokensBytes(self.codigo_fonte)
+        adicionar_tipo = buffer.tipos.append
+        adicionar_inicio = buffer.inicios.append
+        adicionar_fim = buffer.fins.append
+        adicionar_linha = buffer.linhas.append
+        adicionar_coluna = buffer.colunas.append
+        especiais = buffer.lexemas_especiais
+        lexema_do_codigo = buffer._lexema_do_codigo
+        for codigo_tipo, lexema, inicio, fim, linha, coluna in self._tokens:
+            if codigo_tipo == CODIGO_TEXTO and lexema_do_codigo(codigo_tipo, inicio, fim) != lexema:
+                especiais[len(buffer.tipos)] = lexema
+            adicionar_tipo(codigo_tipo)
+            adicionar_inicio(inicio)
+            adicionar_fim(fim)
+            adicionar_linha(linha)
+            adicionar_coluna(coluna)
+            if codigo_tipo == CODIGO_EOF:
+                return buffer
+
+    def _varrer(self) -> Iterator[TokenBruto]:
+        """
+        Gera os tokens brutos; após o EOF, continua gerando EOF
+
+        Linha, coluna e posição locais são copiadas para o objeto a cada
+        token, para que `posicao_atual`, `linha` e `coluna` reflitam o
+        ponto após o último token entregue.
+        """
+        codigo = self.codigo_fonte
+        tamanho = self.tamanho_codigo
+        palavras = self._palavras
+        operadores = _CODIGOS_OPERADORES_BYTES
+        casar = PADRAO_MESTRE_BYTES.match
+        posicao, linha, coluna = self.posicao_atual, self.linha, self.coluna
+
+        while True:
+            casamento = casar(codigo, posicao)
+            inicio = casamento.end(1)
+            if inicio != posicao:
+                if codigo.find(b'\r', posicao, inicio) >= 0:
+                    # '\r\n' e '\r' isolado contam como uma quebra de linha
+                    espacos = codigo[posicao:inicio].replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+                    linha += espacos.count(b'\n')
+                    coluna = len(espacos) - espacos.rfind(b'\n')
+                else:
+                    quebras = codigo.count(b'\n', posicao, inicio)
+                    if quebras:
+                        linha += quebras
+                        coluna = inicio - codigo.rfind(b'\n', posicao, inicio)
+                    else:
+                        coluna += inicio - posicao
+                posicao = inicio
+
+            grupo = casamento.lastindex
+            fim = casamento.end()
+
+            if grupo == _GRUPO_IDENTIFICADOR:
+                if fim < tamanho and codigo[fim] >= 0x80:
+                    # Identificador continua com letra acentuada
+                    grupo = None
+                else:
+                    palavra = codigo[inicio:fim]
+                    conhecida = palavras.get(palavra)
+                    if conhecida is None:
+                        lexema = sys.intern(palavra.decode('ascii'))
+                        conhecida = palavras[palavra] = (CODIGOS_TIPO[classificar_palavra(lexema)], lexema)
+                    codigo_tipo, lexema = conhecida
+
+            elif grupo == _GRUPO_OPERADOR:
+                codigo_tipo, lexema = operadores[codigo[inicio:fim]]
+
+            elif grupo == _GRUPO_NUMERO:
+                if codigo.count(b'.', inicio, fim) > 1 or (fim < tamanho and codigo[fim] >= 0x80):
+                    # Erro de múltiplos pontos ou dígito não-ASCII
+                    grupo = None
+                else:
+                    lexema = codigo[inicio:fim].decode('ascii')
+                    codigo_tipo = _COD_NUMERO_REAL if '.' in lexema else _COD_NUMERO_INTEIRO
+
+            elif grupo == _GRUPO_TEXTO:
+                try:
+                    texto = codigo[inicio:fim].decode('utf-8')
+                except UnicodeDecodeError:
+                    raise ErroLexico("Sequência UTF-8 inválida em string", linha, coluna) from None
+                lexema = texto[1:-1]
+                if '\\' in lexema:
+                    lexema = PADRAO_ESCAPE.sub(r'\1', lexema)
+                # Colunas em caracteres, não em bytes
+                self.linha, self.coluna, self.posicao_atual = linha, coluna + len(texto), fim
+                yield CODIGO_TEXTO, lexema, inicio, fim, linha, coluna
+                posicao = fim
+                coluna += len(texto)
+                continue
+
+            elif grupo == _GRUPO_COMENTARIO_LINHA:
+                # O Lexer imperativo não conta colunas dentro do comentário
+                posicao = fim
+                continue
+
+            elif grupo == _GRUPO_COMENTARIO_BLOCO:
+                # Os delimitadores '/*' e '*/' não contam colunas
+                interno = codigo[inicio + 2:fim - 2]
+                if interno.isascii() and b'\r' not in interno:
+                    quebras = interno.count(b'\n')
+                    if quebras:
+                        linha += quebras
+                        coluna = len(interno) - interno.rfind(b'\n')
+                    else:
+                        coluna += len(interno)
+                else:
+                    texto, _ = self._decodificar(interno, linha, coluna)
+                    quebras = texto.count('\n')
+                    if quebras:
+                        linha += quebras
+                        coluna = len(texto) - texto.rfind('\n')
+                    else:
+                        coluna += len(texto)
+                posicao = fim
+                continue
+
+            elif grupo == _GRUPO_EOF:
+                self.posicao_atual, self.linha, self.coluna = posicao, linha, coluna
+                while True:
+                    yield CODIGO_EOF, 'EOF', posicao, posicao, linha, coluna
+
+            else:
+                # COMENTARIO_ABERTO e OUTRO
+                grupo = None
+
+            if grupo is None:
+                # Trecho não-ASCII ou caso de borda: delega ao Lexer imperativo
+                yield from self._varrer_trecho(posicao, linha, coluna)
+                posicao, linha, coluna = self.posicao_atual, self.linha, self.coluna
+                continue
+
+            self.linha = linha
+            self.coluna = coluna + fim - inicio
+            self.posicao_atual = fim
+            yield codigo_tipo, lexema, inicio, fim, linha, coluna
+            posicao = fim
+            coluna += fim - inicio
+
+    def _varrer_trecho(self, inicio: int, linha: int, coluna: int) -> Iterator[TokenBruto]:
+        """
+        Decodifica o trecho que começa em `inicio` e o analisa com o Lexer
+
+        O trecho termina em um ponto onde nenhum token pode continuar: após
+        a última letra/dígito, no fim da string, ou no fim do código (para
+        comentários não fechados). Um trecho que vai até o fim do código
+        inclui o EOF.
+        """
+        codigo = self.codigo_fonte
+        if codigo.startswith(b'"', inicio):
+            fim = PADRAO_TRECHO_STRING.match(codigo, inicio).end()
+        elif codigo.startswith(b'/*', inicio):
+            fim = self.tamanho_codigo
+        else:
+            casamento = PADRAO_TRECHO_PALAVRAS.match(codigo, inicio)
+            fim = casamento.end() if casamento else inicio + 1
+
+        texto, posicoes = self._decodificar(codigo[inicio:fim], linha, coluna)
+        lexer = Lexer(texto)
+        lexer.linha, lexer.coluna = linha, coluna
+        ate_o_fim = fim == self.tamanho_codigo
+        while True:
+            lexer._ignorar_espacos_e_comentarios()
+            inicio_token = lexer.posicao_atual
+            token = lexer.proximo_token()
+            if token.tipo is TipoToken.EOF and not ate_o_fim:
+                break
+            self.posicao_atual = inicio + posicoes[lexer.posicao_atual]
+            self.linha, self.coluna = lexer.linha, lexer.coluna
+            yield (CODIGOS_TIPO[token.tipo], token.lexema, inicio + posicoes[inicio_token],
+                   self.posicao_atual, token.linha, token.coluna)
+        self.posicao_atual, self.linha, self.coluna = fim, lexer.linha, lexer.coluna
+
+    def _decodificar(self, dados: bytes, linha: int, coluna: int) -> Tuple[str, List[int]]:
+        """decodificar_trecho, com UTF-8 inválido reportado como ErroLexico"""
+        try:
+            return decodificar_trecho(dados)
+        except UnicodeDecodeError:
+            raise ErroLexico("Sequência UTF-8 inválida", linha, coluna) from None
@@ -0,0 +1,107 @@
+"""
+Reanálise léxica incremental a partir de edições
+
+Integrações com editores precisam dos tokens atualizados a cada tecla.
+Em vez de tokenizar o arquivo inteiro de novo, `relexar_incremental`
+recebe o `BufferTokens` anterior e a edição (deslocamento, quantidade
+removida, texto inserido) e reanalisa apenas o trecho afetado.
+
+PONTO DE REINÍCIO:
+==================
+O Lexer não guarda estado entre tokens além de (posição, linha, coluna):
+comentários de bloco e strings com quebra de linha são consumidos
+inteiros dentro de uma única chamada a `proximo_token`. Logo, o início de
+qualquer token é um ponto seguro de reinício, com o estado registrado no
+próprio token, desde que:
+
+- o token termine antes da edição (fim < deslocamento): o caractere que
+  encerrou o token não mudou, então ele continua idêntico;
+- o token não seja TEXTO: a linha registrada em uma string é a linha em
+  que ela termina, e não o estado do lexer no seu início.
+
+RESSINCRONIZAÇÃO:
+=================
+Após o fim da edição, cada novo token que começa em uma posição p é
+comparado com o token antigo que começava em p - delta. Se ambos têm o
+mesmo tipo, o mesmo tamanho e a mesma coluna, o lexer está no mesmo
+estado sobre o mesmo texto, e todos os tokens seguintes se repetem: são
+copiados do buffer antigo com posições deslocadas por delta e linhas por
+uma diferença constante.
+"""
+
+from bisect import bisect_left
+from typing import Type
+from .ast_nodes import TipoToken
+from .buffer_tokens import BufferTokens, CODIGO_TEXTO
+from .lexer import Lexer
+from .lexer_regex import LexerRegex
+
+
+def _ponto_de_reinicio(buffer: BufferTokens, deslocamento: int) -> int:
+    """Índice do último token seguro para reiniciar antes da edição (-1 se nenhum)"""
+    indice = bisect_left(buffer.fins, deslocamento) - 1
+    while indice >= 0 and buffer.tipos[indice] == CODIGO_TEXTO:
+        indice -= 1
+    return indice
+
+
+def relexar_incremental(buffer: BufferTokens, deslocamento: int, removidos: int,
+                        inseridos: str, classe_lexer: Type[Lexer] = LexerRegex) -> BufferTokens:
+    """
+    Aplica uma edição ao código do buffer e retorna os novos tokens
+
+    Args:
+        buffer: Tokens do código antes da edição (saída de `tokenizar()`)
+        deslocamento: Posição da edição no código antigo
+        removidos: Quantidade de caracteres removidos a partir do deslocamento
+        inseridos: Texto inserido no deslocamento
+        classe_lexer: Motor léxico usado no trecho reanalisado
+
+    Returns:
+        BufferTokens: Tokens do código editado, idênticos aos de uma
+        tokenização completa
+
+    Raises:
+        ErroLexico: Se o trecho reanalisado contiver um caractere inválido
+        ValueError: Se a edição estiver fora do código
+    """
+    antigo = buffer.codigo_fonte
+    if deslocamento < 0 or removidos < 0 or deslocamento + removidos > len(antigo):
+        raise ValueError("Edição fora dos limites do código fonte")
+
+    codigo = antigo[:deslocamento] + inseridos + antigo[deslocamento + removidos:]
+    delta = len(inseridos) - removidos
+    fim_edicao = deslocamento + len(inseridos)
+
+    # Prefixo intacto: copiado sem reanálise
+    reinicio = _ponto_de_reinicio(buffer, deslocamento)
+    novo = BufferTokens(codigo)
+    lexer = classe_lexer(codigo)
+    if reinicio >= 0:
+        novo.copiar(buffer, 0, reinicio)
+        lexer.posicao_atual = buffer.inicios[reinicio]
+        lexer.linha = buffer.linhas[reinicio]
+        lexer.coluna = buffer.colunas[reinicio]
+
+    inicios_antigos = buffer.inicios
+    while True:
+        lexer._ignorar_espacos_e_comentarios()
+        inicio = lexer.posicao_atual
+        token = lexer.proximo_token()
+        fim = lexer.posicao_atual
+
+        if inicio >= fim_edicao:
+            # Mesmo texto adiante: procura o token antigo correspondente
+            correspondente = bisect_left(inicios_antigos, inicio - delta)
+            if (correspondente < len(buffer)
+                    and inicios_antigos[correspondente] == inicio - delta
+                    and buffer.fins[correspondente] == fim - delta
+                    and buffer.tipo(correspondente) == token.tipo
+                    and buffer.colunas[correspondente] == token.coluna):
+                novo.copiar(buffer, correspondente, len(buffer), delta,
+                            token.linha - buffer.linhas[correspondente])
+                return novo
+
+        novo.adicionar_token(token, inicio, fim)
+        if token.tipo == TipoToken.EOF:
+            return novo
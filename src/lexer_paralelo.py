@@ -0,0 +1,146 @@
+"""
+Tokenização paralela de arquivos grandes
+
+O código fonte é dividido em trechos nas quebras de linha, cada trecho é
+tokenizado em um processo separado (`ProcessPoolExecutor`) e os buffers
+parciais são unidos em um único `BufferTokens`, com posições e linhas
+corrigidas. O resultado é idêntico ao de `Lexer.tokenizar()`.
+
+PONTOS DE CORTE SEGUROS:
+========================
+Um corte logo após um '\\n' é seguro se o '\\n' não estiver dentro de uma
+string ou de um comentário de bloco: ali nenhum token atravessa a quebra
+e o lexer sequencial estaria na coluna 1. Uma varredura prévia com uma
+única ER (`PADRAO_TRECHOS_PROTEGIDOS`) localiza strings e comentários na
+mesma ordem em que o lexer os encontraria (o mais à esquerda primeiro, e
+'//' antes de '/*'); os cortes evitam esses intervalos.
+
+Cada trecho começa na linha 1. O deslocamento de linhas do trecho seguinte
+vem da linha do EOF do trecho anterior (não da contagem de '\\n'), o que
+preserva inclusive o caso do '\\n' escapado dentro de string, que o lexer
+não conta como nova linha.
+
+Abaixo de `LIMIAR_PARALELO_PADRAO` caracteres, o custo de criar processos
+e transferir os buffers supera o ganho e a tokenização é sequencial.
+"""
+
+import bisect
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple, Type
+from .buffer_tokens import BufferTokens
+from .exceptions import ErroLexico
+from .lexer import Lexer
+from .lexer_regex import LexerRegex
+
+
+# Tamanho mínimo (em caracteres) para tokenizar em paralelo
+LIMIAR_PARALELO_PADRAO = 1 << 22
+
+# Strings (inclusive não fechadas) e comentários, na ordem do lexer
+PADRAO_TRECHOS_PROTEGIDOS = re.compile(
+    r'"(?:[^"\\]|\\.)*(?:"|\\?\Z)'
+    r'|//[^\n]*'
+    r'|/\*.*?(?:\*/|\Z)',
+    re.DOTALL,
+)
+
+
+def pontos_de_corte(codigo: str, partes: int) -> List[int]:
+    """
+    Encontra posições de corte seguras para dividir o código
+
+    Args:
+        codigo: Código fonte completo
+        partes: Quantidade desejada de trechos
+
+    Returns:
+        List[int]: Posições iniciais dos trechos após o primeiro (cada uma
+        logo após um '\\n' fora de strings e comentários de bloco)
+    """
+    inicios: List[int] = []
+    fins: List[int] = []
+    for casamento in PADRAO_TRECHOS_PROTEGIDOS.finditer(codigo):
+        inicios.append(casamento.start())
+        fins.append(casamento.end())
+
+    cortes: List[int] = []
+    tamanho_trecho = len(codigo) // max(partes, 1)
+    alvo = tamanho_trecho
+    while alvo < len(codigo) and len(cortes) < partes - 1:
+        quebra = codigo.find('\n', alvo)
+        while quebra != -1:
+            # Intervalo protegido que começa antes da quebra
+            indice = bisect.bisect_right(inicios, quebra) - 1
+            if indice < 0 or fins[indice] <= quebra:
+                break
+            quebra = codigo.find('\n', fins[indice])
+        if quebra == -1 or quebra + 1 >= len(codigo):
+            break
+        cortes.append(quebra + 1)
+        alvo = max(quebra + 1, alvo + tamanho_trecho)
+    return cortes
+
+
+def _tokenizar_trecho(trecho: str, classe_lexer: Type[Lexer]) -> Tuple:
+    """
+    Tokeniza um trecho em um processo de trabalho
+
+    Retorna apenas os arrays do buffer (o trecho já está no processo
+    principal), ou os dados do erro léxico com a linha relativa ao trecho.
+    """
+    try:
+        buffer = classe_lexer(trecho).tokenizar()
+    except ErroLexico as erro:
+        return ('erro', erro.mensagem, erro.linha, erro.coluna)
+    return ('tokens', buffer.tipos, buffer.inicios, buffer.fins, buffer.linhas,
+            buffer.colunas, buffer.lexemas_especiais)
+
+
+def tokenizar_paralelo(codigo: str, classe_lexer: Type[Lexer] = LexerRegex,
+                       trabalhadores: Optional[int] = None,
+                       limiar: int = LIMIAR_PARALELO_PADRAO) -> BufferTokens:
+    """
+    Tokeniza o código em paralelo, com resultado idêntico ao sequencial
+
+    Args:
+        codigo: Código fonte completo
+        classe_lexer: Motor léxico usado em cada trecho
+        trabalhadores: Número de processos (padrão: os.cpu_count())
+        limiar: Tamanho mínimo do código para usar processos
+
+    Returns:
+        BufferTokens: Todos os tokens, terminando em EOF
+
+    Raises:
+        ErroLexico: O primeiro erro léxico do código, com a posição do
+        lexer sequencial
+    """
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+    cortes = pontos_de_corte(codigo, trabalhadores) if len(codigo) >= limiar else []
+    if not cortes:
+        return classe_lexer(codigo).tokenizar()
+
+    limites = [0] + cortes + [len(codigo)]
+    trechos = [codigo[inicio:fim] for inicio, fim in zip(limites, limites[1:])]
+    with ProcessPoolExecutor(max_workers=trabalhadores) as executor:
+        resultados = list(executor.map(_tokenizar_trecho, trechos,
+                                       [classe_lexer] * len(trechos)))
+
+    buffer = BufferTokens(codigo)
+    delta_linha = 0
+    for numero, resultado in enumerate(resultados):
+        if resultado[0] == 'erro':
+            _, mensagem, linha, coluna = resultado
+            raise ErroLexico(mensagem, linha + delta_linha, coluna)
+
+        parcial = BufferTokens(trechos[numero])
+        (_, parcial.tipos, parcial.inicios, parcial.fins, parcial.linhas,
+         parcial.colunas, parcial.lexemas_especiais) = resultado
+        ultimo = numero == len(resultados) - 1
+        # O EOF intermediário só informa a linha final do trecho
+        quantidade = len(parcial) if ultimo else len(parcial) - 1
+        buffer.copiar(parcial, 0, quantidade, limites[numero], delta_linha)
+        delta_linha += parcial.linhas[-1] - 1
+    return buffer
@@ -0,0 +1,295 @@
+"""
+Motor léxico baseado em uma única expressão regular mestre
+
+Este módulo implementa uma segunda engine para a análise léxica. Em vez de
+percorrer o código fonte caractere a caractere, as ERs documentadas em
+`lexer.py` são combinadas em uma única alternância de grupos nomeados,
+compilada uma vez no carregamento do módulo:
+
+    ESPACO* (IDENTIFICADOR | COMENTARIO_LINHA | COMENTARIO_BLOCO |
+             OPERADOR | NUMERO | TEXTO | EOF)
+
+Espaços e comentários são consumidos pelo próprio motor de regex (os
+espaços antes de cada token vêm no mesmo casamento) e os lexemas são
+obtidos por fatias do código fonte.
+
+COMPATIBILIDADE:
+================
+O `LexerRegex` produz exatamente a mesma sequência de tokens do `Lexer`
+imperativo, incluindo linha/coluna e as posições de `ErroLexico`. Os casos
+raros que a regex não cobre de forma segura (caracteres não-ASCII fora de
+strings, strings com quebra de linha ou não fechadas, comentários de bloco
+não fechados, números com múltiplos pontos e caracteres inválidos) são
+delegados ao `Lexer` imperativo a partir da posição atual.
+"""
+
+import re
+import sys
+from .ast_nodes import TipoToken, Token
+from .buffer_tokens import BufferTokens, CODIGOS_TIPO
+from .lexer import Lexer, PALAVRAS_CHAVE, TAMANHOS_PALAVRAS_CHAVE
+
+
+# Alternância mestre: espaços iniciais seguidos de um token ou comentário.
+# A ordem dos grupos alternativos define a prioridade.
+PADRAO_MESTRE = re.compile(r"""
+    (?P<ESPACO>[\t-\r\x1c-\x1f ]*)
+    (?:
+        (?P<IDENTIFICADOR>[A-Za-z_][A-Za-z0-9_]*)
+      | (?P<COMENTARIO_LINHA>//[^\n]*)
+      | (?P<COMENTARIO_BLOCO>/\*(?s:.*?)\*/)
+      | (?P<COMENTARIO_ABERTO>/\*)
+      | (?P<OPERADOR><=|>=|==|!=|<-|[-+*/%^<>=(){};,])
+      | (?P<NUMERO>[0-9][0-9.]*)
+      | (?P<TEXTO>"[^"\\\n]*(?:\\[^\n][^"\\\n]*)*")
+      | (?P<TEXTO_ABERTO>")
+      | (?P<EOF>\Z)
+    )
+""", re.VERBOSE)
+
+# Remoção das barras de escape dentro de strings
+PADRAO_ESCAPE = re.compile(r'\\(.)')
+
+OPERADORES = {
+    '<=': TipoToken.MENOR_IGUAL,
+    '>=': TipoToken.MAIOR_IGUAL,
+    '==': TipoToken.IGUAL,
+    '!=': TipoToken.DIFERENTE,
+    '<-': TipoToken.ATRIBUICAO,
+    '=': TipoToken.ATRIBUICAO,
+    '<': TipoToken.MENOR,
+    '>': TipoToken.MAIOR,
+    '(': TipoToken.ABRE_PARENTESES,
+    ')': TipoToken.FECHA_PARENTESES,
+    '{': TipoToken.ABRE_CHAVES,
+    '}': TipoToken.FECHA_CHAVES,
+    ';': TipoToken.PONTO_E_VIRGULA,
+    ',': TipoToken.VIRGULA,
+    '+': TipoToken.MAIS,
+    '-': TipoToken.MENOS,
+    '*': TipoToken.MULTIPLICACAO,
+    '/': TipoToken.DIVISAO,
+    '%': TipoToken.MODULO,
+    '^': TipoToken.POTENCIA,
+}
+
+# Membros do enum em variáveis de módulo (o acesso via classe é mais lento)
+_IDENTIFICADOR = TipoToken.IDENTIFICADOR
+_NUMERO_INTEIRO = TipoToken.NUMERO_INTEIRO
+_NUMERO_REAL = TipoToken.NUMERO_REAL
+_TEXTO = TipoToken.TEXTO
+_EOF = TipoToken.EOF
+
+# Mesmas tabelas, com os códigos inteiros usados pelo BufferTokens
+_CODIGOS_OPERADORES = {lexema: CODIGOS_TIPO[tipo] for lexema, tipo in OPERADORES.items()}
+_CODIGOS_PALAVRAS_CHAVE = {palavra: CODIGOS_TIPO[tipo] for palavra, tipo in PALAVRAS_CHAVE.items()}
+_COD_IDENTIFICADOR = CODIGOS_TIPO[_IDENTIFICADOR]
+_COD_NUMERO_INTEIRO = CODIGOS_TIPO[_NUMERO_INTEIRO]
+_COD_NUMERO_REAL = CODIGOS_TIPO[_NUMERO_REAL]
+_COD_TEXTO = CODIGOS_TIPO[_TEXTO]
+
+# Índices dos grupos da regex mestre (comparação inteira via `lastindex`)
+_GRUPO_IDENTIFICADOR = PADRAO_MESTRE.groupindex['IDENTIFICADOR']
+_GRUPO_COMENTARIO_LINHA = PADRAO_MESTRE.groupindex['COMENTARIO_LINHA']
+_GRUPO_COMENTARIO_BLOCO = PADRAO_MESTRE.groupindex['COMENTARIO_BLOCO']
+_GRUPO_OPERADOR = PADRAO_MESTRE.groupindex['OPERADOR']
+_GRUPO_NUMERO = PADRAO_MESTRE.groupindex['NUMERO']
+_GRUPO_TEXTO = PADRAO_MESTRE.groupindex['TEXTO']
+
+
+class LexerRegex(Lexer):
+    """
+    Analisador léxico dirigido por uma expressão regular mestre
+
+    Mantém a mesma interface do `Lexer` (`proximo_token`) e o mesmo
+    rastreamento de linha/coluna, mas reconhece cada token com uma única
+    chamada a `PADRAO_MESTRE.match`.
+    """
+
+    def proximo_token(self) -> Token:
+        """
+        Retorna o próximo token do código fonte
+
+        Returns:
+            Token: O próximo token encontrado
+
+        Raises:
+            ErroLexico: Se encontrar um caractere inválido
+        """
+        codigo = self.codigo_fonte
+        tamanho = self.tamanho_codigo
+        casar = PADRAO_MESTRE.match
+
+        while True:
+            posicao = self.posicao_atual
+            casamento = casar(codigo, posicao)
+            if casamento is None:
+                # Caractere fora do alfabeto ASCII ou inválido
+                return super().proximo_token()
+
+            inicio = casamento.end(1)
+            if inicio != posicao:
+                quebras = codigo.count('\n', posicao, inicio)
+                if quebras:
+                    self.linha += quebras
+                    self.coluna = inicio - codigo.rfind('\n', posicao, inicio)
+                else:
+                    self.coluna += inicio - posicao
+                self.posicao_atual = inicio
+
+            grupo = casamento.lastgroup
+            fim = casamento.end()
+
+            if grupo == 'IDENTIFICADOR':
+                if fim < tamanho and codigo[fim] >= '\x80':
+                    # Identificador continua com letra acentuada
+                    return super().proximo_token()
+                lexema = codigo[inicio:fim]
+                tipo = PALAVRAS_CHAVE.get(lexema)
+                if tipo is None:
+                    # Ver classificar_palavra: lower() só para maiúsculas
+                    if len(lexema) in TAMANHOS_PALAVRAS_CHAVE and not lexema.islower():
+                        tipo = PALAVRAS_CHAVE.get(lexema.lower(), _IDENTIFICADOR)
+                    else:
+                        tipo = _IDENTIFICADOR
+                    if tipo is _IDENTIFICADOR:
+                        lexema = sys.intern(lexema)
+
+            elif grupo == 'OPERADOR':
+                lexema = codigo[inicio:fim]
+                tipo = OPERADORES[lexema]
+
+            elif grupo == 'NUMERO':
+                lexema = codigo[inicio:fim]
+                if lexema.count('.') > 1 or (fim < tamanho and codigo[fim] >= '\x80'):
+                    # Erro de múltiplos pontos ou dígito não-ASCII
+                    return super().proximo_token()
+                tipo = _NUMERO_REAL if '.' in lexema else _NUMERO_INTEIRO
+
+            elif grupo == 'TEXTO':
+                lexema = codigo[inicio + 1:fim - 1]
+                if '\\' in lexema:
+                    lexema = PADRAO_ESCAPE.sub(r'\1', lexema)
+                tipo = _TEXTO
+
+            elif grupo == 'COMENTARIO_LINHA':
+                # O Lexer imperativo não conta colunas dentro do comentário
+                self.posicao_atual = fim
+                continue
+
+            elif grupo == 'COMENTARIO_BLOCO':
+                # Os delimitadores '/*' e '*/' não contam colunas
+                self._contabilizar_espacos(inicio + 2, fim - 2)
+                self.posicao_atual = fim
+                continue
+
+            elif grupo == 'EOF':
+                return Token(_EOF, 'EOF', self.linha, self.coluna)
+
+            else:
+                # COMENTARIO_ABERTO e TEXTO_ABERTO: casos de borda
+                return super().proximo_token()
+
+            coluna = self.coluna
+            self.coluna = coluna + fim - inicio
+            self.posicao_atual = fim
+            return Token(tipo, lexema, self.linha, coluna)
+
+    def tokenizar(self) -> BufferTokens:
+        """
+        Tokeniza todo o código fonte restante de uma vez
+
+        Caminho rápido da API em lote: os tokens vão direto para os arrays
+        do buffer, sem criar objetos Token.
+
+        Returns:
+            BufferTokens: Buffer compacto com todos os tokens, terminando em EOF
+
+        Raises:
+            ErroLexico: Se encontrar um caractere inválido
+        """
+        codigo = self.codigo_fonte
+        tamanho = self.tamanho_codigo
+        palavras_chave = _CODIGOS_PALAVRAS_CHAVE
+        operadores = _CODIGOS_OPERADORES
+
+        buffer = BufferTokens(codigo)
+        adicionar_tipo = buffer.tipos.append
+        adicionar_inicio = buffer.inicios.append
+        adicionar_fim = buffer.fins.append
+        adicionar_linha = buffer.linhas.append
+        adicionar_coluna = buffer.colunas.append
+        especiais = buffer.lexemas_especiais
+
+        posicao, linha, coluna = self.posicao_atual, self.linha, self.coluna
+        while True:
+            # O scanner continua cada casamento do fim do anterior
+            proximo_casamento = PADRAO_MESTRE.scanner(codigo, posicao).match
+            while True:
+                casamento = proximo_casamento()
+                if casamento is None:
+                    break
+                inicio = casamento.end(1)
+                if inicio != posicao:
+                    quebras = codigo.count('\n', posicao, inicio)
+                    if quebras:
+                        linha += quebras
+                        coluna = inicio - codigo.rfind('\n', posicao, inicio)
+                    else:
+                        coluna += inicio - posicao
+                    posicao = inicio
+
+                grupo = casamento.lastindex
+                fim = casamento.end()
+
+                if grupo == _GRUPO_IDENTIFICADOR:
+                    if fim < tamanho and codigo[fim] >= '\x80':
+                        break
+                    palavra = codigo[inicio:fim]
+                    codigo_tipo = palavras_chave.get(palavra)
+                    if codigo_tipo is None:
+                        codigo_tipo = _COD_IDENTIFICADOR
+                        if len(palavra) in TAMANHOS_PALAVRAS_CHAVE and not palavra.islower():
+                            codigo_tipo = palavras_chave.get(palavra.lower(), _COD_IDENTIFICADOR)
+                elif grupo == _GRUPO_OPERADOR:
+                    codigo_tipo = operadores[codigo[inicio:fim]]
+                elif grupo == _GRUPO_NUMERO:
+                    if codigo.count('.', inicio, fim) > 1 or (fim < tamanho and codigo[fim] >= '\x80'):
+                        break
+                    codigo_tipo = _COD_NUMERO_REAL if codigo.find('.', inicio, fim) >= 0 else _COD_NUMERO_INTEIRO
+                elif grupo == _GRUPO_TEXTO:
+                    if codigo.find('\\', inicio, fim) >= 0:
+                        especiais[len(buffer.tipos)] = PADRAO_ESCAPE.sub(r'\1', codigo[inicio + 1:fim - 1])
+                    codigo_tipo = _COD_TEXTO
+                elif grupo == _GRUPO_COMENTARIO_LINHA:
+                    posicao = fim
+                    continue
+                elif grupo == _GRUPO_COMENTARIO_BLOCO:
+                    quebras = codigo.count('\n', inicio + 2, fim - 2)
+                    if quebras:
+                        linha += quebras
+                        coluna = fim - 2 - codigo.rfind('\n', inicio + 2, fim - 2)
+                    else:
+                        coluna += fim - inicio - 4
+                    posicao = fim
+                    continue
+                else:
+                    break
+
+                adicionar_tipo(codigo_tipo)
+                adicionar_inicio(inicio)
+                adicionar_fim(fim)
+                adicionar_linha(linha)
+                adicionar_coluna(coluna)
+                coluna += fim - inicio
+                posicao = fim
+
+            # EOF e casos de borda: delega ao Lexer imperativo
+            self.posicao_atual, self.linha, self.coluna = posicao, linha, coluna
+            Lexer._ignorar_espacos_e_comentarios(self)
+            inicio = self.posicao_atual
+            token = Lexer.proximo_token(self)
+            buffer.adicionar_token(token, inicio, self.posicao_atual)
+            if token.tipo == TipoToken.EOF:
+                return buffer
+            posicao, linha, coluna = self.posicao_atual, self.linha, self.coluna
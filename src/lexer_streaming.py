@@ -0,0 +1,152 @@
+"""
+Motor léxico em fluxo (streaming) para arquivos muito grandes
+
+O `Lexer` e o `LexerRegex` recebem o código fonte inteiro em uma `str`.
+Para programas gerados com centenas de MB isso exige memória proporcional
+ao tamanho do arquivo. O `LexerStreaming` lê a fonte em blocos e mantém
+apenas uma janela deslizante do texto:
+
+    [ já consumido | token atual ... | bloco seguinte ]
+      descartado     janela (codigo_fonte)
+
+A FONTE pode ser:
+- um arquivo de texto (read() retorna str)
+- um arquivo binário ou `mmap` (read() retorna bytes), decodificado como
+  UTF-8 de forma incremental, com quebras de linha universais (\\r\\n e
+  \\r viram \\n, como na leitura em modo texto)
+
+TOKENS NA FRONTEIRA DOS BLOCOS:
+===============================
+Cada token é reconhecido pelo `LexerRegex` sobre a janela atual. Se o
+reconhecimento chegar ao fim da janela (identificador, número, string ou
+comentário que pode continuar no bloco seguinte, ou lookahead de um
+operador composto), o estado de linha/coluna é restaurado, o próximo bloco
+é lido e o token é reconhecido de novo. Assim a sequência de tokens é
+idêntica à do `Lexer` sobre o texto completo, para qualquer tamanho de
+bloco.
+
+O prefixo já consumido da janela é descartado a cada leitura, de modo que
+a memória depende do tamanho do bloco e do maior token, e não do tamanho
+do arquivo. O `Parser` consome os tokens sob demanda via `proximo_token()`.
+"""
+
+import codecs
+import io
+import mmap
+from typing import IO, Union
+from .ast_nodes import Token
+from .buffer_tokens import BufferTokens
+from .exceptions import ErroLexico
+from .lexer_regex import LexerRegex
+
+
+# Tamanho padrão de cada leitura da fonte (em caracteres ou bytes)
+TAMANHO_BLOCO_PADRAO = 1 << 16
+
+
+class LexerStreaming(LexerRegex):
+    """
+    Analisador léxico que lê a fonte em blocos
+
+    Atributos adicionais:
+        fonte: Arquivo (texto ou binário) ou mmap de onde os blocos são lidos
+        deslocamento: Posição absoluta, na fonte, do início da janela
+        fim_entrada: True quando a fonte foi totalmente lida
+    """
+
+    def __init__(self, fonte: Union[IO, mmap.mmap], tamanho_bloco: int = TAMANHO_BLOCO_PADRAO):
+        """
+        Inicializa o lexer e lê o primeiro bloco
+
+        Args:
+            fonte: Objeto com método read(n) retornando str ou bytes
+            tamanho_bloco: Quantidade lida da fonte a cada bloco
+        """
+        super().__init__('')
+        self.fonte = fonte
+        self.tamanho_bloco = max(1, tamanho_bloco)
+        self.deslocamento = 0
+        self.fim_entrada = False
+        self._decodificador = None
+        self._carregar_bloco()
+
+    def _ler_bloco(self) -> str:
+        """Lê o próximo bloco da fonte, decodificando bytes se necessário"""
+        dados = self.fonte.read(self.tamanho_bloco)
+        if not dados:
+            self.fim_entrada = True
+        if isinstance(dados, str):
+            return dados
+        if self._decodificador is None:
+            self._decodificador = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder('utf-8')(), translate=True)
+        return self._decodificador.decode(bytes(dados), final=self.fim_entrada)
+
+    def _carregar_bloco(self) -> None:
+        """Descarta o trecho já consumido e acrescenta um bloco à janela"""
+        if self.posicao_atual:
+            self.deslocamento += self.posicao_atual
+            self.codigo_fonte = self.codigo_fonte[self.posicao_atual:]
+            self.posicao_atual = 0
+
+        # Lê ao menos o tamanho da janela restante: um token muito longo
+        # é reconhecido novamente poucas vezes (a janela dobra a cada
+        # leitura). Um bloco pode não produzir texto (UTF-8 incompleto).
+        blocos = []
+        lido = 0
+        while not self.fim_entrada and (lido == 0 or lido < len(self.codigo_fonte)):
+            texto = self._ler_bloco()
+            blocos.append(texto)
+            lido += len(texto)
+
+        self.codigo_fonte += ''.join(blocos)
+        self.tamanho_codigo = len(self.codigo_fonte)
+
+    def _janela_suficiente(self) -> bool:
+        """Indica se o último reconhecimento não dependeu do fim da janela"""
+        return self.fim_entrada or self.posicao_atual < self.tamanho_codigo - 1
+
+    def proximo_token(self) -> Token:
+        """
+        Retorna o próximo token, lendo novos blocos quando necessário
+
+        Returns:
+            Token: O próximo token encontrado
+
+        Raises:
+            ErroLexico: Se encontrar um caractere inválido
+        """
+        while True:
+            estado = (self.posicao_atual, self.linha, self.coluna)
+            try:
+                token = super().proximo_token()
+            except ErroLexico:
+                # Erros no fim da janela (ex.: string não fechada) podem
+                # desaparecer com o próximo bloco
+                if self._janela_suficiente():
+                    raise
+                token = None
+
+            if token is not None and self._janela_suficiente():
+                return token
+
+            self.posicao_atual, self.linha, self.coluna = estado
+            self._carregar_bloco()
+
+    def tokenizar(self) -> BufferTokens:
+        """
+        Tokeniza todo o restante da fonte de uma vez
+
+        O buffer referencia o texto completo, então o restante da fonte é
+        carregado em memória. Para memória limitada, use `proximo_token()`.
+
+        Returns:
+            BufferTokens: Buffer compacto com os tokens restantes
+
+        Raises:
+            ErroLexico: Se encontrar um caractere inválido
+        """
+        while not self.fim_entrada:
+            self.codigo_fonte += self._ler_bloco()
+        self.tamanho_codigo = len(self.codigo_fonte)
+        return super().tokenizar()
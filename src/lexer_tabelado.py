@@ -0,0 +1,134 @@
+"""
+Motor léxico dirigido pelo AFD gerado das expressões regulares
+
+As tabelas vêm de `gerador_afd.py` (Thompson + construção de
+subconjuntos sobre a especificação completa de tokens) e são carregadas
+do módulo gerado `tabelas_lexicas.py`, sem nova geração a cada execução.
+
+Diferente do `LexerAFD`, que só reconhece identificadores e números pelas
+tabelas, aqui um único laço de transições reconhece todos os tokens:
+palavras-chave, operadores, strings, comentários e espaços. O resultado
+(tokens, posições e erros) é idêntico ao do `Lexer` imperativo; os casos
+que as ERs não descrevem seguem o `Lexer`:
+
+- caracteres fora do ASCII (letras acentuadas, espaços Unicode)
+- strings com quebra de linha e comentários de bloco não fechados
+- números com múltiplos pontos e caracteres inválidos (erros)
+"""
+
+import sys
+from typing import Optional
+from .ast_nodes import TipoToken, Token
+from .automaton import AFDTabelado
+from .gerador_afd import carregar_tabelas
+from .lexer import Lexer
+from .lexer_regex import PADRAO_ESCAPE
+
+
+# AFD gerado da especificação (carregado uma vez por processo)
+AFD_GERADO = carregar_tabelas().para_afd()
+
+# Nomes aceitos pelo AFD → tipos de token
+TIPOS_POR_NOME = {tipo.name: tipo for tipo in TipoToken}
+_IDENTIFICADOR = TipoToken.IDENTIFICADOR
+_TEXTO = TipoToken.TEXTO
+_NUMEROS = (TipoToken.NUMERO_INTEIRO, TipoToken.NUMERO_REAL)
+
+
+class LexerTabelado(Lexer):
+    """
+    Analisador léxico que percorre as tabelas do AFD gerado
+
+    Args:
+        codigo_fonte: Código fonte em Portugol
+        afd: Tabelas a usar (padrão: AFD_GERADO)
+        recuperar: Registra erros léxicos e devolve tokens ERRO (ver Lexer)
+    """
+
+    def __init__(self, codigo_fonte: str, afd: Optional[AFDTabelado] = None,
+                 recuperar: bool = False):
+        super().__init__(codigo_fonte, recuperar)
+        self.afd = afd if afd is not None else AFD_GERADO
+
+    def proximo_token(self) -> Token:
+        """
+        Retorna o próximo token do código fonte
+
+        Returns:
+            Token: O próximo token encontrado
+
+        Raises:
+            ErroLexico: Se encontrar um caractere inválido
+        """
+        codigo = self.codigo_fonte
+        tamanho = self.tamanho_codigo
+        afd = self.afd
+        transicoes = afd.transicoes
+        latin1 = afd.deslocamentos_latin1
+        aceitacao = afd.aceitacao
+
+        while True:
+            posicao = self.posicao_atual
+            if posicao >= tamanho:
+                return Token(TipoToken.EOF, 'EOF', self.linha, self.coluna)
+
+            # Percorre as tabelas até o estado morto
+            estado = 0
+            fim = posicao
+            while fim < tamanho:
+                ordinal = ord(codigo[fim])
+                proximo = transicoes[(latin1[ordinal] if ordinal < 256 else afd.deslocamento(codigo[fim])) + estado]
+                if proximo < 0:
+                    break
+                estado = proximo
+                fim += 1
+
+            nome = aceitacao[estado]
+            if nome is None or codigo[posicao] >= '\x80':
+                # Sem casamento completo (recuo) ou fora do ASCII
+                return super().proximo_token()
+
+            if nome == 'ESPACO':
+                quebras = codigo.count('\n', posicao, fim)
+                if quebras:
+                    self.linha += quebras
+                    self.coluna = fim - codigo.rfind('\n', posicao, fim)
+                else:
+                    self.coluna += fim - posicao
+                self.posicao_atual = fim
+                continue
+
+            if nome == 'COMENTARIO_LINHA':
+                # O Lexer imperativo não conta colunas dentro do comentário
+                self.posicao_atual = fim
+                continue
+
+            if nome == 'COMENTARIO_BLOCO':
+                # Os delimitadores '/*' e '*/' não contam colunas
+                quebras = codigo.count('\n', posicao + 2, fim - 2)
+                if quebras:
+                    self.linha += quebras
+                    self.coluna = fim - 2 - codigo.rfind('\n', posicao + 2, fim - 2)
+                else:
+                    self.coluna += fim - posicao - 4
+                self.posicao_atual = fim
+                continue
+
+            tipo = TIPOS_POR_NOME[nome]
+            if tipo is _TEXTO:
+                lexema = codigo[posicao + 1:fim - 1]
+                if '\\' in lexema:
+                    lexema = PADRAO_ESCAPE.sub(r'\1', lexema)
+            elif fim < tamanho and (codigo[fim] >= '\x80' or (codigo[fim] == '.' and tipo in _NUMEROS)):
+                # Palavra que continua com letra acentuada, ou número com
+                # múltiplos pontos (erro na posição do Lexer)
+                return super().proximo_token()
+            else:
+                lexema = codigo[posicao:fim]
+                if tipo is _IDENTIFICADOR:
+                    lexema = sys.intern(lexema)
+
+            coluna = self.coluna
+            self.coluna = coluna + fim - posicao
+            self.posicao_atual = fim
+            return Token(tipo, lexema, self.linha, coluna)
@@ -13,17 +13,54 @@ Novas flags disponíveis:
 --intermediate : Gera e mostra código intermediário (3 endereços)
 --optimize     : Aplica otimizações no código intermediário
 --show-afd     : Demonstra AFD de reconhecimento de tokens
+--lexer=MOTOR  : Seleciona o motor léxico (imperativo, regex, afd, tabelado)
+--streaming    : Lê o arquivo em blocos (memória limitada)
+--paralelo     : Tokeniza arquivos grandes em vários processos
+--bytes        : Analisa os bytes UTF-8 do arquivo, sem decodificá-lo antes
+--parser=MOTOR : Seleciona o analisador sintático (descendente, pratt, iterativo)
+--recuperar    : Relata todos os erros do programa em uma única compilação
+--compartilhar : Compartilha subexpressões iguais da AST após a análise semântica
 """
 
+import mmap
+import os
 import sys
-from typing import Optional
+from typing import IO, List, Optional, Tuple, Union
 from .lexer import Lexer
+from .lexer_regex import LexerRegex
+from .lexer_afd import LexerAFD
+from .lexer_tabelado import LexerTabelado
+from .lexer_streaming import LexerStreaming
+from .lexer_paralelo import LIMIAR_PARALELO_PADRAO, tokenizar_paralelo
+from .lexer_bytes import LexerBytes, decodificar_fonte
+from .buffer_tokens import BufferTokens
+from .ast_nodes import Programa
 from .parser import Parser
+from .parser_pratt import ParserPratt
+from .parser_iterativo import ParserIterativo, PROFUNDIDADE_MAXIMA_PADRAO, TAMANHO_MAXIMO_PADRAO
 from .semantic import AnalisadorSemantico
 from .codegen import GeradorDeCodigo
 from .intermediate import GeradorCodigoIntermediario
 from .optimizer import OtimizadorCodigoIntermediario
+from .compartilhamento import compartilhar_expressoes
 from .exceptions import CompiladorError
+from .indice_linhas import IndiceLinhas
+
+
+# Motores léxicos disponíveis (todos produzem a mesma sequência de tokens)
+MOTORES_LEXICOS = {
+    'imperativo': Lexer,
+    'regex': LexerRegex,
+    'afd': LexerAFD,
+    'tabelado': LexerTabelado,
+}
+
+# Motores sintáticos disponíveis (todos produzem a mesma AST)
+MOTORES_SINTATICOS = {
+    'descendente': Parser,
+    'pratt': ParserPratt,
+    'iterativo': ParserIterativo,
+}
 
 
 class CompiladorPortugol:
@@ -35,7 +72,13 @@ class CompiladorPortugol:
     """
     
     def __init__(self, debug: bool = False, mostrar_intermediario: bool = False,
-                 otimizar: bool = False):
+                 otimizar: bool = False, motor_lexico: str = 'imperativo',
+                 streaming: bool = False, paralelo: bool = False,
+                 limiar_paralelo: int = LIMIAR_PARALELO_PADRAO, modo_bytes: bool = False,
+                 motor_sintatico: str = 'descendente',
+                 profundidade_maxima: int = PROFUNDIDADE_MAXIMA_PADRAO,
+                 tamanho_maximo: int = TAMANHO_MAXIMO_PADRAO, recuperar: bool = False,
+                 compartilhar: bool = False):
         """
         Inicializa o compilador
         
@@ -43,10 +86,132 @@ class CompiladorPortugol:
             debug: Se True, imprime informações de debug
             mostrar_intermediario: Se True, mostra código intermediário
             otimizar: Se True, aplica otimizações
+            motor_lexico: Nome do motor léxico (ver MOTORES_LEXICOS)
+            streaming: Se True, arquivos são lidos em blocos pelo LexerStreaming
+            paralelo: Se True, códigos grandes são tokenizados em vários processos
+            limiar_paralelo: Tamanho mínimo (caracteres) para tokenizar em paralelo
+            modo_bytes: Se True, arquivos são lidos como bytes e analisados
+                pelo LexerBytes (BOM e CRLF tratados pelo próprio lexer)
+            motor_sintatico: Nome do motor sintático (ver MOTORES_SINTATICOS)
+            profundidade_maxima: Aninhamento máximo de expressões e blocos
+                aceito pelo motor iterativo (acima dele, ErroSintatico)
+            tamanho_maximo: Quantidade máxima de nós da AST no motor iterativo
+            recuperar: Se True, as análises léxica, sintática e semântica
+                continuam após cada erro e todos são relatados de uma vez
+                (ver `diagnosticar`)
+            compartilhar: Se True, subexpressões iguais da AST viram um
+                único nó após a análise semântica (ver compartilhamento.py)
+            
+        Raises:
+            ValueError: Se o motor léxico ou sintático não existir, ou se
+                streaming/modo_bytes for combinado com outra leitura, com
+                paralelo ou com um motor léxico diferente do imperativo
         """
+        if motor_lexico not in MOTORES_LEXICOS:
+            raise ValueError(
+                f"Motor léxico desconhecido '{motor_lexico}'. "
+                f"Opções: {', '.join(MOTORES_LEXICOS)}"
+            )
+        if motor_sintatico not in MOTORES_SINTATICOS:
+            raise ValueError(
+                f"Motor sintático desconhecido '{motor_sintatico}'. "
+                f"Opções: {', '.join(MOTORES_SINTATICOS)}"
+            )
+        if streaming and modo_bytes:
+            raise ValueError("As leituras em blocos (streaming) e em bytes (modo_bytes) são exclusivas")
+        leitura = ("A leitura em blocos (streaming)" if streaming else
+                   "A leitura em bytes (modo_bytes)" if modo_bytes else None)
+        if leitura and paralelo:
+            raise ValueError(f"{leitura} tem lexer próprio e não tokeniza em paralelo")
+        if leitura and motor_lexico != 'imperativo':
+            raise ValueError(f"{leitura} tem lexer próprio e não usa o motor léxico '{motor_lexico}'")
         self.debug = debug
         self.mostrar_intermediario = mostrar_intermediario
         self.otimizar = otimizar
+        self.motor_lexico = motor_lexico
+        self.streaming = streaming
+        self.paralelo = paralelo
+        self.limiar_paralelo = limiar_paralelo
+        self.modo_bytes = modo_bytes
+        self.motor_sintatico = motor_sintatico
+        self.profundidade_maxima = profundidade_maxima
+        self.tamanho_maximo = tamanho_maximo
+        self.recuperar = recuperar
+        self.compartilhar = compartilhar
+
+    def criar_lexer(self, codigo_fonte: Union[str, bytes, IO, mmap.mmap]) -> Union[Lexer, BufferTokens]:
+        """
+        Cria o analisador léxico do motor configurado
+        
+        Bytes UTF-8 são analisados pelo LexerBytes, sem decodificação
+        prévia. Outra fonte que não é `str` (arquivo ou mmap) é lida em
+        blocos pelo LexerStreaming. No modo paralelo, o código já é
+        tokenizado e o parser consome o BufferTokens resultante.
+        
+        Raises:
+            ValueError: Se a fonte não é `str` e o compilador usa o modo
+                paralelo ou um motor léxico diferente do imperativo
+        """
+        if not isinstance(codigo_fonte, str) and (self.paralelo or self.motor_lexico != 'imperativo'):
+            motivo = "o modo paralelo" if self.paralelo else f"o motor léxico '{self.motor_lexico}'"
+            raise ValueError(f"Bytes, arquivos e mmap têm lexer próprio; {motivo} exige o código como str")
+        if isinstance(codigo_fonte, (bytes, bytearray, memoryview)):
+            return LexerBytes(codigo_fonte)
+        if not isinstance(codigo_fonte, str):
+            return LexerStreaming(codigo_fonte)
+        classe_lexer = MOTORES_LEXICOS[self.motor_lexico]
+        if self.paralelo:
+            return tokenizar_paralelo(codigo_fonte, classe_lexer, limiar=self.limiar_paralelo)
+        return classe_lexer(codigo_fonte)
+
+    def criar_parser(self, lexer: Union[Lexer, BufferTokens], recuperar: bool = False) -> Parser:
+        """
+        Cria o analisador sintático do motor configurado
+        
+        O motor iterativo (--parser=iterativo) não usa recursão e recebe os
+        limites de profundidade e tamanho do compilador; os demais, incluindo
+        o descendente (padrão), são recursivos.
+        """
+        classe_parser = MOTORES_SINTATICOS[self.motor_sintatico]
+        if classe_parser is ParserIterativo:
+            return ParserIterativo(lexer, self.profundidade_maxima, self.tamanho_maximo, recuperar)
+        return classe_parser(lexer, recuperar)
+
+    def diagnosticar(self, codigo_fonte: Union[str, bytes, IO, mmap.mmap]
+                     ) -> Tuple[Programa, List[CompiladorError]]:
+        """
+        Analisa o código com recuperação de erros, em uma única passada
+        
+        O lexer devolve tokens ERRO em vez de lançar, o parser se
+        ressincroniza em modo pânico e a análise semântica segue com o tipo
+        de erro, de modo que um programa com vários erros é verificado por
+        inteiro em uma só compilação.
+        
+        Args:
+            codigo_fonte: Código fonte (bytes, arquivo ou mmap são lidos e
+                decodificados por inteiro)
+            
+        Returns:
+            Tuple: AST com os comandos bem formados e a lista de erros:
+            léxicos e sintáticos em ordem de posição, seguidos dos
+            semânticos na ordem da análise (vazia se o código é válido)
+        """
+        lexer = MOTORES_LEXICOS[self.motor_lexico](self._texto_fonte(codigo_fonte), recuperar=True)
+        parser = self.criar_parser(lexer, recuperar=True)
+        ast = parser.analisar()
+        analisador_semantico = AnalisadorSemantico(recuperar=True)
+        analisador_semantico.analisar(ast)
+        erros = sorted(lexer.erros + parser.erros, key=lambda erro: (erro.linha, erro.coluna))
+        return ast, erros + analisador_semantico.erros
+
+    @staticmethod
+    def _texto_fonte(codigo_fonte: Union[str, bytes, IO, mmap.mmap]) -> str:
+        """Código fonte como texto (arquivo ou mmap lido por inteiro)"""
+        if not isinstance(codigo_fonte, (str, bytes, bytearray, memoryview)):
+            codigo_fonte = codigo_fonte.read()
+        if isinstance(codigo_fonte, str):
+            return codigo_fonte
+        return decodificar_fonte(codigo_fonte)
 
     def compilar_arquivo(self, caminho_arquivo: str, 
                         arquivo_saida: Optional[str] = None,
@@ -63,12 +228,25 @@ class CompiladorPortugol:
             bool: True se compilação foi bem-sucedida, False caso contrário
         """
         try:
-            # Ler arquivo fonte
-            with open(caminho_arquivo, 'r', encoding='utf-8') as arquivo:
-                codigo_fonte = arquivo.read()
-            
-            # Compilar código
-            codigo_python = self.compilar_codigo(codigo_fonte)
+            if self.streaming:
+                # Ler arquivo fonte em blocos (memória limitada)
+                with open(caminho_arquivo, 'rb') as arquivo:
+                    if os.fstat(arquivo.fileno()).st_size == 0:
+                        codigo_python = self.compilar_codigo(arquivo)
+                    else:
+                        with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+                            codigo_python = self.compilar_codigo(mapa)
+            elif self.modo_bytes:
+                # Ler os bytes do arquivo (decodificação sob demanda no lexer)
+                with open(caminho_arquivo, 'rb') as arquivo:
+                    codigo_python = self.compilar_codigo(arquivo.read())
+            else:
+                # Ler arquivo fonte
+                with open(caminho_arquivo, 'r', encoding='utf-8') as arquivo:
+                    codigo_fonte = arquivo.read()
+                
+                # Compilar código
+                codigo_python = self.compilar_codigo(codigo_fonte)
             
             if codigo_python is None:
                 return False
@@ -111,12 +289,13 @@ class CompiladorPortugol:
             print(f"Erro inesperado: {e}")
             return False
 
-    def compilar_codigo(self, codigo_fonte: str) -> Optional[str]:
+    def compilar_codigo(self, codigo_fonte: Union[str, bytes, IO, mmap.mmap]) -> Optional[str]:
         """
         Compila código Portugol para Python
         
         Args:
-            codigo_fonte: Código fonte em Portugol
+            codigo_fonte: Código fonte em Portugol, seus bytes UTF-8, ou
+                arquivo/mmap lido em blocos
             
         Returns:
             str: Código Python gerado, ou None se houve erro
@@ -126,37 +305,60 @@ class CompiladorPortugol:
                 print("📝 Iniciando compilação...")
                 print("=" * 40)
             
-            # Fase 1: Análise Léxica
-            if self.debug:
-                print("🔍 Análise Léxica")
-            
-            lexer = Lexer(codigo_fonte)
-            
-            if self.debug:
-                print("   ✓ Lexer inicializado")
-            
-            # Fase 2: Análise Sintática
-            if self.debug:
-                print("🌳 Análise Sintática")
-            
-            parser = Parser(lexer)
-            ast = parser.analisar()
-            
-            if self.debug:
-                print("   ✓ AST construída")
-                print(f"   - Declarações: {len(ast.declaracoes)}")
-                print(f"   - Comandos: {len(ast.comandos)}")
-            
-            # Fase 3: Análise Semântica
-            if self.debug:
-                print("🔬 Análise Semântica")
-            
-            analisador_semantico = AnalisadorSemantico()
-            analisador_semantico.analisar(ast)
-            
-            if self.debug:
-                print("   ✓ Análise concluída")
-                print(f"   - Variáveis: {len(analisador_semantico.tabela_simbolos.simbolos)}")
+            if self.recuperar:
+                # Fases 1 a 3 com recuperação de erros
+                if self.debug:
+                    print("🔍 Análises léxica, sintática e semântica (com recuperação)")
+                
+                codigo_fonte = self._texto_fonte(codigo_fonte)
+                ast, diagnosticos = self.diagnosticar(codigo_fonte)
+                if diagnosticos:
+                    self._mostrar_diagnosticos(diagnosticos, codigo_fonte)
+                    return None
+                
+                if self.debug:
+                    print("   ✓ Nenhum erro encontrado")
+            else:
+                # Fase 1: Análise Léxica
+                if self.debug:
+                    print("🔍 Análise Léxica")
+                
+                lexer = self.criar_lexer(codigo_fonte)
+                
+                if self.debug:
+                    print(f"   ✓ Lexer inicializado (motor: {type(lexer).__name__})")
+                
+                # Fase 2: Análise Sintática
+                if self.debug:
+                    print("🌳 Análise Sintática")
+                
+                parser = self.criar_parser(lexer)
+                ast = parser.analisar()
+                
+                if self.debug:
+                    print("   ✓ AST construída")
+                    print(f"   - Declarações: {len(ast.declaracoes)}")
+                    print(f"   - Comandos: {len(ast.comandos)}")
+                
+                # Fase 3: Análise Semântica
+                if self.debug:
+                    print("🔬 Análise Semântica")
+                
+                analisador_semantico = AnalisadorSemantico()
+                analisador_semantico.analisar(ast)
+                
+                if self.debug:
+                    print("   ✓ Análise concluída")
+                    print(f"   - Variáveis: {len(analisador_semantico.tabela_simbolos.simbolos)}")
+            
+            # Compartilhamento (OPCIONAL) de subexpressões iguais
+            compartilhados = frozenset()
+            if self.compartilhar:
+                tabela = compartilhar_expressoes(ast)
+                compartilhados = tabela.compartilhados
+                
+                if self.debug:
+                    print(f"   ✓ Expressões compartilhadas: {tabela.ocorrencias} → {len(tabela)} nós")
             
             # Fase 4 (OPCIONAL): Geração de Código Intermediário
             codigo_intermediario = None
@@ -206,7 +408,7 @@ class CompiladorPortugol:
             if self.debug:
                 print("⚙️  Geração de Código")
             
-            gerador = GeradorDeCodigo()
+            gerador = GeradorDeCodigo(compartilhados)
             codigo_python = gerador.gerar(ast)
             
             if self.debug:
@@ -219,6 +421,12 @@ class CompiladorPortugol:
             
         except CompiladorError as e:
             print(f"❌ Erro de compilação: {e}")
+            if isinstance(codigo_fonte, (bytes, bytearray, memoryview)):
+                codigo_fonte = decodificar_fonte(codigo_fonte)
+            if isinstance(codigo_fonte, str):
+                contexto = e.contexto(IndiceLinhas(codigo_fonte))
+                if contexto:
+                    print(contexto)
             return None
         except Exception as e:
             print(f"❌ Erro inesperado durante compilação: {e}")
@@ -227,6 +435,16 @@ class CompiladorPortugol:
                 traceback.print_exc()
             return None
 
+    def _mostrar_diagnosticos(self, diagnosticos: List[CompiladorError], codigo_fonte: str) -> None:
+        """Imprime cada erro, com a fase e a linha do código"""
+        print(f"❌ {len(diagnosticos)} erro(s) de compilação:")
+        indice = IndiceLinhas(codigo_fonte)
+        for erro in diagnosticos:
+            print(f"  [{erro.fase}] {erro}")
+            contexto = erro.contexto(indice)
+            if contexto:
+                print(contexto)
+
     def executar_compilacao_e_teste(self, codigo_fonte: str) -> bool:
         """
         Compila e executa o código para teste
@@ -275,17 +493,12 @@ class CompiladorPortugol:
             print("🔍 Análise de Tokens:")
             print("-" * 40)
             
-            lexer = Lexer(codigo_fonte)
-            tokens = []
+            lexer = self.criar_lexer(codigo_fonte)
+            # No modo paralelo, o buffer já vem preenchido
+            tokens = lexer if isinstance(lexer, BufferTokens) else lexer.tokenizar()
             
-            while True:
-                token = lexer.proximo_token()
-                tokens.append(token)
-                
+            for token in tokens:
                 print(f"  {token.tipo.value:15} | {token.lexema:10} | L:{token.linha} C:{token.coluna}")
-                
-                if token.tipo.value == 'EOF':
-                    break
             
             print("-" * 40)
             print(f"Total de tokens: {len(tokens)}")
@@ -308,6 +521,13 @@ def main():
         print("  --intermediate   Mostra código intermediário (3 endereços)")
         print("  --optimize       Aplica otimizações no código intermediário")
         print("  --show-afd       Demonstra AFDs de reconhecimento de tokens")
+        print("  --lexer=MOTOR    Motor léxico: " + ", ".join(MOTORES_LEXICOS))
+        print("  --streaming      Lê o arquivo em blocos (arquivos muito grandes)")
+        print("  --paralelo       Tokeniza arquivos grandes em vários processos")
+        print("  --bytes          Analisa os bytes UTF-8 do arquivo (BOM, CRLF)")
+        print("  --parser=MOTOR   Motor sintático: " + ", ".join(MOTORES_SINTATICOS))
+        print("  --recuperar      Relata todos os erros do programa de uma vez")
+        print("  --compartilhar   Compartilha subexpressões iguais da AST")
         print("\nExemplos:")
         print("  python -m src.main programa.por")
         print("  python -m src.main programa.por --debug")
@@ -322,6 +542,18 @@ def main():
     mostrar_intermediario = '--intermediate' in sys.argv
     otimizar = '--optimize' in sys.argv
     mostrar_afd = '--show-afd' in sys.argv
+    streaming = '--streaming' in sys.argv
+    paralelo = '--paralelo' in sys.argv
+    modo_bytes = '--bytes' in sys.argv
+    recuperar = '--recuperar' in sys.argv
+    compartilhar = '--compartilhar' in sys.argv
+    motor_lexico = 'imperativo'
+    motor_sintatico = 'descendente'
+    for argumento in sys.argv[2:]:
+        if argumento.startswith('--lexer='):
+            motor_lexico = argumento.split('=', 1)[1]
+        elif argumento.startswith('--parser='):
+            motor_sintatico = argumento.split('=', 1)[1]
     
     # Demonstração de AFD
     if mostrar_afd:
@@ -329,11 +561,22 @@ def main():
         demonstrar_afd()
         print("\n")
     
-    compilador = CompiladorPortugol(
-        debug=debug,
-        mostrar_intermediario=mostrar_intermediario,
-        otimizar=otimizar
-    )
+    try:
+        compilador = CompiladorPortugol(
+            debug=debug,
+            mostrar_intermediario=mostrar_intermediario,
+            otimizar=otimizar,
+            motor_lexico=motor_lexico,
+            streaming=streaming,
+            paralelo=paralelo,
+            modo_bytes=modo_bytes,
+            motor_sintatico=motor_sintatico,
+            recuperar=recuperar,
+            compartilhar=compartilhar
+        )
+    except ValueError as e:
+        print(f"Erro: {e}")
+        sys.exit(1)
     
     if '--tokens' in sys.argv:
         # Modo de listagem de tokens
@@ -3,18 +3,85 @@ Analisador Sintático (Parser) para a linguagem Portugol
 
 Este módulo implementa a análise sintática usando descida recursiva,
 convertendo a sequência de tokens em uma Árvore Sintática Abstrata (AST).
+
+A escolha de cada comando e o fim de cada bloco vêm da tabela LL(1)
+gerada da gramática em `gerador_ll1.py` (carregada de
+`tabelas_sintaticas.py`): o tipo do token indexa a linha `comando` e o
+número da produção indexa o método que a analisa.
+
+RECUPERAÇÃO DE ERROS (MODO PÂNICO):
+===================================
+Com `recuperar=True`, um erro não interrompe a análise: ele é guardado em
+`erros` e o parser se ressincroniza, de modo que todos os erros de um
+programa são relatados em uma única passada:
+
+- Comando com erro: é descartado junto com os tokens seguintes até um
+  ponto de sincronização: fechamento de bloco (fimse, senao, fimenquanto,
+  fimpara, fim), início de comando (se, enquanto, para, leia, escreva, ou
+  identificador seguido de '<-') ou ';' (consumido)
+- Cabeçalho com erro (se/enquanto/para): descartado até 'entao'/'faca';
+  os comandos do bloco são analisados e mantidos no bloco externo
+- Fechamento ausente (ex.: 'fimenquanto' antes de 'fimse'): registrado,
+  e o token fica para o bloco externo que o aceita
+- Fechamento sem bloco correspondente: registrado e consumido
+- Declaração com erro: descartada até ';', outra declaração ou 'inicio'
+
+Um erro na mesma posição do anterior (consequência dele), em um token
+ERRO (já relatado pelo lexer) ou no EOF logo após um token ERRO que foi
+até o fim do código (ex.: string não fechada) não é repetido. O primeiro
+erro registrado é sempre o que o modo normal lançaria (a string não
+fechada, na linha da aspa de abertura), e a AST contém apenas os
+comandos bem formados.
 """
 
-from typing import List, Optional
+from typing import FrozenSet, List, Optional, Union
 from .ast_nodes import (
     TipoToken, Token, Programa, DeclaracaoVariavel,
     Comando, Atribuicao, Condicional, Repeticao, RepeticaoPara, Entrada, Saida,
     Expressao, ExpressaoBinaria, ExpressaoUnaria, Literal, Variavel
 )
 from .lexer import Lexer
+from .buffer_tokens import BufferTokens
+from .fluxo_tokens import FluxoTokens
+from .gerador_ll1 import carregar_tabela
 from .exceptions import ErroSintatico
 
 
+# Tabela LL(1) gerada da gramática (carregada uma vez por processo)
+TABELA_LL1 = carregar_tabela()
+
+# Linhas da tabela usadas pelo parser: tipo do token -> número da produção
+_PRODUCAO_COMANDO = {TipoToken[terminal]: producao
+                     for terminal, producao in TABELA_LL1.linha('comando').items()}
+_PRODUCAO_COMANDOS = {TipoToken[terminal]: producao
+                      for terminal, producao in TABELA_LL1.linha('comandos').items()}
+
+# Tokens com 'comandos -> ε' (FOLLOW de comandos): encerram o bloco atual.
+# Um fechamento fora do lugar (ex.: 'fimpara' dentro de 'enquanto') também
+# encerra o bloco e é reportado como "Esperado 'fimenquanto', encontrado
+# 'fimpara'", e não como comando inesperado
+_FIM_DE_BLOCO = frozenset(tipo for tipo, producao in _PRODUCAO_COMANDOS.items()
+                          if not TABELA_LL1.producoes[producao][1])
+
+# Token de fechamento e token que encerra o cabeçalho de cada bloco
+_FECHAMENTOS = {
+    TipoToken.SE: TipoToken.FIMSE,
+    TipoToken.ENQUANTO: TipoToken.FIMENQUANTO,
+    TipoToken.PARA: TipoToken.FIMPARA,
+}
+_FIM_DE_CABECALHO = {
+    TipoToken.SE: TipoToken.ENTAO,
+    TipoToken.ENQUANTO: TipoToken.FACA,
+    TipoToken.PARA: TipoToken.FACA,
+}
+
+# Pontos de sincronização do modo pânico (além de identificador seguido de '<-')
+_SINCRONIZACAO = _FIM_DE_BLOCO | {TipoToken.EOF} | frozenset(
+    tipo for tipo in _PRODUCAO_COMANDO if tipo is not TipoToken.IDENTIFICADOR
+)
+
+_TIPOS_DECLARACAO = frozenset({TipoToken.INTEIRO, TipoToken.REAL, TipoToken.CARACTER, TipoToken.LOGICO})
+
 class Parser:
     """
     Analisador sintático para a linguagem Portugol
@@ -23,15 +90,39 @@ class Parser:
     - programa -> declaracoes inicio comandos fim
     - declaracoes -> (tipo lista_vars ";")*
     - comando -> atribuicao | estrutura_controle | entrada_saida
+    
+    Os tokens podem vir de qualquer Lexer (sob demanda) ou de um
+    BufferTokens já preenchido por `Lexer.tokenizar()`, e passam por um
+    FluxoTokens, que oferece lookahead (`_espiar`) e retrocesso
+    (`tokens.mark()`/`tokens.reset()`) sem reanalisar o código.
+    
+    Args:
+        lexer: Fonte de tokens
+        recuperar: Se True, registra os erros em `erros` e continua a
+            análise (ver RECUPERAÇÃO DE ERROS)
     """
     
-    def __init__(self, lexer: Lexer):
+    def __init__(self, lexer: Union[Lexer, BufferTokens, FluxoTokens], recuperar: bool = False):
         self.lexer = lexer
-        self.token_atual = self.lexer.proximo_token()
+        self.tokens = lexer if isinstance(lexer, FluxoTokens) else FluxoTokens(lexer)
+        self.token_atual = self.tokens.proximo_token()
+        # Ação de cada produção 'comando -> X': o método _analisar_X
+        self._acoes = [
+            getattr(self, '_analisar_' + corpo[0]) if cabeca == 'comando' else None
+            for cabeca, corpo in TABELA_LL1.producoes
+        ]
+        self.recuperar = recuperar
+        self.erros: List[ErroSintatico] = []
+        # Tokens que encerram cada bloco aberto (modo de recuperação)
+        self._blocos_abertos: List[FrozenSet[TipoToken]] = []
 
     def _avancar(self) -> None:
         """Avança para o próximo token"""
-        self.token_atual = self.lexer.proximo_token()
+        self.token_atual = self.tokens.proximo_token()
+
+    def _espiar(self, k: int = 1) -> Token:
+        """Retorna o token k posições após o atual, sem consumi-lo"""
+        return self.tokens.peek(k)
 
     def _esperar_token(self, tipo_esperado: TipoToken) -> Token:
         """
@@ -47,15 +138,79 @@ class Parser:
             ErroSintatico: Se o token não for do tipo esperado
         """
         if self.token_atual.tipo != tipo_esperado:
-            raise ErroSintatico(
-                f"Esperado '{tipo_esperado.value}', encontrado '{self.token_atual.lexema}'",
-                self.token_atual.linha,
-                self.token_atual.coluna
-            )
+            raise self._erro_esperado(tipo_esperado)
         token = self.token_atual
         self._avancar()
         return token
 
+    def _erro_esperado(self, tipo_esperado: TipoToken) -> ErroSintatico:
+        """Erro de token diferente do esperado, na posição do token atual"""
+        return ErroSintatico(
+            f"Esperado '{tipo_esperado.value}', encontrado '{self.token_atual.lexema}'",
+            self.token_atual.linha,
+            self.token_atual.coluna
+        )
+
+    def _esperar_fechamento(self, fechamento: TipoToken) -> None:
+        """
+        Consome o token que fecha um bloco
+        
+        No modo de recuperação, um fechamento ausente é registrado e o token
+        atual (que fecha um bloco externo) fica para quem o aceita.
+        """
+        if self.recuperar and self.token_atual.tipo is not fechamento:
+            self._registrar_erro(self._erro_esperado(fechamento))
+        else:
+            self._esperar_token(fechamento)
+
+    def _registrar_erro(self, erro: ErroSintatico) -> None:
+        """
+        Guarda um erro do modo de recuperação
+        
+        Erros em um token ERRO (já relatado pelo lexer), no EOF após um
+        token ERRO que consumiu o resto do código ou na mesma posição do
+        erro anterior são consequência de um erro já registrado.
+        """
+        if self.token_atual.tipo is TipoToken.ERRO:
+            return
+        if self.token_atual.tipo is TipoToken.EOF and getattr(self.lexer, 'erro_ate_o_fim', False):
+            return
+        if self.erros and (self.erros[-1].linha, self.erros[-1].coluna) == (erro.linha, erro.coluna):
+            return
+        self.erros.append(erro)
+
+    def _ponto_de_sincronizacao(self) -> bool:
+        """Se o token atual fecha um bloco ou inicia um comando"""
+        tipo = self.token_atual.tipo
+        if tipo is TipoToken.IDENTIFICADOR:
+            return self._espiar().tipo is TipoToken.ATRIBUICAO
+        return tipo in _SINCRONIZACAO
+
+    def _sincronizar(self, inicio: Token) -> None:
+        """
+        Modo pânico: descarta tokens até um ponto de sincronização
+        
+        Args:
+            inicio: Primeiro token do comando com erro; se ele ainda é o
+                atual, é descartado antes, garantindo o progresso
+        """
+        if self.token_atual is inicio:
+            self._avancar()
+        while not self._ponto_de_sincronizacao():
+            if self.token_atual.tipo is TipoToken.PONTO_E_VIRGULA:
+                self._avancar()
+                return
+            self._avancar()
+
+    def _sincronizar_cabecalho(self, abertura: TipoToken) -> None:
+        """Descarta um cabeçalho com erro até 'entao'/'faca' (consumido) ou um ponto de sincronização"""
+        fim_cabecalho = _FIM_DE_CABECALHO[abertura]
+        while not self._ponto_de_sincronizacao():
+            if self.token_atual.tipo is fim_cabecalho:
+                self._avancar()
+                return
+            self._avancar()
+
     def analisar(self) -> Programa:
         """
         Analisa o programa completo e retorna a AST
@@ -63,75 +218,159 @@ class Parser:
         Returns:
             Programa: Nó raiz da AST
         """
+        linha, coluna = self.token_atual.linha, self.token_atual.coluna
         declaracoes = self._analisar_declaracoes()
-        self._esperar_token(TipoToken.INICIO)
-        comandos = self._analisar_comandos()
-        self._esperar_token(TipoToken.FIM)
-        self._esperar_token(TipoToken.EOF)
+        if self.recuperar:
+            comandos = self._analisar_programa_recuperando()
+        else:
+            self._esperar_token(TipoToken.INICIO)
+            comandos = self._analisar_comandos()
+            self._esperar_token(TipoToken.FIM)
+            self._esperar_token(TipoToken.EOF)
         
-        return Programa(declaracoes, comandos)
+        return Programa(declaracoes, comandos, linha=linha, coluna=coluna)
+
+    def _analisar_programa_recuperando(self) -> List[Comando]:
+        """Analisa 'inicio comandos fim' no modo de recuperação"""
+        if self.token_atual.tipo is TipoToken.INICIO:
+            self._avancar()
+        else:
+            self._registrar_erro(self._erro_esperado(TipoToken.INICIO))
+            while not self._ponto_de_sincronizacao():
+                if self.token_atual.tipo is TipoToken.INICIO:
+                    self._avancar()
+                    break
+                self._avancar()
+        comandos = self._analisar_comandos()
+        self._esperar_fechamento(TipoToken.FIM)
+        if self.token_atual.tipo is not TipoToken.EOF:
+            self._registrar_erro(self._erro_esperado(TipoToken.EOF))
+        return comandos
 
     def _analisar_declaracoes(self) -> List[DeclaracaoVariavel]:
         """Analisa declarações de variáveis"""
         declaracoes = []
         
-        # Tipos válidos para declaração
-        tipos_validos = {TipoToken.INTEIRO, TipoToken.REAL, TipoToken.CARACTER, TipoToken.LOGICO}
+        while self.token_atual.tipo in _TIPOS_DECLARACAO:
+            try:
+                self._analisar_declaracao(declaracoes)
+            except ErroSintatico as erro:
+                if not self.recuperar:
+                    raise
+                self._registrar_erro(erro)
+                # Descarta até ';' (consumido), outra declaração ou 'inicio'
+                while self.token_atual.tipo not in _TIPOS_DECLARACAO | {
+                        TipoToken.PONTO_E_VIRGULA, TipoToken.INICIO, TipoToken.EOF}:
+                    self._avancar()
+                if self.token_atual.tipo is TipoToken.PONTO_E_VIRGULA:
+                    self._avancar()
+        
+        return declaracoes
+
+    def _analisar_declaracao(self, declaracoes: List[DeclaracaoVariavel]) -> None:
+        """
+        Analisa 'tipo nome (, nome)* ;'
+        
+        Cada variável entra em `declaracoes` assim que é lida (na
+        recuperação, as anteriores a um erro continuam declaradas).
+        """
+        tipo = self.token_atual.lexema
+        self._avancar()
+        
+        # Lista de variáveis separadas por vírgula
+        nome = self._esperar_token(TipoToken.IDENTIFICADOR)
+        declaracoes.append(DeclaracaoVariavel(tipo, nome.lexema, linha=nome.linha, coluna=nome.coluna))
         
-        while self.token_atual.tipo in tipos_validos:
-            tipo = self.token_atual.lexema
+        while self.token_atual.tipo == TipoToken.VIRGULA:
             self._avancar()
-            
-            # Lista de variáveis separadas por vírgula
-            nomes = []
-            nomes.append(self._esperar_token(TipoToken.IDENTIFICADOR).lexema)
-            
-            while self.token_atual.tipo == TipoToken.VIRGULA:
-                self._avancar()
-                nomes.append(self._esperar_token(TipoToken.IDENTIFICADOR).lexema)
-            
-            self._esperar_token(TipoToken.PONTO_E_VIRGULA)
-            
-            # Cria uma declaração para cada variável
-            for nome in nomes:
-                declaracoes.append(DeclaracaoVariavel(tipo, nome))
+            nome = self._esperar_token(TipoToken.IDENTIFICADOR)
+            declaracoes.append(DeclaracaoVariavel(tipo, nome.lexema, linha=nome.linha, coluna=nome.coluna))
         
-        return declaracoes
+        self._esperar_token(TipoToken.PONTO_E_VIRGULA)
 
     def _analisar_comandos(self) -> List[Comando]:
-        """Analisa uma sequência de comandos"""
-        comandos = []
+        """Analisa a sequência de comandos do programa"""
+        return self._analisar_bloco()
+
+    def _analisar_bloco(self, fechamento: TipoToken = TipoToken.FIM, senao: bool = False) -> List[Comando]:
+        """
+        Analisa comandos até um token que encerra o bloco
+        comandos -> comando comandos | ε
         
-        while self.token_atual.tipo != TipoToken.FIM:
-            comando = self._analisar_comando()
-            if comando:
-                comandos.append(comando)
+        O token de fechamento (fim, fimse, senao, ...) não é consumido: o
+        chamador verifica se é o esperado.
         
+        Args:
+            fechamento: Token que fecha o bloco (usado na recuperação)
+            senao: Se 'senao' também encerra o bloco (parte 'entao' de um 'se')
+        """
+        if self.recuperar:
+            return self._analisar_bloco_recuperando(fechamento, senao)
+        comandos = []
+        comando = self._analisar_comando()
+        while comando is not None:
+            comandos.append(comando)
+            comando = self._analisar_comando()
+        return comandos
+
+    def _analisar_bloco_recuperando(self, fechamento: TipoToken, senao: bool) -> List[Comando]:
+        """_analisar_bloco no modo de recuperação (ver RECUPERAÇÃO DE ERROS)"""
+        self._blocos_abertos.append(frozenset({fechamento, TipoToken.SENAO} if senao else {fechamento}))
+        comandos = []
+        while True:
+            tipo = self.token_atual.tipo
+            if tipo in _FIM_DE_BLOCO:
+                if any(tipo in aceitos for aceitos in self._blocos_abertos):
+                    break
+                # Fechamento que nenhum bloco aberto espera
+                self._registrar_erro(self._erro_esperado(fechamento))
+                self._avancar()
+                continue
+            inicio = self.token_atual
+            try:
+                comandos.append(self._analisar_comando())
+            except ErroSintatico as erro:
+                self._registrar_erro(erro)
+                if tipo is TipoToken.EOF:
+                    break
+                if tipo in _FECHAMENTOS:
+                    # Erro no cabeçalho: o bloco é analisado mesmo assim
+                    self._sincronizar_cabecalho(tipo)
+                    comandos.extend(self._analisar_corpo_recuperado(tipo))
+                else:
+                    self._sincronizar(inicio)
+        self._blocos_abertos.pop()
+        return comandos
+
+    def _analisar_corpo_recuperado(self, abertura: TipoToken) -> List[Comando]:
+        """Comandos do bloco de um se/enquanto/para cujo cabeçalho tem erro"""
+        fechamento = _FECHAMENTOS[abertura]
+        comandos = self._analisar_bloco(fechamento, senao=abertura is TipoToken.SE)
+        if abertura is TipoToken.SE and self.token_atual.tipo is TipoToken.SENAO:
+            self._avancar()
+            comandos += self._analisar_bloco(fechamento)
+        self._esperar_fechamento(fechamento)
         return comandos
 
     def _analisar_comando(self) -> Optional[Comando]:
-        """Analisa um comando individual"""
-        if self.token_atual.tipo == TipoToken.IDENTIFICADOR:
-            return self._analisar_atribuicao()
-        elif self.token_atual.tipo == TipoToken.SE:
-            return self._analisar_condicional()
-        elif self.token_atual.tipo == TipoToken.ENQUANTO:
-            return self._analisar_repeticao()
-        elif self.token_atual.tipo == TipoToken.PARA:
-            return self._analisar_repeticao_para()
-        elif self.token_atual.tipo == TipoToken.LEIA:
-            return self._analisar_entrada()
-        elif self.token_atual.tipo == TipoToken.ESCREVA:
-            return self._analisar_saida()
-        else:
-            # Token não reconhecido como início de comando
-            if self.token_atual.tipo != TipoToken.FIM:
-                raise ErroSintatico(
-                    f"Comando inesperado '{self.token_atual.lexema}'",
-                    self.token_atual.linha,
-                    self.token_atual.coluna
-                )
+        """
+        Analisa um comando individual, escolhido pela tabela LL(1)
+        
+        Returns:
+            Optional[Comando]: O comando, ou None se o token encerra o bloco
+        """
+        tipo = self.token_atual.tipo
+        producao = _PRODUCAO_COMANDO.get(tipo)
+        if producao is not None:
+            return self._acoes[producao]()
+        if tipo in _FIM_DE_BLOCO:
             return None
+        # Token não reconhecido como início de comando
+        raise ErroSintatico(
+            f"Comando inesperado '{self.token_atual.lexema}'",
+            self.token_atual.linha,
+            self.token_atual.coluna
+        )
 
     def _analisar_atribuicao(self) -> Atribuicao:
         """Analisa comando de atribuição: variavel <- expressao"""
@@ -139,56 +378,42 @@ class Parser:
         nome_variavel = token_var.lexema
         self._esperar_token(TipoToken.ATRIBUICAO)
         expressao = self._analisar_expressao()
-        atrib = Atribuicao(nome_variavel, expressao)
-        # Adicionar informações de localização dinamicamente
-        atrib.linha = token_var.linha
-        atrib.coluna = token_var.coluna
-        return atrib
+        return Atribuicao(nome_variavel, expressao, linha=token_var.linha, coluna=token_var.coluna)
 
     def _analisar_condicional(self) -> Condicional:
         """Analisa comando condicional: se condicao entao comandos [senao comandos] fimse"""
-        self._esperar_token(TipoToken.SE)
+        token_se = self._esperar_token(TipoToken.SE)
         condicao = self._analisar_expressao()
         self._esperar_token(TipoToken.ENTAO)
         
-        comandos_entao = []
-        while self.token_atual.tipo not in {TipoToken.SENAO, TipoToken.FIMSE}:
-            comando = self._analisar_comando()
-            if comando:
-                comandos_entao.append(comando)
+        comandos_entao = self._analisar_bloco(TipoToken.FIMSE, senao=True)
         
         comandos_senao = []
         if self.token_atual.tipo == TipoToken.SENAO:
             self._avancar()
-            while self.token_atual.tipo != TipoToken.FIMSE:
-                comando = self._analisar_comando()
-                if comando:
-                    comandos_senao.append(comando)
+            comandos_senao = self._analisar_bloco(TipoToken.FIMSE)
         
-        self._esperar_token(TipoToken.FIMSE)
-        return Condicional(condicao, comandos_entao, comandos_senao)
+        self._esperar_fechamento(TipoToken.FIMSE)
+        return Condicional(condicao, comandos_entao, comandos_senao,
+                           linha=token_se.linha, coluna=token_se.coluna)
 
     def _analisar_repeticao(self) -> Repeticao:
         """Analisa comando de repetição: enquanto condicao faca comandos fimenquanto"""
-        self._esperar_token(TipoToken.ENQUANTO)
+        token_enquanto = self._esperar_token(TipoToken.ENQUANTO)
         condicao = self._analisar_expressao()
         self._esperar_token(TipoToken.FACA)
 
-        comandos = []
-        while self.token_atual.tipo != TipoToken.FIMENQUANTO:
-            comando = self._analisar_comando()
-            if comando:
-                comandos.append(comando)
+        comandos = self._analisar_bloco(TipoToken.FIMENQUANTO)
 
-        self._esperar_token(TipoToken.FIMENQUANTO)
-        return Repeticao(condicao, comandos)
+        self._esperar_fechamento(TipoToken.FIMENQUANTO)
+        return Repeticao(condicao, comandos, linha=token_enquanto.linha, coluna=token_enquanto.coluna)
 
     def _analisar_repeticao_para(self) -> RepeticaoPara:
         """Analisa comando de repetição: para variavel de inicio ate fim [passo incremento] faca comandos fimpara
 
         Nota: A cláusula 'passo' é opcional. Se omitida, o passo padrão é 1.
         """
-        self._esperar_token(TipoToken.PARA)
+        token_para = self._esperar_token(TipoToken.PARA)
         variavel = self._esperar_token(TipoToken.IDENTIFICADOR).lexema
         self._esperar_token(TipoToken.DE)
         inicio = self._analisar_expressao()
@@ -200,18 +425,19 @@ class Parser:
             self._avancar()
             passo = self._analisar_expressao()
         else:
-            passo = Literal("1")
+            passo = self._passo_padrao(token_para)
 
         self._esperar_token(TipoToken.FACA)
 
-        comandos = []
-        while self.token_atual.tipo != TipoToken.FIMPARA:
-            comando = self._analisar_comando()
-            if comando:
-                comandos.append(comando)
+        comandos = self._analisar_bloco(TipoToken.FIMPARA)
+
+        self._esperar_fechamento(TipoToken.FIMPARA)
+        return RepeticaoPara(variavel, inicio, fim, passo, comandos,
+                             linha=token_para.linha, coluna=token_para.coluna)
 
-        self._esperar_token(TipoToken.FIMPARA)
-        return RepeticaoPara(variavel, inicio, fim, passo, comandos)
+    def _passo_padrao(self, token_para: Token) -> Expressao:
+        """Passo implícito de um 'para' sem 'passo', na posição do 'para'"""
+        return Literal("1", linha=token_para.linha, coluna=token_para.coluna)
 
     def _analisar_entrada(self) -> Entrada:
         """Analisa comando de entrada: leia(variavel)"""
@@ -219,15 +445,11 @@ class Parser:
         self._esperar_token(TipoToken.ABRE_PARENTESES)
         nome_variavel = self._esperar_token(TipoToken.IDENTIFICADOR).lexema
         self._esperar_token(TipoToken.FECHA_PARENTESES)
-        entrada = Entrada(nome_variavel)
-        # Adicionar informações de localização dinamicamente
-        entrada.linha = token_leia.linha
-        entrada.coluna = token_leia.coluna
-        return entrada
+        return Entrada(nome_variavel, linha=token_leia.linha, coluna=token_leia.coluna)
 
     def _analisar_saida(self) -> Saida:
         """Analisa comando de saída: escreva(expressao1, expressao2, ...)"""
-        self._esperar_token(TipoToken.ESCREVA)
+        token_escreva = self._esperar_token(TipoToken.ESCREVA)
         self._esperar_token(TipoToken.ABRE_PARENTESES)
         
         expressoes = []
@@ -238,7 +460,7 @@ class Parser:
             expressoes.append(self._analisar_expressao())
         
         self._esperar_token(TipoToken.FECHA_PARENTESES)
-        return Saida(expressoes)
+        return Saida(expressoes, linha=token_escreva.linha, coluna=token_escreva.coluna)
 
     def _analisar_expressao(self) -> Expressao:
         """
@@ -251,7 +473,7 @@ class Parser:
             operador = self.token_atual.lexema
             self._avancar()
             direita = self._analisar_expressao_e()
-            esquerda = ExpressaoBinaria(esquerda, operador, direita)
+            esquerda = ExpressaoBinaria(esquerda, operador, direita, linha=esquerda.linha, coluna=esquerda.coluna)
         
         return esquerda
 
@@ -266,7 +488,7 @@ class Parser:
             operador = self.token_atual.lexema
             self._avancar()
             direita = self._analisar_expressao_relacional()
-            esquerda = ExpressaoBinaria(esquerda, operador, direita)
+            esquerda = ExpressaoBinaria(esquerda, operador, direita, linha=esquerda.linha, coluna=esquerda.coluna)
         
         return esquerda
 
@@ -287,7 +509,7 @@ class Parser:
             operador = self.token_atual.lexema
             self._avancar()
             direita = self._analisar_expressao_aritmetica()
-            return ExpressaoBinaria(esquerda, operador, direita)
+            return ExpressaoBinaria(esquerda, operador, direita, linha=esquerda.linha, coluna=esquerda.coluna)
         
         return esquerda
 
@@ -302,7 +524,7 @@ class Parser:
             operador = self.token_atual.lexema
             self._avancar()
             direita = self._analisar_termo()
-            esquerda = ExpressaoBinaria(esquerda, operador, direita)
+            esquerda = ExpressaoBinaria(esquerda, operador, direita, linha=esquerda.linha, coluna=esquerda.coluna)
         
         return esquerda
 
@@ -317,7 +539,7 @@ class Parser:
             operador = self.token_atual.lexema
             self._avancar()
             direita = self._analisar_potencia()
-            esquerda = ExpressaoBinaria(esquerda, operador, direita)
+            esquerda = ExpressaoBinaria(esquerda, operador, direita, linha=esquerda.linha, coluna=esquerda.coluna)
 
         return esquerda
 
@@ -333,7 +555,7 @@ class Parser:
             self._avancar()
             # Associatividade à direita: recursão
             direita = self._analisar_potencia()
-            return ExpressaoBinaria(esquerda, operador, direita)
+            return ExpressaoBinaria(esquerda, operador, direita, linha=esquerda.linha, coluna=esquerda.coluna)
 
         return esquerda
 
@@ -347,40 +569,28 @@ class Parser:
             valor = self.token_atual.lexema
             linha, coluna = self.token_atual.linha, self.token_atual.coluna
             self._avancar()
-            lit = Literal(valor)
-            lit.linha = linha
-            lit.coluna = coluna
-            return lit
+            return Literal(valor, linha=linha, coluna=coluna)
         
         # Literais booleanos
         if self.token_atual.tipo in {TipoToken.VERDADEIRO, TipoToken.FALSO}:
             valor = self.token_atual.lexema
             linha, coluna = self.token_atual.linha, self.token_atual.coluna
             self._avancar()
-            lit = Literal(valor)
-            lit.linha = linha
-            lit.coluna = coluna
-            return lit
+            return Literal(valor, linha=linha, coluna=coluna)
         
         # Strings
         if self.token_atual.tipo == TipoToken.TEXTO:
             valor = self.token_atual.lexema
             linha, coluna = self.token_atual.linha, self.token_atual.coluna
             self._avancar()
-            lit = Literal(f'"{valor}"')
-            lit.linha = linha
-            lit.coluna = coluna
-            return lit
+            return Literal(f'"{valor}"', linha=linha, coluna=coluna)
         
         # Variáveis
         if self.token_atual.tipo == TipoToken.IDENTIFICADOR:
             nome = self.token_atual.lexema
             linha, coluna = self.token_atual.linha, self.token_atual.coluna
             self._avancar()
-            var = Variavel(nome)
-            var.linha = linha
-            var.coluna = coluna
-            return var
+            return Variavel(nome, linha=linha, coluna=coluna)
         
         # Expressão entre parênteses
         if self.token_atual.tipo == TipoToken.ABRE_PARENTESES:
@@ -395,10 +605,7 @@ class Parser:
             linha, coluna = self.token_atual.linha, self.token_atual.coluna
             self._avancar()
             operando = self._analisar_fator()
-            expr_un = ExpressaoUnaria(operador, operando)
-            expr_un.linha = linha
-            expr_un.coluna = coluna
-            return expr_un
+            return ExpressaoUnaria(operador, operando, linha=linha, coluna=coluna)
         
         # Token inesperado
         raise ErroSintatico(
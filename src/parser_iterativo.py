@@ -0,0 +1,406 @@
+"""
+Analisador sintático sem recursão (pilhas explícitas)
+
+O `Parser` e o `ParserPratt` aninham chamadas Python a cada parêntese,
+operador unário, potência à direita e bloco `se`/`enquanto`/`para`, de
+modo que programas gerados com aninhamento profundo esgotam a pilha do
+interpretador (`RecursionError`). O `ParserIterativo` analisa os mesmos
+programas com laços e pilhas explícitas: a profundidade fica limitada
+apenas pela memória e pelos limites configuráveis abaixo.
+
+PILHAS EXPLÍCITAS:
+==================
+Expressões: o laço de precedência do `ParserPratt` guarda em uma lista o
+que a recursão guardaria em quadros de chamada:
+
+    (BINARIO, esquerda, operador, minimo, proximo_limite)
+        operando direito pendente de um operador binário
+    (PARENTESES, minimo)
+        expressão entre parênteses; ao fechar, volta ao nível anterior
+    (UNARIO, token)
+        '-' aplicado ao próximo fator
+
+Comandos: cada bloco aberto (`se`, `enquanto`, `para`) empilha o seu
+cabeçalho já analisado e a lista de comandos em construção; o token de
+fechamento desempilha o bloco e o comando pronto entra na lista do bloco
+anterior.
+
+LIMITES:
+========
+- profundidade_maxima: níveis simultâneos na pilha de expressões e na de
+  blocos (entradas hostis são rejeitadas ao ultrapassá-lo, antes de
+  consumirem memória)
+- tamanho_maximo: quantidade total de nós da AST
+
+Ambos produzem `ErroSintatico` na posição do token que os excedeu. As
+árvores (inclusive linha/coluna) e os demais erros são idênticos aos do
+`Parser`, também no modo de recuperação (`recuperar=True`), em que os
+limites continuam interrompendo a análise.
+"""
+
+from typing import List, Optional, Tuple, Union
+from .ast_nodes import (
+    TipoToken, Comando, Condicional, Repeticao, RepeticaoPara,
+    Expressao, ExpressaoBinaria, ExpressaoUnaria, Literal, Variavel
+)
+from .buffer_tokens import BufferTokens
+from .exceptions import ErroSintatico
+from .fluxo_tokens import FluxoTokens
+from .lexer import Lexer
+from .parser import _FECHAMENTOS, _FIM_DE_BLOCO
+from .parser_pratt import ParserPratt, SEM_LIMITE, _TABELA
+
+
+PROFUNDIDADE_MAXIMA_PADRAO = 10_000
+TAMANHO_MAXIMO_PADRAO = 5_000_000
+
+# Quadros da pilha de expressões
+_BINARIO = 0
+_PARENTESES = 1
+_UNARIO = 2
+
+_NUMEROS_E_LOGICOS = frozenset({
+    TipoToken.NUMERO_INTEIRO, TipoToken.NUMERO_REAL, TipoToken.VERDADEIRO, TipoToken.FALSO,
+})
+_IDENTIFICADOR = TipoToken.IDENTIFICADOR
+_TEXTO = TipoToken.TEXTO
+_ABRE_PARENTESES = TipoToken.ABRE_PARENTESES
+_FECHA_PARENTESES = TipoToken.FECHA_PARENTESES
+_MENOS = TipoToken.MENOS
+
+
+class ParserIterativo(ParserPratt):
+    """
+    Parser sem recursão, com limites de profundidade e de tamanho
+
+    Args:
+        lexer: Fonte de tokens (Lexer, BufferTokens ou FluxoTokens)
+        profundidade_maxima: Aninhamento máximo de expressões e de blocos
+        tamanho_maximo: Quantidade máxima de nós da AST
+        recuperar: Se True, registra os erros e continua (ver `Parser`)
+    """
+
+    def __init__(self, lexer: Union[Lexer, BufferTokens, FluxoTokens],
+                 profundidade_maxima: int = PROFUNDIDADE_MAXIMA_PADRAO,
+                 tamanho_maximo: int = TAMANHO_MAXIMO_PADRAO,
+                 recuperar: bool = False):
+        super().__init__(lexer, recuperar)
+        self.profundidade_maxima = profundidade_maxima
+        self.tamanho_maximo = tamanho_maximo
+        self.nos = 0  # nós da AST criados até agora
+        self._limite_excedido = False
+
+    def _erro_profundidade(self) -> ErroSintatico:
+        """Erro de aninhamento acima de `profundidade_maxima`"""
+        self._limite_excedido = True
+        return ErroSintatico(
+            f"Aninhamento excede a profundidade máxima ({self.profundidade_maxima})",
+            self.token_atual.linha,
+            self.token_atual.coluna
+        )
+
+    def _erro_tamanho(self) -> ErroSintatico:
+        """Erro de programa acima de `tamanho_maximo` nós"""
+        self._limite_excedido = True
+        return ErroSintatico(
+            f"Programa excede o tamanho máximo ({self.tamanho_maximo} nós)",
+            self.token_atual.linha,
+            self.token_atual.coluna
+        )
+
+    def _analisar_comandos(self) -> List[Comando]:
+        """Analisa uma sequência de comandos (até o fim do bloco)"""
+        return self._analisar_blocos(unico=False)
+
+    def _analisar_comando(self) -> Optional[Comando]:
+        """Analisa um comando individual (blocos sem recursão)"""
+        if self.token_atual.tipo in _FECHAMENTOS:
+            return self._analisar_blocos(unico=True)[0]
+        return super()._analisar_comando()
+
+    def _analisar_blocos(self, unico: bool) -> List[Comando]:
+        """
+        Analisa comandos com os blocos aninhados em uma pilha explícita
+
+        Args:
+            unico: Se True, para após o primeiro comando completo (o token
+                atual abre um bloco); senão, para antes do token que encerra
+                a sequência ('fim', ou o fechamento de um bloco externo)
+
+        Returns:
+            List[Comando]: Comandos analisados
+        """
+        if self.recuperar and not unico:
+            return self._analisar_blocos_recuperando()
+        comandos: List[Comando] = []
+        lista = comandos
+        # Blocos abertos: [tipo, cabeçalho, lista externa, comandos do 'então', token de abertura]
+        blocos: List[list] = []
+        fechamento = None
+        while True:
+            tipo = self.token_atual.tipo
+            if tipo is fechamento:
+                bloco = blocos.pop()
+                self._avancar()
+                comando = self._construir_bloco(bloco, lista)
+                lista = bloco[2]
+                fechamento = _FECHAMENTOS[blocos[-1][0]] if blocos else None
+            elif tipo is TipoToken.SENAO and fechamento is TipoToken.FIMSE and blocos[-1][3] is None:
+                self._avancar()
+                blocos[-1][3] = lista
+                lista = []
+                continue
+            elif tipo in _FIM_DE_BLOCO:
+                if blocos:
+                    # Fechamento de outro bloco (ou 'fim') antes do esperado
+                    self._esperar_token(fechamento)
+                return comandos
+            elif tipo in _FECHAMENTOS:
+                if len(blocos) >= self.profundidade_maxima:
+                    raise self._erro_profundidade()
+                abertura = self.token_atual
+                if tipo is TipoToken.PARA:
+                    cabecalho = self._analisar_cabecalho_para()
+                else:
+                    self._avancar()
+                    cabecalho = self._analisar_expressao()
+                    self._esperar_token(TipoToken.ENTAO if tipo is TipoToken.SE else TipoToken.FACA)
+                blocos.append([tipo, cabecalho, lista, None, abertura])
+                lista = []
+                fechamento = _FECHAMENTOS[tipo]
+                continue
+            else:
+                # Comandos simples (atribuição, leia, escreva) ou erro
+                comando = super()._analisar_comando()
+            self.nos += 1
+            if self.nos > self.tamanho_maximo:
+                raise self._erro_tamanho()
+            lista.append(comando)
+            if unico and not blocos:
+                return comandos
+
+    @staticmethod
+    def _construir_bloco(bloco: list, lista: List[Comando]) -> Comando:
+        """Nó do bloco fechado, a partir do quadro e dos últimos comandos"""
+        tipo, cabecalho, _, entao, abertura = bloco
+        linha, coluna = abertura.linha, abertura.coluna
+        if tipo is TipoToken.SE:
+            if entao is None:
+                return Condicional(cabecalho, lista, [], linha=linha, coluna=coluna)
+            return Condicional(cabecalho, entao, lista, linha=linha, coluna=coluna)
+        if tipo is TipoToken.ENQUANTO:
+            return Repeticao(cabecalho, lista, linha=linha, coluna=coluna)
+        variavel, inicio, fim, passo = cabecalho
+        return RepeticaoPara(variavel, inicio, fim, passo, lista, linha=linha, coluna=coluna)
+
+    def _analisar_blocos_recuperando(self) -> List[Comando]:
+        """
+        _analisar_blocos no modo de recuperação
+        
+        Segue as regras do `Parser` (ver RECUPERAÇÃO DE ERROS em parser.py),
+        com a pilha de blocos no lugar da recursão. Um bloco cujo cabeçalho
+        tem erro fica com cabeçalho None e, ao fechar, os seus comandos
+        entram no bloco externo.
+        """
+        comandos: List[Comando] = []
+        lista = comandos
+        blocos: List[list] = []
+        fechamento = TipoToken.FIM
+        while True:
+            tipo = self.token_atual.tipo
+            fechar = False
+            if tipo in _FIM_DE_BLOCO:
+                senao_aceito = [bloco for bloco in blocos
+                                if bloco[0] is TipoToken.SE and bloco[3] is None]
+                if tipo is fechamento:
+                    if not blocos:
+                        return comandos
+                    self._avancar()
+                    fechar = True
+                elif tipo is TipoToken.SENAO and senao_aceito and senao_aceito[-1] is blocos[-1]:
+                    self._avancar()
+                    blocos[-1][3] = lista
+                    lista = []
+                elif tipo is TipoToken.FIM or any(tipo is _FECHAMENTOS[bloco[0]] for bloco in blocos) \
+                        or (tipo is TipoToken.SENAO and senao_aceito):
+                    # Fechamento de um bloco externo: o atual fica sem o seu
+                    self._registrar_erro(self._erro_esperado(fechamento))
+                    fechar = True
+                else:
+                    # Fechamento que nenhum bloco aberto espera
+                    self._registrar_erro(self._erro_esperado(fechamento))
+                    self._avancar()
+            elif tipo in _FECHAMENTOS:
+                if len(blocos) >= self.profundidade_maxima:
+                    raise self._erro_profundidade()
+                abertura = self.token_atual
+                try:
+                    if tipo is TipoToken.PARA:
+                        cabecalho = self._analisar_cabecalho_para()
+                    else:
+                        self._avancar()
+                        cabecalho = self._analisar_expressao()
+                        self._esperar_token(TipoToken.ENTAO if tipo is TipoToken.SE else TipoToken.FACA)
+                except ErroSintatico as erro:
+                    if self._limite_excedido:
+                        raise
+                    self._registrar_erro(erro)
+                    self._sincronizar_cabecalho(tipo)
+                    cabecalho = None
+                blocos.append([tipo, cabecalho, lista, None, abertura])
+                lista = []
+                fechamento = _FECHAMENTOS[tipo]
+            else:
+                inicio = self.token_atual
+                try:
+                    comando = super()._analisar_comando()
+                except ErroSintatico as erro:
+                    if self._limite_excedido:
+                        raise
+                    self._registrar_erro(erro)
+                    if tipo is not TipoToken.EOF:
+                        self._sincronizar(inicio)
+                        continue
+                    if not blocos:
+                        return comandos
+                    # Fim do arquivo: cada bloco aberto fica sem o seu fechamento
+                    self._registrar_erro(self._erro_esperado(fechamento))
+                    fechar = True
+                else:
+                    self._adicionar_no(lista, comando)
+            if fechar:
+                bloco = blocos.pop()
+                externa = bloco[2]
+                if bloco[1] is None:
+                    if bloco[3] is not None:
+                        externa.extend(bloco[3])
+                    externa.extend(lista)
+                else:
+                    self._adicionar_no(externa, self._construir_bloco(bloco, lista))
+                lista = externa
+                fechamento = _FECHAMENTOS[blocos[-1][0]] if blocos else TipoToken.FIM
+
+    def _adicionar_no(self, lista: List[Comando], comando: Comando) -> None:
+        """Acrescenta o comando à lista, contando-o no limite de tamanho"""
+        self.nos += 1
+        if self.nos > self.tamanho_maximo:
+            raise self._erro_tamanho()
+        lista.append(comando)
+
+    def _analisar_cabecalho_para(self) -> Tuple[str, Expressao, Expressao, Expressao]:
+        """Analisa 'para variavel de inicio ate fim [passo incremento] faca'"""
+        token_para = self._esperar_token(TipoToken.PARA)
+        variavel = self._esperar_token(TipoToken.IDENTIFICADOR).lexema
+        self._esperar_token(TipoToken.DE)
+        inicio = self._analisar_expressao()
+        self._esperar_token(TipoToken.ATE)
+        fim = self._analisar_expressao()
+
+        # Passo é opcional - padrão é 1
+        if self.token_atual.tipo == TipoToken.PASSO:
+            self._avancar()
+            passo = self._analisar_expressao()
+        else:
+            passo = self._passo_padrao(token_para)
+
+        self._esperar_token(TipoToken.FACA)
+        return variavel, inicio, fim, passo
+
+    def _analisar_expressao(self) -> Expressao:
+        """Analisa uma expressão completa com uma pilha explícita"""
+        tabela = _TABELA
+        proximo_token = self.tokens.proximo_token
+        profundidade_maxima = self.profundidade_maxima
+        tamanho_maximo = self.tamanho_maximo
+        nos = self.nos
+        pilha: list = []
+        minimo = 0
+        while True:
+            # Fator: prefixos '(' e '-' são empilhados até chegar a um operando
+            token = self.token_atual
+            tipo = token.tipo
+            if tipo is _IDENTIFICADOR:
+                self.token_atual = proximo_token()
+                esquerda = Variavel(token.lexema, linha=token.linha, coluna=token.coluna)
+            elif tipo in _NUMEROS_E_LOGICOS:
+                self.token_atual = proximo_token()
+                esquerda = Literal(token.lexema, linha=token.linha, coluna=token.coluna)
+            elif tipo is _TEXTO:
+                self.token_atual = proximo_token()
+                esquerda = Literal(f'"{token.lexema}"', linha=token.linha, coluna=token.coluna)
+            elif tipo is _ABRE_PARENTESES or tipo is _MENOS:
+                if len(pilha) >= profundidade_maxima:
+                    raise self._erro_profundidade()
+                self.token_atual = proximo_token()
+                if tipo is _MENOS:
+                    pilha.append((_UNARIO, token))
+                else:
+                    pilha.append((_PARENTESES, minimo))
+                    minimo = 0
+                continue
+            else:
+                raise ErroSintatico(
+                    f"Expressão inesperada '{token.lexema}'",
+                    token.linha,
+                    token.coluna
+                )
+            nos += 1
+            if nos > tamanho_maximo:
+                raise self._erro_tamanho()
+            if pilha and pilha[-1][0] is _UNARIO:
+                esquerda, nos = self._aplicar_unarios(pilha, esquerda, nos)
+            limite = SEM_LIMITE
+
+            while True:
+                # Operador que continua o nível atual: empilha e analisa o operando direito
+                token = self.token_atual
+                entrada = tabela.get(token.tipo)
+                if entrada is not None:
+                    nivel, minimo_direita, proximo_limite = entrada
+                    if minimo < nivel < limite:
+                        if len(pilha) >= profundidade_maxima:
+                            raise self._erro_profundidade()
+                        self.token_atual = proximo_token()
+                        pilha.append((_BINARIO, esquerda, token.lexema, minimo, proximo_limite))
+                        minimo = minimo_direita
+                        break
+
+                # Fim do nível atual: combina com os quadros de baixo
+                if not pilha:
+                    self.nos = nos
+                    return esquerda
+                quadro = pilha.pop()
+                if quadro[0] is _BINARIO:
+                    esquerda = ExpressaoBinaria(quadro[1], quadro[2], esquerda,
+                                                linha=quadro[1].linha, coluna=quadro[1].coluna)
+                    nos += 1
+                    minimo = quadro[3]
+                    limite = quadro[4]
+                    if entrada is None:
+                        # Sem operador à frente: todos os binários pendentes se fecham
+                        while pilha and pilha[-1][0] is _BINARIO:
+                            quadro = pilha.pop()
+                            esquerda = ExpressaoBinaria(quadro[1], quadro[2], esquerda,
+                                                        linha=quadro[1].linha, coluna=quadro[1].coluna)
+                            nos += 1
+                            minimo = quadro[3]
+                        limite = SEM_LIMITE
+                        if pilha:
+                            continue
+                        self.nos = nos
+                        return esquerda
+                else:
+                    self._esperar_token(_FECHA_PARENTESES)
+                    minimo = quadro[1]
+                    if pilha and pilha[-1][0] is _UNARIO:
+                        esquerda, nos = self._aplicar_unarios(pilha, esquerda, nos)
+                    limite = SEM_LIMITE
+
+    @staticmethod
+    def _aplicar_unarios(pilha: list, operando: Expressao, nos: int) -> Tuple[Expressao, int]:
+        """Aplica ao fator pronto os operadores unários do topo da pilha"""
+        while pilha and pilha[-1][0] is _UNARIO:
+            token = pilha.pop()[1]
+            operando = ExpressaoUnaria(token.lexema, operando, linha=token.linha, coluna=token.coluna)
+            nos += 1
+        return operando, nos
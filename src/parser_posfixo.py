@@ -0,0 +1,309 @@
+"""
+Expressões em notação pós-fixa (RPN) geradas durante a análise
+
+Motores de execução que avaliam expressões com uma pilha não precisam da
+árvore: construir um `ExpressaoBinaria`/`ExpressaoUnaria` por operador só
+para percorrê-lo e descartá-lo é alocação perdida. O `ParserPosfixo`
+mantém os comandos da AST (a estrutura do programa continua a mesma), mas
+cada expressão vira um intervalo de um único array de inteiros,
+compartilhado por todo o programa, sem nenhum objeto Python por nó.
+
+CÓDIGO PÓS-FIXO:
+================
+`CodigoPosfixo.instrucoes` é um array('i') de códigos de operação, alguns
+seguidos de um operando:
+
+    LITERAL  i     empilha constantes[i] (lexema do literal, como no nó Literal)
+    VARIAVEL i     empilha o valor da variável nomes[i]
+    NEGACAO        '-' unário sobre o topo
+    binários       um código por operador (OPERADORES_BINARIOS do Pratt):
+                   desempilha a direita e a esquerda, empilha o resultado
+
+Constantes e nomes iguais compartilham o mesmo índice. Cada expressão do
+programa é um `ExpressaoPosfixa`, o intervalo [inicio, fim) do array com
+a posição da raiz da árvore equivalente; o passo implícito do `para` é o
+literal 1, emitido em cada laço sem 'passo' na posição do 'para'.
+
+ANÁLISE:
+========
+O laço é o do `ParserIterativo`, que cria os nós exatamente em pós-ordem
+(os dois operandos antes do operador): emitir o código no lugar de criar
+o nó produz a notação pós-fixa sem pilha adicional. Erros, limites de
+profundidade e de tamanho (cada código conta como um nó) e o modo de
+recuperação são os do `ParserIterativo`. `para_arvore` reconstrói a árvore
+de uma expressão, com um consumidor de pilha como o de um avaliador.
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, Union
+from .ast_nodes import (
+    TipoToken, Token, Expressao, ExpressaoBinaria, ExpressaoUnaria, Literal, Variavel
+)
+from .buffer_tokens import BufferTokens
+from .exceptions import ErroSintatico
+from .fluxo_tokens import FluxoTokens
+from .lexer import Lexer
+from .parser_iterativo import (
+    ParserIterativo, PROFUNDIDADE_MAXIMA_PADRAO, TAMANHO_MAXIMO_PADRAO, _BINARIO, _PARENTESES, _UNARIO
+)
+from .parser_pratt import OPERADORES_BINARIOS, SEM_LIMITE, _TABELA
+
+
+# Códigos de operação (ver CÓDIGO PÓS-FIXO)
+LITERAL = 0
+VARIAVEL = 1
+NEGACAO = 2
+
+_LEXEMAS_BINARIOS = {
+    TipoToken.OU: 'ou', TipoToken.E: 'e',
+    TipoToken.IGUAL: '==', TipoToken.DIFERENTE: '!=',
+    TipoToken.MENOR: '<', TipoToken.MENOR_IGUAL: '<=',
+    TipoToken.MAIOR: '>', TipoToken.MAIOR_IGUAL: '>=',
+    TipoToken.MAIS: '+', TipoToken.MENOS: '-',
+    TipoToken.MULTIPLICACAO: '*', TipoToken.DIVISAO: '/', TipoToken.MODULO: '%',
+    TipoToken.POTENCIA: '^',
+}
+
+# Código de cada operador binário, a partir de 3, na ordem da tabela de precedência
+CODIGOS_BINARIOS: Dict[TipoToken, int] = {
+    tipo: codigo for codigo, tipo in enumerate(OPERADORES_BINARIOS, NEGACAO + 1)
+}
+
+# Operador de cada código (None para os que não são operadores binários)
+OPERADORES: Tuple = (None, None, '-') + tuple(_LEXEMAS_BINARIOS[tipo] for tipo in OPERADORES_BINARIOS)
+
+_NUMEROS_E_LOGICOS = frozenset({
+    TipoToken.NUMERO_INTEIRO, TipoToken.NUMERO_REAL, TipoToken.VERDADEIRO, TipoToken.FALSO,
+})
+_IDENTIFICADOR = TipoToken.IDENTIFICADOR
+_TEXTO = TipoToken.TEXTO
+_ABRE_PARENTESES = TipoToken.ABRE_PARENTESES
+_FECHA_PARENTESES = TipoToken.FECHA_PARENTESES
+_MENOS = TipoToken.MENOS
+
+
+class CodigoPosfixo:
+    """
+    Código pós-fixo de todas as expressões de um programa
+
+    Attributes:
+        instrucoes: Códigos de operação e operandos (ver CÓDIGO PÓS-FIXO)
+        constantes: Lexemas dos literais, por índice
+        nomes: Nomes das variáveis, por índice
+    """
+
+    def __init__(self):
+        self.instrucoes = array('i')
+        self.constantes: List[str] = []
+        self.nomes: List[str] = []
+        self._indices_constantes: Dict[str, int] = {}
+        self._indices_nomes: Dict[str, int] = {}
+
+    def indice_constante(self, valor: str) -> int:
+        """Índice do literal em `constantes` (acrescentado se novo)"""
+        indice = self._indices_constantes.get(valor)
+        if indice is None:
+            indice = self._indices_constantes[valor] = len(self.constantes)
+            self.constantes.append(valor)
+        return indice
+
+    def indice_nome(self, nome: str) -> int:
+        """Índice da variável em `nomes` (acrescentado se novo)"""
+        indice = self._indices_nomes.get(nome)
+        if indice is None:
+            indice = self._indices_nomes[nome] = len(self.nomes)
+            self.nomes.append(nome)
+        return indice
+
+
+@dataclass(slots=True)
+class ExpressaoPosfixa(Expressao):
+    """Expressão como o intervalo [inicio, fim) de `codigo.instrucoes`"""
+    codigo: CodigoPosfixo = field(repr=False)
+    inicio: int
+    fim: int
+
+
+def para_arvore(expressao: ExpressaoPosfixa) -> Expressao:
+    """
+    Reconstrói a árvore da expressão (a mesma do `ParserIterativo`)
+
+    Os operadores binários usam o lexema em minúsculas; as posições dos
+    nós internos não são guardadas no código pós-fixo e ficam em 0, 0,
+    exceto a da raiz.
+
+    Args:
+        expressao: Expressão pós-fixa
+
+    Returns:
+        Expressao: Raiz da árvore equivalente
+    """
+    codigo = expressao.codigo
+    instrucoes = codigo.instrucoes
+    pilha: List[Expressao] = []
+    indice = expressao.inicio
+    while indice < expressao.fim:
+        operacao = instrucoes[indice]
+        if operacao == LITERAL:
+            indice += 1
+            pilha.append(Literal(codigo.constantes[instrucoes[indice]]))
+        elif operacao == VARIAVEL:
+            indice += 1
+            pilha.append(Variavel(codigo.nomes[instrucoes[indice]]))
+        elif operacao == NEGACAO:
+            pilha.append(ExpressaoUnaria('-', pilha.pop()))
+        else:
+            direita = pilha.pop()
+            pilha.append(ExpressaoBinaria(pilha.pop(), OPERADORES[operacao], direita))
+        indice += 1
+    raiz = pilha.pop()
+    raiz.linha, raiz.coluna = expressao.linha, expressao.coluna
+    return raiz
+
+
+class ParserPosfixo(ParserIterativo):
+    """
+    Parser que gera as expressões em código pós-fixo (ver ANÁLISE)
+
+    Args:
+        lexer: Fonte de tokens (Lexer, BufferTokens ou FluxoTokens)
+        profundidade_maxima: Aninhamento máximo de expressões e de blocos
+        tamanho_maximo: Quantidade máxima de nós (comandos e códigos de operação)
+        recuperar: Se True, registra os erros e continua (ver `Parser`)
+
+    Attributes:
+        codigo: Código pós-fixo de todas as expressões analisadas
+    """
+
+    def __init__(self, lexer: Union[Lexer, BufferTokens, FluxoTokens],
+                 profundidade_maxima: int = PROFUNDIDADE_MAXIMA_PADRAO,
+                 tamanho_maximo: int = TAMANHO_MAXIMO_PADRAO,
+                 recuperar: bool = False):
+        super().__init__(lexer, profundidade_maxima, tamanho_maximo, recuperar)
+        self.codigo = CodigoPosfixo()
+        # Fim da última expressão concluída: o que vier depois é resto de
+        # uma expressão com erro (modo de recuperação)
+        self._fim_valido = 0
+
+    def _passo_padrao(self, token_para: Token) -> ExpressaoPosfixa:
+        """Passo implícito do 'para' como expressão pós-fixa (o literal 1)"""
+        instrucoes = self.codigo.instrucoes
+        del instrucoes[self._fim_valido:]
+        inicio = len(instrucoes)
+        instrucoes.append(LITERAL)
+        instrucoes.append(self.codigo.indice_constante("1"))
+        self._fim_valido = len(instrucoes)
+        return ExpressaoPosfixa(self.codigo, inicio, self._fim_valido,
+                                linha=token_para.linha, coluna=token_para.coluna)
+
+    def _analisar_expressao(self) -> ExpressaoPosfixa:
+        """Analisa uma expressão completa, emitindo o código pós-fixo"""
+        codigo = self.codigo
+        instrucoes = codigo.instrucoes
+        if len(instrucoes) != self._fim_valido:
+            del instrucoes[self._fim_valido:]
+        inicio = len(instrucoes)
+        emitir = instrucoes.append
+        indice_constante = codigo.indice_constante
+        indice_nome = codigo.indice_nome
+        tabela = _TABELA
+        binarios = CODIGOS_BINARIOS
+        proximo_token = self.tokens.proximo_token
+        profundidade_maxima = self.profundidade_maxima
+        tamanho_maximo = self.tamanho_maximo
+        nos = self.nos
+        pilha: list = []
+        minimo = 0
+        while True:
+            # Fator: prefixos '(' e '-' são empilhados até chegar a um operando.
+            # `raiz` é o token com a posição da subexpressão pronta
+            raiz = self.token_atual
+            tipo = raiz.tipo
+            if tipo is _IDENTIFICADOR:
+                self.token_atual = proximo_token()
+                emitir(VARIAVEL)
+                emitir(indice_nome(raiz.lexema))
+            elif tipo in _NUMEROS_E_LOGICOS:
+                self.token_atual = proximo_token()
+                emitir(LITERAL)
+                emitir(indice_constante(raiz.lexema))
+            elif tipo is _TEXTO:
+                self.token_atual = proximo_token()
+                emitir(LITERAL)
+                emitir(indice_constante(f'"{raiz.lexema}"'))
+            elif tipo is _ABRE_PARENTESES or tipo is _MENOS:
+                if len(pilha) >= profundidade_maxima:
+                    raise self._erro_profundidade()
+                self.token_atual = proximo_token()
+                if tipo is _MENOS:
+                    pilha.append((_UNARIO, raiz))
+                else:
+                    pilha.append((_PARENTESES, minimo))
+                    minimo = 0
+                continue
+            else:
+                raise ErroSintatico(
+                    f"Expressão inesperada '{raiz.lexema}'",
+                    raiz.linha,
+                    raiz.coluna
+                )
+            nos += 1
+            if nos > tamanho_maximo:
+                raise self._erro_tamanho()
+            while pilha and pilha[-1][0] is _UNARIO:
+                raiz = pilha.pop()[1]
+                emitir(NEGACAO)
+                nos += 1
+            limite = SEM_LIMITE
+
+            while True:
+                # Operador que continua o nível atual: empilha e analisa o operando direito
+                token = self.token_atual
+                entrada = tabela.get(token.tipo)
+                if entrada is not None:
+                    nivel, minimo_direita, proximo_limite = entrada
+                    if minimo < nivel < limite:
+                        if len(pilha) >= profundidade_maxima:
+                            raise self._erro_profundidade()
+                        self.token_atual = proximo_token()
+                        pilha.append((_BINARIO, raiz, binarios[token.tipo], minimo, proximo_limite))
+                        minimo = minimo_direita
+                        break
+
+                # Fim do nível atual: combina com os quadros de baixo
+                if not pilha:
+                    return self._concluir(inicio, raiz, nos)
+                quadro = pilha.pop()
+                if quadro[0] is _BINARIO:
+                    emitir(quadro[2])
+                    raiz = quadro[1]
+                    nos += 1
+                    minimo = quadro[3]
+                    limite = quadro[4]
+                    if entrada is None:
+                        # Sem operador à frente: todos os binários pendentes se fecham
+                        while pilha and pilha[-1][0] is _BINARIO:
+                            quadro = pilha.pop()
+                            emitir(quadro[2])
+                            raiz = quadro[1]
+                            nos += 1
+                            minimo = quadro[3]
+                        limite = SEM_LIMITE
+                        if pilha:
+                            continue
+                        return self._concluir(inicio, raiz, nos)
+                else:
+                    self._esperar_token(_FECHA_PARENTESES)
+                    minimo = quadro[1]
+                    while pilha and pilha[-1][0] is _UNARIO:
+                        raiz = pilha.pop()[1]
+                        emitir(NEGACAO)
+                        nos += 1
+                    limite = SEM_LIMITE
+
+    def _concluir(self, inicio: int, raiz, nos: int) -> ExpressaoPosfixa:
+        """Expressão pronta: intervalo desde `inicio`, na posição do token `raiz`"""
+        self.nos = nos
+        self._fim_valido = fim = len(self.codigo.instrucoes)
+        return ExpressaoPosfixa(self.codigo, inicio, fim, linha=raiz.linha, coluna=raiz.coluna)
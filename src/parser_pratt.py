@@ -0,0 +1,162 @@
+"""
+Analisador de expressões por precedência (Pratt)
+
+O `Parser` analisa expressões com um método por nível de precedência
+(`_analisar_expressao` → `_analisar_expressao_e` → ... → `_analisar_fator`),
+de modo que mesmo um literal isolado atravessa sete chamadas. O
+`ParserPratt` substitui essa cadeia por um único laço dirigido pela tabela
+`OPERADORES_BINARIOS`, que define precedência e associatividade de cada
+operador em um só lugar.
+
+PODER DE LIGAÇÃO:
+=================
+Cada operador tem um nível (maior = liga mais forte) e uma associatividade:
+
+    ou                     1  esquerda
+    e                      2  esquerda
+    == != < <= > >=        3  nenhuma   (a < b < c é erro, como no Parser)
+    + -                    4  esquerda
+    * / %                  5  esquerda
+    ^                      6  direita   (2 ^ 3 ^ 2 = 2 ^ (3 ^ 2))
+    - unário               acima de todos: o operando é um fator, logo
+                           -2 ^ 2 = (-2) ^ 2, como no Parser
+
+Ao encontrar um operador de nível n, o laço analisa o operando direito
+aceitando apenas operadores de nível > n (esquerda ou nenhuma) ou >= n
+(direita). Depois de combinar, o próximo operador precisa ter nível <= n
+(ou < n, para os não associativos e à direita), o que reproduz exatamente
+as árvores `ExpressaoBinaria`/`ExpressaoUnaria` e os erros do `Parser`.
+"""
+
+from typing import Dict, Tuple
+from .ast_nodes import TipoToken, Expressao, ExpressaoBinaria, ExpressaoUnaria, Literal, Variavel
+from .exceptions import ErroSintatico
+from .parser import Parser
+
+
+ESQUERDA = 'esquerda'
+DIREITA = 'direita'
+NENHUMA = 'nenhuma'
+
+# Tabela única de precedência: tipo do token -> (nível, associatividade)
+OPERADORES_BINARIOS: Dict[TipoToken, Tuple[int, str]] = {
+    TipoToken.OU: (1, ESQUERDA),
+    TipoToken.E: (2, ESQUERDA),
+    TipoToken.IGUAL: (3, NENHUMA),
+    TipoToken.DIFERENTE: (3, NENHUMA),
+    TipoToken.MENOR: (3, NENHUMA),
+    TipoToken.MENOR_IGUAL: (3, NENHUMA),
+    TipoToken.MAIOR: (3, NENHUMA),
+    TipoToken.MAIOR_IGUAL: (3, NENHUMA),
+    TipoToken.MAIS: (4, ESQUERDA),
+    TipoToken.MENOS: (4, ESQUERDA),
+    TipoToken.MULTIPLICACAO: (5, ESQUERDA),
+    TipoToken.DIVISAO: (5, ESQUERDA),
+    TipoToken.MODULO: (5, ESQUERDA),
+    TipoToken.POTENCIA: (6, DIREITA),
+}
+
+# Limite acima de qualquer nível (nenhum operador combinado ainda)
+SEM_LIMITE = max(nivel for nivel, _ in OPERADORES_BINARIOS.values()) + 1
+
+
+def compilar_tabela(operadores: Dict[TipoToken, Tuple[int, str]]) -> Dict[TipoToken, Tuple[int, int, int]]:
+    """
+    Converte a tabela de precedência nos valores usados pelo laço
+
+    Returns:
+        Dict: tipo -> (nível, mínimo exclusivo do operando direito, limite
+        exclusivo do próximo operador após combinar)
+    """
+    tabela = {}
+    for tipo, (nivel, associatividade) in operadores.items():
+        if associatividade == ESQUERDA:
+            tabela[tipo] = (nivel, nivel, nivel + 1)
+        elif associatividade == DIREITA:
+            tabela[tipo] = (nivel, nivel - 1, nivel)
+        elif associatividade == NENHUMA:
+            tabela[tipo] = (nivel, nivel, nivel)
+        else:
+            raise ValueError(f"Associatividade desconhecida '{associatividade}'")
+    return tabela
+
+
+_TABELA = compilar_tabela(OPERADORES_BINARIOS)
+
+_NUMEROS_E_LOGICOS = frozenset({
+    TipoToken.NUMERO_INTEIRO, TipoToken.NUMERO_REAL, TipoToken.VERDADEIRO, TipoToken.FALSO,
+})
+_IDENTIFICADOR = TipoToken.IDENTIFICADOR
+_TEXTO = TipoToken.TEXTO
+_ABRE_PARENTESES = TipoToken.ABRE_PARENTESES
+_FECHA_PARENTESES = TipoToken.FECHA_PARENTESES
+_MENOS = TipoToken.MENOS
+
+
+class ParserPratt(Parser):
+    """
+    Parser com expressões analisadas por precedência (Pratt)
+
+    Comandos e declarações são os do `Parser`; apenas `_analisar_expressao`
+    é substituído, produzindo árvores estruturalmente idênticas.
+    """
+
+    def _analisar_expressao(self) -> Expressao:
+        """Analisa uma expressão completa (todos os níveis)"""
+        return self._analisar_expressao_pratt(0)
+
+    def _analisar_expressao_pratt(self, minimo: int) -> Expressao:
+        """
+        Analisa uma expressão cujos operadores têm nível maior que `minimo`
+
+        Args:
+            minimo: Nível exclusivo; operadores de nível <= minimo
+                encerram a expressão e ficam para o chamador
+        """
+        esquerda = self._analisar_fator()
+        tabela = _TABELA
+        limite = SEM_LIMITE
+        while True:
+            token = self.token_atual
+            entrada = tabela.get(token.tipo)
+            if entrada is None:
+                return esquerda
+            nivel, minimo_direita, proximo_limite = entrada
+            if nivel <= minimo or nivel >= limite:
+                return esquerda
+            self.token_atual = self.tokens.proximo_token()
+            direita = self._analisar_expressao_pratt(minimo_direita)
+            esquerda = ExpressaoBinaria(esquerda, token.lexema, direita,
+                                        linha=esquerda.linha, coluna=esquerda.coluna)
+            limite = proximo_limite
+
+    def _analisar_fator(self) -> Expressao:
+        """
+        Analisa fator (elemento mais básico da expressão)
+        fator -> numero | identificador | (expressao) | verdadeiro | falso | -fator
+        """
+        token = self.token_atual
+        tipo = token.tipo
+
+        if tipo is _IDENTIFICADOR:
+            self.token_atual = self.tokens.proximo_token()
+            return Variavel(token.lexema, linha=token.linha, coluna=token.coluna)
+        if tipo in _NUMEROS_E_LOGICOS:
+            self.token_atual = self.tokens.proximo_token()
+            return Literal(token.lexema, linha=token.linha, coluna=token.coluna)
+        if tipo is _TEXTO:
+            self.token_atual = self.tokens.proximo_token()
+            return Literal(f'"{token.lexema}"', linha=token.linha, coluna=token.coluna)
+        if tipo is _ABRE_PARENTESES:
+            self._avancar()
+            expr = self._analisar_expressao_pratt(0)
+            self._esperar_token(_FECHA_PARENTESES)
+            return expr
+        if tipo is _MENOS:
+            self._avancar()
+            return ExpressaoUnaria(token.lexema, self._analisar_fator(), linha=token.linha, coluna=token.coluna)
+        raise ErroSintatico(
+            f"Expressão inesperada '{token.lexema}'",
+            token.linha,
+            token.coluna
+        )
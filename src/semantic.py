@@ -5,15 +5,81 @@ Este módulo implementa a análise semântica, verificando:
 - Declaração e uso de variáveis
 - Compatibilidade de tipos em operações
 - Escopo e visibilidade
+
+RECUPERAÇÃO DE ERROS:
+=====================
+Com `recuperar=True`, cada erro é guardado em `erros` e a análise
+continua. Uma expressão com erro recebe o tipo TIPO_ERRO, aceito por
+qualquer operação ou atribuição sem novos erros, de modo que um erro não
+se propaga para as expressões que o contêm.
+
+ANOTAÇÕES:
+==========
+A mesma passada que verifica o programa grava na AST o que descobriu
+(ver ANOTAÇÕES SEMÂNTICAS em ast_nodes.py): o tipo de cada nó de
+expressão, inclusive TIPO_ERRO, e a entrada da tabela de símbolos de cada
+variável usada ou atribuída. As fases seguintes as leem sem percorrer as
+declarações de novo.
+
+SÍMBOLOS:
+=========
+Cada variável declarada é um `Simbolo` (dataclass com `slots=True`) com
+um índice denso: 0, 1, 2, ... na ordem das declarações. Cada uso é
+resolvido uma única vez (uma busca por nome) para o próprio registro,
+que fica anotado no nó. Interpretadores, máquinas virtuais e geradores
+de código podem guardar os valores das variáveis em uma lista indexada
+por `simbolo.indice`, em vez de um dicionário por nome. O acesso
+`simbolo['tipo']` continua aceito, para o código que tratava cada
+símbolo como um dicionário.
+
+INICIALIZAÇÃO:
+==============
+A análise acompanha o fluxo de controle: o conjunto das variáveis com
+certeza atribuídas em cada ponto é um inteiro usado como máscara de bits
+(bit `simbolo.indice`). Ao fim de um 'se', valem as atribuídas nos dois
+ramos (interseção); o corpo de 'enquanto' e de 'para' pode não executar,
+então após o laço valem as de antes dele (mais a variável do 'para').
+Como não há desvios ('interrompa', 'retorne'), uma passada em ordem sobre
+a estrutura dá o resultado exato, sem iterar até um ponto fixo. Uma
+leitura fora do conjunto gera um `AvisoSemantico` em `avisos` (e um
+SyntaxWarning), uma única vez por variável. A variável atribuída no
+programa e nunca lida antes disso fica com
+`simbolo.atribuida_antes_do_uso`, e o gerador de código dispensa o seu
+valor padrão. `Simbolo.inicializada` continua
+indicando apenas que há alguma atribuição no programa.
 """
 
-from typing import Dict, Set, Any, Union
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Set, Any, Tuple, Union
 from .ast_nodes import (
     Programa, DeclaracaoVariavel,
     Comando, Atribuicao, Condicional, Repeticao, RepeticaoPara, Entrada, Saida,
     Expressao, ExpressaoBinaria, ExpressaoUnaria, Literal, Variavel
 )
-from .exceptions import ErroSemantico
+from .exceptions import AvisoSemantico, ErroSemantico
+
+
+# Tipo de uma expressão cujo erro já foi registrado (modo de recuperação)
+TIPO_ERRO = 'erro'
+
+
+@dataclass(slots=True)
+class Simbolo:
+    """Variável declarada (ver SÍMBOLOS)"""
+    nome: str
+    tipo: str
+    indice: int
+    linha_declaracao: int
+    coluna_declaracao: int
+    inicializada: bool = False
+    # Toda leitura vem depois de uma atribuição (ver INICIALIZAÇÃO)
+    atribuida_antes_do_uso: bool = False
+
+    def __getitem__(self, campo: str) -> Any:
+        """Acesso por nome do campo, como no antigo dicionário por variável"""
+        if campo not in self.__dataclass_fields__:
+            raise KeyError(campo)
+        return getattr(self, campo)
 
 
 class TabelaSimbolos:
@@ -24,10 +90,16 @@ class TabelaSimbolos:
     - Nome da variável
     - Tipo declarado
     - Status de inicialização
+    - Índice denso de cada variável (ver SÍMBOLOS)
+    
+    Attributes:
+        simbolos: Símbolo de cada nome
+        por_indice: Símbolos na ordem dos índices
     """
     
     def __init__(self):
-        self.simbolos: Dict[str, Dict[str, Any]] = {}
+        self.simbolos: Dict[str, Simbolo] = {}
+        self.por_indice: List[Simbolo] = []
 
     def declarar_variavel(self, nome: str, tipo: str, linha: int, coluna: int) -> None:
         """
@@ -48,16 +120,13 @@ class TabelaSimbolos:
                 linha, coluna
             )
         
-        self.simbolos[nome] = {
-            'tipo': tipo,
-            'inicializada': False,
-            'linha_declaracao': linha,
-            'coluna_declaracao': coluna
-        }
+        simbolo = Simbolo(nome, tipo, len(self.por_indice), linha, coluna)
+        self.simbolos[nome] = simbolo
+        self.por_indice.append(simbolo)
 
-    def verificar_variavel_declarada(self, nome: str, linha: int, coluna: int) -> str:
+    def resolver(self, nome: str, linha: int, coluna: int) -> Simbolo:
         """
-        Verifica se uma variável foi declarada
+        Símbolo de uma variável usada
         
         Args:
             nome: Nome da variável
@@ -65,31 +134,52 @@ class TabelaSimbolos:
             coluna: Coluna do uso
             
         Returns:
-            str: Tipo da variável
+            Simbolo: Registro da variável
             
         Raises:
             ErroSemantico: Se a variável não foi declarada
         """
-        if nome not in self.simbolos:
+        simbolo = self.simbolos.get(nome)
+        if simbolo is None:
             raise ErroSemantico(
                 f"Variável '{nome}' não foi declarada",
                 linha, coluna
             )
+        return simbolo
+
+    def verificar_variavel_declarada(self, nome: str, linha: int, coluna: int) -> str:
+        """
+        Verifica se uma variável foi declarada
         
-        return self.simbolos[nome]['tipo']
+        Args:
+            nome: Nome da variável
+            linha: Linha do uso
+            coluna: Coluna do uso
+            
+        Returns:
+            str: Tipo da variável
+            
+        Raises:
+            ErroSemantico: Se a variável não foi declarada
+        """
+        return self.resolver(nome, linha, coluna).tipo
 
     def marcar_como_inicializada(self, nome: str) -> None:
         """Marca uma variável como inicializada"""
-        if nome in self.simbolos:
-            self.simbolos[nome]['inicializada'] = True
+        simbolo = self.simbolos.get(nome)
+        if simbolo is not None:
+            simbolo.inicializada = True
 
     def verificar_inicializada(self, nome: str, linha: int, coluna: int) -> None:
         """
         Verifica se uma variável foi inicializada antes do uso
         
-        Emite um warning se a variável não foi inicializada.
+        Emite um warning se a variável não foi inicializada. Não considera
+        o fluxo de controle: o `AnalisadorSemantico` usa a análise descrita
+        em INICIALIZAÇÃO.
         """
-        if nome in self.simbolos and not self.simbolos[nome]['inicializada']:
+        simbolo = self.simbolos.get(nome)
+        if simbolo is not None and not simbolo.inicializada:
             # Emitir warning ao invés de erro fatal
             import warnings
             warnings.warn(
@@ -101,7 +191,8 @@ class TabelaSimbolos:
 
     def obter_tipo(self, nome: str) -> str:
         """Obtém o tipo de uma variável"""
-        return self.simbolos.get(nome, {}).get('tipo', 'desconhecido')
+        simbolo = self.simbolos.get(nome)
+        return simbolo.tipo if simbolo is not None else 'desconhecido'
 
 
 class AnalisadorSemantico:
@@ -112,11 +203,50 @@ class AnalisadorSemantico:
     - Consistência de tipos
     - Declaração e uso de variáveis
     - Compatibilidade de operações
+    
+    Args:
+        recuperar: Se True, registra os erros em `erros` e continua a
+            análise (ver RECUPERAÇÃO DE ERROS)
+    
+    Attributes:
+        erros: Erros registrados no modo de recuperação
+        avisos: Leituras de variáveis possivelmente não inicializadas,
+            uma por variável (ver INICIALIZAÇÃO)
     """
     
-    def __init__(self):
+    def __init__(self, recuperar: bool = False):
         self.tabela_simbolos = TabelaSimbolos()
         self.tipos_compativel_int_real = {'inteiro', 'real'}
+        self.recuperar = recuperar
+        self.erros: List[ErroSemantico] = []
+        self.avisos: List[AvisoSemantico] = []
+        # Máscaras de bits por índice de símbolo: variáveis com certeza
+        # atribuídas no ponto atual e variáveis já avisadas
+        self._atribuidas = 0
+        self._avisadas = 0
+
+    def _relatar(self, erro: ErroSemantico) -> str:
+        """
+        Lança o erro ou, no modo de recuperação, registra-o
+        
+        Returns:
+            str: TIPO_ERRO, o tipo da construção com erro
+            
+        Raises:
+            ErroSemantico: Fora do modo de recuperação
+        """
+        if not self.recuperar:
+            raise erro
+        self.erros.append(erro)
+        return TIPO_ERRO
+
+    def _resolver(self, nome: str, linha: int, coluna: int) -> Optional[Simbolo]:
+        """Símbolo da variável, ou None (erro registrado) se não foi declarada"""
+        try:
+            return self.tabela_simbolos.resolver(nome, linha, coluna)
+        except ErroSemantico as erro:
+            self._relatar(erro)
+            return None
 
     def analisar(self, programa: Programa) -> None:
         """
@@ -127,44 +257,83 @@ class AnalisadorSemantico:
         """
         # Primeira passada: registrar todas as declarações
         for declaracao in programa.declaracoes:
-            self._analisar_declaracao(declaracao)
+            try:
+                self._analisar_declaracao(declaracao)
+            except ErroSemantico as erro:
+                self._relatar(erro)
         
         # Segunda passada: analisar comandos
-        for comando in programa.comandos:
-            self._analisar_comando(comando)
+        self._analisar_comandos(programa.comandos)
+        
+        for simbolo in self.tabela_simbolos.por_indice:
+            simbolo.atribuida_antes_do_uso = (
+                simbolo.inicializada and not self._avisadas >> simbolo.indice & 1
+            )
 
     def _analisar_declaracao(self, declaracao: DeclaracaoVariavel) -> None:
         """Analisa uma declaração de variável"""
         self.tabela_simbolos.declarar_variavel(
             declaracao.nome,
             declaracao.tipo,
-            getattr(declaracao, 'linha', 0),
-            getattr(declaracao, 'coluna', 0)
+            declaracao.linha,
+            declaracao.coluna
         )
+        declaracao.simbolo = self.tabela_simbolos.simbolos[declaracao.nome]
+
+    def _analisar_comandos(self, comandos: List[Comando]) -> None:
+        """
+        Analisa uma lista de comandos sem recursão
+        
+        Os comandos com blocos aninhados são geradores que produzem cada
+        bloco no momento em que ele deve ser analisado; a pilha explícita
+        guarda os blocos e geradores em andamento.
+        """
+        pilha: List[Iterator] = [iter(comandos)]
+        while pilha:
+            item = next(pilha[-1], None)
+            if item is None:
+                pilha.pop()
+            elif isinstance(item, list):
+                pilha.append(iter(item))
+            else:
+                etapas = self._iniciar_comando(item)
+                if etapas is not None:
+                    pilha.append(etapas)
 
     def _analisar_comando(self, comando: Comando) -> None:
-        """Analisa um comando"""
+        """Analisa um comando (e seus blocos aninhados)"""
+        self._analisar_comandos([comando])
+
+    def _iniciar_comando(self, comando: Comando) -> Optional[Iterator[List[Comando]]]:
+        """
+        Analisa um comando simples, ou inicia um comando com blocos
+        
+        Returns:
+            Gerador dos blocos aninhados, ou None para comandos simples
+        """
         if isinstance(comando, Atribuicao):
             self._analisar_atribuicao(comando)
         elif isinstance(comando, Condicional):
-            self._analisar_condicional(comando)
+            return self._analisar_condicional(comando)
         elif isinstance(comando, Repeticao):
-            self._analisar_repeticao(comando)
+            return self._analisar_repeticao(comando)
         elif isinstance(comando, RepeticaoPara):
-            self._analisar_repeticao_para(comando)
+            return self._analisar_repeticao_para(comando)
         elif isinstance(comando, Entrada):
             self._analisar_entrada(comando)
         elif isinstance(comando, Saida):
             self._analisar_saida(comando)
+        return None
 
     def _analisar_atribuicao(self, atribuicao: Atribuicao) -> None:
         """Analisa comando de atribuição"""
         # Verificar se variável foi declarada
-        tipo_variavel = self.tabela_simbolos.verificar_variavel_declarada(
+        simbolo = self._resolver(
             atribuicao.variavel, 
-            getattr(atribuicao, 'linha', 0), 
-            getattr(atribuicao, 'coluna', 0)
+            atribuicao.linha,
+            atribuicao.coluna
         )
+        tipo_variavel = simbolo.tipo if simbolo is not None else TIPO_ERRO
         
         # Analisar expressão do lado direito
         tipo_expressao = self._analisar_expressao(atribuicao.expressao)
@@ -172,48 +341,59 @@ class AnalisadorSemantico:
         # Verificar compatibilidade de tipos
         self._verificar_compatibilidade_tipos(
             tipo_variavel, tipo_expressao, 
-            getattr(atribuicao, 'linha', 0), 
-            getattr(atribuicao, 'coluna', 0),
+            atribuicao.linha,
+            atribuicao.coluna,
             f"Atribuição incompatível: '{tipo_variavel}' = '{tipo_expressao}'"
         )
         
         # Marcar variável como inicializada
-        self.tabela_simbolos.marcar_como_inicializada(atribuicao.variavel)
+        if simbolo is not None:
+            simbolo.inicializada = True
+            self._atribuidas |= 1 << simbolo.indice
+        atribuicao.simbolo = simbolo
 
-    def _analisar_condicional(self, condicional: Condicional) -> None:
-        """Analisa comando condicional"""
+    def _analisar_condicional(self, condicional: Condicional) -> Iterator[List[Comando]]:
+        """Analisa comando condicional (gerador dos blocos aninhados)"""
         # Analisar condição (deve ser lógica)
         tipo_condicao = self._analisar_expressao(condicional.condicao)
         if tipo_condicao != 'logico':
             # Permitir conversão implícita para booleano
             pass
+        antes = self._atribuidas
         
         # Analisar comandos do 'então'
-        for comando in condicional.comandos_entao:
-            self._analisar_comando(comando)
+        yield condicional.comandos_entao
+        depois_entao = self._atribuidas
+        self._atribuidas = antes
         
         # Analisar comandos do 'senão' (se existir)
-        for comando in condicional.comandos_senao:
-            self._analisar_comando(comando)
+        yield condicional.comandos_senao
+        
+        # Atribuídas com certeza: as dos dois caminhos
+        self._atribuidas &= depois_entao
 
-    def _analisar_repeticao(self, repeticao: Repeticao) -> None:
-        """Analisa comando de repetição"""
+    def _analisar_repeticao(self, repeticao: Repeticao) -> Iterator[List[Comando]]:
+        """Analisa comando de repetição (gerador dos blocos aninhados)"""
         # Analisar condição (deve ser lógica)
         tipo_condicao = self._analisar_expressao(repeticao.condicao)
         if tipo_condicao != 'logico':
             # Permitir conversão implícita para booleano
             pass
+        antes = self._atribuidas
 
         # Analisar comandos do loop
-        for comando in repeticao.comandos:
-            self._analisar_comando(comando)
+        yield repeticao.comandos
+
+        # O corpo pode não executar nenhuma vez
+        self._atribuidas = antes
 
-    def _analisar_repeticao_para(self, repeticao: RepeticaoPara) -> None:
-        """Analisa comando de repetição 'para'"""
+    def _analisar_repeticao_para(self, repeticao: RepeticaoPara) -> Iterator[List[Comando]]:
+        """Analisa comando de repetição 'para' (gerador dos blocos aninhados)"""
         # Verificar se variável foi declarada
-        self.tabela_simbolos.verificar_variavel_declarada(
+        simbolo = self._resolver(
             repeticao.variavel,
-            0, 0
+            repeticao.linha,
+            repeticao.coluna
         )
 
         # Analisar expressões de início, fim e passo
@@ -222,23 +402,32 @@ class AnalisadorSemantico:
         self._analisar_expressao(repeticao.passo)
 
         # Marcar variável como inicializada
-        self.tabela_simbolos.marcar_como_inicializada(repeticao.variavel)
+        if simbolo is not None:
+            simbolo.inicializada = True
+            self._atribuidas |= 1 << simbolo.indice
+        repeticao.simbolo = simbolo
+        antes = self._atribuidas
 
         # Analisar comandos do loop
-        for comando in repeticao.comandos:
-            self._analisar_comando(comando)
+        yield repeticao.comandos
+
+        # O corpo pode não executar nenhuma vez
+        self._atribuidas = antes
 
     def _analisar_entrada(self, entrada: Entrada) -> None:
         """Analisa comando de entrada"""
         # Verificar se variável foi declarada
-        self.tabela_simbolos.verificar_variavel_declarada(
+        simbolo = self._resolver(
             entrada.variavel, 
-            getattr(entrada, 'linha', 0), 
-            getattr(entrada, 'coluna', 0)
+            entrada.linha,
+            entrada.coluna
         )
         
         # Marcar como inicializada
-        self.tabela_simbolos.marcar_como_inicializada(entrada.variavel)
+        if simbolo is not None:
+            simbolo.inicializada = True
+            self._atribuidas |= 1 << simbolo.indice
+        entrada.simbolo = simbolo
 
     def _analisar_saida(self, saida: Saida) -> None:
         """Analisa comando de saída"""
@@ -250,47 +439,93 @@ class AnalisadorSemantico:
         """
         Analisa uma expressão e retorna seu tipo
         
+        Percorre a árvore em pós-ordem com uma pilha explícita (sem
+        recursão): cada operador é verificado depois dos seus operandos,
+        na mesma ordem da análise recursiva. O tipo de cada nó fica
+        anotado em `tipo` (ver ANOTAÇÕES).
+        
         Args:
             expressao: Nó da expressão
             
         Returns:
             str: Tipo da expressão
         """
-        if isinstance(expressao, Literal):
-            return self._inferir_tipo_literal(expressao.valor)
-        
-        elif isinstance(expressao, Variavel):
-            # Verificar se variável foi declarada
-            tipo = self.tabela_simbolos.verificar_variavel_declarada(
-                expressao.nome, 
-                getattr(expressao, 'linha', 0), 
-                getattr(expressao, 'coluna', 0)
-            )
+        tipos: List[str] = []
+        pilha: List[Tuple[Expressao, bool]] = [(expressao, False)]
+        while pilha:
+            no, operandos_prontos = pilha.pop()
+            if isinstance(no, Literal):
+                no.tipo = tipo = self._inferir_tipo_literal(no.valor)
+                tipos.append(tipo)
             
-            # Verificar se foi inicializada
-            self.tabela_simbolos.verificar_inicializada(
-                expressao.nome, 
-                getattr(expressao, 'linha', 0), 
-                getattr(expressao, 'coluna', 0)
-            )
+            elif isinstance(no, Variavel):
+                no.tipo = tipo = self._analisar_variavel(no)
+                tipos.append(tipo)
+            
+            elif isinstance(no, ExpressaoBinaria):
+                if operandos_prontos:
+                    tipo_direita = tipos.pop()
+                    no.tipo = tipo = self._analisar_expressao_binaria(no, tipos.pop(), tipo_direita)
+                    tipos.append(tipo)
+                else:
+                    pilha.append((no, True))
+                    pilha.append((no.direita, False))
+                    pilha.append((no.esquerda, False))
+            
+            elif isinstance(no, ExpressaoUnaria):
+                if operandos_prontos:
+                    no.tipo = tipo = self._analisar_expressao_unaria(no, tipos.pop())
+                    tipos.append(tipo)
+                else:
+                    pilha.append((no, True))
+                    pilha.append((no.operando, False))
             
-            return tipo
+            else:
+                raise ErroSemantico(f"Tipo de expressão não reconhecido", 0, 0)
         
-        elif isinstance(expressao, ExpressaoBinaria):
-            return self._analisar_expressao_binaria(expressao)
+        return tipos[0]
+
+    def _analisar_variavel(self, expressao: Variavel) -> str:
+        """Analisa o uso de uma variável em expressão e retorna seu tipo"""
+        # Verificar se variável foi declarada (uma única busca por nome)
+        simbolo = self._resolver(
+            expressao.nome,
+            expressao.linha,
+            expressao.coluna
+        )
+        expressao.simbolo = simbolo
+        if simbolo is None:
+            return TIPO_ERRO
         
-        elif isinstance(expressao, ExpressaoUnaria):
-            return self._analisar_expressao_unaria(expressao)
+        # Verificar se foi atribuída em todos os caminhos até aqui
+        bit = 1 << simbolo.indice
+        if not (self._atribuidas | self._avisadas) & bit:
+            self._avisar_nao_inicializada(expressao)
+            self._avisadas |= bit
         
-        else:
-            raise ErroSemantico(f"Tipo de expressão não reconhecido", 0, 0)
+        return simbolo.tipo
 
-    def _analisar_expressao_binaria(self, expressao: ExpressaoBinaria) -> str:
-        """Analisa expressão binária e verifica compatibilidade de tipos"""
-        tipo_esquerda = self._analisar_expressao(expressao.esquerda)
-        tipo_direita = self._analisar_expressao(expressao.direita)
+    def _avisar_nao_inicializada(self, expressao: Variavel) -> None:
+        """Registra a primeira leitura não inicializada de uma variável"""
+        aviso = AvisoSemantico(
+            f"Variável '{expressao.nome}' pode estar sendo usada antes de ser inicializada",
+            expressao.linha,
+            expressao.coluna
+        )
+        self.avisos.append(aviso)
+        # Emitir warning ao invés de erro fatal
+        import warnings
+        warnings.warn(str(aviso), SyntaxWarning, stacklevel=2)
+
+    def _analisar_expressao_binaria(self, expressao: ExpressaoBinaria,
+                                    tipo_esquerda: str, tipo_direita: str) -> str:
+        """Verifica a compatibilidade de tipos de uma expressão binária"""
         operador = expressao.operador
         
+        # Operando com erro já registrado
+        if tipo_esquerda == TIPO_ERRO or tipo_direita == TIPO_ERRO:
+            return TIPO_ERRO
+        
         # Operadores aritméticos
         if operador in {'+', '-', '*', '%'}:
             if (tipo_esquerda in self.tipos_compativel_int_real and
@@ -300,10 +535,10 @@ class AnalisadorSemantico:
                     return 'real'
                 return 'inteiro'
             else:
-                raise ErroSemantico(
+                return self._relatar(ErroSemantico(
                     f"Operação aritmética '{operador}' incompatível entre '{tipo_esquerda}' e '{tipo_direita}'",
-                    0, 0
-                )
+                    expressao.linha, expressao.coluna
+                ))
 
         # Divisão e potenciação sempre retornam real (comportamento do Python 3)
         elif operador in {'/', '^'}:
@@ -311,10 +546,10 @@ class AnalisadorSemantico:
                 tipo_direita in self.tipos_compativel_int_real):
                 return 'real'  # Divisão e potenciação sempre retornam real
             else:
-                raise ErroSemantico(
+                return self._relatar(ErroSemantico(
                     f"Operação aritmética '{operador}' incompatível entre '{tipo_esquerda}' e '{tipo_direita}'",
-                    0, 0
-                )
+                    expressao.linha, expressao.coluna
+                ))
         
         # Operadores relacionais
         elif operador in {'==', '!=', '<', '<=', '>', '>='}:
@@ -333,24 +568,26 @@ class AnalisadorSemantico:
             return 'logico'
         
         else:
-            raise ErroSemantico(f"Operador '{operador}' não reconhecido", 0, 0)
+            return self._relatar(ErroSemantico(f"Operador '{operador}' não reconhecido", expressao.linha, expressao.coluna))
 
-    def _analisar_expressao_unaria(self, expressao: ExpressaoUnaria) -> str:
-        """Analisa expressão unária"""
-        tipo_operando = self._analisar_expressao(expressao.operando)
+    def _analisar_expressao_unaria(self, expressao: ExpressaoUnaria, tipo_operando: str) -> str:
+        """Verifica o tipo do operando de uma expressão unária"""
         operador = expressao.operador
         
+        if tipo_operando == TIPO_ERRO:
+            return TIPO_ERRO
+        
         if operador == '-':
             if tipo_operando in self.tipos_compativel_int_real:
                 return tipo_operando
             else:
-                raise ErroSemantico(
+                return self._relatar(ErroSemantico(
                     f"Operador unário '-' não aplicável a '{tipo_operando}'",
-                    0, 0
-                )
+                    expressao.linha, expressao.coluna
+                ))
         
         else:
-            raise ErroSemantico(f"Operador unário '{operador}' não reconhecido", 0, 0)
+            return self._relatar(ErroSemantico(f"Operador unário '{operador}' não reconhecido", expressao.linha, expressao.coluna))
 
     def _inferir_tipo_literal(self, valor: str) -> str:
         """Infere o tipo de um literal baseado em seu valor"""
@@ -386,7 +623,8 @@ class AnalisadorSemantico:
             mensagem: Mensagem de erro
             
         Raises:
-            ErroSemantico: Se os tipos não são compatíveis
+            ErroSemantico: Se os tipos não são compatíveis (fora do modo
+                de recuperação)
         """
         if tipo1 == tipo2:
             return
@@ -397,8 +635,8 @@ class AnalisadorSemantico:
             return
         
         # Permitir tipos desconhecidos (pode ser literal ou erro anterior)
-        if tipo1 == 'desconhecido' or tipo2 == 'desconhecido':
+        if tipo1 in ('desconhecido', TIPO_ERRO) or tipo2 in ('desconhecido', TIPO_ERRO):
             return
         
-        # Tipos incompatíveis - lançar erro
-        raise ErroSemantico(mensagem, linha, coluna)
\ No newline at end of file
+        # Tipos incompatíveis - lançar erro (ou registrar, na recuperação)
+        self._relatar(ErroSemantico(mensagem, linha, coluna))
\ No newline at end of file
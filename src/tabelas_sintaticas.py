@@ -0,0 +1,106 @@
+"""
+Tabela LL(1) gerada por `python -m src.gerador_ll1`
+
+NÃO EDITE: altere GRAMATICA em gerador_ll1.py e gere novamente.
+"""
+
+ASSINATURA = '4878f18d73827185cae39c99cb79f0ad4bd890f9'
+
+NAO_TERMINAIS = (
+    'programa', 'declaracoes', 'declaracao', 'tipo', 'lista_nomes', 'comandos',
+    'comando', 'atribuicao', 'condicional', 'senao', 'repeticao', 'repeticao_para',
+    'passo', 'entrada', 'saida', 'lista_expressoes', 'expressao', 'resto_expressao',
+    'fator', 'operador_binario',
+)
+
+TERMINAIS = (
+    'INICIO', 'FIM', 'EOF', 'IDENTIFICADOR', 'PONTO_E_VIRGULA', 'INTEIRO',
+    'REAL', 'CARACTER', 'LOGICO', 'VIRGULA', 'ATRIBUICAO', 'SE',
+    'ENTAO', 'FIMSE', 'SENAO', 'ENQUANTO', 'FACA', 'FIMENQUANTO',
+    'PARA', 'DE', 'ATE', 'FIMPARA', 'PASSO', 'LEIA',
+    'ABRE_PARENTESES', 'FECHA_PARENTESES', 'ESCREVA', 'NUMERO_INTEIRO', 'NUMERO_REAL', 'TEXTO',
+    'VERDADEIRO', 'FALSO', 'MENOS', 'OU', 'E', 'IGUAL',
+    'DIFERENTE', 'MENOR', 'MENOR_IGUAL', 'MAIOR', 'MAIOR_IGUAL', 'MAIS',
+    'MULTIPLICACAO', 'DIVISAO', 'MODULO', 'POTENCIA',
+)
+
+PRODUCOES = (
+    ('programa', ('declaracoes', 'INICIO', 'comandos', 'FIM', 'EOF')),
+    ('declaracoes', ('declaracao', 'declaracoes')),
+    ('declaracoes', ()),
+    ('declaracao', ('tipo', 'IDENTIFICADOR', 'lista_nomes', 'PONTO_E_VIRGULA')),
+    ('tipo', ('INTEIRO',)),
+    ('tipo', ('REAL',)),
+    ('tipo', ('CARACTER',)),
+    ('tipo', ('LOGICO',)),
+    ('lista_nomes', ('VIRGULA', 'IDENTIFICADOR', 'lista_nomes')),
+    ('lista_nomes', ()),
+    ('comandos', ('comando', 'comandos')),
+    ('comandos', ()),
+    ('comando', ('atribuicao',)),
+    ('comando', ('condicional',)),
+    ('comando', ('repeticao',)),
+    ('comando', ('repeticao_para',)),
+    ('comando', ('entrada',)),
+    ('comando', ('saida',)),
+    ('atribuicao', ('IDENTIFICADOR', 'ATRIBUICAO', 'expressao')),
+    ('condicional', ('SE', 'expressao', 'ENTAO', 'comandos', 'senao', 'FIMSE')),
+    ('senao', ('SENAO', 'comandos')),
+    ('senao', ()),
+    ('repeticao', ('ENQUANTO', 'expressao', 'FACA', 'comandos', 'FIMENQUANTO')),
+    ('repeticao_para', ('PARA', 'IDENTIFICADOR', 'DE', 'expressao', 'ATE', 'expressao', 'passo', 'FACA', 'comandos', 'FIMPARA')),
+    ('passo', ('PASSO', 'expressao')),
+    ('passo', ()),
+    ('entrada', ('LEIA', 'ABRE_PARENTESES', 'IDENTIFICADOR', 'FECHA_PARENTESES')),
+    ('saida', ('ESCREVA', 'ABRE_PARENTESES', 'expressao', 'lista_expressoes', 'FECHA_PARENTESES')),
+    ('lista_expressoes', ('VIRGULA', 'expressao', 'lista_expressoes')),
+    ('lista_expressoes', ()),
+    ('expressao', ('fator', 'resto_expressao')),
+    ('resto_expressao', ('operador_binario', 'fator', 'resto_expressao')),
+    ('resto_expressao', ()),
+    ('fator', ('IDENTIFICADOR',)),
+    ('fator', ('NUMERO_INTEIRO',)),
+    ('fator', ('NUMERO_REAL',)),
+    ('fator', ('TEXTO',)),
+    ('fator', ('VERDADEIRO',)),
+    ('fator', ('FALSO',)),
+    ('fator', ('ABRE_PARENTESES', 'expressao', 'FECHA_PARENTESES')),
+    ('fator', ('MENOS', 'fator')),
+    ('operador_binario', ('OU',)),
+    ('operador_binario', ('E',)),
+    ('operador_binario', ('IGUAL',)),
+    ('operador_binario', ('DIFERENTE',)),
+    ('operador_binario', ('MENOR',)),
+    ('operador_binario', ('MENOR_IGUAL',)),
+    ('operador_binario', ('MAIOR',)),
+    ('operador_binario', ('MAIOR_IGUAL',)),
+    ('operador_binario', ('MAIS',)),
+    ('operador_binario', ('MENOS',)),
+    ('operador_binario', ('MULTIPLICACAO',)),
+    ('operador_binario', ('DIVISAO',)),
+    ('operador_binario', ('MODULO',)),
+    ('operador_binario', ('POTENCIA',)),
+)
+
+CELULAS = (
+    0, -1, -1, -1, -1, 0, 0, 0, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    2, -1, -1, -1, -1, 1, 1, 1, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, 3, 3, 3, 3, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, 4, 5, 6, 7, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, 9, -1, -1, -1, -1, 8, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, 11, -1, 10, -1, -1, -1, -1, -1, -1, -1, 10, -1, 11, 11, 10, -1, 11, 10, -1, -1, 11, -1, 10, -1, -1, 10, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, 12, -1, -1, -1, -1, -1, -1, -1, 13, -1, -1, -1, 14, -1, -1, 15, -1, -1, -1, -1, 16, -1, -1, 17, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, 18, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 19, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 21, 20, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 22, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 23, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 25, -1, -1, -1, -1, -1, 24, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 26, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 27, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, 28, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 29, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, 30, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 30, -1, -1, 30, 30, 30, 30, 30, 30, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, 32, -1, 32, -1, -1, -1, -1, -1, 32, -1, 32, 32, 32, 32, 32, 32, 32, 32, -1, 32, 32, 32, 32, -1, 32, 32, -1, -1, -1, -1, -1, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+    -1, -1, -1, 33, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 39, -1, -1, 34, 35, 36, 37, 38, 40, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 50, 41, 42, 43, 44, 45, 46, 47, 48, 49, 51, 52, 53, 54,
+)
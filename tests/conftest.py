@@ -1,5 +1,6 @@
 import sys
 import os
+from dataclasses import fields, is_dataclass
 import pytest
 
 # Adiciona o diretório raiz ao PYTHONPATH para importar os módulos src
@@ -9,6 +10,49 @@ from src.lexer import Lexer
 from src.parser import Parser
 from src.semantic import AnalisadorSemantico
 from src.codegen import GeradorDeCodigo
+from src.semantic import Simbolo
+from src.ast_nodes import TipoToken
+from src.exceptions import ErroLexico, ErroSintatico
+
+
+def listar_tokens(lexer):
+    """Lista os tokens até EOF; um erro léxico encerra a lista"""
+    tokens = []
+    try:
+        while True:
+            token = lexer.proximo_token()
+            tokens.append(token)
+            if token.tipo == TipoToken.EOF:
+                return tokens
+    except ErroLexico as erro:
+        tokens.append((erro.mensagem, erro.linha, erro.coluna))
+        return tokens
+
+
+def arvore(no, simbolos=False):
+    """
+    Estrutura completa do nó, incluindo linha/coluna
+
+    Com `simbolos=True`, cada `Simbolo` anotado vira apenas (índice, tipo
+    declarado), para comparar as anotações de análises diferentes.
+    """
+    if isinstance(no, list):
+        return [arvore(item, simbolos) for item in no]
+    if simbolos and isinstance(no, Simbolo):
+        return no.indice, no.tipo
+    if is_dataclass(no):
+        return type(no).__name__, {
+            campo.name: arvore(getattr(no, campo.name), simbolos) for campo in fields(no)
+        }
+    return no
+
+
+def analisar(classe_parser, codigo):
+    """AST do código (ver `arvore`), ou os dados do erro sintático"""
+    try:
+        return arvore(classe_parser(Lexer(codigo)).analisar())
+    except ErroSintatico as erro:
+        return erro.mensagem, erro.linha, erro.coluna
 
 
 @pytest.fixture
@@ -75,3 +119,32 @@ inicio
     fimpara
 fim
 """
+
+
+@pytest.fixture
+def codigos_borda():
+    """Fixture com entradas que exercitam os casos de borda do lexer"""
+    return [
+        "",
+        "   \n\t  ",
+        "inteiro x; inicio x <- 5 fim",
+        "SE Fim EnQuAnTo _a1 b_2",
+        "x<-1.5+2*3/4%5^6-(7)",
+        "a<=b>=c==d!=e<f>g=h",
+        "/* bloco */ x /* multi\nlinha */ y",
+        "// linha\nx // fim sem quebra",
+        "/* nao fechado",
+        "/*/",
+        'escreva("texto", "com \\"aspas\\"", "barra \\\\")',
+        'escreva("quebra\nde linha") x',
+        '"nao fechada',
+        '"escape no fim\\',
+        "ação <- 1 ; coração",
+        "x²",
+        "1.2.3",
+        "12abc 3.",
+        "a ! b",
+        "a @ b",
+        "x <- 1",
+        "x\r\ny",
+    ]
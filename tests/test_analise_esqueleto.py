@@ -0,0 +1,159 @@
+"""
+Testes para a análise de esqueleto (corpos de blocos adiados)
+
+Valida que as declarações e o contorno dos blocos saem sem analisar os
+corpos, que cada bloco é analisado só quando acessado e que a AST e os
+erros são os mesmos da análise completa.
+"""
+
+import pytest
+from src.lexer import Lexer
+from src.lexer_regex import LexerRegex
+from src.parser import Parser
+from src.analise_esqueleto import Esqueleto
+from src.ast_nodes import TipoToken, Condicional, Repeticao
+from src.exceptions import ErroLexico, ErroSintatico
+from benchmarks.programas_sinteticos import gerar_programa
+
+
+CODIGO = """inteiro x, i;
+real y;
+inicio
+    x <- 1
+    se x > 0 entao
+        enquanto x < 10 faca
+            x <- x + 1
+        fimenquanto
+    senao
+        para i de 1 ate 3 faca
+            escreva(i)
+        fimpara
+    fimse
+    enquanto x > 0 faca
+        x <- x - 1
+    fimenquanto
+fim
+"""
+
+
+def completo(codigo):
+    """AST do código, pelo Parser"""
+    return Parser(Lexer(codigo)).analisar()
+
+
+def erro(funcao):
+    """Tipo e mensagem do erro lançado pela função"""
+    with pytest.raises((ErroLexico, ErroSintatico)) as info:
+        funcao()
+    return type(info.value), str(info.value)
+
+
+class TestEsqueleto:
+    """Testes das declarações e do contorno"""
+
+    def test_declaracoes(self):
+        """Testa que as declarações são as da análise completa"""
+        esqueleto = Esqueleto(CODIGO)
+        assert esqueleto.declaracoes == completo(CODIGO).declaracoes
+        assert [d.nome for d in esqueleto.declaracoes] == ['x', 'i', 'y']
+
+    def test_contorno(self):
+        """Testa tipo, nível e posições dos blocos"""
+        esqueleto = Esqueleto(CODIGO)
+        contorno = [(nivel, bloco.tipo, bloco.linha, bloco.linha_fim)
+                    for nivel, bloco in esqueleto.contorno()]
+        assert contorno == [
+            (0, TipoToken.SE, 5, 13),
+            (1, TipoToken.ENQUANTO, 6, 8),
+            (1, TipoToken.PARA, 10, 12),
+            (0, TipoToken.ENQUANTO, 14, 16),
+        ]
+
+    def test_nada_analisado_na_construcao(self):
+        """Testa que nenhum corpo é analisado antes de ser acessado"""
+        esqueleto = Esqueleto(CODIGO)
+        assert esqueleto._comandos is None
+        assert not any(bloco.analisado for _, bloco in esqueleto.contorno())
+
+    def test_buffer_de_tokens(self):
+        """Testa a construção a partir de um BufferTokens"""
+        esqueleto = Esqueleto(LexerRegex(CODIGO).tokenizar())
+        assert esqueleto.analisar() == completo(CODIGO)
+
+
+class TestAnaliseSobDemanda:
+    """Testes da análise dos corpos adiados"""
+
+    def test_bloco_isolado(self):
+        """Testa que só o bloco acessado (e os internos) é analisado"""
+        esqueleto = Esqueleto(CODIGO)
+        se, enquanto = esqueleto.blocos
+        assert enquanto.comando == completo(CODIGO).comandos[2]
+        assert isinstance(enquanto.comando, Repeticao)
+        assert not se.analisado and esqueleto._comandos is None
+
+    def test_blocos_internos_associados(self):
+        """Testa que os blocos internos reaproveitam os nós do bloco externo"""
+        esqueleto = Esqueleto(CODIGO)
+        se = esqueleto.blocos[0]
+        condicional = se.comando
+        assert isinstance(condicional, Condicional)
+        interno_entao, interno_senao = se.blocos
+        assert interno_entao.comando is condicional.comandos_entao[0]
+        assert interno_senao.comando is condicional.comandos_senao[0]
+
+    def test_analisar_igual_ao_completo(self):
+        """Testa que a AST, com as posições, é a da análise completa"""
+        esqueleto = Esqueleto(CODIGO)
+        esqueleto.blocos[1].comando
+        programa = esqueleto.analisar()
+        esperado = completo(CODIGO)
+        assert programa == esperado
+        assert (programa.linha, programa.coluna) == (esperado.linha, esperado.coluna)
+        assert all(bloco.analisado for _, bloco in esqueleto.contorno())
+        assert esqueleto.blocos[0].comando is programa.comandos[1]
+
+    @pytest.mark.parametrize('blocos', [1, 20])
+    def test_programa_sintetico(self, blocos):
+        """Testa um programa gerado com blocos aninhados"""
+        codigo = gerar_programa(blocos)
+        assert Esqueleto(codigo).analisar() == completo(codigo)
+
+    def test_programa_sem_comandos(self):
+        """Testa um corpo vazio"""
+        esqueleto = Esqueleto("inteiro x; inicio fim")
+        assert esqueleto.blocos == [] and esqueleto.comandos == []
+
+
+class TestErros:
+    """Testes dos erros adiados e imediatos"""
+
+    def test_erro_dentro_de_bloco_adiado(self):
+        """Testa que o erro de um corpo só aparece quando ele é analisado"""
+        codigo = "inteiro x; inicio se x entao x <- fimse enquanto x faca fimenquanto fim"
+        esqueleto = Esqueleto(codigo)
+        assert esqueleto.blocos[1].comando is not None
+        assert erro(lambda: esqueleto.blocos[0].comando) == erro(lambda: completo(codigo))
+        assert erro(esqueleto.analisar) == erro(lambda: completo(codigo))
+
+    @pytest.mark.parametrize('codigo', [
+        "inteiro x; inicio se x entao fimenquanto fim",
+        "inteiro x; inicio fimse fim",
+        "inteiro x; inicio se x entao fim",
+        "inteiro x; inicio se x entao inicio fimse fim",
+        "inteiro x; inicio x <- 1",
+        "inteiro x; inicio x <- 1 fim x",
+        "inteiro x; inicio fim fim",
+    ])
+    def test_estrutura_invalida(self, codigo):
+        """Testa que a estrutura inválida lança o erro da análise completa"""
+        assert erro(lambda: Esqueleto(codigo)) == erro(lambda: completo(codigo))
+
+    @pytest.mark.parametrize('codigo', [
+        "inteiro x inicio fim",
+        "inteiro x; x <- 1 fim",
+        "inteiro x; inicio x <- @ fim",
+    ])
+    def test_erro_nas_declaracoes_ou_lexico(self, codigo):
+        """Testa que erros das declarações e léxicos são lançados na construção"""
+        assert erro(lambda: Esqueleto(codigo)) == erro(lambda: completo(codigo))
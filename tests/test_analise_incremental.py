@@ -0,0 +1,187 @@
+"""
+Testes para a análise sintática e semântica incremental
+
+Valida que cada edição produz a mesma AST (com linhas e colunas) e os
+mesmos erros de uma análise completa, que os nós fora do trecho editado
+são reaproveitados e que apenas os comandos afetados são reanalisados e
+verificados.
+"""
+
+import warnings
+import pytest
+from src.lexer_regex import LexerRegex
+from src.parser import Parser
+from src.semantic import AnalisadorSemantico
+from src.analise_incremental import AnaliseIncremental
+from src.exceptions import ErroSintatico, ErroLexico
+from conftest import arvore
+
+
+CODIGO = """inteiro x, y;
+real r;
+inicio
+    x <- 1
+    se x > 0 entao
+        y <- x + 1
+        escreva(y)
+    senao
+        leia(y)
+    fimse
+    enquanto x < 10 faca
+        x <- x + 1
+    fimenquanto
+    r <- y / 2
+fim
+"""
+
+
+def erros_completos(ast):
+    """Erros semânticos de uma análise completa no modo de recuperação"""
+    analisador = AnalisadorSemantico(recuperar=True)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        analisador.analisar(ast)
+    return [(erro.mensagem, erro.linha, erro.coluna) for erro in analisador.erros]
+
+
+def editar(analise, trecho, novo, ocorrencia=0):
+    """Substitui a ocorrência de `trecho` e compara com a análise completa"""
+    deslocamento = -1
+    for _ in range(ocorrencia + 1):
+        deslocamento = analise.codigo_fonte.index(trecho, deslocamento + 1)
+    ast = analise.editar(deslocamento, len(trecho), novo)
+    completa = Parser(LexerRegex(analise.codigo_fonte)).analisar()
+    erros = erros_completos(completa)
+    # Símbolos só pelo índice e tipo: o verificador incremental considera
+    # todas as variáveis inicializadas
+    assert arvore(ast, simbolos=True) == arvore(completa, simbolos=True)
+    assert [(erro.mensagem, erro.linha, erro.coluna) for erro in analise.erros] == erros
+    return ast
+
+
+class TestEquivalencia:
+    """Mesma AST e mesmos erros de uma análise completa"""
+
+    @pytest.mark.parametrize('trecho,novo', [
+        ("x <- 1", "x <- 1 + 2 * y"),                       # na linha
+        ("y <- x + 1", "y <- x + 1\n        x <- 2"),       # nova linha no bloco
+        ("        escreva(y)\n", ""),                        # remove linha
+        ("leia(y)", "leia(x) escreva(r)"),                   # bloco 'senao'
+        ("x < 10", "x < 20 e x > 0"),                        # cabeçalho do laço
+        ("    r <- y / 2\n", "    r <- y / 2\n    /* c\n */ leia(r)\n"),
+        ("fimse\n", "fimse\n\n\n"),                          # entre comandos
+        ("inicio\n", "inicio\n    y <- 0\n"),                # antes do primeiro comando
+    ])
+    def test_edicoes_validas(self, trecho, novo):
+        """Testa edições dentro e entre comandos, com e sem novas linhas"""
+        editar(AnaliseIncremental(CODIGO), trecho, novo)
+
+    def test_fechamento_alterado(self):
+        """Testa que um bloco cujo fechamento muda é reanalisado por fora"""
+        analise = AnaliseIncremental(CODIGO)
+        editar(analise, "        leia(y)\n", "        leia(y)\n    fimse\n    se y > 1 entao\n")
+        editar(analise, "fimenquanto", "fimenquanto enquanto x > 0 faca x <- x - 1 fimenquanto")
+
+    def test_declaracoes(self):
+        """Testa edições nas declarações, com novos erros semânticos"""
+        analise = AnaliseIncremental(CODIGO)
+        editar(analise, "real r;", "caracter r;")
+        assert [erro.mensagem for erro in analise.erros] == ["Atribuição incompatível: 'caracter' = 'real'"]
+        editar(analise, "inteiro x, y;", "inteiro x;\nlogico y, x;")
+        editar(analise, "logico y, x;", "inteiro y;\n")
+        assert analise.erros[0].linha == 16
+
+    def test_sequencia_de_edicoes(self):
+        """Testa várias edições seguidas sobre o mesmo estado"""
+        analise = AnaliseIncremental(CODIGO)
+        editar(analise, "escreva(y)", "escreva(z)")
+        editar(analise, "x <- x + 1", "x <- x + 1\n        z <- 2\n")
+        editar(analise, "inteiro x, y;", "inteiro x, y, z;")
+        assert analise.erros == []
+        editar(analise, "x <- 1", "x <- verdadeiro")
+        assert len(analise.erros) == 1
+
+
+class TestErros:
+    """Código editado inválido"""
+
+    def test_erro_igual_ao_da_analise_completa(self):
+        """Testa que o erro do trecho é o da análise completa"""
+        analise = AnaliseIncremental(CODIGO)
+        deslocamento = CODIGO.index("y <- x + 1")
+        with pytest.raises(ErroSintatico) as info:
+            analise.editar(deslocamento + 2, 2, "")
+        with pytest.raises(ErroSintatico) as completo:
+            Parser(LexerRegex(analise.codigo_fonte)).analisar()
+        assert (info.value.mensagem, info.value.linha, info.value.coluna) == \
+            (completo.value.mensagem, completo.value.linha, completo.value.coluna)
+        assert analise.ast is None and analise.erros == []
+
+    def test_edicao_apos_erro(self):
+        """Testa que a edição que corrige o código volta a produzir a AST"""
+        analise = AnaliseIncremental(CODIGO)
+        deslocamento = CODIGO.index("escreva(y)")
+        with pytest.raises(ErroLexico):
+            analise.editar(deslocamento, 0, "@")
+        ast = analise.editar(deslocamento, 1, "")
+        completa = Parser(LexerRegex(CODIGO)).analisar()
+        erros_completos(completa)
+        assert arvore(ast, simbolos=True) == arvore(completa, simbolos=True)
+
+    def test_codigo_inicial_invalido(self):
+        """Testa que o código inicial inválido lança o erro"""
+        with pytest.raises(ErroSintatico):
+            AnaliseIncremental("inicio x <- fim")
+
+    def test_edicao_fora_do_codigo(self):
+        """Testa edição além do fim do código"""
+        analise = AnaliseIncremental(CODIGO)
+        with pytest.raises(ValueError):
+            analise.editar(len(CODIGO), 1, "")
+
+
+class TestReaproveitamento:
+    """Apenas o trecho afetado é reanalisado"""
+
+    def test_nos_reaproveitados(self):
+        """Testa que os comandos fora do trecho são os mesmos objetos"""
+        analise = AnaliseIncremental(CODIGO)
+        ast = analise.ast
+        se, enquanto, final = ast.comandos[1], ast.comandos[2], ast.comandos[3]
+        senao = se.comandos_senao[0]
+        editar(analise, "escreva(y)", "escreva(y, x)\n        x <- 3")
+        assert analise.ast is ast
+        assert ast.comandos[1] is se and ast.comandos[2] is enquanto and ast.comandos[3] is final
+        assert se.comandos_senao[0] is senao
+        assert len(se.comandos_entao) == 3
+        assert (final.linha, enquanto.comandos[0].linha) == (15, 13)
+
+    def test_comandos_reanalisados_e_verificados(self):
+        """Testa os contadores da última edição"""
+        analise = AnaliseIncremental(CODIGO)
+        assert analise.comandos_analisados == analise.comandos_verificados == 8
+        editar(analise, "x <- x + 1", "x <- x + 2")
+        assert analise.comandos_analisados == analise.comandos_verificados == 1
+        # Bloco interno: o 'se' inteiro é reanalisado
+        editar(analise, "x > 0", "x > 1")
+        assert analise.comandos_analisados == 4
+
+    def test_declaracao_verifica_apenas_quem_usa(self):
+        """Testa que mudar o tipo de 'r' verifica só os comandos que usam 'r'"""
+        analise = AnaliseIncremental(CODIGO)
+        editar(analise, "real r;", "inteiro r;")
+        assert analise.comandos_analisados == 0
+        assert analise.comandos_verificados == 1
+        assert [erro.mensagem for erro in analise.erros] == []
+
+    def test_programa_grande(self):
+        """Testa que editar uma linha de 20 mil reanalisa um comando"""
+        linhas = [f"    x <- x + {n}" for n in range(20000)]
+        codigo = "inteiro x;\ninicio\n" + "\n".join(linhas) + "\nfim\n"
+        analise = AnaliseIncremental(codigo)
+        ultimo = analise.ast.comandos[-1]
+        deslocamento = codigo.index("x + 10000\n")
+        analise.editar(deslocamento, 1, "y")
+        assert analise.comandos_analisados == analise.comandos_verificados == 1
+        assert analise.ast.comandos[-1] is ultimo
+        assert [erro.linha for erro in analise.erros] == [10003]
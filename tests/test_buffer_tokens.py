@@ -0,0 +1,92 @@
+"""
+Testes para o buffer compacto de tokens (BufferTokens)
+
+Valida a API em lote `tokenizar()` dos motores léxicos e o consumo
+direto do buffer pelo Parser.
+"""
+
+import pytest
+from src.lexer import Lexer
+from src.lexer_regex import LexerRegex
+from src.parser import Parser
+from src.buffer_tokens import BufferTokens, CODIGOS_TIPO
+from src.ast_nodes import TipoToken, Token
+from src.exceptions import ErroLexico
+from src.main import CompiladorPortugol
+from conftest import listar_tokens
+
+
+class TestTokenizar:
+    """Equivalência entre tokenizar() e proximo_token()"""
+
+    @pytest.mark.parametrize('classe_lexer', [Lexer, LexerRegex])
+    def test_casos_de_borda(self, classe_lexer, codigos_borda):
+        """Testa que o buffer materializa os mesmos tokens"""
+        for codigo in codigos_borda:
+            esperado = listar_tokens(Lexer(codigo))
+            if isinstance(esperado[-1], tuple):
+                with pytest.raises(ErroLexico) as info:
+                    classe_lexer(codigo).tokenizar()
+                erro = info.value
+                assert (erro.mensagem, erro.linha, erro.coluna) == esperado[-1], codigo
+            else:
+                assert list(classe_lexer(codigo).tokenizar()) == esperado, codigo
+
+    def test_lexemas_resolvidos_do_codigo(self):
+        """Testa que apenas strings com escape guardam o lexema"""
+        buffer = LexerRegex('escreva("a", "b\\"c") x').tokenizar()
+        assert buffer.lexema(2) == 'a'
+        assert buffer.lexema(4) == 'b"c'
+        assert list(buffer.lexemas_especiais) == [4]
+        assert buffer.tipo(len(buffer) - 1) == TipoToken.EOF
+        assert buffer[-1].lexema == 'EOF'
+
+    def test_posicoes_no_codigo(self):
+        """Testa os deslocamentos de início e fim de cada token"""
+        codigo = "x <- 10\n  y"
+        buffer = LexerRegex(codigo).tokenizar()
+        fatias = [codigo[buffer.inicios[i]:buffer.fins[i]] for i in range(len(buffer) - 1)]
+        assert fatias == ['x', '<-', '10', 'y']
+        assert list(buffer.linhas) == [1, 1, 1, 2, 2]
+
+
+class TestBufferTokens:
+    """Estrutura e consumo do buffer"""
+
+    def test_adicionar_e_materializar(self):
+        """Testa a inclusão manual de tokens"""
+        buffer = BufferTokens("x <- 1")
+        buffer.adicionar(CODIGOS_TIPO[TipoToken.IDENTIFICADOR], 0, 1, 1, 1)
+        buffer.adicionar_token(Token(TipoToken.ATRIBUICAO, '<-', 1, 3), 2, 4)
+        assert len(buffer) == 2
+        assert buffer[0] == Token(TipoToken.IDENTIFICADOR, 'x', 1, 1)
+        assert buffer[1] == Token(TipoToken.ATRIBUICAO, '<-', 1, 3)
+        assert not buffer.lexemas_especiais
+
+    def test_proximo_token_permanece_em_eof(self):
+        """Testa que o cursor não avança além do EOF"""
+        buffer = Lexer("x").tokenizar()
+        assert buffer.proximo_token().lexema == 'x'
+        assert buffer.proximo_token().tipo == TipoToken.EOF
+        assert buffer.proximo_token().tipo == TipoToken.EOF
+        buffer.reiniciar()
+        assert buffer.proximo_token().lexema == 'x'
+
+    def test_memoria_menor_que_lista_de_tokens(self):
+        """Testa que cada token ocupa poucos bytes no buffer"""
+        codigo = "inteiro x; inicio x <- x + 1 fim\n" * 100
+        buffer = LexerRegex(codigo).tokenizar()
+        assert buffer.tamanho_em_bytes() <= 17 * len(buffer)
+
+    def test_parser_consome_buffer(self, codigo_fibonacci):
+        """Testa que o Parser gera a mesma AST a partir do buffer"""
+        ast_lexer = Parser(Lexer(codigo_fibonacci)).analisar()
+        ast_buffer = Parser(LexerRegex(codigo_fibonacci).tokenizar()).analisar()
+        assert ast_buffer == ast_lexer
+
+    def test_listar_tokens_termina(self, capsys):
+        """Testa que listar_tokens percorre o buffer até o EOF"""
+        CompiladorPortugol().listar_tokens("inteiro x; inicio fim")
+        saida = capsys.readouterr().out
+        assert 'EOF' in saida
+        assert 'inteiro' in saida
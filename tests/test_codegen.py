@@ -289,6 +289,34 @@ class TestCodegenIO:
         assert "x = input()" in python_code
         assert "x = int(x)" in python_code  # Conversão para inteiro
 
+    def test_entrada_usa_simbolo_anotado(self):
+        """Testa que a conversão do leia vem do símbolo anotado pela análise semântica"""
+        ast = Parser(Lexer("real r; inicio leia(r) fim")).analisar()
+        AnalisadorSemantico().analisar(ast)
+        # Sem a anotação, o tipo viria das declarações
+        ast.declaracoes.clear()
+        python_code = GeradorDeCodigo().gerar(ast)
+
+        assert "r = float(_input_temp)" in python_code
+
+    def test_valor_padrao_dispensado(self):
+        """Testa que variáveis atribuídas antes de qualquer leitura não recebem valor padrão"""
+        codigo = """inteiro x, y, z;
+        inicio
+            leia(y)
+            se y > 0 entao x <- 1 senao x <- 2 fimse
+            enquanto y > 0 faca z <- y y <- y - 1 fimenquanto
+            escreva(x, z)
+        fim"""
+        ast = Parser(Lexer(codigo)).analisar()
+        with pytest.warns(SyntaxWarning):
+            AnalisadorSemantico().analisar(ast)
+        linhas = [linha.strip() for linha in GeradorDeCodigo().gerar(ast).splitlines()]
+
+        assert "x = 0" not in linhas and "y = 0" not in linhas
+        # 'z' só é atribuída no corpo do laço, que pode não executar
+        assert "z = 0" in linhas
+
     def test_saida_simples(self):
         """Testa geração de comando escreva"""
         codigo = """
@@ -0,0 +1,120 @@
+"""
+Testes para o compartilhamento de subexpressões (hash-consing)
+
+Valida que subexpressões iguais viram um único nó, que as diferentes
+continuam separadas e que o código intermediário e o código Python
+gerados a partir da AST compartilhada são os mesmos.
+"""
+
+import glob
+import os
+import pytest
+from src.lexer import Lexer
+from src.parser import Parser
+from src.parser_pratt import ParserPratt
+from src.parser_iterativo import ParserIterativo
+from src.intermediate import GeradorCodigoIntermediario
+from src.codegen import GeradorDeCodigo
+from src.compartilhamento import TabelaNos, compartilhar_expressoes
+from src.ast_nodes import ExpressaoBinaria, Literal, Variavel
+from src.main import CompiladorPortugol
+
+
+CODIGO = """inteiro x, y;
+inicio
+    x <- y * 2 + 1
+    se y * 2 + 1 > x entao
+        escreva(y * 2, -x, -x)
+    fimse
+    y <- 1 + y * 2
+fim
+"""
+
+
+def analisar(codigo):
+    """AST do código, pelo Parser"""
+    return Parser(Lexer(codigo)).analisar()
+
+
+class TestTabelaNos:
+    """Testes da tabela de nós únicos"""
+
+    def test_expressoes_iguais_sao_o_mesmo_no(self):
+        """Testa que ocorrências iguais viram um único objeto"""
+        ast = analisar(CODIGO)
+        compartilhar_expressoes(ast)
+        atribuicao, se, ultima = ast.comandos
+        assert se.condicao.esquerda is atribuicao.expressao
+        saida = se.comandos_entao[0]
+        assert saida.expressoes[0] is atribuicao.expressao.esquerda
+        assert saida.expressoes[1] is saida.expressoes[2]
+        assert ultima.expressao.direita is atribuicao.expressao.esquerda
+        assert ultima.expressao.esquerda is atribuicao.expressao.direita
+
+    def test_expressoes_diferentes_continuam_separadas(self):
+        """Testa que operador ou operandos diferentes não são compartilhados"""
+        ast = analisar("inteiro a, b; inicio a <- a + b b <- a - b a <- b + a fim")
+        compartilhar_expressoes(ast)
+        soma, subtracao, invertida = (comando.expressao for comando in ast.comandos)
+        assert soma is not subtracao and soma is not invertida
+        assert soma.esquerda is subtracao.esquerda is invertida.direita
+
+    def test_contagens(self):
+        """Testa ocorrências, nós únicos e compartilhados"""
+        tabela = compartilhar_expressoes(analisar(CODIGO))
+        # y*2+1, y*2+1>x, y*2, -x, -x, 1+y*2, contando as folhas
+        assert tabela.ocorrencias == 5 + 7 + 3 + 2 + 2 + 5
+        # y, 2, *, 1, + (y*2+1), x, >, -, + (1+y*2)
+        assert len(tabela) == 9
+        # Todos menos '>' e '1 + y*2'
+        assert len(tabela.compartilhados) == 7
+
+    def test_tabela_reaproveitada(self):
+        """Testa que uma tabela compartilha nós entre expressões avulsas"""
+        tabela = TabelaNos()
+        primeira = tabela.compartilhar(ExpressaoBinaria(Variavel("a"), "+", Literal("1")))
+        segunda = tabela.compartilhar(ExpressaoBinaria(Variavel("a"), "+", Literal("1")))
+        assert primeira is segunda
+        assert tabela.compartilhados == {id(primeira), id(primeira.esquerda), id(primeira.direita)}
+
+    @pytest.mark.parametrize('motor', [Parser, ParserPratt, ParserIterativo])
+    def test_passo_padrao(self, motor):
+        """Testa que o passo implícito só é o mesmo nó com o compartilhamento"""
+        codigo = "inteiro i; inicio para i de 1 ate 2 faca fimpara\npara i de 3 ate 4 faca fimpara fim"
+        ast = motor(Lexer(codigo)).analisar()
+        primeiro, segundo = ast.comandos
+        assert primeiro.passo is not segundo.passo and primeiro.passo == segundo.passo
+        assert (primeiro.passo.linha, primeiro.passo.coluna) == (1, 19)
+        assert (segundo.passo.linha, segundo.passo.coluna) == (2, 1)
+        compartilhar_expressoes(ast)
+        assert primeiro.passo is segundo.passo
+
+
+class TestGeracao:
+    """Mesmo código gerado com e sem compartilhamento"""
+
+    def test_intermediario_igual(self):
+        """Testa que o código intermediário não muda"""
+        esperado = GeradorCodigoIntermediario().gerar(analisar(CODIGO))
+        ast = analisar(CODIGO)
+        compartilhar_expressoes(ast)
+        obtido = GeradorCodigoIntermediario().gerar(ast)
+        assert [str(instrucao) for instrucao in obtido] == [str(instrucao) for instrucao in esperado]
+
+    def test_codegen_memoizado(self):
+        """Testa que o código de cada nó compartilhado é gerado uma vez"""
+        esperado = GeradorDeCodigo().gerar(analisar(CODIGO))
+        ast = analisar(CODIGO)
+        tabela = compartilhar_expressoes(ast)
+        gerador = GeradorDeCodigo(tabela.compartilhados)
+        assert gerador.gerar(ast) == esperado
+        assert set(gerador._codigo_compartilhado.values()) == {'(-x)', '(y * 2)', '((y * 2) + 1)'}
+
+    def test_exemplos(self):
+        """Testa o compilador com e sem compartilhamento nos exemplos"""
+        raiz = os.path.join(os.path.dirname(__file__), '..', 'exemplos')
+        for caminho in sorted(glob.glob(os.path.join(raiz, '*.por'))):
+            with open(caminho, encoding='utf-8') as arquivo:
+                codigo = arquivo.read()
+            esperado = CompiladorPortugol().compilar_codigo(codigo)
+            assert CompiladorPortugol(compartilhar=True).compilar_codigo(codigo) == esperado
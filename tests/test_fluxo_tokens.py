@@ -0,0 +1,126 @@
+"""
+Testes para o fluxo de tokens com lookahead
+
+Valida peek(k), mark()/reset() e a ordem dos erros léxicos, tanto sobre
+um Lexer sob demanda quanto sobre um BufferTokens já preenchido.
+"""
+
+import pytest
+from src.lexer import Lexer
+from src.parser import Parser
+from src.fluxo_tokens import FluxoTokens
+from src.ast_nodes import TipoToken
+from src.exceptions import ErroLexico, ErroSintatico
+
+
+CODIGO = "inteiro x;\ninicio\nx <- 1 + 2\nfim\n"
+
+
+def criar_fontes(codigo):
+    """Retorna um Lexer sob demanda e um BufferTokens do mesmo código"""
+    return [Lexer(codigo), Lexer(codigo).tokenizar()]
+
+
+def listar_tipos(fluxo):
+    """Consome o fluxo até o EOF e retorna os tipos"""
+    tipos = []
+    while True:
+        token = fluxo.proximo_token()
+        tipos.append(token.tipo)
+        if token.tipo == TipoToken.EOF:
+            return tipos
+
+
+class TestFluxoTokens:
+    """Lookahead e retrocesso"""
+
+    @pytest.mark.parametrize('indice_fonte', [0, 1])
+    def test_mesmos_tokens_da_fonte(self, indice_fonte):
+        """Testa que o fluxo entrega exatamente os tokens do lexer"""
+        codigo = CODIGO * 30
+        fluxo = FluxoTokens(criar_fontes(codigo)[indice_fonte], capacidade=64)
+        esperado = [token.tipo for token in Lexer(codigo).tokenizar()]
+        assert listar_tipos(fluxo) == esperado
+
+    @pytest.mark.parametrize('indice_fonte', [0, 1])
+    def test_peek_nao_consome(self, indice_fonte):
+        """Testa peek(k) antes e depois de consumir"""
+        fluxo = FluxoTokens(criar_fontes(CODIGO)[indice_fonte])
+        assert fluxo.peek().tipo == TipoToken.INTEIRO
+        assert fluxo.peek(2).tipo == TipoToken.IDENTIFICADOR
+        assert fluxo.peek(3).tipo == TipoToken.PONTO_E_VIRGULA
+        assert fluxo.proximo_token().tipo == TipoToken.INTEIRO
+        assert fluxo.peek().lexema == 'x'
+
+    @pytest.mark.parametrize('indice_fonte', [0, 1])
+    def test_eof_repetido(self, indice_fonte):
+        """Testa que peek e proximo_token repetem o EOF"""
+        fluxo = FluxoTokens(criar_fontes('x')[indice_fonte])
+        assert fluxo.peek(50).tipo == TipoToken.EOF
+        fluxo.proximo_token()
+        for _ in range(3):
+            assert fluxo.proximo_token().tipo == TipoToken.EOF
+
+    @pytest.mark.parametrize('indice_fonte', [0, 1])
+    def test_mark_reset(self, indice_fonte):
+        """Testa o retrocesso a uma posição marcada"""
+        fluxo = FluxoTokens(criar_fontes(CODIGO)[indice_fonte])
+        fluxo.proximo_token()
+        marca = fluxo.mark()
+        lidos = [fluxo.proximo_token().lexema for _ in range(4)]
+        fluxo.reset(marca)
+        assert [fluxo.proximo_token().lexema for _ in range(4)] == lidos
+
+    def test_marca_fora_do_buffer(self):
+        """Testa que uma marca sobrescrita é rejeitada"""
+        fluxo = FluxoTokens(Lexer('x ' * 500), capacidade=64)
+        marca = fluxo.mark()
+        for _ in range(200):
+            fluxo.proximo_token()
+        with pytest.raises(ValueError):
+            fluxo.reset(marca)
+        with pytest.raises(ValueError):
+            fluxo.reset(fluxo.mark() + 1)
+
+    def test_lookahead_fora_da_janela(self):
+        """Testa os limites de peek(k)"""
+        fluxo = FluxoTokens(Lexer(CODIGO), capacidade=64)
+        with pytest.raises(ValueError):
+            fluxo.peek(0)
+        with pytest.raises(ValueError):
+            fluxo.peek(fluxo.janela + 1)
+
+
+class TestErrosNoFluxo:
+    """Erros léxicos encontrados durante a leitura antecipada"""
+
+    def test_erro_lexico_na_posicao_certa(self):
+        """Testa que o erro só aparece quando o consumidor chega a ele"""
+        fluxo = FluxoTokens(Lexer('a b c @ d'))
+        assert [fluxo.proximo_token().lexema for _ in range(3)] == ['a', 'b', 'c']
+        with pytest.raises(ErroLexico):
+            fluxo.proximo_token()
+
+    def test_erro_sintatico_antes_do_lexico(self):
+        """Testa que um erro sintático anterior continua sendo o reportado"""
+        codigo = "inteiro x;\ninicio\nx <- ;\ny <- @\nfim\n"
+        with pytest.raises(ErroSintatico):
+            Parser(Lexer(codigo)).analisar()
+
+
+class TestParserComFluxo:
+    """Integração com o Parser"""
+
+    def test_espiar(self):
+        """Testa o lookahead do parser"""
+        parser = Parser(Lexer(CODIGO))
+        assert parser.token_atual.tipo == TipoToken.INTEIRO
+        assert parser._espiar().lexema == 'x'
+        assert parser._espiar(2).tipo == TipoToken.PONTO_E_VIRGULA
+
+    def test_fluxo_fornecido(self):
+        """Testa que o parser aceita um FluxoTokens pronto"""
+        fluxo = FluxoTokens(Lexer(CODIGO))
+        parser = Parser(fluxo)
+        assert parser.tokens is fluxo
+        assert parser.analisar() is not None
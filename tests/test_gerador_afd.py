@@ -0,0 +1,95 @@
+"""
+Testes para o gerador de AFD (Thompson + subconjuntos) e o LexerTabelado
+
+Valida a construção do AFD a partir das ERs, a resolução de conflitos por
+prioridade, a carga das tabelas gravadas e a equivalência do motor com o
+Lexer imperativo.
+"""
+
+import pytest
+from src.gerador_afd import (
+    ESPECIFICACAO, analisar_er, assinatura_especificacao, carregar_tabelas,
+    emitir_modulo, gerar_tabelas
+)
+from src.lexer import Lexer
+from src.lexer_tabelado import LexerTabelado
+from src.main import CompiladorPortugol
+from conftest import listar_tokens
+
+
+def reconhecer(especificacao, texto):
+    """Reconhece o maior prefixo de texto com o AFD da especificação"""
+    return gerar_tabelas(especificacao).para_afd().reconhecer(texto)
+
+
+class TestGeradorAFD:
+    """Construção do AFD a partir das ERs"""
+
+    @pytest.mark.parametrize('er, aceitos, rejeitados', [
+        (r'ab|c', ['ab', 'c'], ['a', 'abc', '']),
+        (r'a*b+', ['b', 'aabb'], ['a', 'ba']),
+        (r'x?[0-9]', ['x1', '7'], ['x', 'xx1']),
+        (r'[^a-c]', ['d', 'π'], ['a', 'b']),
+        (r'\(\.\)', ['(.)'], ['(x)']),
+    ])
+    def test_linguagem_da_er(self, er, aceitos, rejeitados):
+        """Testa que o AFD aceita exatamente as cadeias da ER"""
+        afd = gerar_tabelas([('T', er)]).para_afd()
+        for texto in aceitos:
+            assert afd.aceitar(texto) == 'T', texto
+        for texto in rejeitados:
+            assert afd.aceitar(texto) is None, texto
+
+    def test_prioridade_entre_tokens(self):
+        """Testa que a ER listada primeiro vence em casamentos de mesmo tamanho"""
+        especificacao = [('SE', 'se'), ('IDENTIFICADOR', '[a-z]+')]
+        assert reconhecer(especificacao, 'se x') == (2, 'SE')
+        assert reconhecer(especificacao, 'sem') == (3, 'IDENTIFICADOR')
+
+    def test_especificacao_completa(self):
+        """Testa o AFD gerado para os tokens do Portugol"""
+        afd = carregar_tabelas().para_afd()
+        assert afd.reconhecer('FimSe;') == (5, 'FIMSE')
+        assert afd.reconhecer('<-1') == (2, 'ATRIBUICAO')
+        assert afd.reconhecer('"a\\"b" x') == (6, 'TEXTO')
+        assert afd.reconhecer('/* * */x') == (7, 'COMENTARIO_BLOCO')
+        assert afd.reconhecer('3.;') == (2, 'NUMERO_REAL')
+
+    def test_er_invalida(self):
+        """Testa o erro para ERs mal formadas"""
+        for er in ['(ab', '*a', 'a)']:
+            with pytest.raises(ValueError):
+                analisar_er(er)
+
+
+class TestTabelasGravadas:
+    """Módulo gerado tabelas_lexicas.py"""
+
+    def test_tabelas_atualizadas(self):
+        """Testa que o módulo gravado corresponde à especificação atual"""
+        from src import tabelas_lexicas
+        assert tabelas_lexicas.ASSINATURA == assinatura_especificacao()
+        assert emitir_modulo(gerar_tabelas()) == emitir_modulo(carregar_tabelas())
+
+    def test_assinatura_muda_com_especificacao(self):
+        """Testa que alterar a especificação invalida as tabelas gravadas"""
+        assert assinatura_especificacao(ESPECIFICACAO[:-1]) != assinatura_especificacao()
+
+
+class TestLexerTabelado:
+    """Equivalência do motor com o Lexer imperativo"""
+
+    def test_casos_de_borda(self, codigos_borda):
+        """Testa entradas com comentários, strings e caracteres especiais"""
+        for codigo in codigos_borda:
+            assert listar_tokens(LexerTabelado(codigo)) == listar_tokens(Lexer(codigo)), codigo
+
+    def test_programa_completo(self, codigo_fibonacci):
+        """Testa um programa completo"""
+        assert listar_tokens(LexerTabelado(codigo_fibonacci)) == listar_tokens(Lexer(codigo_fibonacci))
+
+    def test_motor_tabelado(self):
+        """Testa a seleção do motor pelo CompiladorPortugol"""
+        codigo = "inteiro x; inicio x <- 2 + 3 escreva(x) fim"
+        assert (CompiladorPortugol(motor_lexico='tabelado').compilar_codigo(codigo)
+                == CompiladorPortugol().compilar_codigo(codigo))
@@ -0,0 +1,116 @@
+"""
+Testes para o gerador da tabela LL(1) e o Parser dirigido por ela
+
+Valida FIRST/FOLLOW, a detecção de conflitos, a carga da tabela gravada e
+a consulta da tabela pelo Parser para escolher e encerrar comandos.
+"""
+
+import pytest
+from src.gerador_ll1 import (
+    GRAMATICA, SEM_PRODUCAO, assinatura_gramatica, calcular_anulaveis,
+    calcular_first, calcular_follow, carregar_tabela, emitir_modulo, gerar_tabela
+)
+from src.lexer import Lexer
+from src.parser import Parser
+from src.parser_pratt import ParserPratt
+from src.parser_iterativo import ParserIterativo
+from src.parser_posfixo import ParserPosfixo
+from src.ast_nodes import TipoToken
+from src.exceptions import ErroSintatico
+
+
+# E -> T E' ; E' -> + T E' | ε ; T -> ( E ) | id
+GRAMATICA_EXPRESSOES = [
+    ('e', ('t', 'e_linha', 'EOF')),
+    ('e_linha', ('MAIS', 't', 'e_linha')),
+    ('e_linha', ()),
+    ('t', ('ABRE', 'e_interna', 'FECHA')),
+    ('t', ('ID',)),
+    ('e_interna', ('t', 'e_linha')),
+]
+
+
+class TestGeradorLL1:
+    """FIRST, FOLLOW e construção da tabela"""
+
+    def test_first_e_follow(self):
+        """Testa os conjuntos de uma gramática de expressões"""
+        anulaveis = calcular_anulaveis(GRAMATICA_EXPRESSOES)
+        first = calcular_first(GRAMATICA_EXPRESSOES, anulaveis)
+        follow = calcular_follow(GRAMATICA_EXPRESSOES, first, anulaveis)
+        assert anulaveis == {'e_linha'}
+        assert first['e'] == first['t'] == {'ABRE', 'ID'}
+        assert first['e_linha'] == {'MAIS'}
+        assert follow['e_linha'] == {'EOF', 'FECHA'}
+        assert follow['t'] == {'MAIS', 'EOF', 'FECHA'}
+
+    def test_tabela(self):
+        """Testa as células previstas por FIRST e, para ε, por FOLLOW"""
+        tabela = gerar_tabela(GRAMATICA_EXPRESSOES)
+        assert tabela.linha('e_linha') == {'MAIS': 1, 'EOF': 2, 'FECHA': 2}
+        assert tabela.linha('t') == {'ABRE': 3, 'ID': 4}
+        assert tabela.producao('t', 'MAIS') == SEM_PRODUCAO
+        assert tabela.producao('t', 'DESCONHECIDO') == SEM_PRODUCAO
+
+    def test_conflito(self):
+        """Testa que uma gramática ambígua não gera tabela"""
+        gramatica = [('s', ('ID', 'MAIS')), ('s', ('ID',))]
+        with pytest.raises(ValueError, match="não é LL"):
+            gerar_tabela(gramatica)
+
+    def test_nao_terminal_sem_producoes(self):
+        """Testa um não terminal usado mas nunca definido"""
+        with pytest.raises(ValueError, match="'t' sem produções"):
+            gerar_tabela([('s', ('t', 'EOF'))])
+
+    def test_gramatica_do_portugol(self):
+        """Testa que a gramática é LL(1) e usa apenas tokens existentes"""
+        tabela = gerar_tabela()
+        assert set(tabela.terminais) <= set(TipoToken.__members__)
+        assert set(tabela.linha('comando')) == {
+            'IDENTIFICADOR', 'SE', 'ENQUANTO', 'PARA', 'LEIA', 'ESCREVA'
+        }
+        encerram = {terminal for terminal, numero in tabela.linha('comandos').items()
+                    if not tabela.producoes[numero][1]}
+        assert encerram == {'FIM', 'FIMSE', 'SENAO', 'FIMENQUANTO', 'FIMPARA'}
+
+
+class TestTabelaGravada:
+    """Módulo tabelas_sintaticas.py"""
+
+    def test_tabela_atualizada(self):
+        """Testa que a tabela gravada corresponde à gramática atual"""
+        assert emitir_modulo(carregar_tabela()) == emitir_modulo(gerar_tabela())
+
+    def test_assinatura_muda_com_a_gramatica(self):
+        """Testa que alterar uma produção invalida a tabela gravada"""
+        alterada = GRAMATICA[:-1]
+        assert assinatura_gramatica(alterada) != assinatura_gramatica()
+
+
+class TestParserDirigidoPorTabela:
+    """Escolha e encerramento de comandos pela tabela"""
+
+    @pytest.mark.parametrize('codigo, mensagem', [
+        ("inicio senao fim", "Esperado 'fim', encontrado 'senao'"),
+        ("inicio enquanto a faca fimse fim", "Esperado 'fimenquanto', encontrado 'fimse'"),
+        ("inicio enquanto x faca fimpara fimenquanto fim",
+         "Esperado 'fimenquanto', encontrado 'fimpara'"),
+        ("inicio fimse fim", "Esperado 'fim', encontrado 'fimse'"),
+        ("inicio se x entao senao senao fimse fim", "Esperado 'fimse', encontrado 'senao'"),
+        ("inicio x <- 1 ; fim", "Comando inesperado ';'"),
+    ])
+    def test_erros(self, codigo, mensagem):
+        """Testa as mensagens de fechamento trocado e de comando inválido
+
+        Um fechamento fora do lugar encerra o bloco (está no FOLLOW de
+        comandos) e é reportado como o fechamento esperado, em todos os
+        motores e também como primeiro erro do modo de recuperação.
+        """
+        for classe_parser in (Parser, ParserPratt, ParserIterativo, ParserPosfixo):
+            with pytest.raises(ErroSintatico) as info:
+                classe_parser(Lexer(codigo)).analisar()
+            assert mensagem in info.value.mensagem
+            parser = classe_parser(Lexer(codigo), recuperar=True)
+            parser.analisar()
+            assert mensagem in parser.erros[0].mensagem
@@ -0,0 +1,73 @@
+"""
+Testes para o índice de linhas e os diagnósticos com contexto
+
+Valida a resolução de deslocamentos em linha/coluna por busca binária e
+a exibição da linha do erro em CompiladorError.contexto.
+"""
+
+import pytest
+from src.indice_linhas import IndiceLinhas
+from src.exceptions import ErroLexico, ErroSintatico
+from src.main import CompiladorPortugol
+
+
+class TestIndiceLinhas:
+    """Resolução de deslocamentos"""
+
+    def test_posicoes(self):
+        """Testa linha e coluna de deslocamentos em várias linhas"""
+        indice = IndiceLinhas("ab\ncde\n\nf")
+        assert len(indice) == 4
+        assert indice.posicao(0) == (1, 1)
+        assert indice.posicao(2) == (1, 3)   # o próprio '\n'
+        assert indice.posicao(3) == (2, 1)
+        assert indice.posicao(7) == (3, 1)
+        assert indice.posicao(9) == (4, 2)   # fim do código
+        assert indice.linha(5) == 2
+
+    def test_texto_das_linhas(self):
+        """Testa a extração do texto de cada linha"""
+        indice = IndiceLinhas("ab\ncde\n\nf")
+        assert [indice.texto_linha(linha) for linha in range(1, 5)] == ['ab', 'cde', '', 'f']
+        assert indice.inicio_linha(2) == 3
+
+    def test_codigo_vazio(self):
+        """Testa o índice de um código vazio"""
+        indice = IndiceLinhas("")
+        assert len(indice) == 1
+        assert indice.posicao(0) == (1, 1)
+        assert indice.texto_linha(1) == ''
+
+    def test_concorda_com_lexer_sem_comentarios(self, codigo_fibonacci):
+        """Testa que as posições físicas coincidem com as dos tokens"""
+        from src.lexer import Lexer
+        codigo = '\n'.join(linha.split('//')[0] for linha in codigo_fibonacci.split('\n'))
+        buffer = Lexer(codigo).tokenizar()
+        indice = IndiceLinhas(codigo)
+        for numero in range(len(buffer) - 1):
+            assert indice.posicao(buffer.inicios[numero]) == \
+                (buffer.linhas[numero], buffer.colunas[numero])
+
+
+class TestContextoDoErro:
+    """Diagnósticos com a linha do código"""
+
+    def test_marcador_na_coluna(self):
+        """Testa o marcador sob a coluna do erro"""
+        indice = IndiceLinhas("inteiro x;\n\tx <- @\n")
+        contexto = ErroLexico("Caractere inesperado '@'", 2, 7).contexto(indice)
+        linha_codigo, marcador = contexto.split('\n')
+        assert linha_codigo.endswith('| \tx <- @')
+        assert marcador.endswith('| \t     ^')
+        assert linha_codigo.index('|') == marcador.index('|')
+
+    @pytest.mark.parametrize('linha', [0, 10])
+    def test_erro_sem_posicao_no_codigo(self, linha):
+        """Testa erros sem linha ou fora do código"""
+        assert ErroSintatico("erro", linha, 1).contexto(IndiceLinhas("x")) == ''
+
+    def test_compilador_mostra_contexto(self, capsys):
+        """Testa a exibição do contexto pelo compilador"""
+        assert CompiladorPortugol().compilar_codigo("inteiro x;\ninicio\nx <- @\nfim") is None
+        saida = capsys.readouterr().out
+        assert "    3 | x <- @" in saida
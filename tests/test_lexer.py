@@ -1,5 +1,6 @@
 import pytest
-from src.lexer import Lexer
+from src.lexer import Lexer, PALAVRAS_CHAVE, classificar_palavra
+from src.lexer_regex import LexerRegex
 from src.ast_nodes import TipoToken
 from src.exceptions import ErroLexico
 
@@ -42,3 +43,42 @@ def test_string_com_aspas_escapadas():
     assert t_str.tipo == TipoToken.TEXTO
     # Aspas escapadas devem resultar em aspas normais no lexema
     assert t_str.lexema == 'Ola "Mundo"'
+
+def test_palavras_chave_sem_diferenciar_maiusculas():
+    assert classificar_palavra("enquanto") == TipoToken.ENQUANTO
+    assert classificar_palavra("EnQuAnTo") == TipoToken.ENQUANTO
+    assert classificar_palavra("FIM") == TipoToken.FIM
+    assert classificar_palavra("fimx") == TipoToken.IDENTIFICADOR
+    assert classificar_palavra("Contador_Muito_Longo") == TipoToken.IDENTIFICADOR
+
+def test_tabela_de_palavras_chave_compartilhada():
+    assert Lexer("a").palavras_chave is Lexer("b").palavras_chave is PALAVRAS_CHAVE
+
+@pytest.mark.parametrize("classe_lexer", [Lexer, LexerRegex])
+def test_identificadores_internados(classe_lexer):
+    # Ocorrências do mesmo nome devem ser o mesmo objeto str
+    lexer = classe_lexer("contador <- contador + 1")
+    primeiro = lexer.proximo_token()
+    lexer.proximo_token()
+    segundo = lexer.proximo_token()
+    assert primeiro.lexema == segundo.lexema == "contador"
+    assert primeiro.lexema is segundo.lexema
+
+def test_identificadores_internados_no_buffer():
+    buffer = LexerRegex("total <- total").tokenizar()
+    assert buffer.lexema(0) is buffer.lexema(2)
+
+def test_posicoes_apos_strings_e_comentarios():
+    # Convenções de coluna do lexer preservadas pela varredura em bloco
+    codigo = 'x <- "a\nbc" y\n/* c\n  d */ z // e\n"f\\\ng" w'
+    posicoes = [(t.lexema, t.linha, t.coluna) for t in Lexer(codigo).tokenizar()]
+    assert posicoes == [
+        ('x', 1, 1), ('<-', 1, 3), ('a\nbc', 2, 6), ('y', 2, 6),
+        ('z', 4, 6), ('f\ng', 5, 1), ('w', 5, 8), ('EOF', 5, 9),
+    ]
+
+def test_string_longa():
+    codigo = 'escreva("' + 'abc ' * 10000 + '")'
+    tokens = list(Lexer(codigo).tokenizar())
+    assert tokens[2].lexema == 'abc ' * 10000
+    assert tokens[3].coluna == 40011
@@ -0,0 +1,143 @@
+"""
+Testes para os AFDs tabelados e o motor léxico LexerAFD
+
+Valida que a compilação preserva a linguagem de cada AFD e que o motor
+produz a mesma sequência de tokens do Lexer imperativo.
+"""
+
+import pytest
+from src.automaton import (
+    AFDIdentificador, AFDNumeroInteiro, AFDNumeroReal, AFDTabelado, ESTADO_MORTO,
+    TIPOS_VALIDACAO, ValidadorTokensAFD, compilar_afds, compilar_afds_de_tokens,
+    relatorio_minimizacao
+)
+from src.lexer import Lexer
+from src.lexer_afd import LexerAFD
+from src.main import CompiladorPortugol
+from conftest import listar_tokens
+
+
+AMOSTRAS = ["soma", "_x1", "ação", "x²", "123", "3.14", "3.", "1.2.3",
+            ".5", "12abc", "½", "a-b", "", "__", "9_"]
+
+
+class TestCompilacaoAFD:
+    """Compilação dos AFDs em tabelas planas"""
+
+    @pytest.mark.parametrize('classe_afd', [AFDIdentificador, AFDNumeroInteiro, AFDNumeroReal])
+    def test_mesma_linguagem(self, classe_afd):
+        """Testa que a tabela aceita exatamente o que o AFD original aceita"""
+        tabela = compilar_afds([('TOKEN', classe_afd())])
+        for texto in AMOSTRAS:
+            esperado = 'TOKEN' if classe_afd().processar_string(texto) else None
+            assert tabela.aceitar(texto) == esperado, texto
+
+    def test_casamento_mais_longo(self):
+        """Testa o reconhecimento do maior prefixo no AFD combinado"""
+        tabela = compilar_afds_de_tokens()
+        assert tabela.reconhecer("contador1 + 2") == (9, 'IDENTIFICADOR')
+        assert tabela.reconhecer("12.5;") == (4, 'NUMERO_REAL')
+        assert tabela.reconhecer("42abc") == (2, 'NUMERO_INTEIRO')
+        assert tabela.reconhecer("x <- 1", 2) == (2, None)
+
+    def test_tabelas_planas(self):
+        """Testa a estrutura: 256 entradas Latin-1 e transições inteiras"""
+        tabela = compilar_afds_de_tokens()
+        assert len(tabela.deslocamentos_latin1) == 256
+        assert len(tabela.transicoes) == tabela.num_estados * tabela.num_classes
+        assert tabela.transicoes[tabela.deslocamento('@')] == ESTADO_MORTO
+        # Caracteres fora do Latin-1 usam os predicados dos AFDs
+        assert tabela.aceitar("π") == 'IDENTIFICADOR'
+        assert tabela.aceitar("٣") == 'NUMERO_INTEIRO'
+
+
+class TestMinimizacao:
+    """Minimização de Hopcroft e exportação binária"""
+
+    def test_funde_estados_equivalentes(self):
+        """Testa a fusão de estados redundantes de um AFD tabelado"""
+        # a(b|c): os estados após 'b' e após 'c' são equivalentes
+        latin1 = [2 * 4] * 256
+        latin1[ord('a')], latin1[ord('b')], latin1[ord('c')] = 0, 4, 8
+        transicoes = [1, -1, -1, -1,
+                      -1, 2, -1, -1,
+                      -1, 3, -1, -1]
+        afd = AFDTabelado(latin1, transicoes, 4, [None, None, 'T', 'T'], lambda c: 8)
+        minimo = afd.minimizar()
+        assert afd.contagens() == (4, 3)
+        assert minimo.contagens() == (3, 2)
+        for texto in ['ab', 'ac', 'a', 'abc', 'b']:
+            assert minimo.aceitar(texto) == afd.aceitar(texto), texto
+
+    @pytest.mark.parametrize('classe_afd', [AFDIdentificador, AFDNumeroInteiro, AFDNumeroReal])
+    def test_minimizar_afd(self, classe_afd):
+        """Testa que o AFD mínimo aceita a mesma linguagem"""
+        minimo = classe_afd().minimizar('TOKEN')
+        for texto in AMOSTRAS:
+            esperado = 'TOKEN' if classe_afd().processar_string(texto) else None
+            assert minimo.aceitar(texto) == esperado, texto
+
+    def test_afd_combinado(self):
+        """Testa que o AFD combinado mínimo reconhece os mesmos prefixos"""
+        tabela = compilar_afds_de_tokens()
+        minimo = tabela.minimizar()
+        assert minimo.num_estados <= tabela.num_estados
+        for texto in AMOSTRAS + ["contador1 + 2", "12.5;", "x٣ y"]:
+            for inicio in range(len(texto)):
+                assert minimo.reconhecer(texto, inicio) == tabela.reconhecer(texto, inicio)
+        assert "Estados:" in relatorio_minimizacao(tabela, minimo)
+
+    def test_exportar_e_importar(self):
+        """Testa a ida e volta pelo formato binário"""
+        minimo = compilar_afds_de_tokens().minimizar()
+        dados = minimo.exportar()
+        carregado = AFDTabelado.importar(dados, minimo.classificar_unicode)
+        assert carregado.transicoes == minimo.transicoes
+        assert carregado.deslocamentos_latin1 == minimo.deslocamentos_latin1
+        assert carregado.aceitacao == minimo.aceitacao
+        assert carregado.aceitar("π2") == 'IDENTIFICADOR'
+
+    def test_importar_dados_invalidos(self):
+        """Testa a rejeição de dados corrompidos"""
+        dados = compilar_afds_de_tokens().exportar()
+        for invalido in [b'', b'XXXX' + dados[4:], dados[:40]]:
+            with pytest.raises(ValueError):
+                AFDTabelado.importar(invalido, lambda c: 0)
+
+
+class TestValidacaoEmLote:
+    """API em lote do ValidadorTokensAFD"""
+
+    def test_equivale_a_validacao_individual(self):
+        """Testa que o lote classifica como identificar_tipo_token"""
+        validador = ValidadorTokensAFD()
+        textos = AMOSTRAS + ["π", "٣٤", "x.y", "_1.5"]
+        resultado = validador.classificar_lote(textos)
+        assert resultado.typecode == 'B'
+        assert [TIPOS_VALIDACAO[codigo] for codigo in resultado] == \
+            [validador.identificar_tipo_token(texto) for texto in textos]
+
+    def test_iteravel_qualquer(self):
+        """Testa entrada por gerador e lote vazio"""
+        validador = ValidadorTokensAFD()
+        assert list(validador.classificar_lote(texto for texto in ["a", "1", "1.0"])) == [1, 2, 3]
+        assert len(validador.classificar_lote([])) == 0
+
+
+class TestLexerAFD:
+    """Equivalência do motor com o Lexer imperativo"""
+
+    def test_casos_de_borda(self, codigos_borda):
+        """Testa entradas com comentários, strings e caracteres especiais"""
+        for codigo in codigos_borda:
+            assert listar_tokens(LexerAFD(codigo)) == listar_tokens(Lexer(codigo)), codigo
+
+    def test_programa_completo(self, codigo_fibonacci):
+        """Testa um programa completo"""
+        assert listar_tokens(LexerAFD(codigo_fibonacci)) == listar_tokens(Lexer(codigo_fibonacci))
+
+    def test_motor_afd(self):
+        """Testa a seleção do motor pelo CompiladorPortugol"""
+        codigo = "inteiro x; inicio x <- 2 + 3 escreva(x) fim"
+        assert (CompiladorPortugol(motor_lexico='afd').compilar_codigo(codigo)
+                == CompiladorPortugol().compilar_codigo(codigo))
@@ -0,0 +1,94 @@
+"""
+Testes para o motor léxico sobre bytes (LexerBytes)
+
+Valida que a análise dos bytes UTF-8 produz a mesma sequência de tokens
+do Lexer sobre o texto decodificado, inclusive com BOM e quebras de
+linha '\\r\\n' ou '\\r'.
+"""
+
+import pytest
+from src.lexer import Lexer
+from src.lexer_bytes import LexerBytes, decodificar_fonte, decodificar_trecho
+from src.parser import Parser
+from src.ast_nodes import TipoToken
+from src.main import CompiladorPortugol
+from conftest import listar_tokens
+
+
+class TestLexerBytesEquivalencia:
+    """Equivalência com o Lexer sobre o texto decodificado"""
+
+    @pytest.mark.parametrize('quebra', ['\n', '\r\n', '\r'])
+    def test_casos_de_borda(self, codigos_borda, quebra):
+        """Testa os casos de borda com cada estilo de quebra de linha"""
+        for codigo in codigos_borda:
+            dados = codigo.replace('\n', quebra).encode('utf-8')
+            esperado = listar_tokens(Lexer(decodificar_fonte(dados)))
+            assert listar_tokens(LexerBytes(dados)) == esperado, codigo
+
+    def test_identificadores_e_strings_acentuados(self):
+        """Testa colunas contadas em caracteres, e não em bytes"""
+        codigo = 'média <- "ação" ; x\nescreva("coração", número)'
+        tokens = listar_tokens(LexerBytes(codigo.encode('utf-8')))
+        assert tokens == listar_tokens(Lexer(codigo))
+        assert (tokens[3].lexema, tokens[3].coluna) == (';', 17)
+
+    def test_bom_ignorado(self):
+        """Testa que o BOM inicial não gera token nem conta coluna"""
+        tokens = listar_tokens(LexerBytes(b'\xef\xbb\xbfinteiro x;'))
+        assert (tokens[0].tipo, tokens[0].linha, tokens[0].coluna) == (TipoToken.INTEIRO, 1, 1)
+
+    def test_memoryview(self, codigo_fibonacci):
+        """Testa a análise a partir de um memoryview"""
+        dados = memoryview(codigo_fibonacci.encode('utf-8'))
+        assert listar_tokens(LexerBytes(dados)) == listar_tokens(Lexer(codigo_fibonacci))
+
+    def test_utf8_invalido(self):
+        """Testa que bytes inválidos em strings e nomes geram ErroLexico"""
+        for dados in (b'x <- "\xff"', b'a\xffb'):
+            erro = listar_tokens(LexerBytes(dados))[-1]
+            assert erro[0].startswith("Sequência UTF-8 inválida")
+
+
+class TestLexerBytesTokenizar:
+    """Buffer com deslocamentos em bytes"""
+
+    def test_buffer_igual_ao_lexer(self, codigo_fibonacci):
+        """Testa tokens do buffer e deslocamentos convertidos em bytes"""
+        codigo = 'média <- "ação\\"" /* é */ fim\r\n' + codigo_fibonacci.replace('\n', '\r\n')
+        dados = codigo.encode('utf-8')
+        texto, posicoes = decodificar_trecho(dados)
+        esperado = Lexer(texto).tokenizar()
+        buffer = LexerBytes(dados).tokenizar()
+        assert list(buffer) == list(esperado)
+        assert list(buffer.inicios) == [posicoes[i] for i in esperado.inicios]
+        assert list(buffer.fins) == [posicoes[i] for i in esperado.fins]
+
+    def test_decodificar_trecho(self):
+        """Testa a tradução de quebras e o mapa de deslocamentos"""
+        texto, posicoes = decodificar_trecho('a\r\né\rb'.encode('utf-8'))
+        assert texto == 'a\né\nb'
+        assert posicoes == [0, 1, 3, 5, 6, 7]
+
+
+class TestLexerBytesCompilador:
+    """Integração com o Parser e o CompiladorPortugol"""
+
+    def test_parser(self, codigo_fibonacci):
+        """Testa que o Parser gera a mesma AST a partir dos bytes"""
+        esperado = Parser(Lexer(codigo_fibonacci)).analisar()
+        assert Parser(LexerBytes(codigo_fibonacci.encode('utf-8'))).analisar() == esperado
+
+    def test_compilar_arquivo_com_bom_e_crlf(self, tmp_path, capsys):
+        """Testa compilação e execução de arquivo no modo bytes"""
+        caminho = tmp_path / 'programa.por'
+        caminho.write_bytes(b'\xef\xbb\xbfinteiro x;\r\ninicio\r\n x <- 6 * 7\r\n escreva(x)\r\nfim\r\n')
+        assert CompiladorPortugol(modo_bytes=True).compilar_arquivo(str(caminho))
+        assert '42' in capsys.readouterr().out
+
+    def test_contexto_do_erro(self, capsys):
+        """Testa que o contexto do erro é mostrado para fontes em bytes"""
+        dados = 'inteiro x;\r\ninicio\r\n x <- @\r\nfim\r\n'.encode('utf-8')
+        assert CompiladorPortugol().compilar_codigo(dados) is None
+        saida = capsys.readouterr().out
+        assert '    3 |  x <- @' in saida
@@ -0,0 +1,87 @@
+"""
+Testes para a reanálise léxica incremental
+
+Valida que aplicar uma edição ao buffer produz os mesmos tokens de uma
+tokenização completa, reanalisando apenas o trecho próximo da edição.
+"""
+
+import pytest
+from src.lexer_regex import LexerRegex
+from src.lexer_incremental import relexar_incremental
+from src.exceptions import ErroLexico
+
+
+class LexerContador(LexerRegex):
+    """LexerRegex que conta quantos tokens reconheceu"""
+
+    reconhecidos = 0
+
+    def proximo_token(self):
+        LexerContador.reconhecidos += 1
+        return super().proximo_token()
+
+
+def editar(codigo, deslocamento, removidos, inseridos):
+    """Retorna (buffer incremental, buffer completo) para a edição"""
+    buffer = LexerRegex(codigo).tokenizar()
+    incremental = relexar_incremental(buffer, deslocamento, removidos, inseridos)
+    editado = codigo[:deslocamento] + inseridos + codigo[deslocamento + removidos:]
+    return incremental, LexerRegex(editado).tokenizar()
+
+
+def assert_buffers_iguais(obtido, esperado):
+    """Compara tokens e deslocamentos de dois buffers"""
+    assert list(obtido) == list(esperado)
+    assert list(obtido.inicios) == list(esperado.inicios)
+    assert list(obtido.fins) == list(esperado.fins)
+
+
+class TestRelexarIncremental:
+    """Equivalência com a tokenização completa"""
+
+    @pytest.mark.parametrize('deslocamento, removidos, inseridos', [
+        (0, 0, 'inteiro y; '),        # início do código
+        (13, 1, 'xyz'),               # dentro de um identificador
+        (16, 0, '\n\n'),              # novas linhas deslocam as seguintes
+        (16, 0, '/* '),               # abre comentário que engole tokens
+        (20, 0, 'escreva("t")'),      # nova string antes de outra
+        (5, 30, ''),                  # remoção de vários tokens
+    ])
+    def test_edicoes(self, deslocamento, removidos, inseridos):
+        """Testa edições variadas sobre um programa pequeno"""
+        codigo = 'inteiro x;\ninicio\n x <- 1 */\n escreva("a\nb", x)\nfim'
+        assert_buffers_iguais(*editar(codigo, deslocamento, removidos, inseridos))
+
+    def test_fechar_comentario_de_bloco(self):
+        """Testa edição que fecha um comentário de bloco aberto"""
+        codigo = 'x <- 1 /* comentario\ny <- 2\nz <- 3'
+        assert_buffers_iguais(*editar(codigo, len(codigo), 0, ' */'))
+        assert_buffers_iguais(*editar(codigo, 21, 0, '*/'))
+
+    def test_edicao_apos_string_multilinha(self):
+        """Testa reinício antes de uma string com quebra de linha"""
+        codigo = 'escreva("linha 1\nlinha 2") x'
+        assert_buffers_iguais(*editar(codigo, len(codigo), 0, 'y'))
+
+    def test_reanalise_local(self):
+        """Testa que só os tokens próximos da edição são reanalisados"""
+        codigo = 'x <- x + 1\n' * 1000
+        buffer = LexerRegex(codigo).tokenizar()
+        LexerContador.reconhecidos = 0
+        novo = relexar_incremental(buffer, 5005, 0, '2', LexerContador)
+        assert LexerContador.reconhecidos < 10
+        assert novo.linhas[-1] == buffer.linhas[-1]
+        assert_buffers_iguais(novo, LexerRegex(novo.codigo_fonte).tokenizar())
+
+    def test_erro_lexico_na_edicao(self):
+        """Testa que o erro introduzido pela edição é reportado"""
+        buffer = LexerRegex('x <- 1\ny <- 2').tokenizar()
+        with pytest.raises(ErroLexico) as info:
+            relexar_incremental(buffer, 7, 0, '@')
+        assert (info.value.linha, info.value.coluna) == (2, 1)
+
+    def test_edicao_fora_do_codigo(self):
+        """Testa edição com limites inválidos"""
+        buffer = LexerRegex('x').tokenizar()
+        with pytest.raises(ValueError):
+            relexar_incremental(buffer, 0, 5, '')
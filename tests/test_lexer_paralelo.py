@@ -0,0 +1,86 @@
+"""
+Testes para a tokenização paralela
+
+Valida os pontos de corte (fora de strings e comentários de bloco) e que
+o buffer unido é idêntico ao da tokenização sequencial.
+"""
+
+import pytest
+from src.lexer import Lexer
+from src.lexer_paralelo import pontos_de_corte, tokenizar_paralelo
+from src.exceptions import ErroLexico
+from src.main import CompiladorPortugol
+
+
+def assert_buffers_iguais(obtido, esperado):
+    """Compara tokens e deslocamentos de dois buffers"""
+    assert list(obtido) == list(esperado)
+    assert list(obtido.inicios) == list(esperado.inicios)
+    assert list(obtido.fins) == list(esperado.fins)
+
+
+class TestPontosDeCorte:
+    """Escolha das posições de divisão"""
+
+    def test_cortes_apos_quebra_de_linha(self):
+        """Testa que os cortes ficam logo após um '\\n'"""
+        codigo = 'x <- 1\n' * 100
+        cortes = pontos_de_corte(codigo, 4)
+        assert len(cortes) == 3
+        assert all(codigo[corte - 1] == '\n' for corte in cortes)
+
+    def test_evita_strings_e_comentarios(self):
+        """Testa que nenhum corte cai dentro de string ou comentário de bloco"""
+        codigo = 'a\n"linha\nlinha\nlinha"\n/* x\ny\nz */\n' * 20
+        for partes in range(2, 12):
+            for corte in pontos_de_corte(codigo, partes):
+                anterior = codigo[:corte]
+                assert anterior.count('"') % 2 == 0, corte
+                assert anterior.count('/*') == anterior.count('*/'), corte
+
+    def test_sem_quebras_seguras(self):
+        """Testa código sem quebras fora de comentário"""
+        assert pontos_de_corte('/* a\nb\nc\n', 4) == []
+
+
+class TestTokenizarParalelo:
+    """Equivalência com a tokenização sequencial"""
+
+    def test_programa_completo(self, codigo_fibonacci):
+        """Testa um programa dividido em vários trechos"""
+        codigo = codigo_fibonacci * 5
+        assert_buffers_iguais(tokenizar_paralelo(codigo, trabalhadores=3, limiar=0),
+                              Lexer(codigo).tokenizar())
+
+    def test_linhas_com_escape_de_quebra(self):
+        """Testa o deslocamento de linhas após '\\n' escapado em string"""
+        codigo = 'escreva("a\\\nb")\nx <- 1\n' * 10
+        assert_buffers_iguais(tokenizar_paralelo(codigo, trabalhadores=3, limiar=0),
+                              Lexer(codigo).tokenizar())
+
+    def test_erro_lexico_em_trecho_posterior(self):
+        """Testa que o erro é reportado com a linha do lexer sequencial"""
+        codigo = 'x <- 1\n' * 30 + 'y <- @\n' + 'z <- 2\n' * 30
+        with pytest.raises(ErroLexico) as info:
+            tokenizar_paralelo(codigo, trabalhadores=3, limiar=0)
+        assert (info.value.linha, info.value.coluna) == (31, 6)
+
+    def test_abaixo_do_limiar(self):
+        """Testa que códigos pequenos são tokenizados sem processos"""
+        buffer = tokenizar_paralelo('x <- 1\ny <- 2\n', trabalhadores=3)
+        assert_buffers_iguais(buffer, Lexer('x <- 1\ny <- 2\n').tokenizar())
+
+    def test_modo_paralelo_do_compilador(self):
+        """Testa a compilação com o modo paralelo ativado"""
+        codigo = "inteiro x;\ninicio\nx <- 2 + 3\nescreva(x)\nfim\n"
+        compilador = CompiladorPortugol(paralelo=True, limiar_paralelo=0)
+        assert compilador.compilar_codigo(codigo) == CompiladorPortugol().compilar_codigo(codigo)
+
+    def test_listar_tokens_paralelo(self, capsys):
+        """Testa a listagem de tokens com o modo paralelo ativado"""
+        codigo = "inteiro x;\ninicio\nx <- 2 + 3\nfim\n"
+        CompiladorPortugol().listar_tokens(codigo)
+        esperado = capsys.readouterr().out
+        CompiladorPortugol(paralelo=True, limiar_paralelo=0).listar_tokens(codigo)
+        assert capsys.readouterr().out == esperado
+        assert "Total de tokens: 11" in esperado
@@ -0,0 +1,66 @@
+"""
+Testes para o motor léxico por expressão regular (LexerRegex)
+
+Valida que o motor produz exatamente a mesma sequência de tokens do
+Lexer imperativo, incluindo posições e erros léxicos.
+"""
+
+import glob
+import os
+import pytest
+from src.lexer import Lexer
+from src.lexer_regex import LexerRegex
+from src.exceptions import ErroLexico
+from src.main import CompiladorPortugol
+from conftest import listar_tokens
+
+
+class TestLexerRegexEquivalencia:
+    """Equivalência com o Lexer imperativo"""
+
+    def test_casos_de_borda(self, codigos_borda):
+        """Testa entradas com comentários, strings e caracteres especiais"""
+        for codigo in codigos_borda:
+            assert listar_tokens(LexerRegex(codigo)) == listar_tokens(Lexer(codigo)), codigo
+
+    def test_exemplos(self):
+        """Testa todos os programas da pasta exemplos/"""
+        raiz = os.path.join(os.path.dirname(__file__), '..')
+        arquivos = glob.glob(os.path.join(raiz, 'exemplos', '*.por'))
+        assert arquivos
+        for caminho in arquivos:
+            with open(caminho, 'r', encoding='utf-8') as arquivo:
+                codigo = arquivo.read()
+            assert listar_tokens(LexerRegex(codigo)) == listar_tokens(Lexer(codigo)), caminho
+
+    def test_posicoes_apos_comentario_de_bloco(self):
+        """Testa que as colunas seguem as mesmas regras do Lexer imperativo"""
+        tokens = listar_tokens(LexerRegex("/* a */ x\n  y"))
+        assert (tokens[0].lexema, tokens[0].linha, tokens[0].coluna) == ('x', 1, 5)
+        assert (tokens[1].lexema, tokens[1].linha, tokens[1].coluna) == ('y', 2, 3)
+
+    def test_erro_caractere_invalido(self):
+        """Testa que o erro léxico é lançado na mesma posição"""
+        lexer = LexerRegex("x <- 1\n  @")
+        for _ in range(3):
+            lexer.proximo_token()
+        with pytest.raises(ErroLexico) as info:
+            lexer.proximo_token()
+        assert (info.value.linha, info.value.coluna) == (2, 3)
+
+
+class TestSelecaoMotorLexico:
+    """Seleção do motor léxico pelo CompiladorPortugol"""
+
+    def test_compilacao_com_motor_regex(self):
+        """Testa compilação completa usando o motor regex"""
+        codigo = "inteiro x; inicio x <- 2 + 3 escreva(x) fim"
+        padrao = CompiladorPortugol().compilar_codigo(codigo)
+        regex = CompiladorPortugol(motor_lexico='regex').compilar_codigo(codigo)
+        assert regex is not None
+        assert regex == padrao
+
+    def test_motor_desconhecido(self):
+        """Testa erro para motor léxico inexistente"""
+        with pytest.raises(ValueError):
+            CompiladorPortugol(motor_lexico='inexistente')
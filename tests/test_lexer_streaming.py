@@ -0,0 +1,108 @@
+"""
+Testes para o motor léxico em blocos (LexerStreaming)
+
+Valida que a leitura em blocos produz a mesma sequência de tokens do
+Lexer sobre o texto completo, para qualquer tamanho de bloco.
+"""
+
+import io
+import mmap
+import pytest
+from src.lexer import Lexer
+from src.lexer_streaming import LexerStreaming
+from src.parser import Parser
+from src.ast_nodes import TipoToken
+from src.exceptions import ErroLexico
+from src.main import CompiladorPortugol
+from conftest import listar_tokens
+
+
+class TestLexerStreamingEquivalencia:
+    """Equivalência com o Lexer sobre o texto completo"""
+
+    @pytest.mark.parametrize('tamanho_bloco', [1, 2, 3, 7, 64])
+    def test_casos_de_borda_texto(self, codigos_borda, tamanho_bloco):
+        """Testa fontes de texto com tokens cruzando a fronteira dos blocos"""
+        for codigo in codigos_borda:
+            fonte = io.StringIO(codigo, newline='')
+            esperado = listar_tokens(Lexer(codigo))
+            assert listar_tokens(LexerStreaming(fonte, tamanho_bloco)) == esperado, codigo
+
+    @pytest.mark.parametrize('tamanho_bloco', [1, 2, 5])
+    def test_casos_de_borda_bytes(self, codigos_borda, tamanho_bloco):
+        """Testa fontes binárias (UTF-8 incremental e quebras universais)"""
+        for codigo in codigos_borda:
+            fonte = io.BytesIO(codigo.encode('utf-8'))
+            esperado = listar_tokens(Lexer(codigo.replace('\r\n', '\n')))
+            assert listar_tokens(LexerStreaming(fonte, tamanho_bloco)) == esperado, codigo
+
+    def test_comentario_e_string_longos(self):
+        """Testa tokens muito maiores que o bloco"""
+        codigo = '/* ' + 'x\n' * 500 + '*/ escreva("' + 'a' * 1000 + '") fim'
+        esperado = listar_tokens(Lexer(codigo))
+        assert listar_tokens(LexerStreaming(io.StringIO(codigo), 16)) == esperado
+
+    def test_erro_na_posicao_absoluta(self):
+        """Testa que linha/coluna do erro contam desde o início da fonte"""
+        lexer = LexerStreaming(io.StringIO("x <- 1\n" * 50 + "  @"), 4)
+        with pytest.raises(ErroLexico) as info:
+            while lexer.proximo_token().tipo != TipoToken.EOF:
+                pass
+        assert (info.value.linha, info.value.coluna) == (51, 3)
+
+
+class TestLexerStreamingMemoria:
+    """Janela deslizante e integração"""
+
+    def test_janela_limitada(self):
+        """Testa que a janela não cresce com o tamanho da fonte"""
+        codigo = "inteiro x; inicio x <- x + 1 fim\n" * 2000
+        lexer = LexerStreaming(io.StringIO(codigo), 256)
+        maior_janela = 0
+        while lexer.proximo_token().tipo != TipoToken.EOF:
+            maior_janela = max(maior_janela, len(lexer.codigo_fonte))
+        assert maior_janela <= 2 * 256
+        assert lexer.deslocamento + lexer.posicao_atual == len(codigo)
+
+    def test_parser_consome_sob_demanda(self, codigo_fibonacci):
+        """Testa que o Parser gera a mesma AST lendo em blocos"""
+        esperado = Parser(Lexer(codigo_fibonacci)).analisar()
+        fonte = io.BytesIO(codigo_fibonacci.encode('utf-8'))
+        assert Parser(LexerStreaming(fonte, 32)).analisar() == esperado
+
+    def test_mmap(self, tmp_path, codigo_fibonacci):
+        """Testa leitura a partir de um arquivo mapeado em memória"""
+        caminho = tmp_path / 'fibonacci.por'
+        caminho.write_text(codigo_fibonacci, encoding='utf-8')
+        with open(caminho, 'rb') as arquivo:
+            with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+                tokens = listar_tokens(LexerStreaming(mapa, 64))
+        assert tokens == listar_tokens(Lexer(codigo_fibonacci))
+
+    def test_compilar_arquivo_streaming(self, tmp_path, capsys):
+        """Testa compilação e execução de arquivo no modo streaming"""
+        caminho = tmp_path / 'programa.por'
+        caminho.write_text('inteiro x;\r\ninicio\r\n x <- 6 * 7\r\n escreva(x)\r\nfim\r\n',
+                           encoding='utf-8')
+        assert CompiladorPortugol(streaming=True).compilar_arquivo(str(caminho))
+        assert '42' in capsys.readouterr().out
+
+    @pytest.mark.parametrize('opcoes', [
+        {'streaming': True, 'modo_bytes': True},
+        {'streaming': True, 'paralelo': True},
+        {'modo_bytes': True, 'paralelo': True},
+        {'streaming': True, 'motor_lexico': 'regex'},
+        {'modo_bytes': True, 'motor_lexico': 'tabelado'},
+    ])
+    def test_opcoes_incompativeis(self, opcoes):
+        """Testa que streaming/bytes não são combinados silenciosamente"""
+        with pytest.raises(ValueError):
+            CompiladorPortugol(**opcoes)
+
+    @pytest.mark.parametrize('fonte', [b'inicio fim', io.StringIO('inicio fim')])
+    def test_fonte_sem_lexer_configurado(self, fonte):
+        """Testa que bytes e arquivos não ignoram o motor léxico escolhido"""
+        with pytest.raises(ValueError, match="motor léxico 'regex'"):
+            CompiladorPortugol(motor_lexico='regex').criar_lexer(fonte)
+        with pytest.raises(ValueError, match="modo paralelo"):
+            CompiladorPortugol(paralelo=True).criar_lexer(fonte)
@@ -7,10 +7,12 @@ Valida a construção correta da AST a partir dos tokens.
 import pytest
 from src.lexer import Lexer
 from src.parser import Parser
+from src.parser_pratt import ParserPratt
+from src.parser_iterativo import ParserIterativo
 from src.ast_nodes import (
-    Programa, DeclaracaoVariavel, Atribuicao, Condicional,
+    AST, Programa, DeclaracaoVariavel, Atribuicao, Condicional,
     Repeticao, RepeticaoPara, Entrada, Saida, Literal, Variavel,
-    ExpressaoBinaria
+    ExpressaoBinaria, ExpressaoUnaria
 )
 from src.exceptions import ErroSintatico
 
@@ -379,3 +381,65 @@ class TestParserComplexo:
         assert isinstance(cmd, RepeticaoPara)
         assert isinstance(cmd.passo, Literal)
         assert cmd.passo.valor == "1"
+
+
+class TestParserPosicoes:
+    """Testes para os nós compactos e a posição de cada nó"""
+
+    CODIGO = (
+        "inteiro x, y;\n"
+        "inicio\n"
+        "  se x > -1 entao\n"
+        "    enquanto y < 2 faca leia(y) fimenquanto\n"
+        "  fimse\n"
+        "  para x de 1 ate (y + 2) faca escreva(x, \"a\") fimpara\n"
+        "  y <- verdadeiro\n"
+        "fim\n"
+    )
+
+    @pytest.fixture(params=[Parser, ParserPratt, ParserIterativo])
+    def ast(self, request):
+        return request.param(Lexer(self.CODIGO)).analisar()
+
+    def test_nos_sem_dicionario(self, ast):
+        """Testa que nenhum nó tem __dict__ nem aceita atributos novos"""
+        pilha = [ast]
+        while pilha:
+            no = pilha.pop()
+            if isinstance(no, list):
+                pilha.extend(no)
+            elif isinstance(no, AST):
+                assert not hasattr(no, '__dict__')
+                pilha.extend(getattr(no, campo) for campo in no.__slots__)
+        with pytest.raises(AttributeError):
+            ast.extra = 1
+
+    def test_posicao_de_cada_no(self, ast):
+        """Testa que cada nó guarda a posição do seu primeiro token"""
+        def posicao(no):
+            return no.linha, no.coluna
+
+        se, para, atribuicao = ast.comandos
+        enquanto = se.comandos_entao[0]
+        assert posicao(ast) == (1, 1)
+        assert [posicao(d) for d in ast.declaracoes] == [(1, 9), (1, 12)]
+        assert isinstance(se, Condicional) and posicao(se) == (3, 3)
+        assert isinstance(se.condicao, ExpressaoBinaria) and posicao(se.condicao) == (3, 6)
+        assert isinstance(se.condicao.direita, ExpressaoUnaria) and posicao(se.condicao.direita) == (3, 10)
+        assert posicao(se.condicao.direita.operando) == (3, 11)
+        assert isinstance(enquanto, Repeticao) and posicao(enquanto) == (4, 5)
+        assert isinstance(enquanto.comandos[0], Entrada) and posicao(enquanto.comandos[0]) == (4, 25)
+        assert isinstance(para, RepeticaoPara) and posicao(para) == (6, 3)
+        assert posicao(para.fim) == (6, 20)
+        # Passo implícito: literal próprio do laço, na posição do 'para'
+        assert posicao(para.passo) == (6, 3)
+        saida = para.comandos[0]
+        assert isinstance(saida, Saida) and posicao(saida) == (6, 32)
+        assert [posicao(e) for e in saida.expressoes] == [(6, 40), (6, 43)]
+        assert isinstance(atribuicao, Atribuicao) and posicao(atribuicao) == (7, 3)
+        assert posicao(atribuicao.expressao) == (7, 8)
+
+    def test_posicao_fora_da_comparacao(self):
+        """Testa que nós iguais em posições diferentes são iguais"""
+        assert Literal("1", linha=3, coluna=4) == Literal("1")
+        assert Variavel("x", linha=1, coluna=1) != Literal("x", linha=1, coluna=1)
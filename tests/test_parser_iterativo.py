@@ -0,0 +1,153 @@
+"""
+Testes para o analisador sintático sem recursão (ParserIterativo)
+
+Valida que as árvores e os erros são idênticos aos do Parser, que
+programas com aninhamento muito profundo passam por todas as fases sem
+RecursionError e que os limites de profundidade e tamanho produzem
+ErroSintatico.
+"""
+
+import pytest
+from src.lexer import Lexer
+from src.parser import Parser
+from src.parser_iterativo import ParserIterativo
+from src.semantic import AnalisadorSemantico
+from src.intermediate import GeradorCodigoIntermediario
+from src.codegen import GeradorDeCodigo
+from src.ast_nodes import Condicional, ExpressaoBinaria
+from src.exceptions import ErroSintatico
+from src.main import CompiladorPortugol
+from conftest import analisar
+
+
+PROGRAMAS = [
+    "inicio x <- a + b * c - d / e % f fim",
+    "inicio x <- -(2 ^ 3 ^ -2) ou a < b e c >= d fim",
+    "inicio escreva(((x)), -y, \"t\") leia(x) fim",
+    "inicio se a entao x <- 1 senao se b entao x <- 2 fimse fimse fim",
+    "inicio enquanto a faca para i de 1 ate 3 passo -1 faca se b entao fimse fimpara fimenquanto fim",
+    # Erros
+    "inicio x <- a < b < c fim",
+    "inicio x <- (a + b fim",
+    "inicio se a entao x <- 1 fim",
+    "inicio se a entao senao x <- 1 senao fimse fim",
+    "inicio enquanto a faca fimse fim",
+    "inicio para i de 1 faca fimpara fim",
+    "inicio senao fim",
+    "inicio x <- 1",
+]
+
+
+def compilar_fases(ast):
+    """Executa as fases posteriores ao parser sobre a AST"""
+    AnalisadorSemantico().analisar(ast)
+    instrucoes = GeradorCodigoIntermediario().gerar(ast)
+    return instrucoes, GeradorDeCodigo().gerar(ast)
+
+
+class TestEquivalencia:
+    """Mesmas árvores e erros do Parser"""
+
+    @pytest.mark.parametrize('codigo', PROGRAMAS)
+    def test_programa(self, codigo):
+        """Testa comandos, blocos aninhados e erros"""
+        assert analisar(ParserIterativo, codigo) == analisar(Parser, codigo)
+
+    def test_programa_completo(self, codigo_fibonacci):
+        """Testa um programa com todos os comandos"""
+        assert analisar(ParserIterativo, codigo_fibonacci) == analisar(Parser, codigo_fibonacci)
+
+    def test_fim_antes_de_fimse(self):
+        """Testa que 'fim' dentro de um bloco é erro, nos dois parsers"""
+        codigo = "inteiro x;\ninicio\nse x == 5 entao\nx <- 10\nfim"
+        assert analisar(ParserIterativo, codigo) == ("Esperado 'fimse', encontrado 'fim'", 5, 1)
+        assert analisar(Parser, codigo) == analisar(ParserIterativo, codigo)
+
+
+class TestAninhamentoProfundo:
+    """Programas que esgotariam a pilha do interpretador"""
+
+    def test_parenteses_e_unarios(self):
+        """Testa expressão com 4000 níveis de parênteses e '-'"""
+        n = 4000
+        codigo = "inteiro x;\ninicio\nleia(x)\nx <- " + "(-" * n + "x" + ")" * n + "\nfim"
+        ast = ParserIterativo(Lexer(codigo)).analisar()
+        instrucoes, python = compilar_fases(ast)
+        assert len(instrucoes) == n + 3
+        assert python.count("(-") == n
+
+    def test_cadeia_longa(self):
+        """Testa cadeias longas à esquerda (+) e à direita (^)"""
+        n = 5000
+        codigo = ("inteiro x;\ninicio\nx <- " + " + ".join(["1"] * n) +
+                  "\nescreva(" + " ^ ".join(["1"] * n) + ")\nfim")
+        ast = ParserIterativo(Lexer(codigo)).analisar()
+        soma = ast.comandos[0].expressao
+        assert isinstance(soma, ExpressaoBinaria) and isinstance(soma.esquerda, ExpressaoBinaria)
+        instrucoes, python = compilar_fases(ast)
+        assert len(instrucoes) == 1 + (n - 1) + 1 + (n - 1) + 1
+        assert python.count(" + ") == python.count(" ** ") == n - 1
+
+    def test_blocos_aninhados(self):
+        """Testa 10000 blocos se/enquanto aninhados"""
+        n = 5000
+        codigo = ("inteiro x;\ninicio\nleia(x)\n" + "se x < 1 entao enquanto x < 1 faca\n" * n +
+                  "x <- x + 1\n" + "fimenquanto fimse\n" * n + "fim")
+        ast = ParserIterativo(Lexer(codigo)).analisar()
+        no = ast.comandos[1]
+        for _ in range(n - 1):
+            no = no.comandos_entao[0].comandos[0]
+        assert isinstance(no, Condicional)
+        instrucoes, python = compilar_fases(ast)
+        assert python.splitlines()[-4].strip() == "x = (x + 1)"
+        # Um label por 'se' sem 'senao', dois por 'enquanto'
+        assert sum(1 for i in instrucoes if i.tipo == 'LABEL') == 3 * n
+
+    def test_compilador_iterativo(self):
+        """Testa o CompiladorPortugol com o motor iterativo"""
+        codigo = "inteiro x;\ninicio\nx <- " + "(" * 5000 + "1" + ")" * 5000 + "\nfim"
+        compilador = CompiladorPortugol(otimizar=True, motor_sintatico='iterativo')
+        assert compilador.compilar_codigo(codigo) is not None
+
+
+class TestLimites:
+    """Limites de profundidade e tamanho"""
+
+    def test_profundidade_de_expressao(self):
+        """Testa parênteses acima do limite, com a posição do excesso"""
+        parser = ParserIterativo(Lexer("inicio x <- ((((1)))) fim"), profundidade_maxima=3)
+        with pytest.raises(ErroSintatico) as info:
+            parser.analisar()
+        assert (info.value.linha, info.value.coluna) == (1, 16)
+        assert "profundidade máxima (3)" in info.value.mensagem
+
+    def test_profundidade_de_blocos(self):
+        """Testa blocos acima do limite"""
+        codigo = "inicio " + "enquanto a faca " * 3 + "fimenquanto " * 3 + "fim"
+        ParserIterativo(Lexer(codigo), profundidade_maxima=3).analisar()
+        with pytest.raises(ErroSintatico):
+            ParserIterativo(Lexer(codigo), profundidade_maxima=2).analisar()
+
+    def test_tamanho(self):
+        """Testa programa com mais nós que o limite"""
+        codigo = "inicio x <- 1 + 2 + 3 escreva(x) fim"
+        # 6 nós na atribuição (com o comando), 2 no escreva
+        assert ParserIterativo(Lexer(codigo), tamanho_maximo=8).analisar()
+        with pytest.raises(ErroSintatico) as info:
+            ParserIterativo(Lexer(codigo), tamanho_maximo=7).analisar()
+        assert "tamanho máximo (7 nós)" in info.value.mensagem
+
+    def test_limites_do_compilador(self, capsys):
+        """Testa que o compilador repassa os limites e relata o erro"""
+        codigo = "inteiro x;\ninicio\nx <- ((1))\nfim"
+        raso = CompiladorPortugol(motor_sintatico='iterativo', profundidade_maxima=1)
+        assert raso.compilar_codigo(codigo) is None
+        assert "profundidade máxima" in capsys.readouterr().out
+        fundo = CompiladorPortugol(motor_sintatico='iterativo', profundidade_maxima=2)
+        assert fundo.compilar_codigo(codigo) is not None
+
+    def test_motor_opcional(self):
+        """Testa que o descendente é o padrão e o iterativo é escolhido à parte"""
+        assert type(CompiladorPortugol().criar_parser(Lexer("inicio fim"))) is Parser
+        compilador = CompiladorPortugol(motor_sintatico='iterativo')
+        assert type(compilador.criar_parser(Lexer("inicio fim"))) is ParserIterativo
@@ -0,0 +1,175 @@
+"""
+Testes para o parser com expressões em código pós-fixo (ParserPosfixo)
+
+Valida o código gerado para cada operador, que as expressões
+reconstruídas e os comandos são os do ParserIterativo, e que erros e
+limites se comportam como nele.
+"""
+
+import pytest
+from src.lexer import Lexer
+from src.parser_iterativo import ParserIterativo
+from src.parser_posfixo import (
+    ParserPosfixo, ExpressaoPosfixa, para_arvore, LITERAL, VARIAVEL, NEGACAO, CODIGOS_BINARIOS, OPERADORES
+)
+from src.ast_nodes import TipoToken, Expressao, Atribuicao, Condicional
+from src.exceptions import ErroSintatico
+
+
+def expressao(codigo):
+    """Expressão pós-fixa de 'x <- codigo'"""
+    return ParserPosfixo(Lexer(f"inicio x <- {codigo} fim")).analisar().comandos[0].expressao
+
+
+def instrucoes(codigo):
+    """Instruções da expressão, com operandos e operadores legíveis"""
+    expr = expressao(codigo)
+    codigo_posfixo = expr.codigo
+    lista = list(codigo_posfixo.instrucoes[expr.inicio:expr.fim])
+    saida = []
+    while lista:
+        operacao = lista.pop(0)
+        if operacao == LITERAL:
+            saida.append(codigo_posfixo.constantes[lista.pop(0)])
+        elif operacao == VARIAVEL:
+            saida.append(codigo_posfixo.nomes[lista.pop(0)])
+        elif operacao == NEGACAO:
+            saida.append('neg')
+        else:
+            saida.append(OPERADORES[operacao])
+    return saida
+
+
+def converter(no):
+    """Substitui as expressões pós-fixas pelas árvores equivalentes"""
+    if isinstance(no, list):
+        return [converter(item) for item in no]
+    if isinstance(no, ExpressaoPosfixa):
+        return para_arvore(no)
+    if isinstance(no, Expressao) or not hasattr(no, '__dataclass_fields__'):
+        return no
+    for campo in no.__dataclass_fields__:
+        setattr(no, campo, converter(getattr(no, campo)))
+    return no
+
+
+class TestCodigo:
+    """Código pós-fixo gerado"""
+
+    @pytest.mark.parametrize('codigo, esperado', [
+        ("a + b * c", ['a', 'b', 'c', '*', '+']),
+        ("(a + b) * c", ['a', 'b', '+', 'c', '*']),
+        ("a - b - c", ['a', 'b', '-', 'c', '-']),
+        ("2 ^ 3 ^ 2", ['2', '3', '2', '^', '^']),
+        ("-a ^ 2", ['a', 'neg', '2', '^']),
+        ("-(-a)", ['a', 'neg', 'neg']),
+        ("a < b e nao_c ou d", ['a', 'b', '<', 'nao_c', 'e', 'd', 'ou']),
+        ('"t" == verdadeiro', ['"t"', 'verdadeiro', '==']),
+    ])
+    def test_ordem_posfixa(self, codigo, esperado):
+        """Testa operandos antes dos operadores, com precedência e associatividade"""
+        assert instrucoes(codigo) == esperado
+
+    def test_codigos_binarios(self):
+        """Testa que cada operador binário tem um código próprio"""
+        assert len(set(CODIGOS_BINARIOS.values())) == len(CODIGOS_BINARIOS)
+        assert min(CODIGOS_BINARIOS.values()) > NEGACAO
+        assert OPERADORES[CODIGOS_BINARIOS[TipoToken.POTENCIA]] == '^'
+
+    def test_array_unico_e_indices_compartilhados(self):
+        """Testa um só array por programa, com constantes e nomes reaproveitados"""
+        parser = ParserPosfixo(Lexer("inicio x <- a + 1 escreva(a * 1, a) fim"))
+        atribuicao, saida = parser.analisar().comandos
+        expressoes = [atribuicao.expressao, *saida.expressoes]
+        assert all(expr.codigo is parser.codigo for expr in expressoes)
+        assert [(expr.inicio, expr.fim) for expr in expressoes] == [(0, 5), (5, 10), (10, 12)]
+        assert parser.codigo.nomes == ['a'] and parser.codigo.constantes == ['1']
+        assert len(parser.codigo.instrucoes) == 12
+
+    def test_passo_padrao(self):
+        """Testa que o passo implícito é o literal 1, emitido em cada laço"""
+        codigo = "inicio para i de 1 ate 2 faca fimpara\npara i de 3 ate 4 faca fimpara fim"
+        primeiro, segundo = ParserPosfixo(Lexer(codigo)).analisar().comandos
+        assert primeiro.passo is not segundo.passo
+        assert para_arvore(primeiro.passo).valor == para_arvore(segundo.passo).valor == "1"
+        assert [(passo.linha, passo.coluna) for passo in (primeiro.passo, segundo.passo)] == [(1, 8), (2, 1)]
+
+
+class TestEquivalencia:
+    """Mesma estrutura e expressões do ParserIterativo"""
+
+    CODIGO = """inteiro x, i;
+inicio
+    leia(x)
+    se (x + 1) * 2 > 3 entao
+        enquanto -x < 10 faca
+            x <- x + 1
+        fimenquanto
+    senao
+        para i de 1 ate x ^ 2 passo -1 faca
+            escreva(i, "texto", i % 2 == 0)
+        fimpara
+    fimse
+fim
+"""
+
+    def test_programa(self):
+        """Testa comandos e expressões reconstruídas (com a posição da raiz)"""
+        esperado = ParserIterativo(Lexer(self.CODIGO)).analisar()
+        programa = ParserPosfixo(Lexer(self.CODIGO)).analisar()
+        se = programa.comandos[1]
+        assert isinstance(se, Condicional) and isinstance(se.condicao, ExpressaoPosfixa)
+        assert (se.condicao.linha, se.condicao.coluna) == (esperado.comandos[1].condicao.linha,
+                                                           esperado.comandos[1].condicao.coluna)
+        assert converter(programa) == esperado
+
+    def test_posicao_da_raiz(self):
+        """Testa a posição da raiz com parênteses e '-' unário"""
+        assert (expressao("(a) + b").linha, expressao("(a) + b").coluna) == (1, 14)
+        assert (expressao("-a").linha, expressao("-a").coluna) == (1, 13)
+
+    def test_programa_completo(self, codigo_fibonacci):
+        """Testa um programa com todos os comandos"""
+        esperado = ParserIterativo(Lexer(codigo_fibonacci)).analisar()
+        assert converter(ParserPosfixo(Lexer(codigo_fibonacci)).analisar()) == esperado
+
+    def test_aninhamento_profundo(self):
+        """Testa expressão com 4000 níveis de parênteses e '-'"""
+        n = 4000
+        expr = expressao("(-" * n + "x" + ")" * n)
+        assert expr.fim - expr.inicio == 2 + n
+
+
+class TestErros:
+    """Erros e limites como no ParserIterativo"""
+
+    @pytest.mark.parametrize('codigo', [
+        "inicio x <- a < b < c fim",
+        "inicio x <- (a + b fim",
+        "inicio x <- a + fim",
+        "inicio para i de 1 faca fimpara fim",
+    ])
+    def test_mesmo_erro(self, codigo):
+        """Testa mensagem e posição do erro"""
+        with pytest.raises(ErroSintatico) as esperado:
+            ParserIterativo(Lexer(codigo)).analisar()
+        with pytest.raises(ErroSintatico) as obtido:
+            ParserPosfixo(Lexer(codigo)).analisar()
+        assert str(obtido.value) == str(esperado.value)
+
+    def test_limites(self):
+        """Testa os limites de profundidade e de tamanho"""
+        with pytest.raises(ErroSintatico, match="profundidade máxima"):
+            ParserPosfixo(Lexer("inicio x <- ((((1)))) fim"), profundidade_maxima=3).analisar()
+        with pytest.raises(ErroSintatico, match="tamanho máximo"):
+            ParserPosfixo(Lexer("inicio x <- 1 + 2 + 3 fim"), tamanho_maximo=4).analisar()
+
+    def test_recuperacao_descarta_restos(self):
+        """Testa que o código de uma expressão com erro não fica no array"""
+        parser = ParserPosfixo(Lexer("inicio x <- a + b * ) x <- c fim"), recuperar=True)
+        programa = parser.analisar()
+        assert len(parser.erros) == 1
+        atribuicao, = programa.comandos
+        assert isinstance(atribuicao, Atribuicao)
+        assert (atribuicao.expressao.inicio, atribuicao.expressao.fim) == (0, 2)
+        assert list(parser.codigo.instrucoes) == [VARIAVEL, parser.codigo.nomes.index('c')]
@@ -0,0 +1,108 @@
+"""
+Testes para o analisador de expressões por precedência (ParserPratt)
+
+Valida que as árvores (inclusive linha/coluna dos nós) e os erros são
+idênticos aos do Parser de descida recursiva.
+"""
+
+import pytest
+from src.lexer import Lexer
+from src.parser import Parser
+from src.parser_pratt import ParserPratt, compilar_tabela
+from src.ast_nodes import TipoToken, ExpressaoBinaria, ExpressaoUnaria, Literal
+from src.exceptions import ErroSintatico
+from src.main import CompiladorPortugol
+from conftest import analisar
+
+
+EXPRESSOES = [
+    "1",
+    "-x",
+    "--x",
+    "a + b * c - d / e % f",
+    "2 ^ 3 ^ 2",
+    "-2 ^ 2",
+    "a ^ -b ^ c * d",
+    "(a + b) * (c - d)",
+    "a + b < c * d e x ou y == falso",
+    "a < b e c >= d ou verdadeiro",
+    "((((x))))",
+    '"texto" + 1',
+    "a - b - c - d",
+    "a ou b ou c e d e e1",
+]
+
+EXPRESSOES_INVALIDAS = [
+    "a < b < c",
+    "x e a < b < c",
+    "a + b == c != d",
+    "a +",
+    "(a + b",
+    "* a",
+    "a b",
+]
+
+
+class TestEquivalencia:
+    """Mesmas árvores e erros do Parser"""
+
+    @pytest.mark.parametrize('expressao', EXPRESSOES + EXPRESSOES_INVALIDAS)
+    def test_expressao(self, expressao):
+        """Testa a expressão em atribuição, condição e escreva"""
+        for codigo in (f"inicio x <- {expressao} fim",
+                       f"inicio se {expressao} entao escreva(1) fimse fim",
+                       f"inicio escreva({expressao}, 1) fim"):
+            assert analisar(ParserPratt, codigo) == analisar(Parser, codigo), codigo
+
+    def test_programa_completo(self, codigo_fibonacci):
+        """Testa um programa com todos os comandos"""
+        assert analisar(ParserPratt, codigo_fibonacci) == analisar(Parser, codigo_fibonacci)
+
+
+class TestPrecedencia:
+    """Associatividade a partir da tabela"""
+
+    def expressao(self, texto):
+        """Expressão de uma atribuição analisada pelo ParserPratt"""
+        return ParserPratt(Lexer(f"inicio x <- {texto} fim")).analisar().comandos[0].expressao
+
+    def test_potencia_a_direita(self):
+        """Testa 2 ^ 3 ^ 2 = 2 ^ (3 ^ 2)"""
+        expr = self.expressao("2 ^ 3 ^ 2")
+        assert expr == ExpressaoBinaria(Literal("2"), "^",
+                                        ExpressaoBinaria(Literal("3"), "^", Literal("2")))
+
+    def test_subtracao_a_esquerda(self):
+        """Testa a - b - c = (a - b) - c"""
+        expr = self.expressao("5 - 3 - 1")
+        assert expr == ExpressaoBinaria(ExpressaoBinaria(Literal("5"), "-", Literal("3")),
+                                        "-", Literal("1"))
+
+    def test_menos_unario_liga_mais_forte(self):
+        """Testa -2 ^ 2 = (-2) ^ 2"""
+        expr = self.expressao("-2 ^ 2")
+        assert expr == ExpressaoBinaria(ExpressaoUnaria("-", Literal("2")), "^", Literal("2"))
+
+    def test_relacional_nao_associativo(self):
+        """Testa que a < b < c é rejeitado"""
+        with pytest.raises(ErroSintatico):
+            ParserPratt(Lexer("inicio x <- a < b < c fim")).analisar()
+
+    def test_tabela_invalida(self):
+        """Testa associatividade desconhecida na tabela"""
+        with pytest.raises(ValueError):
+            compilar_tabela({TipoToken.MAIS: (1, 'diagonal')})
+
+
+class TestCompiladorComPratt:
+    """Seleção do motor sintático"""
+
+    def test_mesmo_codigo_gerado(self, codigo_fibonacci):
+        """Testa que o código Python gerado é o mesmo"""
+        esperado = CompiladorPortugol().compilar_codigo(codigo_fibonacci)
+        assert CompiladorPortugol(motor_sintatico='pratt').compilar_codigo(codigo_fibonacci) == esperado
+
+    def test_motor_desconhecido(self):
+        """Testa motor sintático inexistente"""
+        with pytest.raises(ValueError):
+            CompiladorPortugol(motor_sintatico='lalr')
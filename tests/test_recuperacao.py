@@ -0,0 +1,251 @@
+"""
+Testes para a recuperação de erros (vários erros em uma compilação)
+
+Valida os tokens ERRO do lexer, a ressincronização do parser em modo
+pânico (com os mesmos erros e árvores nos três motores sintáticos), o tipo
+de erro da análise semântica e a lista única de diagnósticos do
+CompiladorPortugol.
+"""
+
+import pytest
+from src.lexer import Lexer
+from src.lexer_tabelado import LexerTabelado
+from src.parser import Parser
+from src.parser_pratt import ParserPratt
+from src.parser_iterativo import ParserIterativo
+from src.semantic import AnalisadorSemantico, TIPO_ERRO
+from src.ast_nodes import TipoToken, Saida
+from src.exceptions import ErroLexico, ErroSintatico, ErroSemantico
+from src.main import CompiladorPortugol
+from conftest import arvore
+
+
+MOTORES = [Parser, ParserPratt, ParserIterativo]
+
+PROGRAMAS_COM_ERROS = [
+    "inicio x <- 1 + fim",
+    "inicio se x x entao y <- 1 fimse escreva(1) fim",
+    "inicio enquanto a faca fimse x <- 1 fimenquanto fim",
+    "inicio se a entao enquanto b faca x <- 1 fimse fim",
+    "inicio se a entao enquanto b faca senao x <- 1 fimse fim",
+    "inicio para i 1 ate faca x <- 2 fimpara ; ; fim",
+    "inteiro x y; real z; inicio escreva(x leia(y) fim",
+    "inteiro x;\nx <- 1\nfim",
+    "inicio x <- 1 fim x",
+    "inicio se a entao x <- 1",
+    "inicio fimse senao x <- (1 fim",
+]
+
+
+def tokens(lexer):
+    """Tipos e lexemas até EOF"""
+    resultado = []
+    while True:
+        token = lexer.proximo_token()
+        resultado.append((token.tipo, token.lexema))
+        if token.tipo == TipoToken.EOF:
+            return resultado
+
+
+def recuperar(classe_parser, codigo):
+    """AST e erros (mensagem, linha, coluna) da análise com recuperação"""
+    lexer = Lexer(codigo, recuperar=True)
+    parser = classe_parser(lexer, recuperar=True)
+    ast = parser.analisar()
+    erros = sorted(lexer.erros + parser.erros, key=lambda erro: (erro.linha, erro.coluna))
+    return ast, [(erro.mensagem, erro.linha, erro.coluna) for erro in erros]
+
+
+class TestLexer:
+    """Tokens ERRO no lugar de ErroLexico"""
+
+    def test_tokens_erro(self):
+        """Testa que cada trecho inválido vira um token e um erro"""
+        lexer = Lexer('x <- 1.2.3 + @ ! "abc', recuperar=True)
+        assert tokens(lexer) == [
+            (TipoToken.IDENTIFICADOR, 'x'), (TipoToken.ATRIBUICAO, '<-'),
+            (TipoToken.ERRO, '1.2.3'), (TipoToken.MAIS, '+'), (TipoToken.ERRO, '@'),
+            (TipoToken.ERRO, '!'), (TipoToken.ERRO, '"abc'), (TipoToken.EOF, 'EOF'),
+        ]
+        assert [(erro.linha, erro.coluna) for erro in lexer.erros] == [(1, 9), (1, 14), (1, 16), (1, 18)]
+
+    def test_mesmos_erros_do_modo_normal(self):
+        """Testa que o erro registrado é o que o modo normal lança"""
+        codigo = "x <- 2 $ 3"
+        with pytest.raises(ErroLexico) as info:
+            tokens(Lexer(codigo))
+        lexer = Lexer(codigo, recuperar=True)
+        tokens(lexer)
+        assert [(e.mensagem, e.linha, e.coluna) for e in lexer.erros] == [
+            (info.value.mensagem, info.value.linha, info.value.coluna)
+        ]
+
+    def test_motor_tabelado(self):
+        """Testa que os motores que recorrem ao Lexer também recuperam"""
+        codigo = 'a ç$ 1..2 b'
+        assert tokens(LexerTabelado(codigo, recuperar=True)) == tokens(Lexer(codigo, recuperar=True))
+
+
+class TestParser:
+    """Ressincronização em modo pânico"""
+
+    def test_varios_erros(self):
+        """Testa um programa com um erro em cada comando"""
+        codigo = (
+            "inteiro x;\n"
+            "inicio\n"
+            "x <- 1 +\n"
+            "se x > 1\n"
+            "  x <- 2\n"
+            "fimse\n"
+            "escreva(x\n"
+            "leia(x)\n"
+            "fim"
+        )
+        ast, erros = recuperar(Parser, codigo)
+        assert erros == [
+            ("Expressão inesperada 'se'", 4, 1),
+            ("Esperado 'entao', encontrado 'x'", 5, 3),
+            ("Esperado ')', encontrado 'leia'", 8, 1),
+        ]
+        # O bloco do 'se' com cabeçalho inválido é mantido no bloco externo
+        assert [type(comando).__name__ for comando in ast.comandos] == ['Atribuicao', 'Entrada']
+
+    @pytest.mark.parametrize('codigo, erros', [
+        ("inicio enquanto a faca fimse x <- 1 fimenquanto fim",
+         [("Esperado 'fimenquanto', encontrado 'fimse'", 1, 24)]),
+        ("inicio se a entao enquanto b faca x <- 1 fimse fim",
+         [("Esperado 'fimenquanto', encontrado 'fimse'", 1, 42)]),
+        ("inicio se a entao x <- 1",
+         [("Comando inesperado 'EOF'", 1, 25)]),
+    ])
+    def test_fechamentos(self, codigo, erros):
+        """Testa fechamentos sem bloco (consumidos) e ausentes (um erro só)"""
+        assert recuperar(Parser, codigo)[1] == erros
+
+    def test_declaracoes(self):
+        """Testa que as variáveis anteriores ao erro continuam declaradas"""
+        ast, erros = recuperar(Parser, "inteiro a, b c; real d; inicio fim")
+        assert erros == [("Esperado ';', encontrado 'c'", 1, 14)]
+        assert [declaracao.nome for declaracao in ast.declaracoes] == ['a', 'b', 'd']
+
+    def test_erro_lexico_nao_repete(self):
+        """Testa que o token ERRO não gera também um erro sintático"""
+        ast, erros = recuperar(Parser, "inicio x <- 1 @ 2 escreva(x) fim")
+        assert erros == [("Caractere inesperado '@'", 1, 15)]
+        assert isinstance(ast.comandos[-1], Saida)
+
+    @pytest.mark.parametrize('classe_parser', MOTORES)
+    def test_string_nao_fechada(self, classe_parser):
+        """Testa o erro na aspa de abertura, sem o EOF que vem em seguida"""
+        codigo = 'inteiro a;\ninicio\na <- "abc\nfim\n'
+        with pytest.raises(ErroLexico, match="String não fechada"):
+            Parser(Lexer(codigo)).analisar()
+        assert recuperar(classe_parser, codigo)[1] == [("String não fechada", 3, 6)]
+
+    @pytest.mark.parametrize('codigo', PROGRAMAS_COM_ERROS)
+    def test_motores_equivalentes(self, codigo):
+        """Testa mesmas árvores e erros nos três motores"""
+        resultados = [recuperar(classe_parser, codigo) for classe_parser in MOTORES]
+        arvores = [(arvore(ast), erros) for ast, erros in resultados]
+        assert arvores[0] == arvores[1] == arvores[2]
+
+    @pytest.mark.parametrize('codigo', PROGRAMAS_COM_ERROS)
+    def test_primeiro_erro(self, codigo):
+        """Testa que o primeiro erro é o que o modo normal lança"""
+        with pytest.raises((ErroLexico, ErroSintatico)) as info:
+            Parser(Lexer(codigo)).analisar()
+        erro = info.value
+        assert recuperar(Parser, codigo)[1][0] == (erro.mensagem, erro.linha, erro.coluna)
+
+    def test_programa_valido(self, codigo_fibonacci):
+        """Testa que um programa sem erros tem a mesma AST do modo normal"""
+        for classe_parser in MOTORES:
+            ast, erros = recuperar(classe_parser, codigo_fibonacci)
+            assert erros == []
+            assert arvore(ast) == arvore(classe_parser(Lexer(codigo_fibonacci)).analisar())
+
+    def test_limites_interrompem(self):
+        """Testa que os limites do motor iterativo não são recuperados"""
+        parser = ParserIterativo(Lexer("inicio x <- ((1)) fim"), profundidade_maxima=1, recuperar=True)
+        with pytest.raises(ErroSintatico):
+            parser.analisar()
+
+
+class TestSemantico:
+    """Análise semântica com o tipo de erro"""
+
+    def test_varios_erros_sem_cascata(self):
+        """Testa que uma expressão com erro não gera erros nas que a contêm"""
+        codigo = (
+            "inteiro x; caracter c; inteiro x;\n"
+            "inicio\n"
+            "x <- (y + 1) * 2\n"
+            "x <- c * 2\n"
+            "leia(w)\n"
+            "fim"
+        )
+        analisador = AnalisadorSemantico(recuperar=True)
+        analisador.analisar(Parser(Lexer(codigo)).analisar())
+        assert [erro.mensagem for erro in analisador.erros] == [
+            "Variável 'x' já foi declarada",
+            "Variável 'y' não foi declarada",
+            "Operação aritmética '*' incompatível entre 'caracter' e 'inteiro'",
+            "Variável 'w' não foi declarada",
+        ]
+
+    def test_tipo_erro(self):
+        """Testa o tipo da expressão com erro"""
+        analisador = AnalisadorSemantico(recuperar=True)
+        ast = Parser(Lexer("inicio escreva(-(y * 2)) fim")).analisar()
+        assert analisador._analisar_expressao(ast.comandos[0].expressoes[0]) == TIPO_ERRO
+
+    def test_modo_normal_lanca(self):
+        """Testa que sem recuperação o primeiro erro é lançado"""
+        ast = Parser(Lexer("inicio x <- y fim")).analisar()
+        with pytest.raises(ErroSemantico):
+            AnalisadorSemantico().analisar(ast)
+
+
+class TestCompilador:
+    """Lista única de diagnósticos"""
+
+    CODIGO = (
+        "inteiro x;\n"
+        "inicio\n"
+        "x <- z\n"
+        "x <- 1 $ 2\n"
+        "escreva(x\n"
+        "fim"
+    )
+
+    def test_diagnosticar(self):
+        """Testa erros das três fases, em ordem, com a fase de cada um"""
+        _, diagnosticos = CompiladorPortugol().diagnosticar(self.CODIGO)
+        assert [(erro.fase, erro.linha) for erro in diagnosticos] == [
+            ('léxica', 4), ('sintática', 6), ('semântica', 3),
+        ]
+
+    def test_string_nao_fechada(self):
+        """Testa que o primeiro diagnóstico é a string não fechada"""
+        _, diagnosticos = CompiladorPortugol().diagnosticar('inteiro a;\ninicio\na <- "abc\nfim\n')
+        assert [str(erro) for erro in diagnosticos] == ["String não fechada (linha 3, coluna 6)"]
+
+    def test_bytes(self):
+        """Testa diagnósticos a partir dos bytes do arquivo"""
+        _, diagnosticos = CompiladorPortugol().diagnosticar(self.CODIGO.replace('\n', '\r\n').encode())
+        assert len(diagnosticos) == 3
+
+    def test_programa_valido(self, codigo_fibonacci):
+        """Testa programa sem erros: lista vazia e compilação normal"""
+        compilador = CompiladorPortugol(recuperar=True)
+        assert compilador.diagnosticar(codigo_fibonacci)[1] == []
+        assert compilador.compilar_codigo(codigo_fibonacci) == \
+            CompiladorPortugol().compilar_codigo(codigo_fibonacci)
+
+    def test_compilar_relata_todos(self, capsys):
+        """Testa que a compilação com recuperação mostra todos os erros"""
+        assert CompiladorPortugol(recuperar=True).compilar_codigo(self.CODIGO) is None
+        saida = capsys.readouterr().out
+        assert "3 erro(s)" in saida
+        assert "[semântica] Variável 'z' não foi declarada" in saida
@@ -9,8 +9,8 @@ import pytest
 import warnings
 from src.lexer import Lexer
 from src.parser import Parser
-from src.semantic import AnalisadorSemantico, TabelaSimbolos
-from src.exceptions import ErroSemantico
+from src.semantic import AnalisadorSemantico, TabelaSimbolos, Simbolo
+from src.exceptions import AvisoSemantico, ErroSemantico
 
 
 class TestTabelaSimbolos:
@@ -25,6 +25,19 @@ class TestTabelaSimbolos:
         assert tabela.simbolos["x"]["tipo"] == "inteiro"
         assert tabela.simbolos["x"]["inicializada"] == False
 
+    def test_simbolos_com_indices_densos(self):
+        """Testa registros com índice na ordem das declarações"""
+        tabela = TabelaSimbolos()
+        for nome, tipo in (("a", "inteiro"), ("b", "real"), ("c", "logico")):
+            tabela.declarar_variavel(nome, tipo, 1, 1)
+
+        assert [simbolo.indice for simbolo in tabela.por_indice] == [0, 1, 2]
+        assert tabela.por_indice[1] is tabela.simbolos["b"] is tabela.resolver("b", 2, 1)
+        assert isinstance(tabela.simbolos["b"], Simbolo)
+        assert not hasattr(tabela.simbolos["b"], "__dict__")
+        with pytest.raises(KeyError):
+            tabela.simbolos["b"]["indice_inexistente"]
+
     def test_declarar_variavel_duplicada(self):
         """Testa erro ao declarar variável duplicada"""
         tabela = TabelaSimbolos()
@@ -230,9 +243,19 @@ class TestAnalisadorSemantico:
         ast = parser.analisar()
 
         analisador = AnalisadorSemantico()
-        with pytest.raises(ErroSemantico):
+        with pytest.raises(ErroSemantico) as exc_info:
             analisador.analisar(ast)
 
+        # Posição do 'para'
+        assert (exc_info.value.linha, exc_info.value.coluna) == (3, 13)
+
+    def test_erro_de_operador_com_posicao(self):
+        """Testa que erros de operadores apontam para a expressão"""
+        ast = Parser(Lexer('inteiro x;\ninicio\n  x <- 1 + -"a"\nfim')).analisar()
+        with pytest.raises(ErroSemantico) as exc_info:
+            AnalisadorSemantico().analisar(ast)
+        assert (exc_info.value.linha, exc_info.value.coluna) == (3, 12)
+
     def test_saida_multiplas_expressoes(self):
         """Testa comando escreva com múltiplas expressões"""
         codigo = """
@@ -352,3 +375,172 @@ class TestAnalisadorSemanticoComplexo:
 
         analisador = AnalisadorSemantico()
         analisador.analisar(ast)
+
+
+class TestAnotacoes:
+    """Tipos e símbolos gravados na AST pela análise semântica"""
+
+    CODIGO = """
+    inteiro i, n;
+    real media;
+    logico ok;
+    inicio
+        leia(n)
+        media <- n / 2 + 1
+        ok <- -n < media e verdadeiro
+        para i de 1 ate n faca
+            escreva("i", i)
+        fimpara
+    fim
+    """
+
+    def analisar(self, codigo, recuperar=False):
+        """AST analisada e o analisador"""
+        ast = Parser(Lexer(codigo)).analisar()
+        analisador = AnalisadorSemantico(recuperar=recuperar)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            analisador.analisar(ast)
+        return ast, analisador
+
+    def test_tipos_das_expressoes(self):
+        """Testa o tipo de cada nó de expressão"""
+        ast, _ = self.analisar(self.CODIGO)
+        leia, media, ok, para = ast.comandos
+        soma = media.expressao
+        assert (soma.tipo, soma.esquerda.tipo, soma.direita.tipo) == ('real', 'real', 'inteiro')
+        assert (soma.esquerda.esquerda.tipo, soma.esquerda.direita.tipo) == ('inteiro', 'inteiro')
+        conjuncao = ok.expressao
+        assert conjuncao.tipo == 'logico'
+        assert (conjuncao.esquerda.esquerda.tipo, conjuncao.esquerda.direita.tipo) == ('inteiro', 'real')
+        assert [expressao.tipo for expressao in para.comandos[0].expressoes] == ['caracter', 'inteiro']
+        assert (para.inicio.tipo, para.fim.tipo, para.passo.tipo) == ('inteiro', 'inteiro', 'inteiro')
+
+    def test_simbolos(self):
+        """Testa que variáveis, atribuições, leia e para apontam para a tabela"""
+        ast, analisador = self.analisar(self.CODIGO)
+        simbolos = analisador.tabela_simbolos.simbolos
+        leia, media, ok, para = ast.comandos
+        assert leia.simbolo is simbolos['n']
+        assert media.simbolo is simbolos['media']
+        assert media.expressao.esquerda.esquerda.simbolo is simbolos['n']
+        assert para.simbolo is simbolos['i']
+        assert para.comandos[0].expressoes[1].simbolo is simbolos['i']
+        # Índices na ordem das declarações: i, n, media, ok
+        assert [leia.simbolo.indice, media.simbolo.indice, para.simbolo.indice] == [1, 2, 0]
+
+    def test_sem_analise(self):
+        """Testa que a AST do parser ainda não tem anotações"""
+        ast = Parser(Lexer(self.CODIGO)).analisar()
+        atribuicao = ast.comandos[1]
+        assert atribuicao.simbolo is None and atribuicao.expressao.tipo is None
+
+    def test_anotacoes_fora_da_comparacao(self):
+        """Testa que as anotações não mudam a igualdade entre ASTs"""
+        ast, _ = self.analisar(self.CODIGO)
+        assert ast == Parser(Lexer(self.CODIGO)).analisar()
+
+    def test_recuperacao(self):
+        """Testa TIPO_ERRO e símbolo ausente no modo de recuperação"""
+        ast, analisador = self.analisar(
+            'inteiro x; inicio x <- -"a" + 1 escreva(y) fim', recuperar=True)
+        atribuicao, saida = ast.comandos
+        assert len(analisador.erros) == 2
+        assert atribuicao.expressao.tipo == atribuicao.expressao.esquerda.tipo == 'erro'
+        assert saida.expressoes[0].tipo == 'erro' and saida.expressoes[0].simbolo is None
+
+
+class TestInicializacao:
+    """Análise de inicialização pelo fluxo de controle"""
+
+    def analisar(self, codigo):
+        """Analisador após analisar o código, com os warnings emitidos"""
+        analisador = AnalisadorSemantico()
+        with warnings.catch_warnings(record=True) as emitidos:
+            warnings.simplefilter('always')
+            analisador.analisar(Parser(Lexer(codigo)).analisar())
+        return analisador, emitidos
+
+    def avisadas(self, codigo):
+        """Nome e posição de cada aviso, na ordem"""
+        analisador, _ = self.analisar(codigo)
+        return [(aviso.mensagem.split("'")[1], aviso.linha) for aviso in analisador.avisos]
+
+    def test_um_aviso_por_variavel(self):
+        """Testa que só a primeira leitura não inicializada é relatada"""
+        codigo = """inteiro x, i;
+        inicio
+            para i de 1 ate 10 faca
+                escreva(x + x)
+            fimpara
+            escreva(x)
+        fim"""
+        analisador, emitidos = self.analisar(codigo)
+        assert len(analisador.avisos) == len(emitidos) == 1
+        aviso = analisador.avisos[0]
+        assert isinstance(aviso, AvisoSemantico)
+        assert (aviso.linha, aviso.coluna) == (4, 25)
+        assert str(emitidos[0].message) == str(aviso)
+
+    def test_atribuicao_em_um_ramo(self):
+        """Testa que a atribuição em apenas um ramo do 'se' não basta"""
+        codigo = """inteiro x, y;
+        inicio
+            leia(y)
+            se y > 0 entao x <- 1 fimse
+            escreva(x)
+        fim"""
+        assert self.avisadas(codigo) == [('x', 5)]
+
+    def test_atribuicao_nos_dois_ramos(self):
+        """Testa que a atribuição nos dois ramos do 'se' inicializa"""
+        codigo = """inteiro x, y;
+        inicio
+            leia(y)
+            se y > 0 entao x <- 1 senao x <- 2 fimse
+            escreva(x)
+        fim"""
+        assert self.avisadas(codigo) == []
+
+    def test_corpo_de_laco_pode_nao_executar(self):
+        """Testa que atribuições no corpo de laços não valem após o laço"""
+        codigo = """inteiro x, y, i;
+        inicio
+            y <- 0
+            enquanto y < 0 faca x <- 1 fimenquanto
+            para i de 1 ate y faca y <- 2 fimpara
+            escreva(x, i)
+        fim"""
+        # A variável do 'para' recebe o início antes do primeiro teste
+        assert self.avisadas(codigo) == [('x', 6)]
+
+    def test_leitura_no_laco_antes_da_atribuicao(self):
+        """Testa a leitura no corpo antes da atribuição da mesma iteração"""
+        codigo = """inteiro x, y;
+        inicio
+            y <- 0
+            enquanto y < 2 faca
+                escreva(x)
+                x <- y
+                y <- y + 1
+            fimenquanto
+        fim"""
+        assert self.avisadas(codigo) == [('x', 5)]
+
+    def test_atribuida_antes_do_uso(self):
+        """Testa a marcação das variáveis que dispensam o valor padrão"""
+        codigo = """inteiro x, y, z, nunca;
+        inicio
+            leia(y)
+            se y > 0 entao x <- 1 senao x <- 2 fimse
+            se y > 1 entao z <- 1 fimse
+            escreva(x, z)
+        fim"""
+        analisador, _ = self.analisar(codigo)
+        simbolos = analisador.tabela_simbolos.simbolos
+        assert simbolos['x'].atribuida_antes_do_uso and simbolos['y'].atribuida_antes_do_uso
+        # 'z' pode ser lida sem valor; 'nunca' não é atribuída
+        assert not simbolos['z'].atribuida_antes_do_uso
+        assert not simbolos['nunca'].atribuida_antes_do_uso
+        # Continua valendo "atribuída em algum ponto do programa"
+        assert simbolos['z'].inicializada